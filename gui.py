@@ -4,7 +4,7 @@ Interfaz Gráfica del Sistema de Gestión de Inventario Inteligente
 ==================================================================
 
 Aplicación con interfaz gráfica usando tkinter que permite:
-- Cargar inventario desde archivos Excel
+- Cargar inventario desde archivos Excel, CSV o Parquet
 - Gestionar productos en el inventario
 - Registrar entradas y salidas de stock
 - Ver alertas y estadísticas
@@ -21,11 +21,20 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import pandas as pd
 import numpy as np
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+import multiprocessing
+import os
 import sys
 
-from models import Producto, Inventario
-from logic import OperacionesMatriciales
+from models import Producto, Inventario, EventoInventario
+from logic import OperacionesMatriciales, MotorConsultas, RegistroVistas
+from logic.archivos import (
+    ATRIBUTOS_MAPEO, HOJA_ALERTAS, HOJA_CATEGORIAS,
+    leer_columnas, leer_archivo, leer_metadatos, exportar_inventario, mapeo_automatico,
+    parquet_disponible, detectar_formato
+)
+from logic.importacion import ImportadorInventario
+from logic.paginacion import PaginadorTabla
 
 
 class SistemaInventarioGUI:
@@ -36,6 +45,11 @@ class SistemaInventarioGUI:
     el inventario utilizando operaciones de álgebra lineal.
     """
     
+    # Etiqueta que marca el texto de la lista de productos
+    ETIQUETA_VISTA_PRODUCTOS = "vista_productos"
+    # Por encima de esta cantidad de productos cambiados se redibuja todo
+    MAXIMO_CAMBIOS_INCREMENTALES = 200
+    
     def __init__(self, root):
         """Inicializa la interfaz gráfica."""
         self.root = root
@@ -45,7 +59,18 @@ class SistemaInventarioGUI:
         
         # Inicializar el sistema de inventario
         self.inventario = Inventario()
-        self.operaciones = OperacionesMatriciales(self.inventario)
+        self.vistas = RegistroVistas(self.inventario)
+        self.operaciones = OperacionesMatriciales(self.inventario, self.vistas)
+        self.importador = ImportadorInventario(self.inventario)
+        self.consultas = MotorConsultas(self.inventario)
+        
+        # Refresco incremental de la lista de productos
+        self._grupo_de_producto = {}
+        self._ids_por_grupo = {}
+        self._cambios_pendientes = set()
+        self._refresco_total_pendiente = False
+        self._refresco_programado = False
+        self.inventario.eventos.suscribir(self._al_cambiar_inventario)
         
         # Configurar estilo
         self.configurar_estilos()
@@ -123,6 +148,12 @@ class SistemaInventarioGUI:
                               command=self.cargar_excel)
         btn_excel.pack(side=tk.RIGHT, padx=5)
         
+        # Botón de carga masiva (varios archivos)
+        btn_masiva = ttk.Button(titulo_frame,
+                               text="📚 Carga Masiva",
+                               command=self.cargar_archivos_masivo)
+        btn_masiva.pack(side=tk.RIGHT, padx=5)
+        
         # Botón de exportar base de datos
         btn_exportar = ttk.Button(titulo_frame,
                                  text="💾 Exportar Base de Datos",
@@ -157,6 +188,8 @@ class SistemaInventarioGUI:
             ("📊 Ver Estadísticas", self.ver_estadisticas),
             ("📈 Reporte Completo", self.ver_reporte),
             ("📂 Análisis por Categoría", self.ver_analisis_categoria),
+            ("🔤 Clasificación ABC", self.ver_clasificacion_abc),
+            ("🔎 Consulta Avanzada", self.consulta_avanzada),
             ("➕ Agregar Producto", self.agregar_producto),
             ("✏️ Modificar Producto", self.modificar_producto),
         ]
@@ -195,9 +228,149 @@ class SistemaInventarioGUI:
         )
         self.texto_contenido.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # Barra de navegación de las vistas paginadas (oculta hasta usarla)
+        self.crear_barra_paginacion(contenido_frame)
+        
         # Mensaje de bienvenida
         self.mostrar_mensaje_bienvenida()
     
+    def crear_barra_paginacion(self, parent):
+        """Crea los controles de página, salto y orden de las vistas paginadas."""
+        self._paginador = None
+        self._encabezado_paginado = ""
+        self._pie_paginado = ""
+        
+        self.barra_paginacion = ttk.Frame(parent, padding=(0, 5, 0, 0))
+        self.barra_paginacion.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        
+        for texto, comando in [("⏮", self._primera_pagina), ("◀", self._pagina_anterior),
+                               ("▶", self._pagina_siguiente), ("⏭", self._ultima_pagina)]:
+            ttk.Button(self.barra_paginacion, text=texto, width=3, command=comando).pack(side=tk.LEFT)
+        
+        ttk.Label(self.barra_paginacion, text="  Ir a fila:").pack(side=tk.LEFT)
+        self.entrada_fila = ttk.Entry(self.barra_paginacion, width=8)
+        self.entrada_fila.pack(side=tk.LEFT)
+        self.entrada_fila.bind('<Return>', lambda e: self._ir_a_fila_paginada())
+        
+        ttk.Label(self.barra_paginacion, text="  Buscar ID:").pack(side=tk.LEFT)
+        self.entrada_id = ttk.Entry(self.barra_paginacion, width=8)
+        self.entrada_id.pack(side=tk.LEFT)
+        self.entrada_id.bind('<Return>', lambda e: self._buscar_id_paginado())
+        
+        ttk.Label(self.barra_paginacion, text="  Ordenar por:").pack(side=tk.LEFT)
+        self.combo_orden = ttk.Combobox(self.barra_paginacion, state='readonly', width=14)
+        self.combo_orden.pack(side=tk.LEFT)
+        self.combo_orden.bind('<<ComboboxSelected>>', lambda e: self._ordenar_paginado())
+        self.orden_descendente = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.barra_paginacion, text="Desc.", variable=self.orden_descendente,
+                        command=self._ordenar_paginado).pack(side=tk.LEFT, padx=5)
+        
+        self.barra_paginacion.grid_remove()
+    
+    def _limpiar_contenido(self):
+        """Borra el área de contenido y oculta la navegación de la vista paginada."""
+        self.texto_contenido.delete(1.0, tk.END)
+        self._paginador = None
+        self.barra_paginacion.grid_remove()
+    
+    def _mostrar_paginado(self, encabezado: str, paginador: PaginadorTabla, pie: str = ""):
+        """
+        Muestra una tabla paginada con su barra de navegación.
+        
+        Args:
+            encabezado: Texto fijo sobre la tabla
+            paginador: Tabla a mostrar
+            pie: Texto fijo bajo la tabla
+        """
+        self._limpiar_contenido()
+        self._paginador = paginador
+        self._encabezado_paginado = encabezado
+        self._pie_paginado = pie
+        
+        # Solo las columnas de array se pueden ordenar
+        self.combo_orden['values'] = ["(original)"] + [
+            titulo for titulo, datos, _ in paginador.columnas if not callable(datos)
+        ]
+        self.combo_orden.set(paginador.columna_orden or "(original)")
+        self.orden_descendente.set(paginador.descendente)
+        self.barra_paginacion.grid()
+        self._mostrar_pagina()
+    
+    def _mostrar_pagina(self):
+        """Formatea y muestra solo la página visible de la tabla paginada."""
+        if self._paginador is None:
+            return
+        self.texto_contenido.delete(1.0, tk.END)
+        contenido = self._encabezado_paginado
+        contenido += self._paginador.describir_posicion() + "\n\n"
+        contenido += self._paginador.formatear_pagina()
+        contenido += self._pie_paginado
+        self.texto_contenido.insert(1.0, contenido)
+    
+    def _cambiar_pagina(self, accion):
+        """Aplica una acción de navegación y redibuja la página."""
+        if self._paginador is not None:
+            accion(self._paginador)
+            self._mostrar_pagina()
+    
+    def _primera_pagina(self):
+        """Muestra la primera página."""
+        self._cambiar_pagina(lambda p: p.ir_a_pagina(0))
+    
+    def _pagina_anterior(self):
+        """Muestra la página anterior."""
+        self._cambiar_pagina(PaginadorTabla.anterior)
+    
+    def _pagina_siguiente(self):
+        """Muestra la página siguiente."""
+        self._cambiar_pagina(PaginadorTabla.siguiente)
+    
+    def _ultima_pagina(self):
+        """Muestra la última página."""
+        self._cambiar_pagina(lambda p: p.ir_a_pagina(p.total_paginas - 1))
+    
+    def _ir_a_fila_paginada(self):
+        """Muestra la página que contiene la fila indicada."""
+        try:
+            posicion = int(self.entrada_fila.get())
+        except ValueError:
+            messagebox.showerror("Error", "Ingrese un número de fila válido.")
+            return
+        self._cambiar_pagina(lambda p: p.ir_a_fila(posicion))
+    
+    def _buscar_id_paginado(self):
+        """Muestra la página que contiene el producto con el ID indicado."""
+        if self._paginador is None:
+            return
+        # Las vistas fijas titulan la columna "ID"; las consultas usan el nombre del campo
+        titulo_id = next(
+            (titulo for titulo, _, _ in self._paginador.columnas if titulo.lower() == 'id'), None
+        )
+        if titulo_id is None:
+            messagebox.showinfo("Sin columna ID", "Esta vista no tiene una columna de ID.")
+            return
+        try:
+            producto_id = int(self.entrada_id.get())
+            posicion = self._paginador.buscar(titulo_id, producto_id)
+        except (ValueError, KeyError):
+            messagebox.showerror("Error", "Ingrese un ID válido.")
+            return
+        if posicion is None:
+            messagebox.showinfo("Sin resultados", f"El ID {producto_id} no está en esta vista.")
+            return
+        self._mostrar_pagina()
+    
+    def _ordenar_paginado(self):
+        """Ordena la tabla paginada por la columna elegida."""
+        if self._paginador is None:
+            return
+        columna = self.combo_orden.get()
+        self._paginador.ordenar(
+            None if columna in ("", "(original)") else columna,
+            self.orden_descendente.get()
+        )
+        self._mostrar_pagina()
+    
     def mostrar_mensaje_bienvenida(self):
         """Muestra el mensaje de bienvenida inicial."""
         mensaje = """
@@ -209,7 +382,7 @@ class SistemaInventarioGUI:
 
 📌 Características:
    • Gestión de inventario con operaciones matriciales (NumPy/Pandas)
-   • Carga de inventario desde archivos Excel
+   • Carga de inventario desde archivos Excel, CSV o Parquet
    • Alertas automáticas de stock bajo
    • Estadísticas y reportes en tiempo real
    • Análisis por categorías
@@ -226,7 +399,7 @@ class SistemaInventarioGUI:
 ═══════════════════════════════════════════════════════════════════
 
 """
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
         self.texto_contenido.insert(1.0, mensaje)
     
     def _cargar_datos_ejemplo(self):
@@ -251,7 +424,7 @@ class SistemaInventarioGUI:
     def actualizar_vista_productos(self):
         """Actualiza la vista después de cambios en el inventario."""
         # Limpiar el área de contenido
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
         
         # Si no hay productos, mostrar mensaje de bienvenida
         if not self.inventario.productos:
@@ -263,24 +436,22 @@ class SistemaInventarioGUI:
     # ==================== FUNCIONES DEL MENÚ ====================
     
     def cargar_excel(self):
-        """Permite cargar un archivo Excel con inventario."""
+        """Permite cargar un archivo Excel, CSV o Parquet con inventario."""
         archivo = filedialog.askopenfilename(
-            title="Seleccionar archivo Excel",
-            filetypes=[
-                ("Archivos Excel", "*.xlsx *.xls"),
-                ("Todos los archivos", "*.*")
-            ]
+            title="Seleccionar archivo de inventario",
+            filetypes=self._tipos_archivo() + [("Todos los archivos", "*.*")]
         )
         
         if not archivo:
             return
         
         try:
-            # Leer el archivo Excel
-            df = pd.read_excel(archivo)
+            # Solo el encabezado: el archivo se lee completo después del
+            # mapeo, con las columnas mapeadas y sus tipos explícitos
+            columnas = leer_columnas(archivo)
             
             # Abrir diálogo de mapeo de columnas
-            self.abrir_dialogo_mapeo_columnas(df, archivo)
+            self.abrir_dialogo_mapeo_columnas(columnas, archivo)
             
         except Exception as e:
             messagebox.showerror(
@@ -288,8 +459,47 @@ class SistemaInventarioGUI:
                 f"No se pudo cargar el archivo:\n\n{str(e)}"
             )
     
+    def cargar_archivos_masivo(self):
+        """Carga varios archivos a la vez, leyéndolos en paralelo."""
+        archivos = filedialog.askopenfilenames(
+            title="Seleccionar archivos de inventario",
+            filetypes=self._tipos_archivo() + [("Todos los archivos", "*.*")]
+        )
+        
+        if not archivos:
+            return
+        
+        try:
+            # Las columnas de cada archivo se reconocen por su nombre
+            resumen = self.importador.importar_archivos(
+                list(archivos), procesos=os.cpu_count()
+            )
+            
+            messagebox.showinfo(
+                "Carga Masiva",
+                f"Archivos procesados: {len(archivos)}\n"
+                f"Filas leídas: {resumen['filas']}\n\n{resumen['mensaje']}"
+            )
+            self.actualizar_vista_productos()
+            
+        except Exception as e:
+            messagebox.showerror(
+                "Error en Carga Masiva",
+                f"No se pudieron cargar los archivos:\n\n{str(e)}"
+            )
+    
+    def _tipos_archivo(self) -> list:
+        """Tipos de archivo de inventario disponibles para los diálogos."""
+        tipos = [
+            ("Archivos Excel", "*.xlsx *.xls"),
+            ("Archivos CSV", "*.csv"),
+        ]
+        if parquet_disponible():
+            tipos.append(("Archivos Parquet", "*.parquet"))
+        return tipos
+    
     def exportar_base_datos(self):
-        """Exporta todos los productos actuales a un archivo Excel."""
+        """Exporta todos los productos actuales a un archivo Excel, CSV o Parquet."""
         if not self.inventario.productos:
             messagebox.showwarning(
                 "Sin Datos",
@@ -299,57 +509,91 @@ class SistemaInventarioGUI:
         
         # Solicitar ubicación y nombre del archivo
         archivo = filedialog.asksaveasfilename(
-            title="Guardar Base de Datos como Excel",
+            title="Guardar Base de Datos",
             defaultextension=".xlsx",
             filetypes=[
                 ("Archivos Excel", "*.xlsx"),
-                ("Todos los archivos", "*.*")
-            ],
+                ("Archivos CSV", "*.csv"),
+            ] + [t for t in self._tipos_archivo() if t[1] == "*.parquet"],
             initialfile="inventario_exportado.xlsx"
         )
         
         if not archivo:
             return
         
+        ventana_progreso = None
         try:
-            # Crear lista de diccionarios con todos los productos
-            datos_productos = []
+            # En Excel se pueden agregar hojas de alertas y análisis por categoría
+            hojas_extra = []
+            if detectar_formato(archivo) == "excel" and messagebox.askyesno(
+                "Hojas Adicionales",
+                "¿Desea incluir las hojas de alertas de stock bajo y "
+                "análisis por categoría?"
+            ):
+                hojas_extra = [HOJA_ALERTAS, HOJA_CATEGORIAS]
             
-            for producto in self.inventario.listar_productos():
-                datos_productos.append({
-                    'ID': producto.id,
-                    'Numero_Item': producto.numero_item,
-                    'Codigo_UPC': producto.codigo_upc,
-                    'BIN_Bodega': producto.bin,
-                    'Nombre': producto.nombre,
-                    'Precio': producto.precio,
-                    'Stock_Actual': producto.stock_actual,
-                    'Stock_Minimo': producto.stock_minimo,
-                    'Stock_Maximo': producto.stock_maximo,
-                    'Categoria': producto.categoria
-                })
-            
-            # Crear DataFrame
-            df = pd.DataFrame(datos_productos)
-            
-            # Exportar a Excel
-            df.to_excel(archivo, index=False, sheet_name='Inventario')
+            # Exportar en el formato indicado por la extensión
+            ventana_progreso, reportar_progreso = self._crear_ventana_progreso(
+                "Exportando Base de Datos", len(self.inventario)
+            )
+            cantidad = exportar_inventario(
+                self.inventario, archivo, hojas_extra, progreso=reportar_progreso
+            )
+            ventana_progreso.destroy()
+            ventana_progreso = None
             
             messagebox.showinfo(
                 "Exportación Exitosa",
                 f"Base de datos exportada exitosamente.\n\n"
                 f"Archivo: {archivo.split('/')[-1].split(chr(92))[-1]}\n"
-                f"Productos exportados: {len(datos_productos)}\n\n"
+                f"Productos exportados: {cantidad}\n\n"
                 f"Puede usar este archivo con la opción 'Cargar Excel' "
                 f"para restaurar estos datos en una nueva sesión."
             )
             
         except Exception as e:
+            if ventana_progreso is not None:
+                ventana_progreso.destroy()
             messagebox.showerror(
                 "Error al Exportar",
                 f"No se pudo exportar la base de datos:\n\n{str(e)}"
             )
     
+    def _crear_ventana_progreso(self, titulo: str, total: int):
+        """
+        Crea una ventana con barra de progreso.
+        
+        Args:
+            titulo: Título de la ventana
+            total: Cantidad total de elementos a procesar
+        
+        Returns:
+            Tuple[tk.Toplevel, Callable]: (ventana, función reportar(hechos, total))
+        """
+        ventana = tk.Toplevel(self.root)
+        ventana.title(titulo)
+        ventana.geometry("400x110")
+        ventana.transient(self.root)
+        ventana.resizable(False, False)
+        # Modal: ventana.update() procesa eventos y el usuario no debe poder
+        # modificar el inventario mientras se recorre
+        ventana.grab_set()
+        ventana.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        etiqueta = ttk.Label(ventana, text=f"0 de {total} productos")
+        etiqueta.pack(pady=(20, 10))
+        
+        barra = ttk.Progressbar(ventana, length=340, mode='determinate', maximum=max(total, 1))
+        barra.pack(pady=(0, 20))
+        ventana.update()
+        
+        def reportar(hechos: int, total: int):
+            barra['value'] = hechos
+            etiqueta.config(text=f"{hechos} de {total} productos")
+            ventana.update()
+        
+        return ventana, reportar
+    
     def purgar_base_datos(self):
         """Elimina todos los productos del inventario con confirmación de seguridad."""
         if not self.inventario.productos:
@@ -483,8 +727,7 @@ class SistemaInventarioGUI:
             productos_eliminados = cantidad_productos
             
             # Eliminar todos los productos
-            self.inventario.productos.clear()
-            self.inventario._invalidar_cache()
+            self.inventario.vaciar()
             
             # Actualizar vista
             self.actualizar_vista_productos()
@@ -505,10 +748,10 @@ class SistemaInventarioGUI:
                 f"Ocurrió un error durante la purga:\n\n{str(e)}"
             )
     
-    def abrir_dialogo_mapeo_columnas(self, df: pd.DataFrame, archivo: str):
-        """Abre un diálogo para mapear columnas del Excel a atributos de Producto."""
+    def abrir_dialogo_mapeo_columnas(self, columnas: List[str], archivo: str):
+        """Abre un diálogo para mapear columnas del archivo a atributos de Producto."""
         dialog = tk.Toplevel(self.root)
-        dialog.title("Mapeo de Columnas - Carga de Excel")
+        dialog.title("Mapeo de Columnas - Carga de Archivo")
         dialog.geometry("700x600")
         dialog.transient(self.root)
         dialog.grab_set()
@@ -526,7 +769,7 @@ class SistemaInventarioGUI:
         
         # Título
         ttk.Label(main_frame, 
-                 text="Mapeo de Columnas del Archivo Excel",
+                 text="Mapeo de Columnas del Archivo",
                  style='Subtitle.TLabel').grid(row=0, column=0, columnspan=2, pady=(0, 10))
         
         ttk.Label(main_frame,
@@ -534,7 +777,7 @@ class SistemaInventarioGUI:
                  font=('Segoe UI', 9)).grid(row=1, column=0, columnspan=2, pady=(0, 5))
         
         ttk.Label(main_frame,
-                 text=f"Filas encontradas: {len(df)}",
+                 text=f"Columnas encontradas: {len(columnas)}",
                  font=('Segoe UI', 9)).grid(row=2, column=0, columnspan=2, pady=(0, 15))
         
         # Crear frame con scroll para el mapeo
@@ -556,22 +799,14 @@ class SistemaInventarioGUI:
         main_frame.rowconfigure(3, weight=1)
         main_frame.columnconfigure(0, weight=1)
         
-        # Opciones de columnas del Excel + "No cargar datos"
-        columnas_excel = ["No cargar datos"] + df.columns.tolist()
-        
-        # Atributos de Producto a mapear
-        atributos = [
-            ("ID del Producto", "id", True),
-            ("Número Item (6 dígitos)", "numero_item", True),
-            ("Código UPC", "codigo_upc", True),
-            ("BIN (Ubicación Bodega)", "bin", True),
-            ("Nombre", "nombre", False),
-            ("Precio", "precio", False),
-            ("Stock Actual", "stock_actual", False),
-            ("Stock Mínimo", "stock_minimo", False),
-            ("Stock Máximo", "stock_maximo", False),
-            ("Categoría", "categoria", False),
-        ]
+        # Opciones de columnas del archivo + "No cargar datos"
+        columnas_excel = ["No cargar datos"] + list(columnas)
+        
+        # Atributos de Producto a mapear (compartidos con la consola)
+        atributos = ATRIBUTOS_MAPEO
+        
+        # Preseleccionar columnas con nombres reconocidos (p. ej. archivos exportados)
+        mapeo_sugerido = mapeo_automatico(columnas)
         
         # Diccionario para almacenar los comboboxes
         mapeo_combos = {}
@@ -579,7 +814,7 @@ class SistemaInventarioGUI:
         # Crear encabezados
         ttk.Label(scrollable_frame, text="Atributo del Producto", 
                  font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, padx=10, pady=5, sticky=tk.W)
-        ttk.Label(scrollable_frame, text="Columna del Excel", 
+        ttk.Label(scrollable_frame, text="Columna del Archivo", 
                  font=('Segoe UI', 10, 'bold')).grid(row=0, column=1, padx=10, pady=5, sticky=tk.W)
         
         # Crear comboboxes para cada atributo
@@ -593,7 +828,7 @@ class SistemaInventarioGUI:
             # Combobox para seleccionar columna
             combo = ttk.Combobox(scrollable_frame, values=columnas_excel, 
                                state="readonly", width=30)
-            combo.set("No cargar datos")
+            combo.set(mapeo_sugerido.get(key, "No cargar datos"))
             combo.grid(row=i, column=1, padx=10, pady=5, sticky=(tk.W, tk.E))
             
             mapeo_combos[key] = combo
@@ -642,7 +877,14 @@ class SistemaInventarioGUI:
                 if columna_seleccionada != "No cargar datos":
                     mapeo[key] = columna_seleccionada
             
-            # Procesar los datos
+            # Leer solo las columnas mapeadas y procesar los datos
+            try:
+                df = leer_archivo(archivo, mapeo)
+                # La marca de agua guardada evita reentregar IDs ya usados
+                self.inventario.ids.restaurar(leer_metadatos(archivo))
+            except Exception as e:
+                messagebox.showerror("Error al cargar Excel", f"No se pudo leer el archivo:\n\n{str(e)}")
+                return
             exito, mensaje = self.procesar_datos_excel(df, mapeo)
             
             if exito:
@@ -661,188 +903,24 @@ class SistemaInventarioGUI:
     
     def procesar_datos_excel(self, df: pd.DataFrame, mapeo: dict) -> Tuple[bool, str]:
         """
-        Procesa los datos del Excel y actualiza/agrega productos al inventario.
+        Procesa los datos del archivo y actualiza/agrega productos al inventario.
         
         Args:
-            df: DataFrame con los datos del Excel
-            mapeo: Diccionario que mapea atributos a columnas del Excel
+            df: DataFrame con los datos del archivo
+            mapeo: Diccionario que mapea atributos a columnas del archivo
+        
+        Solo se aplican las filas nuevas o modificadas desde la carga anterior.
         
         Returns:
             Tuple[bool, str]: (éxito, mensaje)
         """
-        productos_agregados = 0
-        productos_actualizados = 0
-        errores = []
-        
-        for idx, fila in df.iterrows():
-            try:
-                # Extraer valores según el mapeo
-                datos_producto = {}
-                
-                # Procesar cada atributo mapeado
-                for atributo, columna_excel in mapeo.items():
-                    valor = fila[columna_excel]
-                    
-                    # Manejar valores NaN o vacíos
-                    if pd.isna(valor) or (isinstance(valor, str) and valor.strip() == ""):
-                        datos_producto[atributo] = "N/D"
-                    else:
-                        datos_producto[atributo] = valor
-                
-                # Determinar si el producto existe (considerando BIN)
-                producto_existente = None
-                bin_value = str(datos_producto.get('bin', 'N/D')) if datos_producto.get('bin') != "N/D" else "N/D"
-                
-                # Buscar por numero_item + BIN
-                if 'numero_item' in datos_producto and datos_producto['numero_item'] != "N/D" and bin_value != "N/D":
-                    producto_existente = self.inventario.obtener_producto_por_numero_item_y_bin(
-                        str(datos_producto['numero_item']), bin_value
-                    )
-                
-                # Si no se encontró, buscar por codigo_upc + BIN
-                if not producto_existente and 'codigo_upc' in datos_producto and datos_producto['codigo_upc'] != "N/D" and bin_value != "N/D":
-                    producto_existente = self.inventario.obtener_producto_por_codigo_upc_y_bin(
-                        str(datos_producto['codigo_upc']), bin_value
-                    )
-                
-                # Si no se encontró y no hay BIN, intentar buscar por id
-                if not producto_existente and 'id' in datos_producto and datos_producto['id'] != "N/D":
-                    try:
-                        producto_existente = self.inventario.obtener_producto(int(datos_producto['id']))
-                    except (ValueError, TypeError):
-                        pass
-                
-                if producto_existente:
-                    # Actualizar producto existente
-                    self._actualizar_producto_existente(producto_existente, datos_producto, mapeo)
-                    productos_actualizados += 1
-                else:
-                    # Crear nuevo producto
-                    nuevo_producto = self._crear_nuevo_producto(datos_producto, mapeo)
-                    if self.inventario.agregar_producto(nuevo_producto):
-                        productos_agregados += 1
-                    else:
-                        errores.append(f"Fila {idx + 2}: No se pudo agregar el producto")
-                        
-            except Exception as e:
-                errores.append(f"Fila {idx + 2}: {str(e)}")
-        
-        # Preparar mensaje final
-        mensaje = f"Proceso completado:\n\n"
-        mensaje += f"✓ Productos agregados: {productos_agregados}\n"
-        mensaje += f"✓ Productos actualizados: {productos_actualizados}\n"
-        
-        if errores:
-            mensaje += f"\n⚠ Errores encontrados: {len(errores)}\n"
-            mensaje += "\n".join(errores[:5])  # Mostrar solo los primeros 5 errores
-            if len(errores) > 5:
-                mensaje += f"\n... y {len(errores) - 5} errores más"
-        
-        return True, mensaje
-    
-    def _actualizar_producto_existente(self, producto: Producto, datos: dict, mapeo: dict):
-        """Actualiza un producto existente con los datos del Excel."""
-        # Actualizar solo los atributos que fueron mapeados
-        if 'nombre' in mapeo and 'nombre' in datos and datos['nombre'] != "N/D":
-            producto.nombre = str(datos['nombre'])
-        
-        if 'precio' in mapeo and 'precio' in datos and datos['precio'] != "N/D":
-            try:
-                producto.precio = float(datos['precio'])
-            except (ValueError, TypeError):
-                pass
-        
-        if 'stock_actual' in mapeo and 'stock_actual' in datos and datos['stock_actual'] != "N/D":
-            try:
-                producto.stock_actual = int(datos['stock_actual'])
-            except (ValueError, TypeError):
-                pass
-        
-        if 'stock_minimo' in mapeo and 'stock_minimo' in datos and datos['stock_minimo'] != "N/D":
-            try:
-                producto.stock_minimo = int(datos['stock_minimo'])
-            except (ValueError, TypeError):
-                pass
-        
-        if 'stock_maximo' in mapeo and 'stock_maximo' in datos and datos['stock_maximo'] != "N/D":
-            try:
-                producto.stock_maximo = int(datos['stock_maximo'])
-            except (ValueError, TypeError):
-                pass
-        
-        if 'categoria' in mapeo and 'categoria' in datos and datos['categoria'] != "N/D":
-            producto.categoria = str(datos['categoria'])
-        
-        if 'numero_item' in mapeo and 'numero_item' in datos and datos['numero_item'] != "N/D":
-            producto.numero_item = str(datos['numero_item'])
-        
-        if 'codigo_upc' in mapeo and 'codigo_upc' in datos and datos['codigo_upc'] != "N/D":
-            producto.codigo_upc = str(datos['codigo_upc'])
-        
-        if 'bin' in mapeo and 'bin' in datos and datos['bin'] != "N/D":
-            producto.bin = str(datos['bin'])
-        
-        # Invalidar caché del inventario
-        self.inventario.notificar_cambio_stock()
-    
-    def _crear_nuevo_producto(self, datos: dict, mapeo: dict) -> Producto:
-        """Crea un nuevo producto con los datos del Excel."""
-        # Generar un ID único si no se proporcionó
-        if 'id' not in datos or datos['id'] == "N/D":
-            # Generar ID basado en el máximo ID actual + 1
-            max_id = max([p.id for p in self.inventario.productos.values()], default=0)
-            producto_id = max_id + 1
-        else:
-            try:
-                producto_id = int(datos['id'])
-            except (ValueError, TypeError):
-                max_id = max([p.id for p in self.inventario.productos.values()], default=0)
-                producto_id = max_id + 1
-        
-        # Extraer valores con valores por defecto
-        nombre = str(datos.get('nombre', 'N/D')) if datos.get('nombre') != "N/D" else "N/D"
-        
-        try:
-            precio = float(datos.get('precio', 0.0)) if datos.get('precio') != "N/D" else 0.0
-        except (ValueError, TypeError):
-            precio = 0.0
-        
-        try:
-            stock_actual = int(datos.get('stock_actual', 0)) if datos.get('stock_actual') != "N/D" else 0
-        except (ValueError, TypeError):
-            stock_actual = 0
-        
-        try:
-            stock_minimo = int(datos.get('stock_minimo', 10)) if datos.get('stock_minimo') != "N/D" else 10
-        except (ValueError, TypeError):
-            stock_minimo = 10
-        
-        try:
-            stock_maximo = int(datos.get('stock_maximo', 100)) if datos.get('stock_maximo') != "N/D" else 100
-        except (ValueError, TypeError):
-            stock_maximo = 100
-        
-        categoria = str(datos.get('categoria', 'N/D')) if datos.get('categoria') != "N/D" else "N/D"
-        numero_item = str(datos.get('numero_item', 'N/D')) if datos.get('numero_item') != "N/D" else "N/D"
-        codigo_upc = str(datos.get('codigo_upc', 'N/D')) if datos.get('codigo_upc') != "N/D" else "N/D"
-        bin_location = str(datos.get('bin', 'N/D')) if datos.get('bin') != "N/D" else "N/D"
-        
-        return Producto(
-            id=producto_id,
-            nombre=nombre,
-            precio=precio,
-            stock_actual=stock_actual,
-            stock_minimo=stock_minimo,
-            stock_maximo=stock_maximo,
-            categoria=categoria,
-            numero_item=numero_item,
-            codigo_upc=codigo_upc,
-            bin=bin_location
-        )
+        resumen = self.importador.importar_diferencial(df, mapeo)
+        return True, resumen['mensaje']
     
     def ver_productos(self):
         """Muestra todos los productos del inventario agrupados por item."""
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
+        self._descartar_cambios_pendientes()
         
         if not self.inventario.productos:
             self.texto_contenido.insert(1.0, "No hay productos en el inventario.")
@@ -851,39 +929,147 @@ class SistemaInventarioGUI:
         # Obtener productos agrupados
         agrupados = self.inventario.obtener_productos_agrupados()
         
-        contenido = """
+        encabezado = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                     LISTA DE PRODUCTOS                            ║
 ║            (Agrupados por Item con Stock por Bodega)              ║
 ╚═══════════════════════════════════════════════════════════════════╝
 
 """
+        self.texto_contenido.insert(tk.END, encabezado, (self.ETIQUETA_VISTA_PRODUCTOS,))
+        
+        # Cada grupo lleva su propia etiqueta para poder redibujarlo solo
         for identificador, productos in agrupados.items():
-            # Obtener información del primer producto (datos comunes)
-            primer_producto = productos[0]
-            
-            # Calcular stock total
-            stock_total = sum(p.stock_actual for p in productos)
+            self._ids_por_grupo[identificador] = [p.id for p in productos]
+            for producto in productos:
+                self._grupo_de_producto[producto.id] = identificador
+            self.texto_contenido.insert(
+                tk.END,
+                self._formatear_grupo(productos),
+                (self.ETIQUETA_VISTA_PRODUCTOS, self._etiqueta_grupo(identificador))
+            )
+    
+    @staticmethod
+    def _formatear_grupo(productos: list) -> str:
+        """Genera el bloque de texto de un grupo de productos del mismo item."""
+        # Obtener información del primer producto (datos comunes)
+        primer_producto = productos[0]
+        
+        # Calcular stock total
+        stock_total = sum(p.stock_actual for p in productos)
+        
+        contenido = f"\n{'═' * 70}\n"
+        contenido += f"📦 {primer_producto.nombre} (Núm. Item: {primer_producto.numero_item})\n"
+        contenido += f"   UPC: {primer_producto.codigo_upc} | Precio: ${primer_producto.precio:.2f}\n"
+        contenido += f"   Categoría: {primer_producto.categoria}\n"
+        contenido += f"   📊 STOCK TOTAL: {stock_total} unidades\n"
+        contenido += f"\n   Desglose por Bodega (BIN):\n"
+        
+        for producto in productos:
+            estado = "⚠️" if producto.necesita_reabastecimiento() else "✓"
+            contenido += f"     {estado} BIN {producto.bin}: {producto.stock_actual} unidades "
+            contenido += f"(ID: {producto.id}, Min: {producto.stock_minimo}, Max: {producto.stock_maximo})\n"
+        
+        contenido += f"{'─' * 70}\n"
+        return contenido
+    
+    @staticmethod
+    def _etiqueta_grupo(identificador: str) -> str:
+        """Nombre de la etiqueta de texto de un grupo."""
+        return f"grupo:{identificador}"
+    
+    def _vista_productos_visible(self) -> bool:
+        """Indica si el área de contenido muestra la lista de productos."""
+        return bool(self.texto_contenido.tag_ranges(self.ETIQUETA_VISTA_PRODUCTOS))
+    
+    def _mostrar_productos_actualizados(self):
+        """Muestra la lista de productos; si ya está visible la refresca el bus de eventos."""
+        if not self._vista_productos_visible():
+            self.actualizar_vista_productos()
+    
+    def _descartar_cambios_pendientes(self):
+        """Olvida los cambios acumulados (la vista se va a redibujar completa)."""
+        self._cambios_pendientes.clear()
+        self._refresco_total_pendiente = False
+        self._grupo_de_producto.clear()
+        self._ids_por_grupo.clear()
+    
+    def _al_cambiar_inventario(self, evento: EventoInventario):
+        """
+        Acumula un cambio del inventario y programa un único refresco.
+        
+        Args:
+            evento: Evento publicado por el inventario
+        """
+        if evento.tipo == EventoInventario.TRANSACCION:
+            if evento.nuevo is None:
+                self._refresco_total_pendiente = True
+            else:
+                self._cambios_pendientes.update(evento.nuevo)
+        elif evento.producto_id is None:
+            self._refresco_total_pendiente = True
+        else:
+            self._cambios_pendientes.add(evento.producto_id)
+            if evento.campo == 'id':
+                # El ID anterior desaparece de su grupo
+                self._cambios_pendientes.add(evento.anterior)
+        
+        if not self._refresco_programado:
+            self._refresco_programado = True
+            self.root.after_idle(self._aplicar_cambios_vista)
+    
+    def _aplicar_cambios_vista(self):
+        """Redibuja solo los grupos afectados por los cambios acumulados."""
+        self._refresco_programado = False
+        if not self._vista_productos_visible():
+            self._descartar_cambios_pendientes()
+            return
+        
+        if (self._refresco_total_pendiente
+                or len(self._cambios_pendientes) > self.MAXIMO_CAMBIOS_INCREMENTALES):
+            self.actualizar_vista_productos()
+            return
+        
+        # Reubicar cada producto cambiado y anotar los grupos que tocan
+        grupos_afectados = set()
+        for producto_id in self._cambios_pendientes:
+            clave_anterior = self._grupo_de_producto.pop(producto_id, None)
+            if clave_anterior is not None:
+                grupos_afectados.add(clave_anterior)
+                self._ids_por_grupo[clave_anterior].remove(producto_id)
             
-            contenido += f"\n{'═' * 70}\n"
-            contenido += f"📦 {primer_producto.nombre} (Núm. Item: {primer_producto.numero_item})\n"
-            contenido += f"   UPC: {primer_producto.codigo_upc} | Precio: ${primer_producto.precio:.2f}\n"
-            contenido += f"   Categoría: {primer_producto.categoria}\n"
-            contenido += f"   📊 STOCK TOTAL: {stock_total} unidades\n"
-            contenido += f"\n   Desglose por Bodega (BIN):\n"
+            producto = self.inventario.obtener_producto(producto_id)
+            if producto is not None:
+                clave = self.inventario.clave_grupo(producto)
+                grupos_afectados.add(clave)
+                self._grupo_de_producto[producto_id] = clave
+                self._ids_por_grupo.setdefault(clave, []).append(producto_id)
+        self._cambios_pendientes.clear()
+        
+        for clave in grupos_afectados:
+            etiqueta = self._etiqueta_grupo(clave)
+            rango = self.texto_contenido.tag_ranges(etiqueta)
+            ids = self._ids_por_grupo.get(clave) or []
+            productos = [self.inventario.productos[i] for i in ids]
             
-            for producto in productos:
-                estado = "⚠️" if producto.necesita_reabastecimiento() else "✓"
-                contenido += f"     {estado} BIN {producto.bin}: {producto.stock_actual} unidades "
-                contenido += f"(ID: {producto.id}, Min: {producto.stock_minimo}, Max: {producto.stock_maximo})\n"
+            if not productos:
+                self._ids_por_grupo.pop(clave, None)
+                if rango:
+                    self.texto_contenido.delete(rango[0], rango[1])
+                continue
             
-            contenido += f"{'─' * 70}\n"
-        
-        self.texto_contenido.insert(1.0, contenido)
+            texto = self._formatear_grupo(productos)
+            etiquetas = (self.ETIQUETA_VISTA_PRODUCTOS, etiqueta)
+            if rango:
+                self.texto_contenido.delete(rango[0], rango[1])
+                self.texto_contenido.insert(rango[0], texto, etiquetas)
+            else:
+                # Grupo nuevo: al final, igual que en la vista completa
+                self.texto_contenido.insert(tk.END, texto, etiquetas)
     
     def ver_matriz(self):
         """Muestra la representación matricial del inventario."""
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
         
         matriz = self.inventario.obtener_matriz_inventario()
         
@@ -891,7 +1077,7 @@ class SistemaInventarioGUI:
             self.texto_contenido.insert(1.0, "No hay productos en el inventario.")
             return
         
-        contenido = """
+        encabezado = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                     MATRIZ DE INVENTARIO                          ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -900,26 +1086,27 @@ Representación matricial I (n × 5):
 Columnas: [ID, Precio, Stock, Mínimo, Máximo]
 
 """
-        # Crear tabla formateada
-        encabezados = ["ID", "Precio", "Stock", "Mínimo", "Máximo"]
-        contenido += f"{'Fila':>5} | " + " | ".join(f"{h:>10}" for h in encabezados) + "\n"
-        contenido += "─" * 70 + "\n"
-        
-        for i, fila in enumerate(matriz):
-            contenido += f"{i:>5} | " + " | ".join(f"{v:>10.2f}" for v in fila) + "\n"
-        
-        contenido += f"\n\nDimensiones de la matriz: {matriz.shape}\n"
-        contenido += f"Tipo de datos: {matriz.dtype}\n"
-        
-        self.texto_contenido.insert(1.0, contenido)
+        # Solo se formatea la página visible; el orden opera sobre las columnas
+        paginador = PaginadorTabla([
+            (titulo, matriz[:, j], ">10.2f")
+            for j, titulo in enumerate(["ID", "Precio", "Stock", "Mínimo", "Máximo"])
+        ])
+        pie = f"\n\nDimensiones de la matriz: {matriz.shape}\n"
+        pie += f"Tipo de datos: {matriz.dtype}\n"
+        
+        self._mostrar_paginado(encabezado, paginador, pie)
+    
+    @staticmethod
+    def _columna_texto(productos: list, atributo: str):
+        """Columna de texto que lee el atributo solo de las filas visibles."""
+        return lambda filas: [str(getattr(productos[i], atributo)) for i in filas]
     
     def ver_alertas(self):
         """Muestra los productos que necesitan reabastecimiento."""
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
         
         vector_alertas = self.operaciones.calcular_alertas_stock_bajo()
-        productos_alerta = self.operaciones.obtener_productos_alerta()
-        sugerencias = self.operaciones.calcular_cantidad_reabastecimiento()
+        filas_alerta = np.flatnonzero(vector_alertas)
         
         contenido = """
 ╔═══════════════════════════════════════════════════════════════════╗
@@ -927,24 +1114,28 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
 ╚═══════════════════════════════════════════════════════════════════╝
 
 """
-        contenido += f"Vector de alertas (booleano): {vector_alertas}\n"
-        contenido += f"Total de alertas: {np.sum(vector_alertas)}\n\n"
+        contenido += f"Total de alertas: {filas_alerta.size} de {vector_alertas.size} productos\n\n"
         
-        if not productos_alerta:
+        if filas_alerta.size == 0:
             contenido += "✓ Todos los productos tienen stock suficiente.\n"
-        else:
-            contenido += "⚠️  PRODUCTOS QUE REQUIEREN REABASTECIMIENTO:\n"
-            contenido += "─" * 70 + "\n\n"
-            
-            productos_lista = self.inventario.listar_productos()
-            for i, producto in enumerate(productos_lista):
-                if vector_alertas[i]:
-                    contenido += f"• {producto.nombre} (ID: {producto.id})\n"
-                    contenido += f"  Stock actual: {producto.stock_actual}\n"
-                    contenido += f"  Stock mínimo: {producto.stock_minimo}\n"
-                    contenido += f"  Sugerencia de compra: {sugerencias[i]} unidades\n\n"
+            self.texto_contenido.insert(1.0, contenido)
+            return
         
-        self.texto_contenido.insert(1.0, contenido)
+        contenido += "⚠️  PRODUCTOS QUE REQUIEREN REABASTECIMIENTO:\n"
+        contenido += "─" * 70 + "\n\n"
+        
+        matriz = self.inventario.obtener_matriz_inventario()
+        productos = self.inventario.listar_productos()
+        paginador = PaginadorTabla([
+            ("ID", matriz[:, 0], ".0f"),
+            ("Nombre", self._columna_texto(productos, 'nombre'), "<30"),
+            ("BIN", self._columna_texto(productos, 'bin'), ""),
+            ("Stock", matriz[:, 2], ".0f"),
+            ("Mínimo", matriz[:, 3], ".0f"),
+            ("Sugerencia", self.operaciones.calcular_cantidad_reabastecimiento(), ".0f"),
+        ], filas=filas_alerta)
+        
+        self._mostrar_paginado(contenido, paginador)
     
     def registrar_entrada(self):
         """Abre un diálogo para registrar entrada de productos."""
@@ -983,7 +1174,7 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
                 if exito:
                     messagebox.showinfo("Éxito", mensaje)
                     dialog.destroy()
-                    self.actualizar_vista_productos()
+                    self._mostrar_productos_actualizados()
                 else:
                     messagebox.showerror("Error", mensaje)
                     
@@ -1034,7 +1225,7 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
                 if exito:
                     messagebox.showinfo("Éxito", mensaje)
                     dialog.destroy()
-                    self.actualizar_vista_productos()
+                    self._mostrar_productos_actualizados()
                 else:
                     messagebox.showerror("Error", mensaje)
                     
@@ -1050,7 +1241,7 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
     
     def ver_estadisticas(self):
         """Muestra estadísticas del inventario."""
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
         
         stats = self.operaciones.calcular_estadisticas()
         
@@ -1079,12 +1270,12 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
         self.texto_contenido.insert(1.0, contenido)
     
     def ver_reporte(self):
-        """Muestra el reporte completo como DataFrame."""
-        self.texto_contenido.delete(1.0, tk.END)
+        """Muestra el reporte completo, paginado sobre los vectores del inventario."""
+        self._limpiar_contenido()
         
-        df = self.operaciones.generar_reporte_dataframe()
+        matriz = self.inventario.obtener_matriz_inventario()
         
-        if df.empty:
+        if matriz.size == 0:
             self.texto_contenido.insert(1.0, "No hay datos para mostrar.")
             return
         
@@ -1094,14 +1285,38 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
 ╚═══════════════════════════════════════════════════════════════════╝
 
 """
-        contenido += df.to_string(index=False)
-        contenido += "\n"
-        
-        self.texto_contenido.insert(1.0, contenido)
+        # Las mismas columnas que generar_reporte_dataframe, sin armar el
+        # DataFrame: los textos se leen solo para la página visible
+        productos = self.inventario.listar_productos()
+        categorias = np.array(self.inventario.categorias, dtype=object)
+        codigos = self.inventario.obtener_codigos_categoria()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ocupacion = np.round(matriz[:, 2] / matriz[:, 4] * 100, 2)
+        
+        paginador = PaginadorTabla([
+            ("ID", matriz[:, 0], ".0f"),
+            ("Núm. Item", self._columna_texto(productos, 'numero_item'), ""),
+            ("UPC", self._columna_texto(productos, 'codigo_upc'), ""),
+            ("BIN", self._columna_texto(productos, 'bin'), ""),
+            ("Nombre", self._columna_texto(productos, 'nombre'), "<30"),
+            ("Categoría", lambda filas: categorias[codigos[filas]], ""),
+            ("Precio", matriz[:, 1], ".2f"),
+            ("Stock", matriz[:, 2], ".0f"),
+            ("Mínimo", matriz[:, 3], ".0f"),
+            ("Máximo", matriz[:, 4], ".0f"),
+            ("Valor", self.operaciones.calcular_vector_valores(), ",.2f"),
+            ("Alerta", self.operaciones.calcular_alertas_stock_bajo(), "d"),
+            ("Espacio", self.operaciones.calcular_espacio_disponible(), ".0f"),
+            ("Sugerencia", self.operaciones.calcular_cantidad_reabastecimiento(), ".0f"),
+            ("ABC", self.operaciones.clasificar_abc(), ""),
+            ("% Ocup.", ocupacion, ".2f"),
+        ])
+        
+        self._mostrar_paginado(contenido, paginador)
     
     def ver_analisis_categoria(self):
         """Muestra el análisis agrupado por categoría."""
-        self.texto_contenido.delete(1.0, tk.END)
+        self._limpiar_contenido()
         
         df = self.operaciones.analisis_por_categoria()
         
@@ -1120,6 +1335,141 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
         
         self.texto_contenido.insert(1.0, contenido)
     
+    def ver_clasificacion_abc(self):
+        """Muestra la clasificación ABC por valor de inventario o de consumo, paginada."""
+        self._limpiar_contenido()
+        
+        base = "consumo" if messagebox.askyesno(
+            "Clasificación ABC",
+            "¿Clasificar por consumo (precio × unidades salidas) en vez de valor en stock?"
+        ) else "valor"
+        resumen = self.operaciones.resumen_abc(base)
+        
+        if resumen.empty:
+            self.texto_contenido.insert(1.0, "No hay datos para mostrar.")
+            return
+        
+        contenido = f"""
+╔═══════════════════════════════════════════════════════════════════╗
+║                  CLASIFICACIÓN ABC (PARETO)                       ║
+╚═══════════════════════════════════════════════════════════════════╝
+
+Base: {base}
+
+"""
+        contenido += resumen.to_string()
+        contenido += "\n\n"
+        
+        # Columnas del caché tipado; los textos se leen solo para la página visible
+        columnas = self.inventario.obtener_columnas()
+        productos = self.inventario.listar_productos()
+        categorias = np.array(self.inventario.categorias, dtype=object)
+        codigos = self.inventario.obtener_codigos_categoria()
+        valores = (
+            self.operaciones.calcular_vector_valores() if base == "valor"
+            else self.operaciones.calcular_vector_consumo()
+        )
+        titulo_valor = "Valor" if base == "valor" else "Consumo"
+        
+        paginador = PaginadorTabla([
+            ("Clase", self.operaciones.clasificar_abc(base), ""),
+            ("ID", columnas['id'], "d"),
+            ("Nombre", self._columna_texto(productos, 'nombre'), "<30"),
+            ("Categoría", lambda filas: categorias[codigos[filas]], ""),
+            (titulo_valor, valores, ",.2f"),
+        ])
+        paginador.ordenar(titulo_valor, descendente=True)
+        
+        self._mostrar_paginado(contenido, paginador)
+    
+    def consulta_avanzada(self):
+        """Abre un diálogo para filtrar, ordenar y limitar el inventario."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Consulta Avanzada")
+        dialog.geometry("620x300")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        frame = ttk.Frame(dialog, padding="20")
+        frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        ttk.Label(frame, text="Condición:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        donde_entry = ttk.Entry(frame, width=60)
+        donde_entry.grid(row=0, column=1, pady=5)
+        donde_entry.insert(0, 'categoria == "Electrónica" and precio > 100')
+        
+        ttk.Label(frame, text="Columnas:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        columnas_entry = ttk.Entry(frame, width=60)
+        columnas_entry.grid(row=1, column=1, pady=5)
+        
+        ttk.Label(frame, text="Ordenar por:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        orden_entry = ttk.Entry(frame, width=60)
+        orden_entry.grid(row=2, column=1, pady=5)
+        
+        descendente_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Descendente", variable=descendente_var).grid(
+            row=3, column=1, sticky=tk.W, pady=5
+        )
+        
+        ttk.Label(frame, text="Límite:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        limite_entry = ttk.Entry(frame, width=60)
+        limite_entry.grid(row=4, column=1, pady=5)
+        
+        ttk.Label(
+            frame,
+            text="Campos: id, precio, stock, minimo, maximo, ocupacion, valor, pasillo, "
+                 "rack, nivel, categoria, bin, item, upc, nombre"
+        ).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        def confirmar():
+            columnas = [c.strip() for c in columnas_entry.get().split(",") if c.strip()]
+            limite = limite_entry.get().strip()
+            try:
+                resultado = self.consultas.consultar(
+                    donde_entry.get().strip() or None,
+                    columnas=columnas or None,
+                    ordenar_por=orden_entry.get().strip() or None,
+                    descendente=descendente_var.get(),
+                    limite=int(limite) if limite else None
+                )
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+            
+            dialog.destroy()
+            self._mostrar_resultado_consulta(donde_entry.get().strip(), resultado)
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.grid(row=6, column=0, columnspan=2, pady=15)
+        
+        ttk.Button(btn_frame, text="Consultar", command=confirmar).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancelar", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+    
+    def _mostrar_resultado_consulta(self, donde: str, resultado: pd.DataFrame):
+        """Muestra paginado el resultado de una consulta avanzada."""
+        self._limpiar_contenido()
+        
+        contenido = f"""
+╔═══════════════════════════════════════════════════════════════════╗
+║                       CONSULTA AVANZADA                           ║
+╚═══════════════════════════════════════════════════════════════════╝
+
+Condición: {donde or '(todas las filas)'}
+Resultado: {len(resultado)} productos
+
+"""
+        if resultado.empty:
+            self.texto_contenido.insert(1.0, contenido + "Ningún producto cumple la condición.\n")
+            return
+        
+        formatos = {'f': ".2f", 'i': "d", 'u': "d"}
+        paginador = PaginadorTabla([
+            (columna, resultado[columna].to_numpy(), formatos.get(resultado[columna].dtype.kind, ""))
+            for columna in resultado.columns
+        ])
+        
+        self._mostrar_paginado(contenido, paginador)
+    
     def agregar_producto(self):
         """Abre un diálogo para agregar un nuevo producto."""
         dialog = tk.Toplevel(self.root)
@@ -1139,7 +1489,7 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
         
         # Campos del formulario
         campos = [
-            ("ID del Producto:", "id"),
+            ("ID del Producto (vacío = automático):", "id"),
             ("Número Item (6 dígitos):", "numero_item"),
             ("Código UPC:", "codigo_upc"),
             ("BIN (Ej: 001/020/006):", "bin"),
@@ -1160,7 +1510,8 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
         
         def confirmar():
             try:
-                producto_id = int(entries['id'].get())
+                texto_id = entries['id'].get().strip()
+                producto_id = int(texto_id) if texto_id else self.inventario.nuevo_id()
                 numero_item = entries['numero_item'].get().strip() or "N/D"
                 codigo_upc = entries['codigo_upc'].get().strip() or "N/D"
                 bin_location = entries['bin'].get().strip() or "N/D"
@@ -1174,10 +1525,34 @@ Columnas: [ID, Precio, Stock, Mínimo, Máximo]
                 producto = Producto(producto_id, nombre, precio, stock, minimo, maximo, 
                                   categoria, numero_item, codigo_upc, bin_location)
                 
-                if self.inventario.agregar_producto(producto):
-                    messagebox.showinfo("Éxito", f"Producto '{nombre}' agregado exitosamente en BIN {bin_location}.")
+                # Un BIN nuevo de un item existente comparte sus datos maestros
+                actualizar_item = False
+                conflictos = self.inventario.conflictos_ficha(producto)
+                if conflictos:
+                    detalle = "\n".join(
+                        f"- {campo}: '{actual}' (item) / '{propio}' (ingresado)"
+                        for campo, (actual, propio) in conflictos.items()
+                    )
+                    respuesta = messagebox.askyesnocancel(
+                        "Item existente",
+                        f"El item {self.inventario.clave_grupo(producto)} ya existe con otros datos:\n"
+                        f"{detalle}\n\n"
+                        "¿Actualizar el item (en todos sus BINs) con los datos ingresados?\n"
+                        "Sí: actualizar · No: conservar los datos del item · Cancelar: no agregar",
+                        parent=dialog
+                    )
+                    if respuesta is None:
+                        return
+                    actualizar_item = respuesta
+                
+                if self.inventario.agregar_producto(producto, actualizar_item):
+                    messagebox.showinfo(
+                        "Éxito",
+                        f"Producto '{producto.nombre}' (precio ${producto.precio:.2f}, "
+                        f"categoría {producto.categoria}) agregado exitosamente en BIN {bin_location}."
+                    )
                     dialog.destroy()
-                    self.actualizar_vista_productos()
+                    self._mostrar_productos_actualizados()
                 else:
                     messagebox.showerror("Error", f"Ya existe un producto con ID {producto_id}.")
                     
@@ -1394,22 +1769,15 @@ Categoría: {producto.categoria}"""
                     messagebox.showerror("Error", "El stock no puede ser negativo.")
                     return
                 
-                # Si se cambió el ID, verificar que no exista otro producto con ese ID
-                if nuevo_id != producto.id and self.inventario.obtener_producto(nuevo_id) is not None:
+                # Cambiar el ID (falla si otro producto ya lo usa)
+                if not self.inventario.cambiar_id(producto.id, nuevo_id):
                     messagebox.showerror(
                         "Error",
                         f"Ya existe un producto con ID {nuevo_id}.\nNo se puede cambiar el ID a uno existente."
                     )
                     return
                 
-                # Aplicar cambios
-                # Si cambió el ID, necesitamos eliminar el antiguo y crear uno nuevo
-                if nuevo_id != producto.id:
-                    self.inventario.eliminar_producto(producto.id)
-                    producto.id = nuevo_id
-                    self.inventario.productos[nuevo_id] = producto
-                
-                # Actualizar atributos
+                # Actualizar atributos (el inventario se entera de cada cambio)
                 producto.numero_item = nuevo_numero_item
                 producto.codigo_upc = nuevo_codigo_upc
                 producto.bin = nuevo_bin
@@ -1420,17 +1788,13 @@ Categoría: {producto.categoria}"""
                 producto.stock_maximo = nuevo_maximo
                 producto.categoria = nueva_categoria
                 
-                # Invalidar caché
-                self.inventario._invalidar_cache()
-                
                 messagebox.showinfo(
                     "Éxito",
                     f"Producto '{producto.nombre}' modificado exitosamente."
                 )
                 dialog.destroy()
-                self.actualizar_vista_productos()
-                self.ver_productos()
-                
+                self._mostrar_productos_actualizados()
+            
             except ValueError as e:
                 messagebox.showerror(
                     "Error de Validación",
@@ -1472,4 +1836,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # En el ejecutable congelado, los procesos de la carga masiva deben
+    # ejecutar su tarea y no volver a abrir la aplicación
+    multiprocessing.freeze_support()
     main()
@@ -6,5 +6,34 @@ para el cálculo eficiente de stock, entradas, salidas y alertas.
 """
 
 from logic.operaciones_matriciales import OperacionesMatriciales
+from logic.inventario_particionado import InventarioParticionado
+from logic.matriz_compartida import MatrizCompartida
+from logic.pronostico_demanda import PronosticoDemanda
+from logic.reabastecimiento import MotorReabastecimiento
+from logic.simulacion_riesgo import SimulacionRiesgo
+from logic.importacion import ImportadorInventario
+from logic.indice_bins import IndiceBins
+from logic.historial_stock import HistorialStock
+from logic.rotacion import MetricasRotacion
+from logic.slotting import OptimizadorSlotting
+from logic.paginacion import PaginadorTabla
+from logic.consultas import MotorConsultas
+from logic.vistas_materializadas import RegistroVistas, VistaMaterializada
 
-__all__ = ['OperacionesMatriciales']
+__all__ = [
+    'OperacionesMatriciales',
+    'InventarioParticionado',
+    'MatrizCompartida',
+    'PronosticoDemanda',
+    'MotorReabastecimiento',
+    'SimulacionRiesgo',
+    'ImportadorInventario',
+    'IndiceBins',
+    'HistorialStock',
+    'MetricasRotacion',
+    'OptimizadorSlotting',
+    'PaginadorTabla',
+    'MotorConsultas',
+    'RegistroVistas',
+    'VistaMaterializada',
+]
@@ -0,0 +1,606 @@
+"""
+Módulo de lectura y escritura de archivos de inventario.
+
+Soporta tres formatos de intercambio:
+- Excel (.xlsx, .xls): mediante openpyxl, el más lento de los tres
+- CSV (.csv): lectura por bloques con tipos de datos explícitos
+- Parquet (.parquet): formato columnar, si hay un motor instalado
+  (pyarrow o fastparquet)
+
+Todos los formatos comparten el mismo modelo de mapeo de columnas que el
+diálogo de carga de la interfaz gráfica: un diccionario
+{atributo_del_producto: columna_del_archivo}.
+"""
+
+import os
+from itertools import islice
+from operator import attrgetter
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional
+from models.inventario import Inventario
+from logic.operaciones_matriciales import OperacionesMatriciales
+
+
+FORMATO_EXCEL = "excel"
+FORMATO_CSV = "csv"
+FORMATO_PARQUET = "parquet"
+
+# Extensiones reconocidas para cada formato
+EXTENSIONES = {
+    '.xlsx': FORMATO_EXCEL,
+    '.xls': FORMATO_EXCEL,  # solo lectura: openpyxl escribe únicamente .xlsx
+    '.csv': FORMATO_CSV,
+    '.parquet': FORMATO_PARQUET,
+    '.pq': FORMATO_PARQUET,
+}
+
+# Extensiones que se pueden leer pero no exportar
+EXTENSIONES_SOLO_LECTURA = ('.xls',)
+
+# Atributos de Producto que se pueden mapear: (etiqueta, atributo, es_identificador)
+ATRIBUTOS_MAPEO = [
+    ("ID del Producto", "id", True),
+    ("Número Item (6 dígitos)", "numero_item", True),
+    ("Código UPC", "codigo_upc", True),
+    ("BIN (Ubicación Bodega)", "bin", True),
+    ("Nombre", "nombre", False),
+    ("Precio", "precio", False),
+    ("Stock Actual", "stock_actual", False),
+    ("Stock Mínimo", "stock_minimo", False),
+    ("Stock Máximo", "stock_maximo", False),
+    ("Categoría", "categoria", False),
+]
+
+# Encabezados usados al exportar (y reconocidos al importar)
+COLUMNAS_EXPORTACION = {
+    'id': 'ID',
+    'numero_item': 'Numero_Item',
+    'codigo_upc': 'Codigo_UPC',
+    'bin': 'BIN_Bodega',
+    'nombre': 'Nombre',
+    'precio': 'Precio',
+    'stock_actual': 'Stock_Actual',
+    'stock_minimo': 'Stock_Minimo',
+    'stock_maximo': 'Stock_Maximo',
+    'categoria': 'Categoria',
+}
+
+# Atributos de texto: se leen como cadenas para conservar ceros a la izquierda
+ATRIBUTOS_TEXTO = ('numero_item', 'codigo_upc', 'bin', 'nombre', 'categoria')
+
+# Atributos numéricos: se leen como float64 para admitir celdas vacías (NaN)
+ATRIBUTOS_NUMERICOS = ('id', 'precio', 'stock_actual', 'stock_minimo', 'stock_maximo')
+
+TAMANO_BLOQUE_TABLA = 100_000
+TAMANO_BLOQUE_EXCEL = 5_000
+
+# Hojas adicionales disponibles en la exportación a Excel
+HOJA_ALERTAS = "alertas"
+HOJA_CATEGORIAS = "categorias"
+
+
+def detectar_formato(ruta: str) -> str:
+    """
+    Determina el formato de un archivo por su extensión.
+    
+    Args:
+        ruta: Ruta del archivo
+    
+    Returns:
+        str: 'excel', 'csv' o 'parquet'
+    
+    Raises:
+        ValueError: Si la extensión no es reconocida
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension not in EXTENSIONES:
+        raise ValueError(f"Formato de archivo no soportado: '{extension}'")
+    return EXTENSIONES[extension]
+
+
+def parquet_disponible() -> bool:
+    """
+    Verifica si hay un motor de Parquet instalado.
+    
+    Returns:
+        bool: True si pyarrow o fastparquet están disponibles
+    """
+    for motor in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(motor)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def _verificar_parquet():
+    """Lanza un error descriptivo si no hay motor de Parquet (uso interno)."""
+    if not parquet_disponible():
+        raise ImportError(
+            "Para usar archivos Parquet instale un motor opcional: pip install pyarrow"
+        )
+
+
+def tipos_columnas(mapeo: Dict[str, str]) -> Dict[str, type]:
+    """
+    Construye los tipos de datos explícitos para las columnas mapeadas.
+    
+    Args:
+        mapeo: Diccionario {atributo: columna del archivo}
+    
+    Returns:
+        Dict[str, type]: {columna del archivo: tipo}
+    """
+    tipos = {}
+    for atributo, columna in mapeo.items():
+        if atributo in ATRIBUTOS_TEXTO:
+            tipos[columna] = str
+        elif atributo in ATRIBUTOS_NUMERICOS:
+            tipos[columna] = np.float64
+    return tipos
+
+
+def mapeo_automatico(columnas: List[str]) -> Dict[str, str]:
+    """
+    Propone un mapeo reconociendo los nombres de atributo o de exportación.
+    
+    La comparación ignora mayúsculas, espacios y guiones bajos, por lo que
+    un archivo exportado por el sistema se mapea completo sin intervención.
+    
+    Args:
+        columnas: Nombres de columnas del archivo
+    
+    Returns:
+        Dict[str, str]: Diccionario {atributo: columna del archivo}
+    """
+    def normalizar(texto) -> str:
+        return str(texto).lower().replace(' ', '').replace('_', '')
+    
+    disponibles = {normalizar(c): c for c in columnas}
+    mapeo = {}
+    for _, atributo, _ in ATRIBUTOS_MAPEO:
+        for candidato in (atributo, COLUMNAS_EXPORTACION[atributo]):
+            columna = disponibles.get(normalizar(candidato))
+            if columna is not None:
+                mapeo[atributo] = columna
+                break
+    return mapeo
+
+
+# =============================================================================
+# LECTURA
+# =============================================================================
+
+def leer_csv(ruta: str, mapeo: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Lee un archivo CSV.
+    
+    Con un mapeo, solo se leen las columnas mapeadas y con tipos explícitos,
+    lo que evita la inferencia de tipos y conserva ceros a la izquierda en
+    códigos como el UPC.
+    
+    Args:
+        ruta: Ruta del archivo CSV
+        mapeo: Diccionario {atributo: columna}; None para leer todo
+    
+    Returns:
+        pd.DataFrame: Datos del archivo
+    """
+    opciones = {}
+    if mapeo:
+        opciones['usecols'] = list(dict.fromkeys(mapeo.values()))
+        opciones['dtype'] = tipos_columnas(mapeo)
+    
+    try:
+        return pd.read_csv(ruta, **opciones)
+    except ValueError:
+        # Alguna columna numérica trae texto: leerla sin tipo y validar por fila
+        if not mapeo:
+            raise
+        opciones['dtype'] = {
+            columna: tipo for columna, tipo in opciones['dtype'].items() if tipo is str
+        }
+        return pd.read_csv(ruta, **opciones)
+
+
+def leer_parquet(ruta: str, mapeo: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Lee un archivo Parquet (solo las columnas mapeadas si hay mapeo).
+    
+    Args:
+        ruta: Ruta del archivo Parquet
+        mapeo: Diccionario {atributo: columna}; None para leer todo
+    
+    Returns:
+        pd.DataFrame: Datos del archivo
+    
+    Raises:
+        ImportError: Si no hay un motor de Parquet instalado
+    """
+    _verificar_parquet()
+    columnas = list(dict.fromkeys(mapeo.values())) if mapeo else None
+    return pd.read_parquet(ruta, columns=columnas)
+
+
+def leer_excel(ruta: str, mapeo: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Lee un archivo Excel (solo las columnas mapeadas y con tipos si hay mapeo).
+    
+    Args:
+        ruta: Ruta del archivo Excel
+        mapeo: Diccionario {atributo: columna}; None para leer todo
+    
+    Returns:
+        pd.DataFrame: Datos del archivo
+    """
+    if not mapeo:
+        return pd.read_excel(ruta)
+    
+    columnas = list(dict.fromkeys(mapeo.values()))
+    tipos = tipos_columnas(mapeo)
+    try:
+        return pd.read_excel(ruta, usecols=columnas, dtype=tipos)
+    except ValueError:
+        # Alguna columna numérica trae texto: leerla sin tipo y validar por fila
+        tipos = {columna: tipo for columna, tipo in tipos.items() if tipo is str}
+        return pd.read_excel(ruta, usecols=columnas, dtype=tipos)
+
+
+def leer_columnas(ruta: str) -> List[str]:
+    """
+    Lee solo los nombres de columnas de un archivo, sin cargar sus filas.
+    
+    Permite armar el mapeo antes de la lectura completa, que luego se hace
+    solo con las columnas mapeadas y con tipos explícitos.
+    
+    Args:
+        ruta: Ruta del archivo
+    
+    Returns:
+        List[str]: Nombres de las columnas
+    """
+    formato = detectar_formato(ruta)
+    if formato == FORMATO_CSV:
+        return pd.read_csv(ruta, nrows=0).columns.tolist()
+    if formato == FORMATO_PARQUET:
+        _verificar_parquet()
+        try:
+            import pyarrow.parquet as pq
+            return list(pq.read_schema(ruta).names)
+        except ImportError:
+            return pd.read_parquet(ruta).columns.tolist()
+    return pd.read_excel(ruta, nrows=0).columns.tolist()
+
+
+def leer_archivo(ruta: str, mapeo: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Lee un archivo de inventario en cualquiera de los formatos soportados.
+    
+    Args:
+        ruta: Ruta del archivo (el formato se deduce de la extensión)
+        mapeo: Diccionario {atributo: columna}; None para leer todo
+    
+    Returns:
+        pd.DataFrame: Datos del archivo
+    """
+    formato = detectar_formato(ruta)
+    if formato == FORMATO_CSV:
+        return leer_csv(ruta, mapeo)
+    if formato == FORMATO_PARQUET:
+        return leer_parquet(ruta, mapeo)
+    return leer_excel(ruta, mapeo)
+
+
+# =============================================================================
+# ESCRITURA
+# =============================================================================
+
+def inventario_a_dataframe(inventario: Inventario) -> pd.DataFrame:
+    """
+    Convierte el inventario al formato de exportación, columna por columna.
+    
+    Args:
+        inventario: Inventario a exportar
+    
+    Returns:
+        pd.DataFrame: Columnas con los encabezados de COLUMNAS_EXPORTACION
+    """
+    productos = inventario.listar_productos()
+    return pd.DataFrame({
+        encabezado: [getattr(p, atributo) for p in productos]
+        for atributo, encabezado in COLUMNAS_EXPORTACION.items()
+    })
+
+
+def _bloques_exportacion(inventario: Inventario, tamano_bloque: int):
+    """
+    Genera el formato de exportación por bloques de productos (uso interno).
+    
+    Recorre una instantánea de los productos: el progreso puede ceder el
+    control a la interfaz y modificar el inventario entre bloques.
+    """
+    extraer = attrgetter(*COLUMNAS_EXPORTACION)
+    encabezados = list(COLUMNAS_EXPORTACION.values())
+    productos = iter(list(inventario.productos.values()))
+    
+    while True:
+        bloque = list(islice(productos, tamano_bloque))
+        if not bloque:
+            break
+        yield pd.DataFrame.from_records(map(extraer, bloque), columns=encabezados)
+
+
+def _escribir_hoja_alertas(libro, inventario: Inventario):
+    """Agrega la hoja de productos con stock bajo (uso interno)."""
+    hoja = libro.create_sheet('Alertas')
+    hoja.append(['ID', 'Nombre', 'BIN_Bodega', 'Stock_Actual', 'Stock_Minimo', 'Faltante'])
+    
+    # Misma condición que calcular_alertas_stock_bajo: s < min
+    for producto in inventario.productos.values():
+        if producto.stock_actual < producto.stock_minimo:
+            hoja.append([
+                producto.id, producto.nombre, producto.bin,
+                producto.stock_actual, producto.stock_minimo,
+                producto.stock_minimo - producto.stock_actual
+            ])
+
+
+def _escribir_hoja_categorias(libro, inventario: Inventario):
+    """
+    Agrega la hoja de análisis por categoría (uso interno).
+    
+    Usa `OperacionesMatriciales.analisis_por_categoria`, que agrega con
+    np.bincount sobre los códigos de categoría del inventario.
+    """
+    hoja = libro.create_sheet('Categorias')
+    hoja.append([
+        'Categoria', 'cantidad_productos', 'total_unidades',
+        'valor_total', 'precio_promedio'
+    ])
+    
+    analisis = OperacionesMatriciales(inventario).analisis_por_categoria()
+    for categoria, fila in zip(analisis.index, analisis.itertuples(index=False)):
+        hoja.append([
+            categoria, int(fila.cantidad_productos), int(fila.total_unidades),
+            float(fila.valor_total), float(fila.precio_promedio)
+        ])
+
+
+def _escribir_metadatos(libro, inventario: Inventario):
+    """Guarda el estado del asignador de IDs como propiedades del libro (uso interno)."""
+    from openpyxl.packaging.custom import IntProperty
+    
+    for clave, valor in inventario.ids.a_dict().items():
+        libro.custom_doc_props.append(IntProperty(name=clave, value=int(valor)))
+
+
+def leer_metadatos(ruta: str) -> Dict[str, int]:
+    """
+    Lee los metadatos guardados por la exportación a Excel.
+    
+    Args:
+        ruta: Ruta del archivo
+    
+    Returns:
+        Dict[str, int]: Propiedades enteras del libro; vacío si el archivo
+            no es Excel
+    """
+    if detectar_formato(ruta) != FORMATO_EXCEL:
+        return {}
+    
+    from openpyxl import load_workbook
+    
+    libro = load_workbook(ruta, read_only=True)
+    try:
+        return {
+            propiedad.name: int(propiedad.value)
+            for propiedad in libro.custom_doc_props.props
+            if isinstance(propiedad.value, int)
+        }
+    finally:
+        libro.close()
+
+
+def exportar_excel_streaming(
+    inventario: Inventario,
+    ruta: str,
+    hojas_extra: Iterable[str] = (),
+    tamano_bloque: int = TAMANO_BLOQUE_EXCEL,
+    progreso: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Exporta el inventario a Excel con un libro de openpyxl de solo escritura.
+    
+    Las filas se escriben directamente desde los productos, por bloques,
+    sin construir diccionarios ni un DataFrame intermedio. El libro de
+    solo escritura envía cada fila a disco, por lo que la memoria usada
+    no crece con la cantidad de productos.
+    
+    Args:
+        inventario: Inventario a exportar
+        ruta: Ruta del archivo .xlsx de destino
+        hojas_extra: Hojas adicionales ('alertas', 'categorias')
+        tamano_bloque: Filas escritas entre cada reporte de progreso
+        progreso: Función llamada con (filas_escritas, total) tras cada bloque
+    
+    Returns:
+        int: Cantidad de productos exportados
+    
+    Raises:
+        ValueError: Si se pide una hoja adicional desconocida
+    """
+    from openpyxl import Workbook
+    
+    hojas_extra = list(hojas_extra)
+    escritores = {
+        HOJA_ALERTAS: _escribir_hoja_alertas,
+        HOJA_CATEGORIAS: _escribir_hoja_categorias,
+    }
+    for nombre in hojas_extra:
+        if nombre not in escritores:
+            raise ValueError(f"Hoja adicional no válida: '{nombre}'")
+    
+    libro = Workbook(write_only=True)
+    hoja = libro.create_sheet('Inventario')
+    hoja.append(list(COLUMNAS_EXPORTACION.values()))
+    
+    extraer = attrgetter(*COLUMNAS_EXPORTACION)
+    total = len(inventario)
+    escritas = 0
+    # Instantánea: el progreso puede ceder el control a la interfaz
+    productos = iter(list(inventario.productos.values()))
+    
+    while True:
+        bloque = list(islice(productos, tamano_bloque))
+        if not bloque:
+            break
+        for producto in bloque:
+            hoja.append(extraer(producto))
+        escritas += len(bloque)
+        if progreso:
+            progreso(escritas, total)
+    
+    for nombre in hojas_extra:
+        escritores[nombre](libro, inventario)
+    _escribir_metadatos(libro, inventario)
+    
+    libro.save(ruta)
+    return escritas
+
+
+def exportar_csv_por_bloques(
+    inventario: Inventario,
+    ruta: str,
+    tamano_bloque: int = TAMANO_BLOQUE_TABLA,
+    progreso: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Exporta el inventario a CSV agregando un bloque de filas a la vez.
+    
+    Solo un bloque del formato de exportación está en memoria; el archivo
+    se crea con los encabezados y cada bloque se anexa al final.
+    
+    Args:
+        inventario: Inventario a exportar
+        ruta: Ruta del archivo .csv de destino
+        tamano_bloque: Filas escritas entre cada reporte de progreso
+        progreso: Función llamada con (filas_escritas, total) tras cada bloque
+    
+    Returns:
+        int: Cantidad de productos exportados
+    """
+    pd.DataFrame(columns=list(COLUMNAS_EXPORTACION.values())).to_csv(ruta, index=False)
+    
+    total = len(inventario)
+    escritas = 0
+    for df in _bloques_exportacion(inventario, tamano_bloque):
+        df.to_csv(ruta, mode='a', header=False, index=False)
+        escritas += len(df)
+        if progreso:
+            progreso(escritas, total)
+    return escritas
+
+
+def exportar_parquet_por_bloques(
+    inventario: Inventario,
+    ruta: str,
+    tamano_bloque: int = TAMANO_BLOQUE_TABLA,
+    progreso: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Exporta el inventario a Parquet escribiendo un grupo de filas por bloque.
+    
+    Con pyarrow cada bloque se escribe como un grupo de filas del mismo
+    archivo. fastparquet no anexa grupos a un archivo en escritura, por lo
+    que con ese motor la tabla se escribe de una vez.
+    
+    Args:
+        inventario: Inventario a exportar
+        ruta: Ruta del archivo .parquet de destino
+        tamano_bloque: Filas escritas entre cada reporte de progreso
+        progreso: Función llamada con (filas_escritas, total) tras cada bloque
+    
+    Returns:
+        int: Cantidad de productos exportados
+    
+    Raises:
+        ImportError: Si no hay un motor de Parquet instalado
+    """
+    _verificar_parquet()
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        df = inventario_a_dataframe(inventario)
+        df.to_parquet(ruta, index=False)
+        if progreso:
+            progreso(len(df), len(df))
+        return len(df)
+    
+    total = len(inventario)
+    escritas = 0
+    escritor = None
+    try:
+        for df in _bloques_exportacion(inventario, tamano_bloque):
+            tabla = pa.Table.from_pandas(df, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(ruta, tabla.schema)
+            escritor.write_table(tabla.cast(escritor.schema))
+            escritas += len(df)
+            if progreso:
+                progreso(escritas, total)
+    finally:
+        if escritor is not None:
+            escritor.close()
+    
+    if escritor is None:
+        # Inventario vacío: el archivo lleva solo el esquema
+        inventario_a_dataframe(inventario).to_parquet(ruta, index=False)
+    return escritas
+
+
+def exportar_inventario(
+    inventario: Inventario,
+    ruta: str,
+    hojas_extra: Iterable[str] = (),
+    progreso: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Exporta el inventario en el formato indicado por la extensión del archivo.
+    
+    Los archivos exportados se pueden volver a cargar con `leer_archivo`
+    y `mapeo_automatico`. Todos los formatos se escriben por bloques y
+    reportan el progreso tras cada uno.
+    
+    Las hojas adicionales y los metadatos (la marca de agua de IDs, como
+    propiedades del libro) solo se incluyen en Excel; CSV y Parquet
+    contienen únicamente la tabla de productos y, al cargarlos, la marca
+    de agua se recupera de los IDs presentes.
+    
+    Args:
+        inventario: Inventario a exportar
+        ruta: Ruta del archivo de destino
+        hojas_extra: Hojas adicionales para Excel ('alertas', 'categorias')
+        progreso: Función llamada con (filas_escritas, total)
+    
+    Returns:
+        int: Cantidad de productos exportados
+    
+    Raises:
+        ValueError: Si la extensión no es reconocida o es de solo lectura (.xls)
+        ImportError: Si se pide Parquet y no hay un motor instalado
+    """
+    formato = detectar_formato(ruta)
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in EXTENSIONES_SOLO_LECTURA:
+        raise ValueError(
+            f"El formato '{extension}' solo se puede leer; exporte a .xlsx"
+        )
+    
+    if formato == FORMATO_EXCEL:
+        return exportar_excel_streaming(inventario, ruta, hojas_extra, progreso=progreso)
+    if formato == FORMATO_CSV:
+        return exportar_csv_por_bloques(inventario, ruta, progreso=progreso)
+    return exportar_parquet_por_bloques(inventario, ruta, progreso=progreso)
@@ -0,0 +1,664 @@
+"""
+Módulo de consultas vectorizadas sobre el inventario.
+
+Traduce condiciones escritas como texto a máscaras booleanas de NumPy
+sobre las columnas del inventario, sin recorrer los productos en Python:
+
+    categoria == "Electrónica" and precio > 100 and ocupacion < 20 and pasillo == 3
+    stock < minimo or contiene(nombre, "cable")
+    categoria in ["Audio", "Accesorios"] and not empieza(bin, "001/")
+
+Lenguaje de consulta:
+=====================
+
+- Campos: id, precio, stock, minimo, maximo, ocupacion (stock / máximo, en
+  %), valor (stock · precio), pasillo, rack, nivel (del BIN; -1 si no tiene
+  formato XXX/XXX/XXX), categoria, bin, item, upc y nombre. También se
+  aceptan los nombres de atributo de Producto (stock_actual, numero_item...).
+- Comparaciones ==, !=, <, <=, >, >= (encadenables: 10 <= precio < 50),
+  pertenencia in / not in sobre una lista de constantes y aritmética
+  + - * / entre campos numéricos.
+- Conectores and, or, not y paréntesis.
+- Funciones de texto contiene(campo, "texto") (sin distinguir mayúsculas),
+  empieza(campo, "prefijo") y termina(campo, "sufijo").
+
+La expresión se interpreta con el módulo `ast` (nunca con eval) y se
+compila una sola vez a un plan: una función de las columnas a la máscara.
+Los planes se guardan en un caché por texto de la consulta, de modo que
+repetir una consulta solo cuesta las operaciones vectoriales.
+"""
+
+import ast
+import operator
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, FrozenSet, Optional, Sequence
+from models.inventario import Inventario
+from models.eventos import EventoInventario
+from logic.indice_bins import BASE_COORDENADA, empaquetar, parsear_bin
+
+
+# Tipos de valor del lenguaje
+NUMERO = "numero"
+TEXTO = "texto"
+CATEGORIA = "categoria"
+BOOLEANO = "booleano"
+
+# Campos consultables y su tipo
+CAMPOS = {
+    'id': NUMERO, 'precio': NUMERO, 'stock': NUMERO, 'minimo': NUMERO, 'maximo': NUMERO,
+    'ocupacion': NUMERO, 'valor': NUMERO, 'pasillo': NUMERO, 'rack': NUMERO, 'nivel': NUMERO,
+    'categoria': CATEGORIA, 'bin': TEXTO, 'item': TEXTO, 'upc': TEXTO, 'nombre': TEXTO,
+}
+
+# Nombres alternativos de los campos (atributos de Producto)
+ALIAS = {
+    'stock_actual': 'stock', 'stock_minimo': 'minimo', 'stock_maximo': 'maximo',
+    'numero_item': 'item', 'codigo_upc': 'upc',
+}
+
+# Atributo de Producto de cada campo de texto
+ATRIBUTOS_TEXTO = {'bin': 'bin', 'item': 'numero_item', 'upc': 'codigo_upc', 'nombre': 'nombre'}
+
+# Columnas de `consultar` cuando no se indican
+COLUMNAS_POR_DEFECTO = ('id', 'item', 'nombre', 'categoria', 'bin', 'precio', 'stock', 'minimo', 'maximo')
+
+# Campos que cambian con el stock y el precio (no invalidan los textos)
+_CAMPOS_NUMERICOS_PRODUCTO = ('precio', 'stock_actual', 'stock_minimo', 'stock_maximo')
+
+# Operadores de Python (no ufuncs) para que los textos se comparen también con NumPy 1.x
+_COMPARADORES = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+
+_ARITMETICOS = {
+    ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply, ast.Div: np.true_divide,
+}
+
+_FUNCIONES_TEXTO = ('contiene', 'empieza', 'termina')
+
+
+def normalizar_campo(nombre: str) -> str:
+    """
+    Obtiene el nombre canónico de un campo consultable.
+    
+    Args:
+        nombre: Campo o alias (por ejemplo, 'stock_actual')
+    
+    Returns:
+        str: Nombre del campo en CAMPOS
+    
+    Raises:
+        ValueError: Si el campo no existe
+    """
+    campo = ALIAS.get(nombre, nombre)
+    if campo not in CAMPOS:
+        raise ValueError(
+            f"Campo desconocido '{nombre}'. Campos válidos: {', '.join(CAMPOS)}"
+        )
+    return campo
+
+
+class PlanConsulta:
+    """
+    Condición compilada, lista para evaluarse sobre las columnas.
+    
+    Atributos:
+        expresion (str): Texto de la condición
+        campos (FrozenSet[str]): Campos que lee la condición
+        _evaluar (Callable): Función de las columnas a la máscara
+    """
+    
+    __slots__ = ('expresion', 'campos', '_evaluar')
+    
+    def __init__(self, expresion: str, campos: FrozenSet[str], evaluar: Callable):
+        """
+        Crea el plan.
+        
+        Args:
+            expresion: Texto de la condición
+            campos: Campos que lee la condición
+            evaluar: Función que recibe las columnas y retorna la máscara
+        """
+        self.expresion = expresion
+        self.campos = campos
+        self._evaluar = evaluar
+    
+    def evaluar(self, columnas: "ColumnasConsulta") -> np.ndarray:
+        """
+        Evalúa la condición sobre todas las filas.
+        
+        Args:
+            columnas: Columnas del inventario
+        
+        Returns:
+            np.ndarray: Máscara booleana alineada con las filas
+        """
+        return np.broadcast_to(self._evaluar(columnas), (len(columnas),))
+    
+    def __repr__(self) -> str:
+        """Representación string del plan."""
+        return f"PlanConsulta({self.expresion!r})"
+
+
+class _Compilador:
+    """
+    Traduce el árbol sintáctico de una condición a funciones vectoriales (uso interno).
+    
+    Cada nodo se compila a un par (función de las columnas, tipo del valor)
+    para rechazar en la compilación comparaciones sin sentido, como un
+    texto contra un número.
+    """
+    
+    def __init__(self):
+        """Inicializa el registro de campos leídos."""
+        self.campos = set()
+    
+    def compilar(self, nodo: ast.AST):
+        """Compila un nodo y retorna (función, tipo)."""
+        metodo = getattr(self, f"_{type(nodo).__name__}", None)
+        if metodo is None:
+            raise ValueError(f"Construcción no permitida en la consulta: {type(nodo).__name__}")
+        return metodo(nodo)
+    
+    def _Expression(self, nodo):
+        """Raíz de la consulta: debe producir una condición."""
+        funcion, tipo = self.compilar(nodo.body)
+        if tipo != BOOLEANO:
+            raise ValueError("La consulta debe ser una condición (por ejemplo, precio > 100)")
+        return funcion, tipo
+    
+    def _Constant(self, nodo):
+        """Número, texto o booleano literal."""
+        valor = nodo.value
+        if isinstance(valor, bool):
+            return (lambda columnas: valor), BOOLEANO
+        if isinstance(valor, (int, float)):
+            return (lambda columnas: valor), NUMERO
+        if isinstance(valor, str):
+            return (lambda columnas: valor), TEXTO
+        raise ValueError(f"Constante no permitida: {valor!r}")
+    
+    def _Name(self, nodo):
+        """Campo del inventario."""
+        campo = normalizar_campo(nodo.id)
+        self.campos.add(campo)
+        return (lambda columnas: columnas[campo]), CAMPOS[campo]
+    
+    def _UnaryOp(self, nodo):
+        """not, signo negativo o positivo."""
+        funcion, tipo = self.compilar(nodo.operand)
+        if isinstance(nodo.op, ast.Not) and tipo == BOOLEANO:
+            return (lambda columnas: np.logical_not(funcion(columnas))), BOOLEANO
+        if isinstance(nodo.op, ast.USub) and tipo == NUMERO:
+            return (lambda columnas: np.negative(funcion(columnas))), NUMERO
+        if isinstance(nodo.op, ast.UAdd) and tipo == NUMERO:
+            return funcion, NUMERO
+        raise ValueError("Operador unario no válido para ese valor")
+    
+    def _BinOp(self, nodo):
+        """Aritmética entre valores numéricos."""
+        operacion = _ARITMETICOS.get(type(nodo.op))
+        izquierda, tipo_izq = self.compilar(nodo.left)
+        derecha, tipo_der = self.compilar(nodo.right)
+        if operacion is None or tipo_izq != NUMERO or tipo_der != NUMERO:
+            raise ValueError("La aritmética solo admite + - * / entre valores numéricos")
+        
+        def evaluar(columnas):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return operacion(izquierda(columnas), derecha(columnas))
+        return evaluar, NUMERO
+    
+    def _BoolOp(self, nodo):
+        """and / or entre condiciones."""
+        partes = []
+        for valor in nodo.values:
+            funcion, tipo = self.compilar(valor)
+            if tipo != BOOLEANO:
+                raise ValueError("'and' y 'or' deben unir condiciones")
+            partes.append(funcion)
+        
+        if isinstance(nodo.op, ast.And):
+            def evaluar(columnas):
+                mascara = partes[0](columnas)
+                for parte in partes[1:]:
+                    # Sin filas que sobrevivan no hace falta evaluar el resto
+                    if not np.any(mascara):
+                        break
+                    mascara = mascara & parte(columnas)
+                return mascara
+        else:
+            def evaluar(columnas):
+                mascara = partes[0](columnas)
+                for parte in partes[1:]:
+                    mascara = mascara | parte(columnas)
+                return mascara
+        return evaluar, BOOLEANO
+    
+    def _Compare(self, nodo):
+        """Comparación, posiblemente encadenada (10 <= precio < 50)."""
+        comparaciones = []
+        izquierda = self.compilar(nodo.left)
+        for operador, derecho in zip(nodo.ops, nodo.comparators):
+            if isinstance(operador, (ast.In, ast.NotIn)):
+                derecha = self._lista(derecho)
+                comparaciones.append(self._pertenencia(izquierda, derecha, isinstance(operador, ast.NotIn)))
+            else:
+                derecha = self.compilar(derecho)
+                comparaciones.append(self._comparacion(izquierda, type(operador), derecha))
+            izquierda = derecha
+        
+        if len(comparaciones) == 1:
+            return comparaciones[0], BOOLEANO
+        
+        def evaluar(columnas):
+            mascara = comparaciones[0](columnas)
+            for comparacion in comparaciones[1:]:
+                mascara = mascara & comparacion(columnas)
+            return mascara
+        return evaluar, BOOLEANO
+    
+    def _lista(self, nodo):
+        """Compila la lista de constantes de un 'in' (uso interno)."""
+        if not isinstance(nodo, (ast.List, ast.Tuple, ast.Set)):
+            raise ValueError("'in' requiere una lista de constantes, por ejemplo [1, 2, 3]")
+        valores, tipos = [], set()
+        for elemento in nodo.elts:
+            signo = 1
+            if isinstance(elemento, ast.UnaryOp) and isinstance(elemento.op, ast.USub):
+                signo, elemento = -1, elemento.operand
+            if not isinstance(elemento, ast.Constant) or isinstance(elemento.value, bool):
+                raise ValueError("'in' requiere una lista de constantes")
+            valor = elemento.value
+            if isinstance(valor, str):
+                if signo < 0:
+                    raise ValueError("'in' requiere una lista de constantes")
+                tipos.add(TEXTO)
+            else:
+                valor = signo * valor
+                tipos.add(NUMERO)
+            valores.append(valor)
+        if len(tipos) > 1:
+            raise ValueError("La lista de 'in' mezcla textos y números")
+        tipo = tipos.pop() if tipos else NUMERO
+        return (lambda columnas: valores), tipo
+    
+    @staticmethod
+    def _compatibles(tipo_izq: str, tipo_der: str) -> bool:
+        """Indica si dos tipos se pueden comparar (uso interno)."""
+        if CATEGORIA in (tipo_izq, tipo_der):
+            return {tipo_izq, tipo_der} <= {CATEGORIA, TEXTO}
+        return tipo_izq == tipo_der and tipo_izq != BOOLEANO
+    
+    def _comparacion(self, izquierda, operador, derecha):
+        """Compila una comparación simple (uso interno)."""
+        funcion_izq, tipo_izq = izquierda
+        funcion_der, tipo_der = derecha
+        if not self._compatibles(tipo_izq, tipo_der):
+            raise ValueError(f"No se puede comparar un valor {tipo_izq} con uno {tipo_der}")
+        comparar = _COMPARADORES[operador]
+        
+        if CATEGORIA in (tipo_izq, tipo_der):
+            if operador not in (ast.Eq, ast.NotEq):
+                raise ValueError("La categoría solo admite ==, != e in")
+            if tipo_izq == tipo_der:
+                return lambda columnas: comparar(funcion_izq(columnas), funcion_der(columnas))
+            # El texto se traduce al código de la categoría al evaluar
+            if tipo_izq == TEXTO:
+                funcion_izq, funcion_der = funcion_der, funcion_izq
+            return lambda columnas: comparar(
+                funcion_izq(columnas), columnas.codigo_categoria(funcion_der(columnas))
+            )
+        
+        return lambda columnas: comparar(funcion_izq(columnas), funcion_der(columnas))
+    
+    def _pertenencia(self, izquierda, derecha, negada: bool):
+        """Compila un 'in' o 'not in' (uso interno)."""
+        funcion_izq, tipo_izq = izquierda
+        funcion_der, tipo_der = derecha
+        if tipo_izq == BOOLEANO or not self._compatibles(tipo_izq, tipo_der):
+            raise ValueError(f"No se puede buscar un valor {tipo_izq} en una lista de {tipo_der}")
+        
+        if tipo_izq == CATEGORIA:
+            def evaluar(columnas):
+                codigos = [columnas.codigo_categoria(valor) for valor in funcion_der(columnas)]
+                return np.isin(funcion_izq(columnas), codigos, invert=negada)
+        else:
+            def evaluar(columnas):
+                return np.isin(funcion_izq(columnas), funcion_der(columnas), invert=negada)
+        return evaluar
+    
+    def _Call(self, nodo):
+        """Funciones de texto contiene, empieza y termina."""
+        nombre = nodo.func.id if isinstance(nodo.func, ast.Name) else None
+        if nombre not in _FUNCIONES_TEXTO:
+            raise ValueError(f"Función desconocida. Funciones válidas: {', '.join(_FUNCIONES_TEXTO)}")
+        if len(nodo.args) != 2 or nodo.keywords or not isinstance(nodo.args[0], ast.Name):
+            raise ValueError(f"Uso: {nombre}(campo, \"texto\")")
+        if not isinstance(nodo.args[1], ast.Constant) or not isinstance(nodo.args[1].value, str):
+            raise ValueError(f"El segundo argumento de {nombre} debe ser un texto")
+        
+        campo = normalizar_campo(nodo.args[0].id)
+        if CAMPOS[campo] not in (TEXTO, CATEGORIA):
+            raise ValueError(f"{nombre} solo se aplica a campos de texto")
+        self.campos.add(campo)
+        texto = nodo.args[1].value
+        
+        if nombre == 'contiene':
+            buscado = texto.lower()
+            return (lambda columnas: np.char.find(columnas.minusculas(campo), buscado) >= 0), BOOLEANO
+        if nombre == 'empieza':
+            return (lambda columnas: np.char.startswith(columnas.texto(campo), texto)), BOOLEANO
+        return (lambda columnas: np.char.endswith(columnas.texto(campo), texto)), BOOLEANO
+
+
+@lru_cache(maxsize=256)
+def compilar(expresion: str) -> PlanConsulta:
+    """
+    Compila una condición a un plan, con caché por texto de la consulta.
+    
+    El plan no depende de un inventario en particular: las categorías se
+    traducen a códigos al evaluar, así que un mismo plan sirve para
+    cualquier inventario y sobrevive a los cambios de datos.
+    
+    Args:
+        expresion: Condición en el lenguaje de consulta
+    
+    Returns:
+        PlanConsulta: Plan compilado
+    
+    Raises:
+        ValueError: Si la condición tiene errores de sintaxis, campos
+            desconocidos o comparaciones entre tipos incompatibles
+    """
+    try:
+        arbol = ast.parse(expresion.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Error de sintaxis en la consulta: {e.msg}") from None
+    
+    compilador = _Compilador()
+    funcion, _ = compilador.compilar(arbol)
+    return PlanConsulta(expresion, frozenset(compilador.campos), funcion)
+
+
+class ColumnasConsulta:
+    """
+    Columnas de una evaluación, calculadas la primera vez que se leen.
+    
+    Las columnas numéricas salen del caché tipado del inventario; las de
+    texto y las coordenadas del BIN, del caché del motor.
+    
+    Atributos:
+        motor (MotorConsultas): Motor que provee los textos
+        _tipadas (Dict[str, np.ndarray]): Columnas de `Inventario.obtener_columnas`
+        _calculadas (Dict[str, np.ndarray]): Columnas ya calculadas en esta evaluación
+    """
+    
+    def __init__(self, motor: "MotorConsultas"):
+        """
+        Prepara las columnas de una evaluación.
+        
+        Args:
+            motor: Motor de consultas
+        """
+        self.motor = motor
+        self._tipadas = motor.inventario.obtener_columnas()
+        self._calculadas: Dict[str, np.ndarray] = {}
+    
+    def __len__(self) -> int:
+        """Cantidad de filas."""
+        return len(self._tipadas['id'])
+    
+    def __getitem__(self, campo: str) -> np.ndarray:
+        """Columna de un campo, en el orden de las filas del inventario."""
+        try:
+            return self._calculadas[campo]
+        except KeyError:
+            valores = self._calcular(campo)
+            self._calculadas[campo] = valores
+            return valores
+    
+    def _calcular(self, campo: str) -> np.ndarray:
+        """Calcula una columna (uso interno)."""
+        tipadas = self._tipadas
+        if campo == 'id':
+            return tipadas['id']
+        if campo == 'precio':
+            return tipadas['precio_centavos'] / 100
+        if campo in ('stock', 'minimo', 'maximo'):
+            return tipadas['stock_' + {'stock': 'actual', 'minimo': 'minimo', 'maximo': 'maximo'}[campo]]
+        if campo == 'valor':
+            return tipadas['precio_centavos'] * tipadas['stock_actual'] / 100
+        if campo == 'ocupacion':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return tipadas['stock_actual'] / tipadas['stock_maximo'] * 100
+        if campo == 'categoria':
+            return self.motor.inventario.obtener_codigos_categoria()
+        if campo in ('pasillo', 'rack', 'nivel'):
+            return self.motor.coordenadas_bin()[campo]
+        return self.motor.texto(campo)
+    
+    def codigo_categoria(self, categoria: str) -> int:
+        """
+        Código de una categoría sin registrarla.
+        
+        Returns:
+            int: Posición en `Inventario.categorias`, o -1 si no existe
+        """
+        try:
+            return self.motor.inventario.categorias.index(categoria)
+        except ValueError:
+            return -1
+    
+    def texto(self, campo: str) -> np.ndarray:
+        """Valores de un campo como texto (la categoría, por su nombre)."""
+        if campo == 'categoria':
+            nombres = np.array(self.motor.inventario.categorias, dtype=str)
+            return nombres[self['categoria']] if nombres.size else np.array([], dtype=str)
+        return self[campo]
+    
+    def minusculas(self, campo: str) -> np.ndarray:
+        """Valores de un campo de texto en minúsculas (para `contiene`)."""
+        clave = f"{campo}:minusculas"
+        if clave not in self._calculadas:
+            self._calculadas[clave] = np.char.lower(self.texto(campo))
+        return self._calculadas[clave]
+
+
+class MotorConsultas:
+    """
+    Motor de consultas vectorizadas sobre las columnas del inventario.
+    
+    Las columnas de texto (BIN, item, UPC, nombre) y las coordenadas del
+    BIN se arman una sola vez y se conservan mientras no cambien productos,
+    IDs o atributos de texto; los cambios de stock y precio no las invalidan.
+    
+    Atributos:
+        inventario (Inventario): Inventario consultado
+        _textos (Dict[str, np.ndarray]): Columnas de texto ya armadas
+        _coordenadas (Optional[Dict[str, np.ndarray]]): pasillo, rack y nivel
+        _total (int): Cantidad de productos cuando se armaron los textos
+        _vigente (bool): Indica si los textos reflejan el inventario
+    
+    Ejemplo:
+        >>> motor = MotorConsultas(inventario)
+        >>> motor.consultar(
+        ...     'categoria == "Electrónica" and precio > 100 and ocupacion < 20',
+        ...     columnas=['id', 'nombre', 'precio', 'ocupacion'],
+        ...     ordenar_por='precio', descendente=True, limite=10
+        ... )
+    """
+    
+    def __init__(self, inventario: Inventario):
+        """
+        Crea el motor y lo suscribe a los cambios del inventario.
+        
+        Args:
+            inventario: Inventario a consultar
+        """
+        self.inventario = inventario
+        self._textos: Dict[str, np.ndarray] = {}
+        self._coordenadas: Optional[Dict[str, np.ndarray]] = None
+        self._total = 0
+        self._vigente = False
+        inventario.eventos.suscribir(self._al_cambiar_inventario)
+    
+    def _al_cambiar_inventario(self, evento: EventoInventario):
+        """Descarta los textos si el cambio puede afectarlos (uso interno)."""
+        if evento.tipo == EventoInventario.STOCK:
+            return
+        if evento.tipo == EventoInventario.ATRIBUTOS and evento.campo in _CAMPOS_NUMERICOS_PRODUCTO:
+            return
+        self._vigente = False
+    
+    def _asegurar_vigente(self):
+        """Descarta los textos armados si quedaron desactualizados (uso interno)."""
+        if self._vigente and self._total == len(self.inventario.productos):
+            return
+        self._textos = {}
+        self._coordenadas = None
+        self._total = len(self.inventario.productos)
+        self._vigente = True
+    
+    def texto(self, campo: str) -> np.ndarray:
+        """
+        Columna de texto de un campo, alineada con las filas del inventario.
+        
+        Args:
+            campo: 'bin', 'item', 'upc' o 'nombre'
+        
+        Returns:
+            np.ndarray: Textos (dtype str)
+        """
+        self._asegurar_vigente()
+        if campo not in self._textos:
+            atributo = ATRIBUTOS_TEXTO[campo]
+            self._textos[campo] = np.array(
+                [str(getattr(p, atributo)) for p in self.inventario.productos.values()], dtype=str
+            )
+        return self._textos[campo]
+    
+    def coordenadas_bin(self) -> Dict[str, np.ndarray]:
+        """
+        Pasillo, rack y nivel de cada fila, interpretando cada BIN distinto una vez.
+        
+        Returns:
+            Dict[str, np.ndarray]: Columnas 'pasillo', 'rack' y 'nivel'
+                (-1 si el BIN no tiene formato XXX/XXX/XXX)
+        """
+        self._asegurar_vigente()
+        if self._coordenadas is None:
+            distintos, posiciones = np.unique(self.texto('bin'), return_inverse=True)
+            codigos = np.array([
+                -1 if c is None else empaquetar(*c)
+                for c in map(parsear_bin, distintos.tolist())
+            ], dtype=np.int64)[posiciones]
+            valido = codigos >= 0
+            self._coordenadas = {
+                'pasillo': np.where(valido, codigos // (BASE_COORDENADA * BASE_COORDENADA), -1),
+                'rack': np.where(valido, (codigos // BASE_COORDENADA) % BASE_COORDENADA, -1),
+                'nivel': np.where(valido, codigos % BASE_COORDENADA, -1),
+            }
+        return self._coordenadas
+    
+    def filtrar(self, donde: Optional[str] = None) -> np.ndarray:
+        """
+        Filas del inventario que cumplen una condición.
+        
+        Args:
+            donde: Condición en el lenguaje de consulta (None = todas)
+        
+        Returns:
+            np.ndarray: Filas (en el orden de `obtener_matriz_inventario`)
+        
+        Raises:
+            ValueError: Si la condición no es válida
+        """
+        columnas = ColumnasConsulta(self)
+        if not donde or not donde.strip():
+            return np.arange(len(columnas))
+        return np.flatnonzero(compilar(donde.strip()).evaluar(columnas))
+    
+    def contar(self, donde: Optional[str] = None) -> int:
+        """
+        Cuenta los productos que cumplen una condición.
+        
+        Returns:
+            int: Cantidad de filas que cumplen
+        """
+        return int(self.filtrar(donde).size)
+    
+    def ids(self, donde: Optional[str] = None) -> np.ndarray:
+        """
+        IDs de los productos que cumplen una condición.
+        
+        Returns:
+            np.ndarray: IDs en el orden de las filas
+        """
+        return self.inventario.obtener_columnas()['id'][self.filtrar(donde)]
+    
+    def consultar(
+        self,
+        donde: Optional[str] = None,
+        columnas: Optional[Sequence[str]] = None,
+        ordenar_por: Optional[str] = None,
+        descendente: bool = False,
+        limite: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Ejecuta una consulta con proyección, orden y límite.
+        
+        La condición se evalúa como máscara sobre todas las filas; las
+        columnas pedidas se leen solo para las filas resultantes.
+        
+        Args:
+            donde: Condición en el lenguaje de consulta (None = todas las filas)
+            columnas: Campos a devolver (None = COLUMNAS_POR_DEFECTO)
+            ordenar_por: Campo de orden (None = orden del inventario)
+            descendente: Mayor a menor
+            limite: Máximo de filas a devolver (None = todas)
+        
+        Returns:
+            pd.DataFrame: Una fila por producto, con los campos pedidos
+        
+        Raises:
+            ValueError: Si la condición, un campo o el límite no son válidos
+        """
+        campos = [normalizar_campo(c) for c in (columnas or COLUMNAS_POR_DEFECTO)]
+        if limite is not None and limite < 0:
+            raise ValueError("El límite no puede ser negativo")
+        
+        datos = ColumnasConsulta(self)
+        if donde and donde.strip():
+            filas = np.flatnonzero(compilar(donde.strip()).evaluar(datos))
+        else:
+            filas = np.arange(len(datos))
+        
+        if ordenar_por is not None:
+            campo_orden = normalizar_campo(ordenar_por)
+            clave = datos.texto(campo_orden) if CAMPOS[campo_orden] == CATEGORIA else datos[campo_orden]
+            valores = clave[filas]
+            if descendente:
+                # Invertir dos veces mantiene la estabilidad entre valores iguales
+                orden = len(valores) - 1 - np.argsort(valores[::-1], kind='stable')[::-1]
+            else:
+                orden = np.argsort(valores, kind='stable')
+            filas = filas[orden]
+        
+        if limite is not None:
+            filas = filas[:limite]
+        
+        resultado = {}
+        for campo in campos:
+            if CAMPOS[campo] == CATEGORIA:
+                resultado[campo] = datos.texto(campo)[filas]
+            else:
+                resultado[campo] = datos[campo][filas]
+        return pd.DataFrame(resultado, columns=campos)
+    
+    def __repr__(self) -> str:
+        """Representación string del motor."""
+        return f"MotorConsultas(productos={len(self.inventario.productos)})"
@@ -0,0 +1,538 @@
+"""
+Módulo de historial comprimido del stock por producto.
+
+Registra cada cambio de `stock_actual` como un punto (producto, instante,
+stock) y lo guarda en bloques por ventana de tiempo. Cada bloque se
+almacena por columnas, ordenado por producto y con codificación delta,
+de modo que un movimiento ocupa unos pocos bytes. Con una ruta, los
+bloques cerrados se guardan como archivos `.npy` y se abren mapeados en
+memoria (np.load con mmap_mode='r'), sin cargarlos completos en RAM.
+
+Modelo Matemático:
+==================
+
+1. CODIFICACIÓN DE UN BLOQUE
+
+   Los puntos se ordenan por (producto, instante). Para el tramo
+   [iₚ, iₚ₊₁) del producto p se guarda:
+   
+   base_tiempoₚ = t[iₚ] − t₀        base_stockₚ = s[iₚ]
+   Δtₖ = t[k] − t[k−1]              Δsₖ = s[k] − s[k−1]     (0 al inicio del tramo)
+   
+   Cada columna usa el tipo entero más pequeño que contiene sus valores
+   (int8, uint16, ...), elegido por bloque.
+
+2. DECODIFICACIÓN
+
+   t[k] = t₀ + base_tiempoₚ + Σ Δt (desde iₚ hasta k)
+   s[k] = base_stockₚ + Σ Δs (desde iₚ hasta k)
+   
+   Para un producto solo se decodifica su tramo (búsqueda binaria sobre
+   los IDs del bloque); para todos se usa una suma acumulada segmentada.
+
+3. STOCK EN UNA FECHA D
+
+   stockₚ(D) = s del último punto de p con t ≤ D
+   
+   Cada bloque guarda además el stock final de cada producto, así los
+   bloques que terminan antes de D no se decodifican: solo se decodifica
+   el bloque que contiene a D.
+"""
+
+import os
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from models.inventario import Inventario
+from models.eventos import EventoInventario
+
+
+Instante = Union[None, int, float, str, pd.Timestamp]
+
+# Columnas guardadas por cada bloque
+COLUMNAS_BLOQUE = (
+    'meta', 'ids', 'inicios', 'base_tiempo', 'base_stock',
+    'stock_final', 'delta_tiempo', 'delta_stock'
+)
+
+
+def _tipo_minimo(valores: np.ndarray, con_signo: bool = True) -> np.dtype:
+    """Tipo entero más pequeño que contiene todos los valores (uso interno)."""
+    if valores.size == 0:
+        return np.dtype(np.int8 if con_signo else np.uint8)
+    
+    minimo, maximo = int(valores.min()), int(valores.max())
+    tipos = (np.int8, np.int16, np.int32, np.int64) if con_signo else \
+        (np.uint8, np.uint16, np.uint32, np.uint64)
+    for tipo in tipos:
+        info = np.iinfo(tipo)
+        if info.min <= minimo and maximo <= info.max:
+            return np.dtype(tipo)
+    return np.dtype(np.int64)
+
+
+def _compactar(valores: np.ndarray, con_signo: bool = True) -> np.ndarray:
+    """Convierte una columna a su tipo entero mínimo (uso interno)."""
+    return valores.astype(_tipo_minimo(valores, con_signo), copy=False)
+
+
+def a_segundos(instante: Instante) -> Optional[int]:
+    """
+    Convierte un instante a segundos enteros desde epoch (UTC).
+    
+    Args:
+        instante: Número (segundos desde epoch), fecha en texto o Timestamp;
+            None se devuelve tal cual
+    
+    Returns:
+        Optional[int]: Segundos desde epoch
+    """
+    if instante is None:
+        return None
+    if isinstance(instante, (int, float, np.integer, np.floating)):
+        return int(instante)
+    return int(pd.Timestamp(instante).value // 1_000_000_000)
+
+
+def codificar_bloque(
+    ids: np.ndarray,
+    tiempos: np.ndarray,
+    stocks: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Codifica puntos de historial como un bloque columnar con deltas.
+    
+    Args:
+        ids: ID de producto de cada punto
+        tiempos: Instante de cada punto en segundos (no decreciente)
+        stocks: Stock del producto tras el cambio
+    
+    Returns:
+        Dict[str, np.ndarray]: Columnas del bloque (ver COLUMNAS_BLOQUE)
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    tiempos = np.asarray(tiempos, dtype=np.int64)
+    stocks = np.asarray(stocks, dtype=np.int64)
+    
+    # Orden estable por producto: dentro de cada producto se conserva el
+    # orden de llegada, que ya es cronológico
+    orden = np.argsort(ids, kind='stable')
+    ids, tiempos, stocks = ids[orden], tiempos[orden], stocks[orden]
+    
+    unicos, inicios = np.unique(ids, return_index=True)
+    inicios = np.append(inicios, ids.size)
+    
+    t0 = int(tiempos.min()) if tiempos.size else 0
+    delta_tiempo = np.diff(tiempos, prepend=t0)
+    delta_stock = np.diff(stocks, prepend=0)
+    delta_tiempo[inicios[:-1]] = 0
+    delta_stock[inicios[:-1]] = 0
+    
+    return {
+        'meta': np.array(
+            [t0, int(tiempos.max()) if tiempos.size else 0, ids.size], dtype=np.int64
+        ),
+        'ids': unicos,
+        'inicios': _compactar(inicios, con_signo=False),
+        'base_tiempo': _compactar(tiempos[inicios[:-1]] - t0, con_signo=False),
+        'base_stock': _compactar(stocks[inicios[:-1]]),
+        'stock_final': _compactar(stocks[inicios[1:] - 1]),
+        'delta_tiempo': _compactar(delta_tiempo, con_signo=False),
+        'delta_stock': _compactar(delta_stock),
+    }
+
+
+def _decodificar_tramo(
+    bloque: Dict[str, np.ndarray],
+    posicion: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Decodifica los puntos de un producto dentro de un bloque (uso interno)."""
+    inicio, fin = int(bloque['inicios'][posicion]), int(bloque['inicios'][posicion + 1])
+    tiempos = (
+        int(bloque['meta'][0]) + int(bloque['base_tiempo'][posicion])
+        + np.cumsum(bloque['delta_tiempo'][inicio:fin], dtype=np.int64)
+    )
+    stocks = int(bloque['base_stock'][posicion]) + np.cumsum(
+        bloque['delta_stock'][inicio:fin], dtype=np.int64
+    )
+    return tiempos, stocks
+
+
+def _suma_segmentada(deltas: np.ndarray, inicios: np.ndarray) -> np.ndarray:
+    """Suma acumulada que se reinicia al comienzo de cada tramo (uso interno)."""
+    acumulada = np.cumsum(deltas, dtype=np.int64)
+    previa = np.concatenate(([0], acumulada))[inicios[:-1]]
+    return acumulada - np.repeat(previa, np.diff(inicios))
+
+
+class HistorialStock:
+    """
+    Serie temporal comprimida del stock de cada producto.
+    
+    Los puntos nuevos se acumulan en un búfer; cuando llega uno de otra
+    ventana de tiempo (DURACION_BLOQUE) o el búfer se llena, se cierra un
+    bloque codificado. Con `inventario`, el historial se suscribe a sus
+    eventos y registra cada cambio de stock automáticamente.
+    
+    Las marcas de tiempo se guardan en segundos enteros y deben llegar en
+    orden no decreciente.
+    
+    Atributos:
+        ruta (Optional[str]): Carpeta donde se guardan los bloques (None = en memoria)
+        duracion_bloque (int): Segundos que abarca cada ventana de bloque
+        _bloques (List[Dict[str, np.ndarray]]): Bloques cerrados, en orden cronológico
+        _ultimo (Dict[int, int]): Último stock registrado de cada producto
+    
+    Ejemplo:
+        >>> historial = HistorialStock("historial/", inventario=inventario)
+        >>> historial.capturar()
+        >>> historial.serie(3, desde="2024-01-01", hasta="2024-03-31")
+        >>> historial.stock_en("2024-02-15")
+    """
+    
+    DURACION_BLOQUE = 7 * 24 * 3600
+    TAMANO_MAXIMO_BUFER = 1 << 20
+    CAPACIDAD_INICIAL = 1024
+    
+    def __init__(
+        self,
+        ruta: Optional[str] = None,
+        inventario: Optional[Inventario] = None,
+        duracion_bloque: Optional[int] = None
+    ):
+        """
+        Crea el historial, abriendo los bloques ya guardados en la ruta.
+        
+        Args:
+            ruta: Carpeta de persistencia (se crea si no existe)
+            inventario: Inventario cuyos cambios de stock se registran
+            duracion_bloque: Segundos por bloque (por defecto, una semana)
+        """
+        self.ruta = ruta
+        self.duracion_bloque = int(duracion_bloque or self.DURACION_BLOQUE)
+        self.inventario = inventario
+        self._bloques: List[Dict[str, np.ndarray]] = []
+        self._ultimo: Dict[int, int] = {}
+        self._ultimo_tiempo: Optional[int] = None
+        self._ids = np.empty(self.CAPACIDAD_INICIAL, dtype=np.int64)
+        self._tiempos = np.empty(self.CAPACIDAD_INICIAL, dtype=np.int64)
+        self._stocks = np.empty(self.CAPACIDAD_INICIAL, dtype=np.int64)
+        self._n = 0
+        self._bufer_codificado: Optional[Dict[str, np.ndarray]] = None
+        
+        if ruta is not None:
+            os.makedirs(ruta, exist_ok=True)
+            for nombre in sorted(os.listdir(ruta)):
+                carpeta = os.path.join(ruta, nombre)
+                if nombre.startswith('bloque_') and os.path.isdir(carpeta):
+                    self._bloques.append(self._abrir_bloque(carpeta))
+            if self._bloques:
+                self._ultimo_tiempo = int(self._bloques[-1]['meta'][1])
+            # Último stock de cada producto: el bloque más reciente que lo tiene
+            for bloque in self._bloques:
+                self._ultimo.update(zip(bloque['ids'].tolist(), bloque['stock_final'].tolist()))
+        
+        if inventario is not None:
+            inventario.eventos.suscribir(self._al_cambiar_inventario)
+    
+    # ==========================================
+    # REGISTRO
+    # ==========================================
+    
+    def _al_cambiar_inventario(self, evento: EventoInventario):
+        """Registra los cambios de stock publicados por el inventario (uso interno)."""
+        if evento.tipo == EventoInventario.STOCK and evento.producto_id is not None:
+            if evento.nuevo is not None:
+                self.registrar(evento.producto_id, evento.nuevo)
+            else:
+                self.capturar([evento.producto_id])
+        elif evento.tipo == EventoInventario.INSERTADO:
+            self.capturar([evento.producto_id])
+        elif evento.tipo == EventoInventario.TRANSACCION and evento.nuevo is not None:
+            self.capturar(evento.nuevo)
+        elif evento.tipo in (EventoInventario.STOCK, EventoInventario.TRANSACCION):
+            self.capturar()
+    
+    def registrar(self, producto_id: int, stock: int, marca_tiempo: Instante = None):
+        """
+        Registra el stock de un producto en un instante.
+        
+        Args:
+            producto_id: ID del producto
+            stock: Stock tras el cambio
+            marca_tiempo: Instante del cambio (por defecto, el actual)
+        
+        Raises:
+            ValueError: Si el instante es anterior al último registrado
+        """
+        self.registrar_lote([producto_id], [stock], marca_tiempo)
+    
+    def registrar_lote(
+        self,
+        producto_ids,
+        stocks,
+        marca_tiempo: Instante = None
+    ):
+        """
+        Registra el stock de varios productos en un mismo instante.
+        
+        Args:
+            producto_ids: IDs de los productos
+            stocks: Stock de cada producto
+            marca_tiempo: Instante común (por defecto, el actual)
+        
+        Raises:
+            ValueError: Si el instante es anterior al último registrado
+        """
+        producto_ids = np.asarray(producto_ids, dtype=np.int64)
+        stocks = np.asarray(stocks, dtype=np.int64)
+        k = producto_ids.size
+        if k == 0:
+            return
+        
+        tiempo = int(time.time()) if marca_tiempo is None else a_segundos(marca_tiempo)
+        if self._ultimo_tiempo is not None:
+            if tiempo < self._ultimo_tiempo:
+                raise ValueError(
+                    "El historial solo admite marcas de tiempo no decrecientes"
+                )
+            if self._n and (
+                tiempo // self.duracion_bloque != self._tiempos[0] // self.duracion_bloque
+                or self._n + k > self.TAMANO_MAXIMO_BUFER
+            ):
+                self.sellar()
+        
+        self._asegurar_capacidad(k)
+        self._ids[self._n:self._n + k] = producto_ids
+        self._tiempos[self._n:self._n + k] = tiempo
+        self._stocks[self._n:self._n + k] = stocks
+        self._n += k
+        self._ultimo_tiempo = tiempo
+        self._ultimo.update(zip(producto_ids.tolist(), stocks.tolist()))
+        self._bufer_codificado = None
+    
+    def capturar(self, producto_ids=None, marca_tiempo: Instante = None) -> int:
+        """
+        Registra el stock actual de productos del inventario que cambió
+        desde su último punto (o que no tienen ninguno).
+        
+        Args:
+            producto_ids: IDs a revisar (por defecto, todos)
+            marca_tiempo: Instante del registro (por defecto, el actual)
+        
+        Returns:
+            int: Puntos registrados
+        """
+        if self.inventario is None:
+            raise RuntimeError("El historial no está asociado a un inventario")
+        
+        productos = self.inventario.productos
+        if producto_ids is None:
+            candidatos = productos.values()
+        else:
+            candidatos = [productos[i] for i in producto_ids if i in productos]
+        
+        ultimo = self._ultimo
+        cambios = [
+            (p.id, p.stock_actual) for p in candidatos
+            if ultimo.get(p.id) != p.stock_actual
+        ]
+        if cambios:
+            ids, stocks = zip(*cambios)
+            self.registrar_lote(ids, stocks, marca_tiempo)
+        return len(cambios)
+    
+    def _asegurar_capacidad(self, adicionales: int):
+        """Duplica la capacidad del búfer si es necesario (uso interno)."""
+        requerida = self._n + adicionales
+        capacidad = len(self._ids)
+        if requerida <= capacidad:
+            return
+        
+        while capacidad < requerida:
+            capacidad *= 2
+        
+        for nombre in ('_ids', '_tiempos', '_stocks'):
+            anterior = getattr(self, nombre)
+            nueva = np.empty(capacidad, dtype=anterior.dtype)
+            nueva[:self._n] = anterior[:self._n]
+            setattr(self, nombre, nueva)
+    
+    # ==========================================
+    # BLOQUES
+    # ==========================================
+    
+    def sellar(self) -> bool:
+        """
+        Cierra el búfer como un bloque codificado y, con ruta, lo guarda.
+        
+        Returns:
+            bool: True si había puntos pendientes
+        """
+        if self._n == 0:
+            return False
+        
+        bloque = codificar_bloque(
+            self._ids[:self._n], self._tiempos[:self._n], self._stocks[:self._n]
+        )
+        if self.ruta is not None:
+            carpeta = os.path.join(self.ruta, f"bloque_{len(self._bloques):06d}")
+            os.makedirs(carpeta, exist_ok=True)
+            for columna in COLUMNAS_BLOQUE:
+                np.save(os.path.join(carpeta, f"{columna}.npy"), bloque[columna])
+            bloque = self._abrir_bloque(carpeta)
+        
+        self._bloques.append(bloque)
+        self._n = 0
+        self._bufer_codificado = None
+        return True
+    
+    @staticmethod
+    def _abrir_bloque(carpeta: str) -> Dict[str, np.ndarray]:
+        """Abre las columnas de un bloque guardado, mapeadas en memoria (uso interno)."""
+        return {
+            columna: np.load(os.path.join(carpeta, f"{columna}.npy"), mmap_mode='r')
+            for columna in COLUMNAS_BLOQUE
+        }
+    
+    def _todos_los_bloques(self) -> List[Dict[str, np.ndarray]]:
+        """Bloques cerrados más el búfer codificado al vuelo (uso interno)."""
+        if self._n == 0:
+            return self._bloques
+        if self._bufer_codificado is None:
+            self._bufer_codificado = codificar_bloque(
+                self._ids[:self._n], self._tiempos[:self._n], self._stocks[:self._n]
+            )
+        return self._bloques + [self._bufer_codificado]
+    
+    # ==========================================
+    # CONSULTAS
+    # ==========================================
+    
+    def serie(
+        self,
+        producto_id: int,
+        desde: Instante = None,
+        hasta: Instante = None
+    ) -> pd.Series:
+        """
+        Obtiene la evolución del stock de un producto en un rango de fechas.
+        
+        Si hay un punto anterior a `desde`, la serie comienza en `desde`
+        con el stock vigente en ese instante.
+        
+        Args:
+            producto_id: ID del producto
+            desde: Inicio del rango (inclusive; None = sin límite)
+            hasta: Fin del rango (inclusive; None = sin límite)
+        
+        Returns:
+            pd.Series: Stock indexado por fecha (UTC)
+        """
+        desde, hasta = a_segundos(desde), a_segundos(hasta)
+        partes_t, partes_s = [], []
+        
+        for bloque in self._todos_los_bloques():
+            if hasta is not None and int(bloque['meta'][0]) > hasta:
+                break
+            ids = bloque['ids']
+            posicion = int(np.searchsorted(ids, producto_id))
+            if posicion == len(ids) or ids[posicion] != producto_id:
+                continue
+            tiempos, stocks = _decodificar_tramo(bloque, posicion)
+            partes_t.append(tiempos)
+            partes_s.append(stocks)
+        
+        tiempos = np.concatenate(partes_t) if partes_t else np.empty(0, dtype=np.int64)
+        stocks = np.concatenate(partes_s) if partes_s else np.empty(0, dtype=np.int64)
+        
+        if hasta is not None:
+            fin = np.searchsorted(tiempos, hasta, side='right')
+            tiempos, stocks = tiempos[:fin], stocks[:fin]
+        if desde is not None:
+            inicio = np.searchsorted(tiempos, desde, side='left')
+            if inicio > 0 and (inicio == len(tiempos) or tiempos[inicio] != desde):
+                # Stock vigente al comienzo del rango
+                tiempos = np.concatenate(([desde], tiempos[inicio:]))
+                stocks = np.concatenate((stocks[inicio - 1:inicio], stocks[inicio:]))
+            else:
+                tiempos, stocks = tiempos[inicio:], stocks[inicio:]
+        
+        return pd.Series(
+            stocks,
+            index=pd.to_datetime(tiempos, unit='s').rename('fecha'),
+            name='stock'
+        )
+    
+    def stock_en(self, fecha: Instante = None) -> pd.Series:
+        """
+        Obtiene el stock de todos los productos en una fecha.
+        
+        Args:
+            fecha: Instante consultado (None = el último registrado)
+        
+        Returns:
+            pd.Series: Stock indexado por ID, solo de productos con algún
+                punto hasta esa fecha
+        """
+        fecha = a_segundos(fecha)
+        partes_ids, partes_stock = [], []
+        
+        for bloque in self._todos_los_bloques():
+            t0, t_max = int(bloque['meta'][0]), int(bloque['meta'][1])
+            if fecha is not None and t0 > fecha:
+                break
+            if fecha is None or t_max <= fecha:
+                partes_ids.append(bloque['ids'])
+                partes_stock.append(bloque['stock_final'].astype(np.int64))
+                continue
+            
+            # Bloque que contiene la fecha: se decodifica completo
+            inicios = bloque['inicios'].astype(np.intp)
+            longitudes = np.diff(inicios)
+            tiempos = t0 + np.repeat(bloque['base_tiempo'].astype(np.int64), longitudes) \
+                + _suma_segmentada(bloque['delta_tiempo'], inicios)
+            vigentes = np.add.reduceat((tiempos <= fecha).astype(np.intp), inicios[:-1])
+            con_punto = vigentes > 0
+            ultimos = (inicios[:-1] + vigentes - 1)[con_punto]
+            stocks = np.repeat(bloque['base_stock'].astype(np.int64), longitudes) \
+                + _suma_segmentada(bloque['delta_stock'], inicios)
+            partes_ids.append(bloque['ids'][con_punto])
+            partes_stock.append(stocks[ultimos])
+        
+        if not partes_ids:
+            return pd.Series([], index=pd.Index([], dtype=np.int64, name='id'),
+                             name='stock', dtype=np.int64)
+        
+        # El último bloque en que aparece cada producto es el más reciente
+        ids = np.concatenate(partes_ids)[::-1]
+        stocks = np.concatenate(partes_stock)[::-1]
+        unicos, posiciones = np.unique(ids, return_index=True)
+        return pd.Series(
+            stocks[posiciones], index=pd.Index(unicos, name='id'), name='stock'
+        )
+    
+    # ==========================================
+    # INFORMACIÓN
+    # ==========================================
+    
+    @property
+    def bloques(self) -> int:
+        """Cantidad de bloques cerrados."""
+        return len(self._bloques)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por las columnas de los bloques cerrados."""
+        return sum(
+            columna.nbytes for bloque in self._bloques for columna in bloque.values()
+        )
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad total de puntos registrados."""
+        return sum(int(b['meta'][2]) for b in self._bloques) + self._n
+    
+    def __repr__(self) -> str:
+        """Representación string del historial."""
+        return f"HistorialStock(puntos={len(self)}, bloques={self.bloques})"
@@ -0,0 +1,652 @@
+"""
+Módulo de importación de datos tabulares al inventario.
+
+Aplica un DataFrame leído desde Excel, CSV o Parquet sobre el inventario
+según un mapeo {atributo: columna}. Es la lógica que usa el diálogo de
+carga de la interfaz gráfica y la opción de importación de la consola.
+
+Cada fila se identifica por (numero_item, BIN), luego por (codigo_upc, BIN)
+y por último por ID. Si existe, se actualiza; si no, se crea un producto.
+
+La importación masiva lee varios archivos en paralelo: cada proceso
+devuelve arreglos de NumPy por columna y el proceso principal los une y
+los aplica en una sola pasada.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from models.producto import Producto
+from models.inventario import Inventario
+from logic.archivos import (
+    ATRIBUTOS_NUMERICOS, leer_archivo, leer_columnas, leer_metadatos, mapeo_automatico
+)
+
+
+# Separador de los componentes de una clave compuesta (no aparece en los datos)
+SEPARADOR_CLAVE = "\x1f"
+
+IDENTIFICADORES = ('id', 'numero_item', 'codigo_upc')
+
+
+def _leer_archivo_columnas(tarea: tuple) -> Tuple[str, Optional[Dict[str, np.ndarray]], Optional[str]]:
+    """
+    Lee un archivo y lo convierte en arreglos por columna (uso interno).
+    
+    Se ejecuta en un proceso del grupo: devuelve arreglos de NumPy, que se
+    transfieren de forma compacta, en lugar de objetos Producto.
+    
+    Args:
+        tarea: (ruta, mapeo); con mapeo None se usa el mapeo automático
+    
+    Returns:
+        Tuple: (ruta, {atributo: arreglo} o None, mensaje de error o None).
+            Los atributos numéricos son float64 (NaN = vacío) y los de
+            texto son cadenas ('' = vacío).
+    """
+    ruta, mapeo = tarea
+    try:
+        if mapeo is None:
+            mapeo = mapeo_automatico(leer_columnas(ruta))
+        if 'bin' not in mapeo or not any(clave in mapeo for clave in IDENTIFICADORES):
+            return ruta, None, "no se reconocen las columnas de BIN e identificador"
+        
+        return ruta, _normalizar_columnas(leer_archivo(ruta, mapeo), mapeo), None
+    except Exception as e:
+        return ruta, None, str(e)
+
+
+def _normalizar_columnas(df: pd.DataFrame, mapeo: Dict[str, str]) -> Dict[str, np.ndarray]:
+    """
+    Convierte las columnas mapeadas a una forma canónica (uso interno).
+    
+    Args:
+        df: Datos leídos del archivo
+        mapeo: Diccionario {atributo: columna}
+    
+    Returns:
+        Dict[str, np.ndarray]: {atributo: arreglo}; numéricos en float64
+            (NaN = vacío) y texto como cadenas sin espacios ('' = vacío)
+    """
+    columnas = {}
+    for atributo, columna in mapeo.items():
+        serie = df[columna]
+        if atributo in ATRIBUTOS_NUMERICOS:
+            columnas[atributo] = pd.to_numeric(serie, errors='coerce').to_numpy(np.float64)
+        else:
+            texto = np.char.strip(serie.fillna('').astype(str).to_numpy(dtype=str))
+            texto[texto == ImportadorInventario.VALOR_VACIO] = ''
+            columnas[atributo] = texto
+    return columnas
+
+
+class ImportadorInventario:
+    """
+    Importador de filas tabulares al inventario.
+    
+    Las búsquedas por (numero_item, BIN) y (codigo_upc, BIN) se resuelven
+    con diccionarios construidos una vez por importación, en lugar de
+    recorrer el inventario completo por cada fila.
+    
+    Atributos:
+        inventario (Inventario): Inventario de destino
+    """
+    
+    VALOR_VACIO = "N/D"
+    
+    def __init__(self, inventario: Inventario):
+        """
+        Inicializa el importador.
+        
+        Args:
+            inventario: Inventario de destino
+        """
+        self.inventario = inventario
+        self._por_item_bin: Dict[Tuple[str, str], Producto] = {}
+        self._por_upc_bin: Dict[Tuple[str, str], Producto] = {}
+        self._ids_reservados: Iterator[int] = iter(())
+        self._version_indices = -1
+        
+        # Estado de la importación diferencial
+        self._hashes: Optional[pd.Series] = None
+        self._atributos_hash: Tuple[str, ...] = ()
+        self._version_hash = -1
+    
+    def _indexar(self, producto: Producto):
+        """Agrega un producto a los índices de búsqueda (uso interno)."""
+        self._por_item_bin.setdefault((producto.numero_item, producto.bin), producto)
+        self._por_upc_bin.setdefault((producto.codigo_upc, producto.bin), producto)
+    
+    def _preparar_indices(self):
+        """
+        Construye los índices de búsqueda a partir del inventario (uso interno).
+        
+        Si el inventario no cambió desde la última importación, se reutilizan.
+        """
+        if self._version_indices == self.inventario.version:
+            return
+        self._por_item_bin = {}
+        self._por_upc_bin = {}
+        for producto in self.inventario.productos.values():
+            self._indexar(producto)
+    
+    def _buscar_por_item(self, numero_item: str, bin_value: str) -> Optional[Producto]:
+        """Busca por (numero_item, BIN) con el índice (uso interno)."""
+        producto = self._por_item_bin.get((numero_item, bin_value))
+        if producto is None or (producto.numero_item, producto.bin) == (numero_item, bin_value):
+            return producto
+        # La entrada quedó obsoleta por una actualización: búsqueda completa
+        return self.inventario.obtener_producto_por_numero_item_y_bin(numero_item, bin_value)
+    
+    def _buscar_por_upc(self, codigo_upc: str, bin_value: str) -> Optional[Producto]:
+        """Busca por (codigo_upc, BIN) con el índice (uso interno)."""
+        producto = self._por_upc_bin.get((codigo_upc, bin_value))
+        if producto is None or (producto.codigo_upc, producto.bin) == (codigo_upc, bin_value):
+            return producto
+        return self.inventario.obtener_producto_por_codigo_upc_y_bin(codigo_upc, bin_value)
+    
+    def procesar_datos(self, df: pd.DataFrame, mapeo: dict) -> Tuple[bool, str]:
+        """
+        Procesa los datos tabulares y actualiza/agrega productos al inventario.
+        
+        Args:
+            df: DataFrame con los datos del archivo
+            mapeo: Diccionario que mapea atributos a columnas del archivo
+        
+        Returns:
+            Tuple[bool, str]: (éxito, mensaje)
+        """
+        with self.inventario.transaccion():
+            agregados, actualizados, errores, _ = self._aplicar_filas(df, mapeo)
+        self._version_indices = self.inventario.version
+        return True, self.formatear_resumen(agregados, actualizados, errores)
+    
+    def _aplicar_filas(self, df: pd.DataFrame, mapeo: dict) -> Tuple[int, int, List[str], list]:
+        """
+        Aplica las filas una por una sobre el inventario (uso interno).
+        
+        Los números de fila de los errores se calculan con el índice del
+        DataFrame, por lo que un subconjunto de filas conserva su numeración.
+        Debe llamarse dentro de una transacción del inventario: una fila con
+        error se deshace completa en lugar de quedar aplicada a medias.
+        
+        Returns:
+            Tuple[int, int, List[str], list]: (agregados, actualizados,
+                errores, etiquetas de las filas con error)
+        """
+        productos_agregados = 0
+        productos_actualizados = 0
+        errores = []
+        filas_con_error = []
+        
+        self._preparar_indices()
+        atributos = list(mapeo.keys())
+        columnas = [df[mapeo[atributo]].tolist() for atributo in atributos]
+        
+        for idx, valores in zip(df.index, zip(*columnas)):
+            punto = self.inventario.punto_guardado()
+            try:
+                # Extraer valores según el mapeo
+                datos_producto = {}
+                for atributo, valor in zip(atributos, valores):
+                    # Manejar valores NaN o vacíos
+                    if pd.isna(valor) or (isinstance(valor, str) and valor.strip() == ""):
+                        datos_producto[atributo] = self.VALOR_VACIO
+                    else:
+                        datos_producto[atributo] = valor
+                
+                # Determinar si el producto existe (considerando BIN)
+                producto_existente = None
+                bin_value = str(datos_producto.get('bin', self.VALOR_VACIO))
+                
+                # Buscar por numero_item + BIN
+                if datos_producto.get('numero_item', self.VALOR_VACIO) != self.VALOR_VACIO and bin_value != self.VALOR_VACIO:
+                    producto_existente = self._buscar_por_item(
+                        str(datos_producto['numero_item']), bin_value
+                    )
+                
+                # Si no se encontró, buscar por codigo_upc + BIN
+                if not producto_existente and datos_producto.get('codigo_upc', self.VALOR_VACIO) != self.VALOR_VACIO and bin_value != self.VALOR_VACIO:
+                    producto_existente = self._buscar_por_upc(
+                        str(datos_producto['codigo_upc']), bin_value
+                    )
+                
+                # Si no se encontró, intentar buscar por id
+                if not producto_existente and datos_producto.get('id', self.VALOR_VACIO) != self.VALOR_VACIO:
+                    try:
+                        producto_existente = self.inventario.obtener_producto(int(datos_producto['id']))
+                    except (ValueError, TypeError):
+                        pass
+                
+                if producto_existente:
+                    # Actualizar producto existente
+                    self.actualizar_producto_existente(producto_existente, datos_producto, mapeo)
+                    self._indexar(producto_existente)
+                    productos_actualizados += 1
+                else:
+                    # Crear nuevo producto
+                    nuevo_producto = self.crear_nuevo_producto(datos_producto, mapeo)
+                    if self.inventario.agregar_producto(nuevo_producto):
+                        # Si el item ya existía en otro BIN, los datos de la fila actualizan su ficha
+                        self.actualizar_producto_existente(nuevo_producto, datos_producto, mapeo)
+                        self._indexar(nuevo_producto)
+                        productos_agregados += 1
+                    else:
+                        errores.append(f"Fila {idx + 2}: No se pudo agregar el producto")
+                        filas_con_error.append(idx)
+            
+            except Exception as e:
+                self.inventario.revertir_a(punto)
+                errores.append(f"Fila {idx + 2}: {str(e)}")
+                filas_con_error.append(idx)
+        
+        return productos_agregados, productos_actualizados, errores, filas_con_error
+    
+    @staticmethod
+    def formatear_resumen(productos_agregados: int, productos_actualizados: int, errores: List[str]) -> str:
+        """
+        Construye el mensaje de resumen de una importación.
+        
+        Args:
+            productos_agregados: Productos creados
+            productos_actualizados: Productos actualizados
+            errores: Mensajes de error
+        
+        Returns:
+            str: Mensaje para mostrar al usuario
+        """
+        mensaje = f"Proceso completado:\n\n"
+        mensaje += f"✓ Productos agregados: {productos_agregados}\n"
+        mensaje += f"✓ Productos actualizados: {productos_actualizados}\n"
+        
+        if errores:
+            mensaje += f"\n⚠ Errores encontrados: {len(errores)}\n"
+            mensaje += "\n".join(errores[:5])  # Mostrar solo los primeros 5 errores
+            if len(errores) > 5:
+                mensaje += f"\n... y {len(errores) - 5} errores más"
+        
+        return mensaje
+    
+    def actualizar_producto_existente(self, producto: Producto, datos: dict, mapeo: dict):
+        """Actualiza un producto existente con los datos del archivo."""
+        vacio = self.VALOR_VACIO
+        
+        # Actualizar solo los atributos que fueron mapeados
+        if 'nombre' in mapeo and datos.get('nombre', vacio) != vacio:
+            producto.nombre = str(datos['nombre'])
+        
+        if 'precio' in mapeo and datos.get('precio', vacio) != vacio:
+            try:
+                producto.precio = float(datos['precio'])
+            except (ValueError, TypeError):
+                pass
+        
+        for atributo in ('stock_actual', 'stock_minimo', 'stock_maximo'):
+            if atributo in mapeo and datos.get(atributo, vacio) != vacio:
+                try:
+                    setattr(producto, atributo, int(datos[atributo]))
+                except (ValueError, TypeError):
+                    pass
+        
+        for atributo in ('categoria', 'numero_item', 'codigo_upc', 'bin'):
+            if atributo in mapeo and datos.get(atributo, vacio) != vacio:
+                setattr(producto, atributo, str(datos[atributo]))
+    
+    def _nuevo_id(self) -> int:
+        """ID para un producto nuevo: del rango reservado o del inventario (uso interno)."""
+        return next(self._ids_reservados, None) or self.inventario.nuevo_id()
+    
+    def crear_nuevo_producto(self, datos: dict, mapeo: dict) -> Producto:
+        """Crea un nuevo producto con los datos del archivo."""
+        vacio = self.VALOR_VACIO
+        
+        # Generar un ID único si no se proporcionó
+        try:
+            producto_id = int(datos['id']) if datos.get('id', vacio) != vacio else self._nuevo_id()
+        except (ValueError, TypeError):
+            producto_id = self._nuevo_id()
+        
+        def numero(atributo, tipo, defecto):
+            try:
+                return tipo(datos[atributo]) if datos.get(atributo, vacio) != vacio else defecto
+            except (ValueError, TypeError):
+                return defecto
+        
+        def texto(atributo):
+            return str(datos[atributo]) if datos.get(atributo, vacio) != vacio else vacio
+        
+        return Producto(
+            id=producto_id,
+            nombre=texto('nombre'),
+            precio=numero('precio', float, 0.0),
+            stock_actual=numero('stock_actual', int, 0),
+            stock_minimo=numero('stock_minimo', int, 10),
+            stock_maximo=numero('stock_maximo', int, 100),
+            categoria=texto('categoria'),
+            numero_item=texto('numero_item'),
+            codigo_upc=texto('codigo_upc'),
+            bin=texto('bin')
+        )
+    
+    # =========================================================================
+    # IMPORTACIÓN DIFERENCIAL
+    # =========================================================================
+    
+    @staticmethod
+    def _claves_y_hashes(columnas: Dict[str, np.ndarray], atributos: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula la clave y el hash de contenido de cada fila (uso interno).
+        
+        La clave es (numero_item, BIN) o, si falta el ítem, (codigo_upc, BIN).
+        El hash cubre todos los atributos mapeados y se calcula en una sola
+        pasada vectorial con `pd.util.hash_pandas_object`.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (claves, '' si la fila no tiene;
+                hashes uint64)
+        """
+        tabla = pd.DataFrame({atributo: columnas[atributo] for atributo in atributos})
+        for atributo in atributos:
+            if atributo.startswith('stock'):
+                # El stock se guarda como entero: 15.7 y 15 son el mismo valor aplicado
+                tabla[atributo] = np.trunc(tabla[atributo])
+        hashes = pd.util.hash_pandas_object(tabla, index=False).to_numpy()
+        
+        n = len(tabla)
+        vacia = np.full(n, '', dtype=str)
+        bin_value = columnas.get('bin', vacia)
+        claves = vacia
+        for prefijo, atributo in (('U', 'codigo_upc'), ('I', 'numero_item')):
+            valor = columnas.get(atributo, vacia)
+            clave = np.char.add(np.char.add(prefijo + valor, SEPARADOR_CLAVE), bin_value)
+            claves = np.where((valor != '') & (bin_value != ''), clave, claves)
+        return claves, hashes
+    
+    def _hashes_inventario(self, claves: pd.Index, atributos: Tuple[str, ...]) -> pd.Series:
+        """
+        Recalcula los hashes de las claves a partir del estado actual (uso interno).
+        
+        Se usa cuando el inventario cambió fuera del importador desde la
+        última importación, para no omitir filas que ya no coinciden.
+        """
+        por_clave = {}
+        for producto in self.inventario.productos.values():
+            por_clave.setdefault('I' + producto.numero_item + SEPARADOR_CLAVE + producto.bin, producto)
+            por_clave.setdefault('U' + producto.codigo_upc + SEPARADOR_CLAVE + producto.bin, producto)
+        
+        encontradas = [clave for clave in claves if clave in por_clave]
+        productos = [por_clave[clave] for clave in encontradas]
+        
+        columnas = {}
+        for atributo in atributos:
+            valores = [getattr(producto, atributo) for producto in productos]
+            if atributo in ATRIBUTOS_NUMERICOS:
+                columnas[atributo] = np.array(valores, dtype=np.float64)
+            else:
+                texto = np.array(valores, dtype=str)
+                columnas[atributo] = np.where(texto == self.VALOR_VACIO, '', texto)
+        
+        _, hashes = self._claves_y_hashes(columnas, atributos)
+        return pd.Series(hashes, index=pd.Index(encontradas, dtype=object))
+    
+    def importar_diferencial(
+        self,
+        df: pd.DataFrame,
+        mapeo: dict,
+        eliminar_ausentes: bool = False
+    ) -> Dict[str, object]:
+        """
+        Importa solo las filas nuevas o modificadas desde la importación anterior.
+        
+        Se guarda un hash de contenido por clave (numero_item/UPC, BIN). En
+        cada importación se calculan los hashes de la hoja entrante y se
+        comparan con los guardados: las filas iguales se omiten y el resto
+        se aplica con la misma lógica que `procesar_datos`. Las filas sin
+        clave y las claves repetidas dentro de la hoja se aplican siempre.
+        
+        Si el inventario se modificó por otra vía desde la última
+        importación, los hashes guardados se recalculan desde los productos.
+        
+        Args:
+            df: DataFrame con los datos del archivo
+            mapeo: Diccionario que mapea atributos a columnas del archivo
+            eliminar_ausentes: Si True, elimina los productos cuyas claves
+                estaban en la importación anterior y ya no aparecen
+        
+        Returns:
+            Dict[str, object]: Conteos del delta ('insertados', 'modificados',
+                'sin_cambios', 'desaparecidos', 'eliminados'), resultado de la
+                aplicación ('agregados', 'actualizados', 'errores') y 'mensaje'
+        """
+        atributos = tuple(sorted(mapeo))
+        claves, hashes = self._claves_y_hashes(_normalizar_columnas(df, mapeo), atributos)
+        
+        previos = self._hashes if self._atributos_hash == atributos else None
+        if previos is not None and self._version_hash != self.inventario.version:
+            previos = self._hashes_inventario(previos.index, atributos)
+        if previos is None:
+            previos = pd.Series([], dtype=np.uint64, index=pd.Index([], dtype=object))
+        
+        # Comparación vectorial contra los hashes guardados
+        con_clave = claves != ''
+        repetidas = pd.Series(claves).duplicated(keep=False).to_numpy() & con_clave
+        posiciones = previos.index.get_indexer(claves.astype(object))
+        encontradas = con_clave & (posiciones >= 0)
+        iguales = encontradas.copy()
+        iguales[encontradas] = previos.to_numpy()[posiciones[encontradas]] == hashes[encontradas]
+        
+        insertadas = con_clave & ~encontradas
+        modificadas = encontradas & ~iguales
+        sin_cambios = iguales & ~repetidas
+        ausentes = previos.index.difference(claves[con_clave])
+        
+        aplicar = ~sin_cambios
+        agregados = actualizados = 0
+        errores, filas_con_error = [], []
+        if aplicar.any():
+            with self.inventario.transaccion():
+                agregados, actualizados, errores, filas_con_error = self._aplicar_filas(df[aplicar], mapeo)
+            self._version_indices = self.inventario.version
+        
+        eliminados = 0
+        if eliminar_ausentes and len(ausentes):
+            eliminados = self._eliminar_claves(ausentes)
+        
+        # Guardar los hashes de esta importación (las filas con error se reintentan)
+        validas = con_clave & ~df.index.isin(filas_con_error)
+        nuevos = pd.Series(hashes[validas], index=pd.Index(claves[validas], dtype=object))
+        self._hashes = nuevos[~nuevos.index.duplicated(keep='last')]
+        self._atributos_hash = atributos
+        self._version_hash = self.inventario.version
+        
+        resumen = {
+            'insertados': int(insertadas.sum()),
+            'modificados': int(modificadas.sum()),
+            'sin_cambios': int(sin_cambios.sum()),
+            'desaparecidos': len(ausentes),
+            'eliminados': eliminados,
+            'agregados': agregados,
+            'actualizados': actualizados,
+            'errores': errores,
+        }
+        resumen['mensaje'] = (
+            f"Filas nuevas: {resumen['insertados']} · "
+            f"modificadas: {resumen['modificados']} · "
+            f"sin cambios: {resumen['sin_cambios']} · "
+            f"desaparecidas: {resumen['desaparecidos']}\n\n"
+            + self.formatear_resumen(agregados, actualizados, errores)
+        )
+        if eliminados:
+            resumen['mensaje'] += f"✓ Productos eliminados: {eliminados}\n"
+        return resumen
+    
+    def _eliminar_claves(self, claves: pd.Index) -> int:
+        """Elimina los productos identificados por claves de importación (uso interno)."""
+        self._preparar_indices()
+        eliminados = 0
+        for clave in claves:
+            tipo, valor, bin_value = clave[0], *clave[1:].split(SEPARADOR_CLAVE)
+            if tipo == 'I':
+                producto = self._buscar_por_item(valor, bin_value)
+            else:
+                producto = self._buscar_por_upc(valor, bin_value)
+            if producto is not None and self.inventario.eliminar_producto(producto.id):
+                eliminados += 1
+        self._version_indices = -1
+        return eliminados
+    
+    # =========================================================================
+    # IMPORTACIÓN MASIVA
+    # =========================================================================
+    
+    def importar_archivos(
+        self,
+        rutas: Sequence[str],
+        mapeo: Optional[Dict[str, str]] = None,
+        procesos: Optional[int] = None
+    ) -> Dict[str, object]:
+        """
+        Importa varios archivos (Excel, CSV o Parquet) en una sola operación.
+        
+        Los archivos se leen en un grupo de procesos. Las filas se unen en
+        el orden de `rutas` y, dentro de cada archivo, en el orden de las
+        filas; cuando varias filas corresponden al mismo producto, cada
+        atributo toma el último valor no vacío. El resultado es el mismo
+        sin importar qué proceso termine primero.
+        
+        Args:
+            rutas: Rutas de los archivos a importar
+            mapeo: Mapeo común {atributo: columna}; None para reconocer
+                las columnas de cada archivo automáticamente
+            procesos: Procesos de lectura (None o 1 = sin grupo)
+        
+        Returns:
+            Dict[str, object]: 'agregados', 'actualizados', 'filas',
+                'errores' (lista) y 'mensaje'
+        """
+        tareas = [(ruta, mapeo) for ruta in rutas]
+        if procesos and procesos > 1 and len(tareas) > 1:
+            with ProcessPoolExecutor(max_workers=min(procesos, len(tareas))) as ejecutor:
+                resultados = list(ejecutor.map(_leer_archivo_columnas, tareas))
+        else:
+            resultados = [_leer_archivo_columnas(tarea) for tarea in tareas]
+        
+        errores = []
+        bloques = []
+        for orden, (ruta, columnas, error) in enumerate(resultados):
+            if error is not None:
+                errores.append(f"{os.path.basename(ruta)}: {error}")
+                continue
+            # La marca de agua guardada evita reentregar IDs ya usados
+            self.inventario.ids.restaurar(leer_metadatos(ruta))
+            bloque = pd.DataFrame(columnas)
+            bloque['_archivo'] = orden
+            bloque['_fila'] = np.arange(len(bloque)) + 2
+            bloques.append(bloque)
+        
+        if bloques:
+            datos = pd.concat(bloques, ignore_index=True)
+            with self.inventario.transaccion():
+                agregados, actualizados = self._combinar_filas(datos, rutas, errores)
+            filas = len(datos)
+        else:
+            agregados = actualizados = filas = 0
+        
+        return {
+            'agregados': agregados,
+            'actualizados': actualizados,
+            'filas': filas,
+            'errores': errores,
+            'mensaje': self.formatear_resumen(agregados, actualizados, errores)
+        }
+    
+    def _combinar_filas(self, datos: pd.DataFrame, rutas: Sequence[str], errores: List[str]) -> Tuple[int, int]:
+        """
+        Resuelve las filas contra el inventario y aplica el resultado (uso interno).
+        
+        1. Claves compuestas (numero_item, BIN) y (codigo_upc, BIN) por fila
+        2. Destino de cada fila en el inventario mediante Series.map
+        3. Agrupación por destino y último valor no vacío por atributo
+        4. Actualización o creación de un producto por grupo
+        
+        Debe llamarse dentro de una transacción del inventario; un grupo
+        con error se deshace completo.
+        
+        Returns:
+            Tuple[int, int]: (productos agregados, productos actualizados)
+        """
+        atributos = [c for c in datos.columns if not c.startswith('_')]
+        for atributo in atributos:
+            if atributo not in ATRIBUTOS_NUMERICOS:
+                datos[atributo] = datos[atributo].astype('string').replace('', pd.NA)
+        
+        def columna(atributo):
+            if atributo in datos:
+                return datos[atributo]
+            if atributo in ATRIBUTOS_NUMERICOS:
+                return pd.Series(np.nan, index=datos.index)
+            return pd.Series(pd.NA, index=datos.index, dtype='string')
+        
+        clave_item = columna('numero_item') + SEPARADOR_CLAVE + columna('bin')
+        clave_upc = columna('codigo_upc') + SEPARADOR_CLAVE + columna('bin')
+        
+        # Índices del inventario actual (la primera coincidencia gana, como en la búsqueda lineal)
+        productos = list(self.inventario.productos.values())
+        ids_actuales = pd.Index([p.id for p in productos])
+        por_item = pd.Series(ids_actuales, index=[p.numero_item + SEPARADOR_CLAVE + p.bin for p in productos])
+        por_upc = pd.Series(ids_actuales, index=[p.codigo_upc + SEPARADOR_CLAVE + p.bin for p in productos])
+        por_item = por_item[~por_item.index.duplicated()]
+        por_upc = por_upc[~por_upc.index.duplicated()]
+        
+        ids_fila = columna('id')
+        destino = clave_item.map(por_item)
+        destino = destino.fillna(clave_upc.map(por_upc))
+        destino = destino.fillna(ids_fila.where(ids_fila.isin(ids_actuales)))
+        datos['_destino'] = destino
+        
+        # Grupo: producto existente o, para filas nuevas, su propia clave
+        grupo = ('E' + destino.astype('Int64').astype(str)).where(destino.notna())
+        grupo = grupo.fillna('I' + clave_item).fillna('U' + clave_upc)
+        grupo = grupo.fillna('D' + ids_fila.astype('Int64').astype(str).where(ids_fila.notna()))
+        grupo = grupo.fillna('F' + pd.Series(datos.index.astype(str), index=datos.index))
+        
+        finales = datos.groupby(grupo.to_numpy(), sort=False).last()
+        
+        mapeo = {atributo: atributo for atributo in atributos}
+        registros = finales.astype(object).where(finales.notna(), self.VALOR_VACIO).to_dict('records')
+        
+        # IDs de las filas nuevas: los explícitos suben la marca de agua y
+        # los que faltan se reservan como un solo rango
+        nuevos = finales['_destino'].isna()
+        if 'id' in finales:
+            explicitos = pd.to_numeric(finales.loc[nuevos, 'id'], errors='coerce')
+            if explicitos.notna().any():
+                self.inventario.ids.observar(int(explicitos.max()))
+            sin_id = int((nuevos & finales['id'].isna()).sum())
+        else:
+            sin_id = int(nuevos.sum())
+        self._ids_reservados = iter(self.inventario.reservar_ids(sin_id))
+        agregados = actualizados = 0
+        
+        for registro in registros:
+            punto = self.inventario.punto_guardado()
+            try:
+                if registro['_destino'] != self.VALOR_VACIO:
+                    producto = self.inventario.obtener_producto(int(registro['_destino']))
+                    self.actualizar_producto_existente(producto, registro, mapeo)
+                    actualizados += 1
+                else:
+                    nuevo = self.crear_nuevo_producto(registro, mapeo)
+                    if not self.inventario.agregar_producto(nuevo):
+                        raise ValueError(f"Ya existe un producto con ID {nuevo.id}")
+                    self.actualizar_producto_existente(nuevo, registro, mapeo)
+                    agregados += 1
+            except Exception as e:
+                self.inventario.revertir_a(punto)
+                archivo = os.path.basename(rutas[int(registro['_archivo'])])
+                errores.append(f"{archivo}, fila {int(registro['_fila'])}: {str(e)}")
+        
+        self._ids_reservados = iter(())
+        return agregados, actualizados
@@ -0,0 +1,339 @@
+"""
+Módulo de índice estructurado de ubicaciones de bodega (BIN).
+
+Los BIN tienen el formato `XXX/XXX/XXX` (pasillo/rack/nivel) pero el
+inventario los guarda como cadenas. Este módulo los interpreta una sola
+vez como coordenadas enteras empaquetadas y mantiene un índice ordenado
+que responde consultas por zona sin recorrer ni partir cadenas.
+
+Modelo Matemático:
+==================
+
+1. EMPAQUETADO
+
+   código = pasillo · 10⁶ + rack · 10³ + nivel
+   
+   El orden de los códigos es el orden lexicográfico (pasillo, rack, nivel),
+   por lo que todos los BIN de un pasillo, o de un rack dentro de un
+   pasillo, ocupan un tramo contiguo del índice ordenado.
+
+2. CONSULTAS POR PREFIJO Y RANGO
+
+   Pasillos [a₁, a₂]           → códigos en [a₁·10⁶, a₂·10⁶ + 999 999]
+   Pasillo a, racks [r₁, r₂]   → códigos en [a·10⁶ + r₁·10³, a·10⁶ + r₂·10³ + 999]
+   
+   El tramo se ubica con búsqueda binaria (np.searchsorted) y las
+   restricciones que no forman un prefijo se aplican con una máscara
+   vectorial sobre ese tramo.
+
+3. AGREGADOS POR ZONA
+
+   zona = código // 10⁶ (pasillo) o código // 10³ (pasillo y rack)
+   
+   Como el índice está ordenado, cada zona es un tramo contiguo y las
+   sumas por zona salen de np.add.reduceat.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from models.inventario import Inventario
+from models.producto import Producto
+from models.eventos import EventoInventario
+
+
+# Factor de empaquetado de cada coordenada (tres dígitos)
+BASE_COORDENADA = 1000
+
+# Niveles de agrupación de `resumen_por_zona`
+ZONA_PASILLO = "pasillo"
+ZONA_RACK = "rack"
+
+Filtro = Union[None, int, Tuple[int, int]]
+
+
+def parsear_bin(bin_value: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Interpreta un BIN con formato XXX/XXX/XXX.
+    
+    Args:
+        bin_value: Código de ubicación
+    
+    Returns:
+        Optional[Tuple[int, int, int]]: (pasillo, rack, nivel), o None si el
+            BIN no tiene el formato esperado
+    """
+    partes = str(bin_value).strip().split('/')
+    if len(partes) != 3 or not all(p.isdigit() and len(p) <= 3 for p in partes):
+        return None
+    pasillo, rack, nivel = (int(p) for p in partes)
+    return pasillo, rack, nivel
+
+
+def empaquetar(pasillo: int, rack: int, nivel: int) -> int:
+    """
+    Empaqueta las coordenadas de un BIN en un entero ordenable.
+    
+    Returns:
+        int: pasillo · 10⁶ + rack · 10³ + nivel
+    """
+    return (pasillo * BASE_COORDENADA + rack) * BASE_COORDENADA + nivel
+
+
+def _rango(filtro: Filtro) -> Tuple[int, int]:
+    """Convierte un filtro (valor o tupla desde-hasta) en un rango cerrado (uso interno)."""
+    if filtro is None:
+        return 0, BASE_COORDENADA - 1
+    if isinstance(filtro, tuple):
+        desde, hasta = filtro
+        return int(desde), int(hasta)
+    return int(filtro), int(filtro)
+
+
+class IndiceBins:
+    """
+    Índice ordenado de los BIN del inventario como coordenadas enteras.
+    
+    El índice se construye la primera vez que se consulta y se mantiene
+    suscrito a los eventos del inventario: solo se reconstruye cuando
+    cambian productos, IDs o BINs, no cuando cambia el stock.
+    
+    Atributos:
+        inventario (Inventario): Inventario indexado
+        _codigos (np.ndarray): Códigos empaquetados, ordenados
+        _filas (np.ndarray): Fila de la matriz de inventario de cada código
+        _ids (np.ndarray): ID de producto de cada código
+        _codigo_por_id (Dict[int, int]): Código indexado de cada producto
+        _sin_ubicacion (List[int]): IDs con BIN vacío o mal formado
+        _vigente (bool): Indica si el índice refleja el inventario
+    """
+    
+    def __init__(self, inventario: Inventario):
+        """
+        Crea el índice y lo suscribe a los cambios del inventario.
+        
+        Args:
+            inventario: Inventario a indexar
+        """
+        self.inventario = inventario
+        self._codigos = np.empty(0, dtype=np.int64)
+        self._filas = np.empty(0, dtype=np.intp)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._codigo_por_id: Dict[int, int] = {}
+        self._sin_ubicacion: List[int] = []
+        self._cache_parseo: Dict[str, Optional[int]] = {}
+        self._total = 0
+        self._vigente = False
+        inventario.eventos.suscribir(self._al_cambiar_inventario)
+    
+    def _al_cambiar_inventario(self, evento: EventoInventario):
+        """Invalida el índice solo si el cambio afecta la ubicación (uso interno)."""
+        if not self._vigente:
+            return
+        
+        if evento.tipo == EventoInventario.STOCK:
+            return
+        if evento.tipo == EventoInventario.ATRIBUTOS:
+            if evento.producto_id is not None and evento.campo not in (None, 'bin', 'id'):
+                return
+        elif evento.tipo == EventoInventario.TRANSACCION and evento.nuevo is not None:
+            # Solo importa si algún producto tocado cambió de BIN o desapareció
+            if all(self._ubicacion_intacta(producto_id) for producto_id in evento.nuevo):
+                return
+        
+        self._vigente = False
+    
+    def _ubicacion_intacta(self, producto_id: int) -> bool:
+        """Indica si un producto sigue indexado con el mismo BIN (uso interno)."""
+        producto = self.inventario.obtener_producto(producto_id)
+        if producto is None:
+            return False
+        if producto_id not in self._codigo_por_id:
+            return False
+        return self._codigo(producto.bin) == self._codigo_por_id[producto_id]
+    
+    def _codigo(self, bin_value: str) -> Optional[int]:
+        """Código empaquetado de un BIN, con caché por cadena (uso interno)."""
+        try:
+            return self._cache_parseo[bin_value]
+        except KeyError:
+            coordenadas = parsear_bin(bin_value)
+            codigo = None if coordenadas is None else empaquetar(*coordenadas)
+            self._cache_parseo[bin_value] = codigo
+            return codigo
+    
+    def _asegurar_vigente(self):
+        """Reconstruye el índice si quedó desactualizado (uso interno)."""
+        if self._vigente and self._total == len(self.inventario.productos):
+            return
+        
+        # El orden de los productos es el orden de las filas de la matriz
+        self.inventario.obtener_matriz_inventario()
+        codigos, filas, ids = [], [], []
+        self._codigo_por_id = {}
+        self._sin_ubicacion = []
+        
+        for fila, producto in enumerate(self.inventario.productos.values()):
+            codigo = self._codigo(producto.bin)
+            if codigo is None:
+                self._sin_ubicacion.append(producto.id)
+                continue
+            codigos.append(codigo)
+            filas.append(fila)
+            ids.append(producto.id)
+            self._codigo_por_id[producto.id] = codigo
+        
+        codigos = np.array(codigos, dtype=np.int64)
+        orden = np.argsort(codigos, kind='stable')
+        self._codigos = codigos[orden]
+        self._filas = np.array(filas, dtype=np.intp)[orden]
+        self._ids = np.array(ids, dtype=np.int64)[orden]
+        self._total = len(self.inventario.productos)
+        self._vigente = True
+    
+    def _seleccionar(self, pasillo: Filtro, rack: Filtro, nivel: Filtro) -> np.ndarray:
+        """
+        Posiciones del índice que cumplen los filtros (uso interno).
+        
+        Returns:
+            np.ndarray: Posiciones en el índice ordenado
+        """
+        self._asegurar_vigente()
+        p1, p2 = _rango(pasillo)
+        r1, r2 = _rango(rack)
+        n1, n2 = _rango(nivel)
+        
+        # El prefijo más largo que forma un tramo contiguo
+        desde, hasta = empaquetar(p1, 0, 0), empaquetar(p2, BASE_COORDENADA - 1, BASE_COORDENADA - 1)
+        if p1 == p2:
+            desde, hasta = empaquetar(p1, r1, 0), empaquetar(p1, r2, BASE_COORDENADA - 1)
+            if r1 == r2:
+                desde, hasta = empaquetar(p1, r1, n1), empaquetar(p1, r1, n2)
+        
+        inicio = np.searchsorted(self._codigos, desde, side='left')
+        fin = np.searchsorted(self._codigos, hasta, side='right')
+        posiciones = np.arange(inicio, fin)
+        
+        # Restricciones restantes con máscara vectorial sobre el tramo
+        codigos = self._codigos[inicio:fin]
+        mascara = np.ones(codigos.size, dtype=bool)
+        if p1 != p2 and rack is not None:
+            racks = (codigos // BASE_COORDENADA) % BASE_COORDENADA
+            mascara &= (racks >= r1) & (racks <= r2)
+        if (p1 != p2 or r1 != r2) and nivel is not None:
+            niveles = codigos % BASE_COORDENADA
+            mascara &= (niveles >= n1) & (niveles <= n2)
+        
+        return posiciones if mascara.all() else posiciones[mascara]
+    
+    def buscar(self, pasillo: Filtro = None, rack: Filtro = None, nivel: Filtro = None) -> np.ndarray:
+        """
+        Busca los productos ubicados en una zona.
+        
+        Cada filtro acepta un valor (2) o un rango cerrado ((10, 15)).
+        
+        Args:
+            pasillo: Pasillo o rango de pasillos
+            rack: Rack o rango de racks
+            nivel: Nivel o rango de niveles
+        
+        Returns:
+            np.ndarray: IDs de los productos, ordenados por ubicación
+        """
+        posiciones = self._seleccionar(pasillo, rack, nivel)
+        return self._ids[posiciones]
+    
+    def productos(self, pasillo: Filtro = None, rack: Filtro = None, nivel: Filtro = None) -> List[Producto]:
+        """
+        Obtiene los productos ubicados en una zona, ordenados por ubicación.
+        
+        Returns:
+            List[Producto]: Productos de la zona
+        """
+        return [self.inventario.productos[int(i)] for i in self.buscar(pasillo, rack, nivel)]
+    
+    def sin_ubicacion(self) -> List[int]:
+        """
+        Retorna los IDs de productos con BIN vacío o sin el formato XXX/XXX/XXX.
+        
+        Returns:
+            List[int]: IDs sin ubicación indexable
+        """
+        self._asegurar_vigente()
+        return list(self._sin_ubicacion)
+    
+    def resumen_por_zona(
+        self,
+        agrupar: str = ZONA_PASILLO,
+        pasillo: Filtro = None,
+        rack: Filtro = None,
+        nivel: Filtro = None
+    ) -> pd.DataFrame:
+        """
+        Calcula stock, valor y ocupación por zona.
+        
+        Operación: para cada zona z (tramo contiguo del índice),
+            stock_z     = Σ sᵢ
+            valor_z     = Σ pᵢ·sᵢ
+            capacidad_z = Σ maxᵢ
+            ocupacion_z = 100 · stock_z / capacidad_z
+        
+        Args:
+            agrupar: 'pasillo' o 'rack' (pasillo y rack)
+            pasillo: Filtro de pasillo
+            rack: Filtro de rack
+            nivel: Filtro de nivel
+        
+        Returns:
+            pd.DataFrame: Índice zona y columnas productos, stock_total,
+                valor_total, capacidad_total y porcentaje_ocupacion
+        
+        Raises:
+            ValueError: Si el nivel de agrupación no es válido
+        """
+        if agrupar == ZONA_PASILLO:
+            divisor = BASE_COORDENADA ** 2
+        elif agrupar == ZONA_RACK:
+            divisor = BASE_COORDENADA
+        else:
+            raise ValueError(f"Agrupación no válida: {agrupar}")
+        
+        posiciones = self._seleccionar(pasillo, rack, nivel)
+        columnas = ['productos', 'stock_total', 'valor_total', 'capacidad_total', 'porcentaje_ocupacion']
+        if posiciones.size == 0:
+            return pd.DataFrame(columns=columnas, index=pd.Index([], name='zona'))
+        
+        matriz = self.inventario.obtener_matriz_inventario()
+        filas = self._filas[posiciones]
+        precios = matriz[filas, 1]
+        stock = matriz[filas, 2]
+        maximos = matriz[filas, 4]
+        
+        # Las zonas ya vienen ordenadas: cada una empieza donde cambia el valor
+        zonas = self._codigos[posiciones] // divisor
+        inicios = np.flatnonzero(np.r_[True, zonas[1:] != zonas[:-1]])
+        claves = zonas[inicios]
+        cantidades = np.diff(np.r_[inicios, zonas.size])
+        stock_total = np.add.reduceat(stock, inicios)
+        capacidad = np.add.reduceat(maximos, inicios)
+        
+        if agrupar == ZONA_PASILLO:
+            etiquetas = [f"{c:03d}" for c in claves]
+        else:
+            etiquetas = [f"{c // BASE_COORDENADA:03d}/{c % BASE_COORDENADA:03d}" for c in claves]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ocupacion = np.where(capacidad > 0, stock_total / capacidad * 100, 0.0)
+        
+        return pd.DataFrame({
+            'productos': cantidades,
+            'stock_total': stock_total.astype(np.int64),
+            'valor_total': np.add.reduceat(precios * stock, inicios).round(2),
+            'capacidad_total': capacidad.astype(np.int64),
+            'porcentaje_ocupacion': ocupacion.round(2)
+        }, index=pd.Index(etiquetas, name='zona'))
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de productos con ubicación indexada."""
+        self._asegurar_vigente()
+        return int(self._codigos.size)
@@ -0,0 +1,559 @@
+"""
+Módulo de inventario particionado en múltiples procesos.
+
+Cuando un único proceso mantiene todas las filas BIN del inventario, los
+cálculos de estadísticas y las importaciones quedan limitados a un solo
+núcleo por el GIL de Python. Este módulo reparte las filas del inventario
+entre N procesos trabajadores (particiones), cada uno con su propio
+`Inventario` y sus `OperacionesMatriciales`.
+
+Modelo de Particionado:
+=======================
+
+1. ASIGNACIÓN DE FILAS A PARTICIONES
+
+   - Por item: k = crc32(numero_item | codigo_upc | id) mod N
+     Todas las ubicaciones (BINs) de un mismo item quedan en la misma
+     partición, por lo que las consultas por item no cruzan procesos.
+   - Por zona: k = crc32(pasillo del BIN) mod N
+     El pasillo es el primer segmento del código XXX/XXX/XXX.
+
+2. ENRUTAMIENTO DE MOVIMIENTOS
+
+   Cada entrada/salida se envía solo a la partición dueña del producto.
+
+3. DISPERSIÓN Y REUNIÓN (scatter-gather)
+
+   Las consultas globales se envían a todas las particiones en paralelo;
+   cada una devuelve sumas parciales y el coordinador las combina:
+   
+   total = Σₖ totalₖ        promedio = Σₖ sumaₖ / Σₖ nₖ
+"""
+
+import multiprocessing as mp
+import zlib
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from models.inventario import Inventario
+from models.producto import Producto
+from logic.operaciones_matriciales import OperacionesMatriciales
+
+
+# =============================================================================
+# PROCESO TRABAJADOR (uso interno)
+# =============================================================================
+
+def _agregados_parciales(ops: OperacionesMatriciales) -> Dict[str, float]:
+    """Calcula las sumas parciales de una partición para combinarlas después."""
+    stock = ops.obtener_vector_stock()
+    if stock.size == 0:
+        return {
+            'total_productos': 0,
+            'total_unidades': 0,
+            'valor_total': 0.0,
+            'productos_alerta': 0,
+            'suma_precios': 0.0
+        }
+    
+    return {
+        'total_productos': int(stock.size),
+        'total_unidades': int(np.sum(stock)),
+        'valor_total': float(np.sum(ops.calcular_vector_valores())),
+        'productos_alerta': int(np.sum(ops.calcular_alertas_stock_bajo())),
+        'suma_precios': float(np.sum(ops.obtener_vector_precios()))
+    }
+
+
+def _categorias_parciales(inventario: Inventario) -> pd.DataFrame:
+    """Calcula las sumas por categoría de una partición."""
+    return OperacionesMatriciales(inventario).sumas_por_categoria()
+
+
+def _agregar_productos(inventario: Inventario, productos: List[Producto]) -> List[bool]:
+    """Agrega un lote de productos a la partición."""
+    return [inventario.agregar_producto(p) for p in productos]
+
+
+def _ejecutar_particion(conexion) -> None:
+    """
+    Bucle principal de un proceso trabajador.
+    
+    Recibe tuplas (comando, argumentos) por la conexión y responde con
+    ('ok', resultado) o ('error', mensaje).
+    """
+    inventario = Inventario()
+    ops = OperacionesMatriciales(inventario)
+    
+    comandos = {
+        'agregar': lambda productos: _agregar_productos(inventario, productos),
+        'eliminar': inventario.eliminar_producto,
+        'obtener': inventario.obtener_producto,
+        'entrada': ops.registrar_entrada,
+        'salida': ops.registrar_salida,
+        'entradas_batch': ops.registrar_entradas_batch,
+        'salidas_batch': ops.registrar_salidas_batch,
+        'estadisticas': lambda: _agregados_parciales(ops),
+        'categorias': lambda: _categorias_parciales(inventario),
+        'alertas': ops.obtener_productos_alerta,
+        'dataframe': inventario.obtener_dataframe,
+        'cantidad': inventario.cantidad_productos,
+    }
+    
+    while True:
+        try:
+            comando, args = conexion.recv()
+        except EOFError:
+            break
+        
+        if comando == 'cerrar':
+            conexion.send(('ok', None))
+            break
+        
+        try:
+            conexion.send(('ok', comandos[comando](*args)))
+        except Exception as e:
+            conexion.send(('error', f"{type(e).__name__}: {e}"))
+    
+    conexion.close()
+
+
+# =============================================================================
+# COORDINADOR
+# =============================================================================
+
+class InventarioParticionado:
+    """
+    Inventario repartido entre varios procesos trabajadores.
+    
+    Cada partición es un proceso independiente con su propio `Inventario`,
+    de modo que los cálculos sobre particiones distintas se ejecutan en
+    paralelo en núcleos diferentes. El coordinador solo mantiene el mapa
+    {producto_id: partición} para enrutar los movimientos.
+    
+    Atributos:
+        num_particiones (int): Cantidad de procesos trabajadores
+        criterio (str): Criterio de particionado ('item' o 'zona')
+    
+    Ejemplo:
+        >>> with InventarioParticionado(num_particiones=4) as inv:
+        ...     inv.agregar_productos(productos)
+        ...     stats = inv.calcular_estadisticas()
+    """
+    
+    CRITERIO_ITEM = "item"
+    CRITERIO_ZONA = "zona"
+    
+    def __init__(self, num_particiones: Optional[int] = None, criterio: str = CRITERIO_ITEM):
+        """
+        Inicia los procesos trabajadores.
+        
+        Args:
+            num_particiones: Cantidad de particiones (por defecto, una por núcleo)
+            criterio: 'item' (hash de numero_item) o 'zona' (pasillo del BIN)
+        
+        Raises:
+            ValueError: Si el criterio o la cantidad de particiones no son válidos
+        """
+        if criterio not in (self.CRITERIO_ITEM, self.CRITERIO_ZONA):
+            raise ValueError(f"Criterio de particionado no válido: {criterio}")
+        
+        if num_particiones is None:
+            num_particiones = mp.cpu_count()
+        if num_particiones < 1:
+            raise ValueError("Debe haber al menos una partición")
+        
+        self.num_particiones = num_particiones
+        self.criterio = criterio
+        self._ubicacion: Dict[int, int] = {}
+        self._conexiones = []
+        self._procesos = []
+        
+        for _ in range(num_particiones):
+            conexion_padre, conexion_hijo = mp.Pipe()
+            proceso = mp.Process(target=_ejecutar_particion, args=(conexion_hijo,), daemon=True)
+            proceso.start()
+            conexion_hijo.close()
+            self._conexiones.append(conexion_padre)
+            self._procesos.append(proceso)
+    
+    # =========================================================================
+    # COMUNICACIÓN CON LAS PARTICIONES (uso interno)
+    # =========================================================================
+    
+    @staticmethod
+    def _respuesta(conexion):
+        """Recibe la respuesta de una partición y propaga sus errores."""
+        estado, resultado = conexion.recv()
+        if estado == 'error':
+            raise RuntimeError(f"Error en partición: {resultado}")
+        return resultado
+    
+    def _enviar(self, particion: int, comando: str, *args):
+        """Envía un comando a una partición y espera su respuesta."""
+        conexion = self._conexiones[particion]
+        conexion.send((comando, args))
+        return self._respuesta(conexion)
+    
+    def _dispersar(self, comando: str, argumentos: Optional[Dict[int, tuple]] = None) -> Dict[int, object]:
+        """
+        Envía un comando a varias particiones y reúne las respuestas.
+        
+        Todos los envíos se hacen antes de la primera recepción, de modo que
+        las particiones trabajan en paralelo. Se reciben todas las respuestas
+        antes de propagar un error, para no dejar respuestas pendientes en
+        las demás conexiones.
+        
+        Args:
+            comando: Nombre del comando
+            argumentos: {partición: args}; si es None se envía a todas sin argumentos
+        
+        Returns:
+            Dict[int, object]: {partición: resultado}
+        
+        Raises:
+            RuntimeError: Si alguna partición respondió con error
+        """
+        if argumentos is None:
+            argumentos = {k: () for k in range(self.num_particiones)}
+        
+        for particion, args in argumentos.items():
+            self._conexiones[particion].send((comando, args))
+        
+        respuestas = {particion: self._conexiones[particion].recv() for particion in argumentos}
+        for estado, resultado in respuestas.values():
+            if estado == 'error':
+                raise RuntimeError(f"Error en partición: {resultado}")
+        return {particion: resultado for particion, (_, resultado) in respuestas.items()}
+    
+    # =========================================================================
+    # PARTICIONADO
+    # =========================================================================
+    
+    def particion_de(self, producto: Producto) -> int:
+        """
+        Determina la partición dueña de un producto.
+        
+        Args:
+            producto: Producto a ubicar
+        
+        Returns:
+            int: Índice de la partición (0 ≤ k < N)
+        """
+        if self.criterio == self.CRITERIO_ZONA:
+            clave = producto.bin.split('/')[0] if producto.bin != "N/D" else "N/D"
+        elif producto.numero_item != "N/D":
+            clave = producto.numero_item
+        elif producto.codigo_upc != "N/D":
+            clave = producto.codigo_upc
+        else:
+            clave = f"ID_{producto.id}"
+        
+        return zlib.crc32(str(clave).encode('utf-8')) % self.num_particiones
+    
+    # =========================================================================
+    # GESTIÓN DE PRODUCTOS
+    # =========================================================================
+    
+    def agregar_producto(self, producto: Producto) -> bool:
+        """
+        Agrega un producto en la partición que le corresponde.
+        
+        Args:
+            producto: Producto a agregar
+        
+        Returns:
+            bool: True si se agregó exitosamente, False si ya existe
+        """
+        return self.agregar_productos([producto]) == 1
+    
+    def agregar_productos(self, productos: List[Producto]) -> int:
+        """
+        Agrega un lote de productos enviando un único mensaje por partición.
+        
+        Args:
+            productos: Productos a agregar
+        
+        Returns:
+            int: Cantidad de productos agregados
+        """
+        lotes: Dict[int, List[Producto]] = {}
+        vistos = set(self._ubicacion)
+        for producto in productos:
+            if producto.id in vistos:
+                continue
+            vistos.add(producto.id)
+            lotes.setdefault(self.particion_de(producto), []).append(producto)
+        
+        if not lotes:
+            return 0
+        
+        resultados = self._dispersar('agregar', {k: (lote,) for k, lote in lotes.items()})
+        
+        agregados = 0
+        for particion, lote in lotes.items():
+            for producto, exito in zip(lote, resultados[particion]):
+                if exito:
+                    self._ubicacion[producto.id] = particion
+                    agregados += 1
+        return agregados
+    
+    def eliminar_producto(self, producto_id: int) -> bool:
+        """
+        Elimina un producto de su partición.
+        
+        Args:
+            producto_id: ID del producto a eliminar
+        
+        Returns:
+            bool: True si se eliminó, False si no existía
+        """
+        particion = self._ubicacion.pop(producto_id, None)
+        if particion is None:
+            return False
+        return self._enviar(particion, 'eliminar', producto_id)
+    
+    def obtener_producto(self, producto_id: int) -> Optional[Producto]:
+        """
+        Obtiene una copia del producto desde su partición.
+        
+        Args:
+            producto_id: ID del producto
+        
+        Returns:
+            Producto o None si no existe
+        """
+        particion = self._ubicacion.get(producto_id)
+        if particion is None:
+            return None
+        return self._enviar(particion, 'obtener', producto_id)
+    
+    # =========================================================================
+    # MOVIMIENTOS (ENRUTADOS A LA PARTICIÓN DUEÑA)
+    # =========================================================================
+    
+    def registrar_entrada(self, producto_id: int, cantidad: int) -> Tuple[bool, str]:
+        """
+        Registra una entrada en la partición dueña del producto.
+        
+        Args:
+            producto_id: ID del producto
+            cantidad: Cantidad a ingresar
+        
+        Returns:
+            Tuple[bool, str]: (éxito, mensaje)
+        """
+        particion = self._ubicacion.get(producto_id)
+        if particion is None:
+            return False, f"Producto con ID {producto_id} no encontrado"
+        return self._enviar(particion, 'entrada', producto_id, cantidad)
+    
+    def registrar_salida(self, producto_id: int, cantidad: int) -> Tuple[bool, str]:
+        """
+        Registra una salida en la partición dueña del producto.
+        
+        Args:
+            producto_id: ID del producto
+            cantidad: Cantidad a retirar
+        
+        Returns:
+            Tuple[bool, str]: (éxito, mensaje)
+        """
+        particion = self._ubicacion.get(producto_id)
+        if particion is None:
+            return False, f"Producto con ID {producto_id} no encontrado"
+        return self._enviar(particion, 'salida', producto_id, cantidad)
+    
+    def _registrar_batch(self, comando: str, vector: Dict[int, int]) -> Tuple[int, List[str]]:
+        """Reparte un lote de movimientos por partición y los aplica en paralelo."""
+        lotes: Dict[int, Dict[int, int]] = {}
+        mensajes = []
+        
+        for producto_id, cantidad in vector.items():
+            particion = self._ubicacion.get(producto_id)
+            if particion is None:
+                mensajes.append(f"Producto con ID {producto_id} no encontrado")
+            else:
+                lotes.setdefault(particion, {})[producto_id] = cantidad
+        
+        exitosas = 0
+        if lotes:
+            resultados = self._dispersar(comando, {k: (lote,) for k, lote in lotes.items()})
+            for exitosas_k, mensajes_k in resultados.values():
+                exitosas += exitosas_k
+                mensajes.extend(mensajes_k)
+        
+        return exitosas, mensajes
+    
+    def registrar_entradas_batch(self, vector_entradas: Dict[int, int]) -> Tuple[int, List[str]]:
+        """
+        Registra múltiples entradas, agrupadas por partición.
+        
+        Args:
+            vector_entradas: Diccionario {producto_id: cantidad}
+        
+        Returns:
+            Tuple[int, List[str]]: (cantidad exitosa, lista de mensajes)
+        """
+        return self._registrar_batch('entradas_batch', vector_entradas)
+    
+    def registrar_salidas_batch(self, vector_salidas: Dict[int, int]) -> Tuple[int, List[str]]:
+        """
+        Registra múltiples salidas, agrupadas por partición.
+        
+        Args:
+            vector_salidas: Diccionario {producto_id: cantidad}
+        
+        Returns:
+            Tuple[int, List[str]]: (cantidad exitosa, lista de mensajes)
+        """
+        return self._registrar_batch('salidas_batch', vector_salidas)
+    
+    # =========================================================================
+    # CONSULTAS GLOBALES (SCATTER-GATHER)
+    # =========================================================================
+    
+    def calcular_estadisticas(self) -> Dict[str, float]:
+        """
+        Calcula las estadísticas globales combinando las sumas de cada partición.
+        
+        Devuelve las mismas claves que `OperacionesMatriciales.calcular_estadisticas`.
+        
+        Returns:
+            Dict con estadísticas del inventario
+        """
+        parciales = list(self._dispersar('estadisticas').values())
+        
+        n = sum(p['total_productos'] for p in parciales)
+        unidades = sum(p['total_unidades'] for p in parciales)
+        valor = sum(p['valor_total'] for p in parciales)
+        alertas = sum(p['productos_alerta'] for p in parciales)
+        suma_precios = sum(p['suma_precios'] for p in parciales)
+        
+        if n == 0:
+            return {
+                'total_productos': 0,
+                'total_unidades': 0,
+                'valor_total': 0.0,
+                'productos_alerta': 0,
+                'porcentaje_alerta': 0.0,
+                'stock_promedio': 0.0,
+                'precio_promedio': 0.0,
+                'valor_promedio': 0.0
+            }
+        
+        return {
+            'total_productos': n,
+            'total_unidades': unidades,
+            'valor_total': valor,
+            'productos_alerta': alertas,
+            'porcentaje_alerta': alertas / n * 100,
+            'stock_promedio': unidades / n,
+            'precio_promedio': suma_precios / n,
+            'valor_promedio': valor / n
+        }
+    
+    def analisis_por_categoria(self) -> pd.DataFrame:
+        """
+        Realiza el análisis por categoría combinando las sumas de cada partición.
+        
+        Returns:
+            pd.DataFrame: Mismo formato que `OperacionesMatriciales.analisis_por_categoria`
+        """
+        parciales = [df for df in self._dispersar('categorias').values() if not df.empty]
+        
+        if not parciales:
+            return pd.DataFrame()
+        
+        total = pd.concat(parciales).groupby(level=0).sum()
+        total['precio_promedio'] = total['suma_precios'] / total['cantidad_productos']
+        total.index.name = 'categoria'
+        
+        return total[[
+            'cantidad_productos', 'total_unidades', 'valor_total', 'precio_promedio'
+        ]].round(2)
+    
+    def obtener_productos_alerta(self) -> List[Producto]:
+        """
+        Reúne los productos con stock bajo de todas las particiones.
+        
+        Returns:
+            List[Producto]: Copias de los productos con stock bajo
+        """
+        resultados = self._dispersar('alertas')
+        return [p for k in sorted(resultados) for p in resultados[k]]
+    
+    def contar_alertas(self) -> int:
+        """
+        Cuenta los productos con stock bajo en todo el inventario.
+        
+        Returns:
+            int: Cantidad de productos con alerta
+        """
+        return sum(p['productos_alerta'] for p in self._dispersar('estadisticas').values())
+    
+    def obtener_dataframe(self) -> pd.DataFrame:
+        """
+        Reúne el inventario completo como DataFrame, ordenado por ID.
+        
+        Returns:
+            pd.DataFrame: Inventario en formato tabular
+        """
+        partes = [df for df in self._dispersar('dataframe').values() if not df.empty]
+        if not partes:
+            return Inventario().obtener_dataframe()
+        df = pd.concat(partes, ignore_index=True).sort_values('id', ignore_index=True)
+        # Cada partición tiene su propio diccionario de categorías
+        df['categoria'] = df['categoria'].astype('category')
+        return df
+    
+    def tamanos_particiones(self) -> List[int]:
+        """
+        Retorna la cantidad de productos en cada partición.
+        
+        Returns:
+            List[int]: Productos por partición
+        """
+        resultados = self._dispersar('cantidad')
+        return [resultados[k] for k in range(self.num_particiones)]
+    
+    # =========================================================================
+    # CICLO DE VIDA
+    # =========================================================================
+    
+    def cerrar(self) -> None:
+        """Detiene todos los procesos trabajadores."""
+        for conexion in self._conexiones:
+            try:
+                conexion.send(('cerrar', ()))
+                conexion.recv()
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+            conexion.close()
+        
+        for proceso in self._procesos:
+            proceso.join(timeout=5)
+        
+        self._conexiones = []
+        self._procesos = []
+    
+    def __enter__(self) -> 'InventarioParticionado':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de productos."""
+        return len(self._ubicacion)
+    
+    def __contains__(self, producto_id: int) -> bool:
+        """Verifica si un producto existe en el inventario."""
+        return producto_id in self._ubicacion
+    
+    def __repr__(self) -> str:
+        """Representación string del inventario particionado."""
+        return (
+            f"InventarioParticionado(productos={len(self._ubicacion)}, "
+            f"particiones={self.num_particiones}, criterio='{self.criterio}')"
+        )
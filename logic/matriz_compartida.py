@@ -0,0 +1,297 @@
+"""
+Módulo de matriz de inventario en memoria compartida.
+
+Permite que varios procesos lectores (reportes, API, análisis) accedan a
+la matriz de inventario sin reconstruir su propia copia ni serializarla.
+La matriz que produce `Inventario.obtener_matriz_inventario` se publica en
+un bloque de `multiprocessing.shared_memory` que los lectores mapean
+directamente como un `np.ndarray` (copia cero).
+
+Protocolo de Consistencia (seqlock):
+====================================
+
+El bloque comienza con una cabecera de 4 enteros int64:
+
+    [secuencia, filas, columnas, capacidad]
+
+seguida de la matriz float64 de forma (capacidad, columnas).
+
+- Escritor (único): secuencia += 1 (impar) → escribe datos → secuencia += 1 (par)
+- Lector: s₁ = secuencia; si s₁ es impar reintenta; lee los datos;
+  s₂ = secuencia; la lectura es consistente si s₁ = s₂.
+
+Los lectores nunca bloquean al escritor y no se necesita ningún candado
+entre procesos.
+"""
+
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Callable, Optional, TypeVar
+from models.inventario import Inventario
+
+
+T = TypeVar('T')
+
+
+class MatrizCompartida:
+    """
+    Matriz de inventario publicada en memoria compartida.
+    
+    Un único proceso escritor (el que crea el bloque) publica la matriz;
+    cualquier cantidad de procesos lectores se conecta por nombre y obtiene
+    instantáneas consistentes sin copiar ni serializar datos.
+    
+    Atributos:
+        nombre (str): Nombre del bloque de memoria compartida
+        columnas (int): Columnas de la matriz (5 para el inventario)
+        capacidad (int): Máximo de filas que caben en el bloque
+        es_escritor (bool): True si este proceso creó el bloque
+    
+    Ejemplo:
+        >>> escritor = MatrizCompartida.crear(capacidad=10000)
+        >>> escritor.publicar_inventario(inventario)
+        >>> lector = MatrizCompartida.conectar(escritor.nombre)  # otro proceso
+        >>> total = lector.con_instantanea(lambda m: m[:, 2].sum())
+    """
+    
+    # Índices de la cabecera
+    CAB_SECUENCIA = 0
+    CAB_FILAS = 1
+    CAB_COLUMNAS = 2
+    CAB_CAPACIDAD = 3
+    TAMANO_CABECERA = 4
+    
+    # Reintentos de lectura antes de ceder el procesador
+    REINTENTOS_ACTIVOS = 100
+    
+    def __init__(self, memoria: shared_memory.SharedMemory, es_escritor: bool):
+        """
+        Envuelve un bloque de memoria compartida (uso interno).
+        
+        Use `MatrizCompartida.crear` o `MatrizCompartida.conectar`.
+        
+        Args:
+            memoria: Bloque de memoria compartida
+            es_escritor: True si este proceso es el dueño del bloque
+        """
+        self._memoria = memoria
+        self.es_escritor = es_escritor
+        self._cabecera = np.ndarray(
+            (self.TAMANO_CABECERA,), dtype=np.int64, buffer=memoria.buf
+        )
+        self.columnas = int(self._cabecera[self.CAB_COLUMNAS])
+        self.capacidad = int(self._cabecera[self.CAB_CAPACIDAD])
+        self._datos = np.ndarray(
+            (self.capacidad, self.columnas),
+            dtype=np.float64,
+            buffer=memoria.buf,
+            offset=self.TAMANO_CABECERA * 8
+        )
+        self.cerrada = False
+    
+    @classmethod
+    def crear(
+        cls,
+        capacidad: int,
+        columnas: int = 5,
+        nombre: Optional[str] = None
+    ) -> 'MatrizCompartida':
+        """
+        Crea un nuevo bloque de memoria compartida (proceso escritor).
+        
+        Args:
+            capacidad: Máximo de filas (productos) que podrá contener
+            columnas: Columnas de la matriz
+            nombre: Nombre del bloque (se genera uno si es None)
+        
+        Returns:
+            MatrizCompartida: Matriz con este proceso como escritor
+        
+        Raises:
+            ValueError: Si la capacidad o las columnas no son positivas
+        """
+        if capacidad <= 0 or columnas <= 0:
+            raise ValueError("La capacidad y las columnas deben ser positivas")
+        
+        tamano = (cls.TAMANO_CABECERA + capacidad * columnas) * 8
+        memoria = shared_memory.SharedMemory(name=nombre, create=True, size=tamano)
+        
+        cabecera = np.ndarray((cls.TAMANO_CABECERA,), dtype=np.int64, buffer=memoria.buf)
+        cabecera[cls.CAB_SECUENCIA] = 0
+        cabecera[cls.CAB_FILAS] = 0
+        cabecera[cls.CAB_COLUMNAS] = columnas
+        cabecera[cls.CAB_CAPACIDAD] = capacidad
+        del cabecera
+        
+        return cls(memoria, es_escritor=True)
+    
+    @classmethod
+    def conectar(cls, nombre: str) -> 'MatrizCompartida':
+        """
+        Se conecta a un bloque existente como lector.
+        
+        Args:
+            nombre: Nombre del bloque publicado por el escritor
+        
+        Returns:
+            MatrizCompartida: Matriz de solo lectura
+        """
+        try:
+            memoria = shared_memory.SharedMemory(name=nombre, track=False)
+        except TypeError:
+            # Python < 3.13: evitar que el rastreador de recursos del lector
+            # elimine el bloque al terminar el proceso
+            from multiprocessing import resource_tracker
+            memoria = shared_memory.SharedMemory(name=nombre)
+            resource_tracker.unregister(memoria._name, 'shared_memory')
+        
+        return cls(memoria, es_escritor=False)
+    
+    @property
+    def nombre(self) -> str:
+        """Nombre del bloque de memoria compartida."""
+        return self._memoria.name
+    
+    @property
+    def secuencia(self) -> int:
+        """Número de secuencia actual (par = estable, impar = escritura en curso)."""
+        return int(self._cabecera[self.CAB_SECUENCIA])
+    
+    # =========================================================================
+    # ESCRITURA (solo el proceso dueño)
+    # =========================================================================
+    
+    def publicar(self, matriz: np.ndarray) -> int:
+        """
+        Publica una nueva versión de la matriz.
+        
+        Args:
+            matriz: Matriz de forma (n, columnas)
+        
+        Returns:
+            int: Número de secuencia de la versión publicada
+        
+        Raises:
+            PermissionError: Si este proceso no es el escritor
+            ValueError: Si la matriz no cabe en el bloque
+        """
+        if not self.es_escritor:
+            raise PermissionError("Solo el proceso escritor puede publicar la matriz")
+        
+        matriz = np.asarray(matriz, dtype=np.float64).reshape(-1, self.columnas)
+        filas = matriz.shape[0]
+        if filas > self.capacidad:
+            raise ValueError(
+                f"La matriz tiene {filas} filas y la capacidad es {self.capacidad}"
+            )
+        
+        self._cabecera[self.CAB_SECUENCIA] += 1
+        self._datos[:filas] = matriz
+        self._cabecera[self.CAB_FILAS] = filas
+        self._cabecera[self.CAB_SECUENCIA] += 1
+        
+        return self.secuencia
+    
+    def publicar_inventario(self, inventario: Inventario) -> int:
+        """
+        Publica la matriz actual de un inventario.
+        
+        Args:
+            inventario: Inventario cuya matriz se publica
+        
+        Returns:
+            int: Número de secuencia de la versión publicada
+        """
+        return self.publicar(inventario.obtener_matriz_inventario())
+    
+    # =========================================================================
+    # LECTURA (cualquier proceso)
+    # =========================================================================
+    
+    def con_instantanea(self, funcion: Callable[[np.ndarray], T]) -> T:
+        """
+        Ejecuta una función sobre una vista de copia cero de la matriz.
+        
+        La función recibe un `np.ndarray` de solo lectura que apunta
+        directamente a la memoria compartida. Si el escritor publica una
+        nueva versión mientras la función se ejecuta, la función se repite
+        sobre la nueva versión; el resultado devuelto corresponde siempre
+        a una versión consistente.
+        
+        La función no debe conservar referencias a la vista ni tener
+        efectos secundarios, porque puede ejecutarse más de una vez.
+        
+        Args:
+            funcion: Función que recibe la matriz y calcula un resultado
+        
+        Returns:
+            Resultado de la función sobre una versión consistente
+        """
+        intentos = 0
+        while True:
+            inicio = self._cabecera[self.CAB_SECUENCIA]
+            if inicio % 2 == 0:
+                vista = self._datos[:int(self._cabecera[self.CAB_FILAS])]
+                vista.flags.writeable = False
+                resultado = funcion(vista)
+                if self._cabecera[self.CAB_SECUENCIA] == inicio:
+                    return resultado
+            
+            intentos += 1
+            if intentos % self.REINTENTOS_ACTIVOS == 0:
+                time.sleep(0)
+    
+    def leer(self) -> np.ndarray:
+        """
+        Obtiene una copia consistente de la matriz.
+        
+        Returns:
+            np.ndarray: Copia de la última versión publicada
+        """
+        return self.con_instantanea(np.copy)
+    
+    def filas(self) -> int:
+        """
+        Retorna la cantidad de filas de la última versión publicada.
+        
+        Returns:
+            int: Número de productos publicados
+        """
+        return self.con_instantanea(len)
+    
+    # =========================================================================
+    # CICLO DE VIDA
+    # =========================================================================
+    
+    def cerrar(self) -> None:
+        """
+        Libera el mapeo de este proceso.
+        
+        Si este proceso es el escritor, además elimina el bloque del sistema.
+        Llamarlo sobre una matriz ya cerrada no hace nada.
+        """
+        if self.cerrada:
+            return
+        self.cerrada = True
+        del self._datos
+        del self._cabecera
+        self._memoria.close()
+        if self.es_escritor:
+            self._memoria.unlink()
+    
+    def __enter__(self) -> 'MatrizCompartida':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+    
+    def __repr__(self) -> str:
+        """Representación string de la matriz compartida."""
+        rol = "escritor" if self.es_escritor else "lector"
+        if self.cerrada:
+            return f"MatrizCompartida(nombre='{self._memoria.name}', rol={rol}, cerrada)"
+        return (
+            f"MatrizCompartida(nombre='{self.nombre}', rol={rol}, "
+            f"capacidad={self.capacidad}, secuencia={self.secuencia})"
+        )
@@ -40,6 +40,24 @@ Modelo Matemático:
    V = pᵀ · s = Σ(precioᵢ × stockᵢ)
    
    Donde p es el vector de precios y s el vector de stock.
+
+6. CLASIFICACIÓN ABC (PARETO)
+   
+   Con los valores v ordenados de mayor a menor (una sola argsort) y
+   su suma acumulada Cₖ (cumsum), cada producto se clasifica según la
+   fracción del valor total acumulada antes de él:
+   
+   fₖ = (Cₖ − vₖ) / Σv        A si fₖ < 0.80,  B si fₖ < 0.95,  C en otro caso
+
+7. TRANSFERENCIAS ENTRE BINS
+   
+   Para transferencias (oₖ, dₖ, qₖ) entre filas de la matriz:
+   
+   x = Σ qₖ·e_oₖ,   e = Σ qₖ·e_dₖ        (np.bincount)
+   Restricciones: x ≤ s  y  s − x + e ≤ max
+   
+   El rebalanceo lleva cada BIN de un ítem a la ocupación común
+   r = Σs / Σmax del ítem: objetivoᵢ = r·maxᵢ (redondeado conservando Σs).
 """
 
 import numpy as np
@@ -47,6 +65,8 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from models.inventario import Inventario
 from models.producto import Producto
+from logic.reabastecimiento import MotorReabastecimiento
+from logic.vistas_materializadas import MEDIDAS_CATEGORIA, RegistroVistas
 
 
 class OperacionesMatriciales:
@@ -71,14 +91,31 @@ class OperacionesMatriciales:
     COL_MIN = 3
     COL_MAX = 4
     
-    def __init__(self, inventario: Inventario):
+    # Clasificación ABC: fracción acumulada del valor en que terminan A y B
+    UMBRALES_ABC = (0.80, 0.95)
+    CLASES_ABC = np.array(['A', 'B', 'C'])
+    # Cambio relativo del valor (Σ|Δv| / Σv) que no obliga a reclasificar
+    TOLERANCIA_ABC = 0.01
+    BASES_ABC = ('valor', 'consumo')
+    
+    # Vista materializada que usa `analisis_por_categoria` si hay registro
+    VISTA_CATEGORIAS = "analisis_por_categoria"
+    
+    def __init__(self, inventario: Inventario, vistas: Optional[RegistroVistas] = None):
         """
         Inicializa el módulo de operaciones con un inventario.
         
         Args:
             inventario: Instancia de Inventario a gestionar
+            vistas: Registro de vistas materializadas del inventario; si se
+                indica, el análisis por categoría se lee de una vista
+                mantenida por deltas en vez de recalcularse
         """
         self.inventario = inventario
+        self.vistas = vistas
+        self.motor_reabastecimiento = MotorReabastecimiento()
+        self._sumas_categoria: Optional[Tuple[int, pd.DataFrame]] = None
+        self._clases_abc: Dict[Tuple, Tuple[int, np.ndarray, np.ndarray, np.ndarray]] = {}
     
     # =========================================================================
     # OPERACIONES DE CONSULTA (LECTURA)
@@ -136,6 +173,22 @@ class OperacionesMatriciales:
             return np.array([])
         return matriz[:, self.COL_MAX]
     
+    def calcular_valor_total_centavos(self) -> int:
+        """
+        Calcula el valor total del inventario en centavos, sin redondeo.
+        
+        Operación matricial: V = cᵀ · s (producto punto entero)
+        
+        Donde:
+            - c: vector de precios en centavos (int64)
+            - s: vector de stock (int32, ampliado a int64)
+        
+        Returns:
+            int: Valor total exacto en centavos
+        """
+        columnas = self.inventario.obtener_columnas()
+        return int(np.dot(columnas['precio_centavos'], columnas['stock_actual'].astype(np.int64)))
+    
     def calcular_valor_total_inventario(self) -> float:
         """
         Calcula el valor monetario total del inventario.
@@ -146,17 +199,14 @@ class OperacionesMatriciales:
             - p: vector de precios
             - s: vector de stock
         
+        La suma se hace en centavos enteros (`calcular_valor_total_centavos`)
+        y solo el resultado se convierte a float, así que no acumula errores
+        de redondeo.
+        
         Returns:
             float: Valor total del inventario
         """
-        precios = self.obtener_vector_precios()
-        stock = self.obtener_vector_stock()
-        
-        if precios.size == 0:
-            return 0.0
-        
-        # Producto punto: suma de (precio × cantidad)
-        return float(np.dot(precios, stock))
+        return self.calcular_valor_total_centavos() / 100
     
     def calcular_vector_valores(self) -> np.ndarray:
         """
@@ -167,14 +217,12 @@ class OperacionesMatriciales:
         Returns:
             np.ndarray: Vector de valores de cada producto
         """
-        precios = self.obtener_vector_precios()
-        stock = self.obtener_vector_stock()
-        
-        if precios.size == 0:
+        columnas = self.inventario.obtener_columnas()
+        if columnas['id'].size == 0:
             return np.array([])
         
-        # Producto de Hadamard (elemento a elemento)
-        return precios * stock
+        # Producto de Hadamard (elemento a elemento), exacto en centavos
+        return (columnas['precio_centavos'] * columnas['stock_actual']) / 100
     
     # =========================================================================
     # OPERACIONES DE ALERTAS
@@ -262,6 +310,68 @@ class OperacionesMatriciales:
         
         return np.maximum(0, cantidad).astype(int)
     
+    def calcular_reabastecimiento_optimo(
+        self,
+        tasa_demanda: np.ndarray,
+        varianza_demanda: np.ndarray,
+        tiempo_reposicion,
+        costo_pedido,
+        costo_mantener,
+        factor_servicio=1.65
+    ) -> pd.DataFrame:
+        """
+        Calcula el reabastecimiento con el modelo de punto de reorden y EOQ.
+        
+        Alternativa a `calcular_cantidad_reabastecimiento`: cuando el stock
+        llega al punto de reorden se pide la cantidad económica (o lo
+        necesario para superar el punto de reorden), limitada al espacio
+        disponible.
+        
+        Operación: r = min(max(Q*, ROP - s), max - s) si s ≤ ROP, 0 en otro caso
+        
+        Args:
+            tasa_demanda: Demanda media por periodo de cada producto
+            varianza_demanda: Varianza de la demanda por periodo
+            tiempo_reposicion: Tiempo de reposición en periodos
+            costo_pedido: Costo fijo por pedido
+            costo_mantener: Costo de mantener una unidad por periodo
+            factor_servicio: Factor z del nivel de servicio
+        
+        Returns:
+            pd.DataFrame: Columnas id, stock_seguridad, punto_reorden,
+                cantidad_economica y cantidad_sugerida
+        """
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return pd.DataFrame(columns=[
+                'id', 'stock_seguridad', 'punto_reorden',
+                'cantidad_economica', 'cantidad_sugerida'
+            ])
+        
+        ids = matriz[:, self.COL_ID].astype(np.int64)
+        stock = matriz[:, self.COL_STOCK]
+        
+        modelo = self.motor_reabastecimiento.calcular(
+            tasa_demanda, varianza_demanda, tiempo_reposicion,
+            costo_pedido, costo_mantener, factor_servicio, n_productos=len(ids)
+        )
+        punto_reorden = modelo['punto_reorden']
+        
+        cantidad = np.maximum(
+            np.ceil(modelo['cantidad_economica']),
+            np.ceil(punto_reorden - stock)
+        )
+        cantidad = np.minimum(cantidad, self.calcular_espacio_disponible())
+        cantidad = np.where(stock <= punto_reorden, cantidad, 0)
+        
+        return pd.DataFrame({
+            'id': ids,
+            'stock_seguridad': modelo['stock_seguridad'].round(2),
+            'punto_reorden': punto_reorden.round(2),
+            'cantidad_economica': modelo['cantidad_economica'].round(2),
+            'cantidad_sugerida': np.maximum(0, cantidad).astype(int)
+        })
+    
     # =========================================================================
     # OPERACIONES DE ENTRADA (COMPRAS/RECEPCIÓN)
     # =========================================================================
@@ -298,23 +408,28 @@ class OperacionesMatriciales:
                 f"Espacio disponible: {espacio}, Cantidad solicitada: {cantidad}"
             )
         
-        # Actualizar stock
+        # Actualizar stock (el inventario recibe el cambio desde el producto)
         producto.stock_actual += cantidad
-        self.inventario.notificar_cambio_stock()
+        self.inventario.movimientos.registrar(producto_id, cantidad)
         
         return True, f"Entrada registrada: {cantidad} unidades de '{producto.nombre}'"
     
     def registrar_entradas_batch(
         self,
-        vector_entradas: Dict[int, int]
+        vector_entradas: Dict[int, int],
+        atomico: bool = False
     ) -> Tuple[int, List[str]]:
         """
         Registra múltiples entradas de inventario.
         
         Operación matricial: s' = s + e
         
+        Las entradas se aplican en una transacción del inventario: el caché
+        se actualiza y se publica un evento una sola vez al final.
+        
         Args:
             vector_entradas: Diccionario {producto_id: cantidad}
+            atomico: Si es True, una sola entrada rechazada deshace todo el lote
         
         Returns:
             Tuple[int, List[str]]: (cantidad exitosa, lista de mensajes)
@@ -322,11 +437,18 @@ class OperacionesMatriciales:
         exitosas = 0
         mensajes = []
         
-        for producto_id, cantidad in vector_entradas.items():
-            exito, mensaje = self.registrar_entrada(producto_id, cantidad)
-            mensajes.append(mensaje)
-            if exito:
-                exitosas += 1
+        with self.inventario.transaccion():
+            inicio = self.inventario.punto_guardado()
+            for producto_id, cantidad in vector_entradas.items():
+                exito, mensaje = self.registrar_entrada(producto_id, cantidad)
+                mensajes.append(mensaje)
+                if exito:
+                    exitosas += 1
+            
+            if atomico and exitosas < len(vector_entradas):
+                self.inventario.revertir_a(inicio)
+                exitosas = 0
+                mensajes.append("Lote cancelado: no se aplicó ninguna entrada")
         
         return exitosas, mensajes
     
@@ -365,23 +487,28 @@ class OperacionesMatriciales:
                 f"Disponible: {producto.stock_actual}, Solicitado: {cantidad}"
             )
         
-        # Actualizar stock
+        # Actualizar stock (el inventario recibe el cambio desde el producto)
         producto.stock_actual -= cantidad
-        self.inventario.notificar_cambio_stock()
+        self.inventario.movimientos.registrar(producto_id, -cantidad)
         
         return True, f"Salida registrada: {cantidad} unidades de '{producto.nombre}'"
     
     def registrar_salidas_batch(
         self,
-        vector_salidas: Dict[int, int]
+        vector_salidas: Dict[int, int],
+        atomico: bool = False
     ) -> Tuple[int, List[str]]:
         """
         Registra múltiples salidas de inventario.
         
         Operación matricial: s' = s - x
         
+        Las salidas se aplican en una transacción del inventario: el caché
+        se actualiza y se publica un evento una sola vez al final.
+        
         Args:
             vector_salidas: Diccionario {producto_id: cantidad}
+            atomico: Si es True, una sola salida rechazada deshace todo el lote
         
         Returns:
             Tuple[int, List[str]]: (cantidad exitosa, lista de mensajes)
@@ -389,14 +516,194 @@ class OperacionesMatriciales:
         exitosas = 0
         mensajes = []
         
-        for producto_id, cantidad in vector_salidas.items():
-            exito, mensaje = self.registrar_salida(producto_id, cantidad)
-            mensajes.append(mensaje)
-            if exito:
-                exitosas += 1
+        with self.inventario.transaccion():
+            inicio = self.inventario.punto_guardado()
+            for producto_id, cantidad in vector_salidas.items():
+                exito, mensaje = self.registrar_salida(producto_id, cantidad)
+                mensajes.append(mensaje)
+                if exito:
+                    exitosas += 1
+            
+            if atomico and exitosas < len(vector_salidas):
+                self.inventario.revertir_a(inicio)
+                exitosas = 0
+                mensajes.append("Lote cancelado: no se aplicó ninguna salida")
         
         return exitosas, mensajes
     
+    # =========================================================================
+    # TRANSFERENCIAS ENTRE BINS
+    # =========================================================================
+    
+    def transferir_lote(
+        self,
+        filas_origen,
+        filas_destino,
+        cantidades
+    ) -> Tuple[bool, List[str]]:
+        """
+        Transfiere stock entre BINs de un mismo ítem de forma atómica.
+        
+        Operación matricial: s' = s − x + e, con x y e las salidas y
+        entradas acumuladas por fila (np.bincount). Todas las
+        restricciones se validan sobre los vectores antes de modificar
+        nada; si alguna falla no se aplica ninguna transferencia.
+        
+        Las transferencias no se anotan en el registro de movimientos:
+        no son entradas ni salidas de la bodega.
+        
+        Args:
+            filas_origen: Filas de la matriz de inventario que entregan stock
+            filas_destino: Filas que reciben stock
+            cantidades: Unidades de cada transferencia (positivas)
+        
+        Returns:
+            Tuple[bool, List[str]]: (éxito, mensajes)
+        """
+        origen = np.asarray(filas_origen, dtype=np.intp).ravel()
+        destino = np.asarray(filas_destino, dtype=np.intp).ravel()
+        cantidades = np.asarray(cantidades, dtype=np.int64).ravel()
+        if not (origen.size == destino.size == cantidades.size):
+            return False, ["Los vectores de origen, destino y cantidad deben tener el mismo largo"]
+        if origen.size == 0:
+            return True, ["No hay transferencias"]
+        
+        matriz = self.inventario.obtener_matriz_inventario()
+        n = matriz.shape[0]
+        if origen.min() < 0 or destino.min() < 0 or max(origen.max(), destino.max()) >= n:
+            return False, [f"Fila fuera de rango (el inventario tiene {n} filas)"]
+        
+        mensajes = []
+        for k in np.flatnonzero(cantidades <= 0):
+            mensajes.append(f"Transferencia {k}: la cantidad debe ser positiva")
+        for k in np.flatnonzero(origen == destino):
+            mensajes.append(f"Transferencia {k}: el origen y el destino son la misma fila")
+        
+        productos = list(self.inventario.productos.values())
+        for k in range(origen.size):
+            a, b = productos[origen[k]], productos[destino[k]]
+            if self.inventario.clave_grupo(a) != self.inventario.clave_grupo(b):
+                mensajes.append(
+                    f"Transferencia {k}: '{a.nombre}' y '{b.nombre}' no son el mismo ítem"
+                )
+        
+        stock = matriz[:, self.COL_STOCK]
+        salidas = np.bincount(origen, weights=cantidades, minlength=n)
+        entradas = np.bincount(destino, weights=cantidades, minlength=n)
+        nuevo = stock - salidas + entradas
+        
+        for fila in np.flatnonzero(salidas > stock):
+            mensajes.append(
+                f"Stock insuficiente en BIN {productos[fila].bin} de '{productos[fila].nombre}'. "
+                f"Disponible: {int(stock[fila])}, Solicitado: {int(salidas[fila])}"
+            )
+        for fila in np.flatnonzero((entradas > 0) & (nuevo > matriz[:, self.COL_MAX])):
+            mensajes.append(
+                f"Capacidad excedida en BIN {productos[fila].bin} de '{productos[fila].nombre}'. "
+                f"Máximo: {int(matriz[fila, self.COL_MAX])}, Resultado: {int(nuevo[fila])}"
+            )
+        
+        if mensajes:
+            mensajes.append("Lote cancelado: no se aplicó ninguna transferencia")
+            return False, mensajes
+        
+        with self.inventario.transaccion():
+            for fila in np.flatnonzero(nuevo != stock):
+                productos[fila].stock_actual = int(nuevo[fila])
+        
+        return True, [
+            f"{origen.size} transferencias aplicadas: {int(cantidades.sum())} unidades movidas"
+        ]
+    
+    def proponer_rebalanceo(self) -> pd.DataFrame:
+        """
+        Calcula las transferencias que igualan la ocupación de los BINs de cada ítem.
+        
+        Para cada ítem con varios BINs, el objetivo de cada BIN es
+        r·max con r = Σstock / Σmax del ítem; el redondeo reparte las
+        unidades sobrantes por mayor parte fraccionaria. Los excedentes y
+        faltantes se emparejan en una sola pasada sobre sus sumas
+        acumuladas, que coinciden al final de cada ítem. Se omiten los
+        ítems cuyo stock total supera su capacidad total.
+        
+        Returns:
+            pd.DataFrame: Columnas fila_origen, fila_destino, id_origen,
+                id_destino, bin_origen, bin_destino y cantidad
+        """
+        columnas = [
+            'fila_origen', 'fila_destino', 'id_origen', 'id_destino',
+            'bin_origen', 'bin_destino', 'cantidad'
+        ]
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return pd.DataFrame(columns=columnas)
+        
+        productos = list(self.inventario.productos.values())
+        _, grupos = np.unique(
+            np.array([self.inventario.clave_grupo(p) for p in productos], dtype=object).astype(str),
+            return_inverse=True
+        )
+        grupos = grupos.ravel()
+        stock = matriz[:, self.COL_STOCK].astype(np.int64)
+        maximo = matriz[:, self.COL_MAX].astype(np.int64)
+        
+        bins_grupo = np.bincount(grupos)
+        stock_grupo = np.bincount(grupos, weights=stock)
+        capacidad_grupo = np.bincount(grupos, weights=maximo)
+        candidatos = (bins_grupo[grupos] > 1) & (capacidad_grupo[grupos] > 0) & \
+            (stock_grupo[grupos] <= capacidad_grupo[grupos])
+        
+        # Objetivo entero por BIN conservando el stock total de cada ítem
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ideal = np.where(candidatos, maximo * stock_grupo[grupos] / capacidad_grupo[grupos], stock)
+        objetivo = np.floor(ideal).astype(np.int64)
+        faltan = (stock_grupo - np.bincount(grupos, weights=objetivo, minlength=len(bins_grupo))).round().astype(np.int64)
+        orden = np.lexsort((-(ideal - objetivo), grupos))
+        inicio_grupo = np.concatenate(([0], np.cumsum(bins_grupo)[:-1]))
+        rango = np.arange(orden.size) - inicio_grupo[grupos[orden]]
+        objetivo[orden[rango < faltan[grupos[orden]]]] += 1
+        
+        diferencia = np.where(candidatos, objetivo - stock, 0)
+        excedentes = np.flatnonzero(diferencia < 0)
+        faltantes = np.flatnonzero(diferencia > 0)
+        if faltantes.size == 0:
+            return pd.DataFrame(columns=columnas)
+        excedentes = excedentes[np.argsort(grupos[excedentes], kind='stable')]
+        faltantes = faltantes[np.argsort(grupos[faltantes], kind='stable')]
+        
+        # Emparejamiento sobre las sumas acumuladas de excedentes y faltantes
+        acum_excedente = np.cumsum(-diferencia[excedentes])
+        acum_faltante = np.cumsum(diferencia[faltantes])
+        cortes = np.union1d(acum_excedente, acum_faltante)
+        inicios = np.concatenate(([0], cortes[:-1]))
+        origen = excedentes[np.searchsorted(acum_excedente, inicios, side='right')]
+        destino = faltantes[np.searchsorted(acum_faltante, inicios, side='right')]
+        
+        return pd.DataFrame({
+            'fila_origen': origen,
+            'fila_destino': destino,
+            'id_origen': [productos[f].id for f in origen.tolist()],
+            'id_destino': [productos[f].id for f in destino.tolist()],
+            'bin_origen': [productos[f].bin for f in origen.tolist()],
+            'bin_destino': [productos[f].bin for f in destino.tolist()],
+            'cantidad': cortes - inicios
+        }, columns=columnas)
+    
+    def rebalancear_bins(self) -> Tuple[bool, List[str]]:
+        """
+        Iguala la ocupación de los BINs de cada ítem en una sola transferencia atómica.
+        
+        Returns:
+            Tuple[bool, List[str]]: (éxito, mensajes) de `transferir_lote`
+        """
+        propuesta = self.proponer_rebalanceo()
+        if propuesta.empty:
+            return True, ["Los BINs ya están balanceados"]
+        
+        return self.transferir_lote(
+            propuesta['fila_origen'], propuesta['fila_destino'], propuesta['cantidad']
+        )
+    
     # =========================================================================
     # ESTADÍSTICAS Y ANÁLISIS
     # =========================================================================
@@ -461,6 +768,7 @@ class OperacionesMatriciales:
         df['alerta_stock'] = alertas
         df['espacio_disponible'] = espacio
         df['sugerencia_reabastecimiento'] = reabastecimiento
+        df['clase_abc'] = self.clasificar_abc()
         
         # Calcular porcentaje de ocupación
         if 'stock_actual' in df.columns and 'stock_maximo' in df.columns:
@@ -470,29 +778,197 @@ class OperacionesMatriciales:
         
         return df
     
+    def sumas_por_categoria(self) -> pd.DataFrame:
+        """
+        Calcula las sumas por categoría sobre los códigos de categoría.
+        
+        Operación: para cada código c,
+            cantidad_c = #{i : cᵢ = c}         (np.bincount)
+            unidades_c = Σ sᵢ [cᵢ = c]         (np.bincount con pesos)
+            valor_c    = Σ pᵢ·sᵢ [cᵢ = c]
+        
+        El resultado se reutiliza mientras no cambie `inventario.version`.
+        
+        Returns:
+            pd.DataFrame: Índice categoria (ordenado) y columnas
+                cantidad_productos, total_unidades, valor_total y suma_precios
+        """
+        version = self.inventario.version
+        if self._sumas_categoria is not None and self._sumas_categoria[0] == version:
+            return self._sumas_categoria[1].copy()
+        
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return pd.DataFrame()
+        
+        codigos = self.inventario.obtener_codigos_categoria()
+        k = len(self.inventario.categorias)
+        # La matriz se guarda por columnas: estas vistas ya son contiguas
+        precios = np.ascontiguousarray(matriz[:, self.COL_PRECIO])
+        stock = np.ascontiguousarray(matriz[:, self.COL_STOCK])
+        
+        cantidad = np.bincount(codigos, minlength=k)
+        presentes = np.flatnonzero(cantidad)
+        df = pd.DataFrame({
+            'cantidad_productos': cantidad[presentes],
+            'total_unidades': np.bincount(codigos, weights=stock, minlength=k)[presentes].astype(np.int64),
+            'valor_total': np.bincount(codigos, weights=precios * stock, minlength=k)[presentes],
+            'suma_precios': np.bincount(codigos, weights=precios, minlength=k)[presentes]
+        }, index=pd.Index(np.array(self.inventario.categorias, dtype=object)[presentes], name='categoria'))
+        df = df.sort_index()
+        
+        self._sumas_categoria = (version, df)
+        return df.copy()
+    
     def analisis_por_categoria(self) -> pd.DataFrame:
         """
         Realiza análisis de inventario agrupado por categoría.
         
-        Utiliza operaciones de agregación de Pandas sobre datos vectorizados.
+        Utiliza `sumas_por_categoria` (np.bincount sobre los códigos de
+        categoría) en lugar de agrupar cadenas. Con un registro de vistas,
+        lee la vista materializada por categoría en O(categorías).
         
         Returns:
             pd.DataFrame: Análisis por categoría
         """
-        df = self.inventario.obtener_dataframe()
+        if self.vistas is not None:
+            if self.VISTA_CATEGORIAS not in self.vistas:
+                self.vistas.registrar(self.VISTA_CATEGORIAS, 'categoria', MEDIDAS_CATEGORIA)
+            df = self.vistas.consultar(self.VISTA_CATEGORIAS)
+            return pd.DataFrame() if df.empty else df.round(2)
+        
+        df = self.sumas_por_categoria()
         
         if df.empty:
             return pd.DataFrame()
         
-        # Agregación por categoría usando operaciones vectoriales
-        return df.groupby('categoria').agg({
-            'id': 'count',
-            'stock_actual': 'sum',
-            'valor_inventario': 'sum',
-            'precio': 'mean'
-        }).rename(columns={
-            'id': 'cantidad_productos',
-            'stock_actual': 'total_unidades',
-            'valor_inventario': 'valor_total',
-            'precio': 'precio_promedio'
-        }).round(2)
+        df['precio_promedio'] = df['suma_precios'] / df['cantidad_productos']
+        return df[[
+            'cantidad_productos', 'total_unidades', 'valor_total', 'precio_promedio'
+        ]].round(2)
+    
+    # =========================================================================
+    # CLASIFICACIÓN ABC
+    # =========================================================================
+    
+    def calcular_vector_consumo(self) -> np.ndarray:
+        """
+        Calcula el valor consumido (precio × unidades salidas) de cada producto.
+        
+        Las salidas del registro de movimientos se acumulan por fila de la
+        matriz con np.bincount.
+        
+        Returns:
+            np.ndarray: Valor de consumo de cada producto
+        """
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return np.array([])
+        
+        ids_salida, cantidades, _ = self.inventario.movimientos.obtener_salidas()
+        ids = matriz[:, self.COL_ID].astype(np.int64)
+        orden = np.argsort(ids, kind='stable')
+        posiciones = np.searchsorted(ids, ids_salida, sorter=orden)
+        posiciones = np.minimum(posiciones, len(ids) - 1)
+        filas = orden[posiciones]
+        presentes = ids[filas] == ids_salida
+        
+        unidades = np.bincount(
+            filas[presentes], weights=cantidades[presentes], minlength=len(ids)
+        )
+        return matriz[:, self.COL_PRECIO] * unidades
+    
+    @classmethod
+    def _codigos_abc(cls, valores: np.ndarray, umbrales: Tuple[float, float]) -> np.ndarray:
+        """Clase (0=A, 1=B, 2=C) de cada valor, con un argsort y un cumsum (uso interno)."""
+        codigos = np.full(valores.size, len(umbrales), dtype=np.int8)
+        total = float(valores.sum())
+        if total <= 0:
+            return codigos
+        
+        orden = np.argsort(-valores, kind='stable')
+        ordenados = valores[orden]
+        previo = (np.cumsum(ordenados) - ordenados) / total
+        codigos[orden] = np.searchsorted(np.asarray(umbrales), previo, side='right')
+        return codigos
+    
+    def clasificar_abc(
+        self,
+        base: str = 'valor',
+        umbrales: Optional[Tuple[float, float]] = None,
+        tolerancia: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Clasifica cada producto en A, B o C según su aporte al valor total.
+        
+        La clasificación se guarda en caché. Si el inventario cambió pero
+        los valores se movieron menos que `tolerancia` (Σ|Δv| / Σv respecto
+        de la última clasificación), se reutiliza sin volver a ordenar.
+        
+        Args:
+            base: 'valor' (precio × stock) o 'consumo' (precio × unidades salidas)
+            umbrales: Fracciones acumuladas en que terminan A y B
+            tolerancia: Cambio relativo tolerado (por defecto, TOLERANCIA_ABC)
+        
+        Returns:
+            np.ndarray: Clase de cada producto, alineada con las filas de la matriz
+        
+        Raises:
+            ValueError: Si la base no es 'valor' ni 'consumo'
+        """
+        if base not in self.BASES_ABC:
+            raise ValueError(f"Base de clasificación desconocida: {base!r}")
+        umbrales = tuple(umbrales or self.UMBRALES_ABC)
+        tolerancia = self.TOLERANCIA_ABC if tolerancia is None else tolerancia
+        
+        clave = (base, umbrales)
+        version = self.inventario.version
+        guardado = self._clases_abc.get(clave)
+        if guardado is not None and guardado[0] == version:
+            return self.CLASES_ABC[guardado[3]]
+        
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return np.array([], dtype=self.CLASES_ABC.dtype)
+        
+        ids = matriz[:, self.COL_ID]
+        valores = self.calcular_vector_valores() if base == 'valor' else self.calcular_vector_consumo()
+        
+        if guardado is not None and np.array_equal(guardado[1], ids):
+            referencia = guardado[2]
+            if np.abs(valores - referencia).sum() <= tolerancia * referencia.sum():
+                self._clases_abc[clave] = (version,) + guardado[1:]
+                return self.CLASES_ABC[guardado[3]]
+        
+        codigos = self._codigos_abc(valores, umbrales)
+        self._clases_abc[clave] = (version, ids.copy(), valores, codigos)
+        return self.CLASES_ABC[codigos]
+    
+    def resumen_abc(self, base: str = 'valor') -> pd.DataFrame:
+        """
+        Resume la clasificación ABC por clase.
+        
+        Args:
+            base: 'valor' o 'consumo' (ver `clasificar_abc`)
+        
+        Returns:
+            pd.DataFrame: Índice clase (A, B, C) y columnas cantidad_productos,
+                porcentaje_productos, valor_total y porcentaje_valor
+        """
+        clases = self.clasificar_abc(base)
+        if clases.size == 0:
+            return pd.DataFrame()
+        
+        valores = self.calcular_vector_valores() if base == 'valor' else self.calcular_vector_consumo()
+        codigos = np.searchsorted(self.CLASES_ABC, clases)
+        k = len(self.CLASES_ABC)
+        cantidad = np.bincount(codigos, minlength=k)
+        valor = np.bincount(codigos, weights=valores, minlength=k)
+        total = valor.sum()
+        
+        return pd.DataFrame({
+            'cantidad_productos': cantidad,
+            'porcentaje_productos': (cantidad / clases.size * 100).round(2),
+            'valor_total': valor.round(2),
+            'porcentaje_valor': (valor / total * 100 if total > 0 else valor * 0).round(2)
+        }, index=pd.Index(self.CLASES_ABC, name='clase'))
@@ -0,0 +1,258 @@
+"""
+Módulo de vistas paginadas para tablas grandes.
+
+Las vistas de la interfaz (matriz, alertas, reporte) se arman sobre
+columnas NumPy alineadas con las filas del inventario. El paginador solo
+guarda una permutación de índices:
+
+- Ordenar es un argsort estable sobre la columna elegida.
+- Saltar a una fila o a un valor es aritmética de enteros sobre la
+  permutación.
+- El texto se genera únicamente para las filas de la página visible.
+
+Abrir una vista cuesta lo mismo con 50 filas que con 500.000.
+"""
+
+import numpy as np
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+
+# Datos de una columna: array alineado con las filas, o función que recibe
+# índices de fila y devuelve sus valores (para textos que solo se leen al mostrarlos)
+DatosColumna = Union[np.ndarray, Callable[[np.ndarray], Sequence]]
+
+
+class PaginadorTabla:
+    """
+    Tabla paginada que formatea solo la página visible.
+    
+    Atributos:
+        columnas (List[Tuple[str, DatosColumna, str]]): (título, datos,
+            especificación de formato) de cada columna
+        filas_por_pagina (int): Filas de cada página
+        pagina (int): Página visible (desde 0)
+        columna_orden (Optional[str]): Título de la columna de orden actual
+        descendente (bool): Sentido del orden actual
+        _orden (np.ndarray): Índices de fila en el orden de la vista
+    
+    Ejemplo:
+        >>> matriz = inventario.obtener_matriz_inventario()
+        >>> paginador = PaginadorTabla([
+        ...     ("ID", matriz[:, 0], ">8.0f"),
+        ...     ("Stock", matriz[:, 2], ">8.0f"),
+        ... ])
+        >>> paginador.ordenar("Stock", descendente=True)
+        >>> print(paginador.formatear_pagina())
+    """
+    
+    FILAS_POR_PAGINA = 100
+    ANCHO_MINIMO = 6
+    
+    def __init__(
+        self,
+        columnas: Sequence[Tuple[str, DatosColumna, str]],
+        filas: Optional[np.ndarray] = None,
+        filas_por_pagina: Optional[int] = None
+    ):
+        """
+        Crea la vista paginada.
+        
+        Args:
+            columnas: (título, datos, formato) de cada columna; el formato es
+                una especificación de `format` como ">10.2f"
+            filas: Índices de las filas a mostrar (None = todas)
+            filas_por_pagina: Filas de cada página
+        
+        Raises:
+            ValueError: Si no hay columnas, las filas por página no son
+                positivas o se indican filas sin ninguna columna de array
+        """
+        if not columnas:
+            raise ValueError("La tabla necesita al menos una columna")
+        self.columnas = list(columnas)
+        self.filas_por_pagina = int(filas_por_pagina or self.FILAS_POR_PAGINA)
+        if self.filas_por_pagina <= 0:
+            raise ValueError("Las filas por página deben ser positivas")
+        
+        if filas is None:
+            largos = [len(datos) for _, datos, _ in self.columnas if not callable(datos)]
+            if not largos:
+                raise ValueError("Indique las filas si ninguna columna es un array")
+            filas = np.arange(largos[0])
+        self._orden = np.asarray(filas, dtype=np.intp)
+        self.pagina = 0
+        self.columna_orden: Optional[str] = None
+        self.descendente = False
+    
+    @property
+    def total_filas(self) -> int:
+        """Cantidad de filas de la vista."""
+        return len(self._orden)
+    
+    @property
+    def total_paginas(self) -> int:
+        """Cantidad de páginas (al menos una, aunque la vista esté vacía)."""
+        return max(1, -(-self.total_filas // self.filas_por_pagina))
+    
+    def _datos(self, titulo: str) -> DatosColumna:
+        """Datos de una columna por su título (uso interno)."""
+        for nombre, datos, _ in self.columnas:
+            if nombre == titulo:
+                return datos
+        raise KeyError(f"No existe la columna '{titulo}'")
+    
+    def ir_a_pagina(self, pagina: int) -> int:
+        """
+        Muestra una página, acotada al rango válido.
+        
+        Args:
+            pagina: Página deseada (desde 0)
+        
+        Returns:
+            int: Página visible
+        """
+        self.pagina = min(max(int(pagina), 0), self.total_paginas - 1)
+        return self.pagina
+    
+    def siguiente(self) -> int:
+        """Avanza una página; retorna la página visible."""
+        return self.ir_a_pagina(self.pagina + 1)
+    
+    def anterior(self) -> int:
+        """Retrocede una página; retorna la página visible."""
+        return self.ir_a_pagina(self.pagina - 1)
+    
+    def ir_a_fila(self, posicion: int) -> int:
+        """
+        Muestra la página que contiene una posición de la vista.
+        
+        Args:
+            posicion: Posición de la fila en el orden actual (desde 0)
+        
+        Returns:
+            int: Página visible
+        """
+        return self.ir_a_pagina(int(posicion) // self.filas_por_pagina)
+    
+    def buscar(self, titulo: str, valor) -> Optional[int]:
+        """
+        Salta a la primera fila cuyo valor en una columna de array es `valor`.
+        
+        Args:
+            titulo: Columna donde buscar
+            valor: Valor buscado
+        
+        Returns:
+            Optional[int]: Posición de la fila en la vista, o None si no está
+        """
+        datos = self._datos(titulo)
+        if callable(datos):
+            raise ValueError(f"La columna '{titulo}' no es un array")
+        posiciones = np.flatnonzero(np.asarray(datos)[self._orden] == valor)
+        if posiciones.size == 0:
+            return None
+        self.ir_a_fila(posiciones[0])
+        return int(posiciones[0])
+    
+    def ordenar(self, titulo: Optional[str], descendente: bool = False):
+        """
+        Ordena la vista por una columna de array y vuelve a la primera página.
+        
+        El orden es estable: a igual valor se conserva el orden previo.
+        
+        Args:
+            titulo: Columna de orden (None = orden original de las filas)
+            descendente: Mayor a menor
+        
+        Raises:
+            ValueError: Si la columna no es un array
+        """
+        if titulo is None:
+            self._orden = np.sort(self._orden)
+        else:
+            datos = self._datos(titulo)
+            if callable(datos):
+                raise ValueError(f"La columna '{titulo}' no es un array y no se puede ordenar")
+            valores = np.asarray(datos)[self._orden]
+            if descendente:
+                # Invertir dos veces mantiene la estabilidad entre valores iguales
+                orden = np.argsort(valores[::-1], kind='stable')[::-1]
+                orden = len(valores) - 1 - orden
+            else:
+                orden = np.argsort(valores, kind='stable')
+            self._orden = self._orden[orden]
+        self.columna_orden = titulo
+        self.descendente = descendente
+        self.pagina = 0
+    
+    def filas_pagina(self) -> np.ndarray:
+        """
+        Índices de fila de la página visible.
+        
+        Returns:
+            np.ndarray: Índices en las columnas originales
+        """
+        inicio = self.pagina * self.filas_por_pagina
+        return self._orden[inicio:inicio + self.filas_por_pagina]
+    
+    def valores_pagina(self) -> List[Sequence]:
+        """
+        Valores de cada columna para las filas de la página visible.
+        
+        Returns:
+            List[Sequence]: Una secuencia por columna
+        """
+        filas = self.filas_pagina()
+        return [
+            datos(filas) if callable(datos) else np.asarray(datos)[filas]
+            for _, datos, _ in self.columnas
+        ]
+    
+    def formatear_pagina(self) -> str:
+        """
+        Genera el texto de la página visible con encabezado y posiciones.
+        
+        Returns:
+            str: Tabla de texto de la página
+        """
+        valores = self.valores_pagina()
+        celdas = [
+            [format(valor, formato) for valor in columna]
+            for (_, _, formato), columna in zip(self.columnas, valores)
+        ]
+        anchos = [
+            max([len(titulo), self.ANCHO_MINIMO] + [len(c) for c in columna])
+            for (titulo, _, _), columna in zip(self.columnas, celdas)
+        ]
+        
+        inicio = self.pagina * self.filas_por_pagina
+        ancho_pos = len(str(max(self.total_filas, 1)))
+        lineas = [
+            f"{'#':>{ancho_pos}} | " + " | ".join(
+                f"{titulo:>{ancho}}" for (titulo, _, _), ancho in zip(self.columnas, anchos)
+            )
+        ]
+        lineas.append("─" * len(lineas[0]))
+        for i, fila in enumerate(zip(*celdas)):
+            lineas.append(
+                f"{inicio + i:>{ancho_pos}} | " + " | ".join(
+                    f"{celda:>{ancho}}" for celda, ancho in zip(fila, anchos)
+                )
+            )
+        return "\n".join(lineas) + "\n"
+    
+    def describir_posicion(self) -> str:
+        """
+        Texto con la página visible y el rango de filas.
+        
+        Returns:
+            str: Por ejemplo "Página 2 de 10 (filas 100-199 de 1000)"
+        """
+        if self.total_filas == 0:
+            return "Sin filas"
+        inicio = self.pagina * self.filas_por_pagina
+        fin = min(inicio + self.filas_por_pagina, self.total_filas) - 1
+        texto = f"Página {self.pagina + 1} de {self.total_paginas} (filas {inicio}-{fin} de {self.total_filas})"
+        if self.columna_orden is not None:
+            texto += f" · orden: {self.columna_orden} {'↓' if self.descendente else '↑'}"
+        return texto
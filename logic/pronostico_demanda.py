@@ -0,0 +1,365 @@
+"""
+Módulo de pronóstico de demanda para calcular stock mínimo y máximo dinámicos.
+
+Los valores `stock_minimo` y `stock_maximo` se ingresan a mano y no siguen
+la velocidad de venta real de cada producto. Este módulo deriva la demanda
+de las salidas registradas y ajusta todos los productos a la vez mediante
+operaciones matriciales.
+
+Modelo Matemático:
+==================
+
+1. MATRIZ DE DEMANDA
+
+   D es una matriz de dimensión (n_productos × n_periodos):
+   Dᵢₜ = unidades despachadas del producto i en el periodo t
+
+2. SUAVIZADO EXPONENCIAL SIMPLE (SES)
+
+   Para todos los productos a la vez (vector de nivel l):
+   lₜ = α·Dₜ + (1 - α)·lₜ₋₁
+   eₜ = Dₜ - lₜ₋₁   (error de pronóstico a un paso)
+
+3. MÉTODO DE CROSTON (demanda intermitente)
+
+   Solo en los periodos con demanda (Dₜ > 0) se actualizan:
+   zₜ = α·Dₜ + (1 - α)·zₜ₋₁    (tamaño de la demanda)
+   pₜ = α·qₜ + (1 - α)·pₜ₋₁    (intervalo entre demandas)
+   pronóstico = z / p
+
+4. PROPUESTA DE MÍNIMOS Y MÁXIMOS
+
+   min = ⌈d·L + z·σ·√L⌉
+   max = max(⌈min + d·C⌉, stock_actual)
+   
+   Donde d es la demanda pronosticada por periodo, L el tiempo de reposición,
+   σ la desviación del error, z el factor de nivel de servicio y C los
+   periodos de cobertura deseados. El máximo nunca queda por debajo del
+   stock que ya hay en el BIN, y los productos con pocos periodos con
+   salidas (por ejemplo, recién cargados: el registro de movimientos no se
+   guarda con el inventario) no reciben propuesta.
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+from models.inventario import Inventario
+
+
+class PronosticoDemanda:
+    """
+    Motor vectorizado de pronóstico de demanda.
+    
+    Ajusta SES y Croston sobre todos los productos en un solo recorrido
+    por periodos: cada paso es una operación vectorial sobre las n filas,
+    por lo que el costo es O(n_periodos) operaciones de NumPy en lugar de
+    un ciclo de Python por producto.
+    
+    Atributos:
+        inventario (Inventario): Inventario con el registro de movimientos
+        alfa (float): Constante de suavizado (0 < α ≤ 1)
+        duracion_periodo (float): Duración de un periodo en segundos
+    """
+    
+    METODO_SES = "ses"
+    METODO_CROSTON = "croston"
+    METODO_AUTO = "auto"
+    
+    # Intervalo medio entre demandas a partir del cual se usa Croston
+    UMBRAL_INTERMITENCIA = 1.32
+    # Periodos con salidas que necesita un producto para recibir propuesta
+    MINIMO_PERIODOS_CON_DEMANDA = 3
+    
+    def __init__(
+        self,
+        inventario: Inventario,
+        alfa: float = 0.2,
+        duracion_periodo: float = 86400.0
+    ):
+        """
+        Inicializa el motor de pronóstico.
+        
+        Args:
+            inventario: Inventario a analizar
+            alfa: Constante de suavizado
+            duracion_periodo: Duración de cada periodo en segundos (por defecto, un día)
+        
+        Raises:
+            ValueError: Si alfa no está en (0, 1]
+        """
+        if not 0 < alfa <= 1:
+            raise ValueError("La constante de suavizado debe estar en (0, 1]")
+        
+        self.inventario = inventario
+        self.alfa = alfa
+        self.duracion_periodo = duracion_periodo
+    
+    # =========================================================================
+    # MATRIZ DE DEMANDA
+    # =========================================================================
+    
+    def obtener_ids(self) -> np.ndarray:
+        """
+        Obtiene los IDs de producto en el orden de las filas de la matriz.
+        
+        Returns:
+            np.ndarray: Vector de IDs
+        """
+        return np.array(list(self.inventario.productos.keys()), dtype=np.int64)
+    
+    def construir_matriz_demanda(
+        self,
+        n_periodos: int,
+        fin: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Construye la matriz de demanda a partir de las salidas registradas.
+        
+        Las salidas se asignan a su fila (producto) y columna (periodo) con
+        una búsqueda ordenada y una acumulación vectorial.
+        
+        Args:
+            n_periodos: Cantidad de periodos hacia atrás desde `fin`
+            fin: Marca de tiempo final (por defecto, el instante actual)
+        
+        Returns:
+            np.ndarray: Matriz (n_productos × n_periodos) de tipo float32
+        """
+        ids = self.obtener_ids()
+        matriz = np.zeros((ids.size, n_periodos), dtype=np.float32)
+        if ids.size == 0:
+            return matriz
+        
+        if fin is None:
+            fin = time.time()
+        inicio = fin - n_periodos * self.duracion_periodo
+        
+        ids_mov, cantidades, tiempos = self.inventario.movimientos.obtener_salidas()
+        
+        # Asignar cada movimiento a su fila mediante búsqueda en IDs ordenados
+        orden = np.argsort(ids)
+        ids_ordenados = ids[orden]
+        posiciones = np.searchsorted(ids_ordenados, ids_mov)
+        posiciones = np.minimum(posiciones, ids.size - 1)
+        filas = orden[posiciones]
+        periodos = np.floor((tiempos - inicio) / self.duracion_periodo).astype(np.int64)
+        
+        validos = (ids[filas] == ids_mov) & (periodos >= 0) & (periodos < n_periodos)
+        celdas = filas[validos] * n_periodos + periodos[validos]
+        matriz[:] = np.bincount(
+            celdas, weights=cantidades[validos], minlength=matriz.size
+        ).reshape(matriz.shape)
+        
+        return matriz
+    
+    # =========================================================================
+    # MÉTODOS DE PRONÓSTICO
+    # =========================================================================
+    
+    def suavizado_exponencial(self, demanda: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aplica suavizado exponencial simple a todas las filas.
+        
+        Operación por periodo: l = l + α·(Dₜ - l)
+        
+        Args:
+            demanda: Matriz (n_productos × n_periodos)
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (pronóstico por periodo, desviación del error)
+        """
+        n, t = demanda.shape
+        if n == 0 or t == 0:
+            return np.zeros(n), np.zeros(n)
+        
+        # Recorrer columnas contiguas en memoria (una por periodo)
+        columnas = np.ascontiguousarray(demanda.T)
+        nivel = columnas[0].astype(np.float64)
+        suma_errores2 = np.zeros(n)
+        
+        for d in columnas[1:]:
+            error = d - nivel
+            suma_errores2 += error * error
+            nivel += self.alfa * error
+        
+        desviacion = np.sqrt(suma_errores2 / max(t - 1, 1))
+        return nivel, desviacion
+    
+    def metodo_croston(self, demanda: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aplica el método de Croston a todas las filas.
+        
+        El tamaño y el intervalo solo se actualizan en las filas que tienen
+        demanda en el periodo, usando máscaras booleanas.
+        
+        Args:
+            demanda: Matriz (n_productos × n_periodos)
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (pronóstico por periodo, desviación de la demanda)
+        """
+        n, t = demanda.shape
+        if n == 0 or t == 0:
+            return np.zeros(n), np.zeros(n)
+        
+        tamano = np.zeros(n)
+        intervalo = np.ones(n)
+        desde_ultima = np.ones(n)
+        iniciado = np.zeros(n, dtype=bool)
+        
+        for d in np.ascontiguousarray(demanda.T):
+            hay = d > 0
+            primera = hay & ~iniciado
+            actualizar = hay & iniciado
+            
+            tamano = np.where(primera, d, tamano)
+            intervalo = np.where(primera, desde_ultima, intervalo)
+            tamano += np.where(actualizar, self.alfa * (d - tamano), 0.0)
+            intervalo += np.where(actualizar, self.alfa * (desde_ultima - intervalo), 0.0)
+            
+            iniciado |= hay
+            desde_ultima = np.where(hay, 1.0, desde_ultima + 1.0)
+        
+        pronostico = np.where(iniciado, tamano / intervalo, 0.0)
+        return pronostico, demanda.std(axis=1).astype(np.float64)
+    
+    def pronosticar(
+        self,
+        demanda: np.ndarray,
+        metodo: str = METODO_AUTO
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pronostica la demanda por periodo de cada producto.
+        
+        Con el método 'auto' se usa Croston en las filas intermitentes
+        (intervalo medio entre demandas > 1.32 periodos) y SES en el resto.
+        
+        Args:
+            demanda: Matriz (n_productos × n_periodos)
+            metodo: 'ses', 'croston' o 'auto'
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (pronóstico por periodo, desviación)
+        
+        Raises:
+            ValueError: Si el método no es válido
+        """
+        if metodo == self.METODO_SES:
+            return self.suavizado_exponencial(demanda)
+        if metodo == self.METODO_CROSTON:
+            return self.metodo_croston(demanda)
+        if metodo != self.METODO_AUTO:
+            raise ValueError(f"Método de pronóstico no válido: {metodo}")
+        
+        media_ses, desv_ses = self.suavizado_exponencial(demanda)
+        media_cro, desv_cro = self.metodo_croston(demanda)
+        
+        periodos_con_demanda = np.count_nonzero(demanda > 0, axis=1)
+        intervalo_medio = demanda.shape[1] / np.maximum(periodos_con_demanda, 1)
+        intermitente = intervalo_medio > self.UMBRAL_INTERMITENCIA
+        
+        return (
+            np.where(intermitente, media_cro, media_ses),
+            np.where(intermitente, desv_cro, desv_ses)
+        )
+    
+    # =========================================================================
+    # PROPUESTA DE MÍNIMOS Y MÁXIMOS
+    # =========================================================================
+    
+    def proponer_minimos_maximos(
+        self,
+        n_periodos: int = 90,
+        periodos_reposicion: float = 7.0,
+        periodos_cobertura: float = 30.0,
+        factor_servicio: float = 1.65,
+        metodo: str = METODO_AUTO,
+        fin: Optional[float] = None,
+        minimo_periodos_con_demanda: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Propone nuevos valores de stock mínimo y máximo para los productos con historia.
+        
+        Operaciones vectoriales:
+            min = ⌈d·L + z·σ·√L⌉
+            max = max(⌈min + d·C⌉, stock_actual)
+        
+        Args:
+            n_periodos: Periodos de historia a considerar
+            periodos_reposicion: Tiempo de reposición L (en periodos)
+            periodos_cobertura: Cobertura C deseada sobre el mínimo (en periodos)
+            factor_servicio: Factor z del nivel de servicio (1.65 ≈ 95%)
+            metodo: 'ses', 'croston' o 'auto'
+            fin: Marca de tiempo final de la historia
+            minimo_periodos_con_demanda: Periodos con salidas que necesita un
+                producto para recibir propuesta (por defecto,
+                MINIMO_PERIODOS_CON_DEMANDA)
+        
+        Returns:
+            pd.DataFrame: Columnas id, demanda_pronosticada, desviacion,
+                stock_minimo_actual, stock_minimo_propuesto,
+                stock_maximo_actual, stock_maximo_propuesto; solo los
+                productos con historia suficiente
+        """
+        if minimo_periodos_con_demanda is None:
+            minimo_periodos_con_demanda = self.MINIMO_PERIODOS_CON_DEMANDA
+        
+        demanda = self.construir_matriz_demanda(n_periodos, fin)
+        media, desviacion = self.pronosticar(demanda, metodo)
+        
+        productos = self.inventario.listar_productos()
+        stock = np.fromiter((p.stock_actual for p in productos), dtype=np.int64, count=len(productos))
+        
+        minimos = np.ceil(
+            media * periodos_reposicion
+            + factor_servicio * desviacion * np.sqrt(periodos_reposicion)
+        ).astype(np.int64)
+        maximos = np.ceil(minimos + media * periodos_cobertura).astype(np.int64)
+        # El máximo no puede dejar fuera de rango el stock que ya está en el BIN
+        maximos = np.maximum(np.maximum(maximos, minimos), stock)
+        
+        # Sin historia suficiente la demanda estimada es ~0: no se propone nada
+        con_historia = np.count_nonzero(demanda, axis=1) >= minimo_periodos_con_demanda
+        filas = np.flatnonzero(con_historia)
+        
+        return pd.DataFrame({
+            'id': self.obtener_ids()[filas],
+            'demanda_pronosticada': media[filas].round(4),
+            'desviacion': desviacion[filas].round(4),
+            'stock_minimo_actual': [productos[f].stock_minimo for f in filas.tolist()],
+            'stock_minimo_propuesto': minimos[filas],
+            'stock_maximo_actual': [productos[f].stock_maximo for f in filas.tolist()],
+            'stock_maximo_propuesto': maximos[filas]
+        })
+    
+    def aplicar_propuesta(self, propuesta: pd.DataFrame) -> int:
+        """
+        Aplica en bloque los mínimos y máximos propuestos.
+        
+        Las filas que dejarían el stock actual por encima del máximo, o el
+        mínimo por encima del máximo, se rechazan (el producto no cambia).
+        
+        Args:
+            propuesta: DataFrame devuelto por `proponer_minimos_maximos`
+        
+        Returns:
+            int: Cantidad de productos actualizados
+        """
+        actualizados = 0
+        with self.inventario.transaccion():
+            for producto_id, minimo, maximo in zip(
+                propuesta['id'],
+                propuesta['stock_minimo_propuesto'],
+                propuesta['stock_maximo_propuesto']
+            ):
+                producto = self.inventario.obtener_producto(int(producto_id))
+                if producto is None:
+                    continue
+                if not producto.stock_actual <= maximo or not 0 <= minimo <= maximo:
+                    continue
+                producto.stock_minimo = int(minimo)
+                producto.stock_maximo = int(maximo)
+                actualizados += 1
+        
+        return actualizados
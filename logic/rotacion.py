@@ -0,0 +1,337 @@
+"""
+Módulo de métricas de rotación del inventario en ventanas móviles.
+
+Calcula, para cada producto y categoría, la rotación, los días de
+cobertura y el sell-through a partir de las salidas registradas en los
+últimos N días. Las sumas por ventana se mantienen de forma incremental
+con un búfer circular de salidas diarias por producto, así que registrar
+una salida y leer las ventas de un producto cuestan O(1).
+
+Modelo Matemático:
+==================
+
+1. BÚFER CIRCULAR DIARIO
+
+   B[i, d mod D] = unidades salidas del producto i el día d
+   
+   con D = la ventana más larga. Al comenzar el día d, la columna
+   d mod D (que guardaba el día d − D) se pone en cero.
+
+2. SUMAS POR VENTANA
+
+   Vᵢ(w) = Σ B[i, k mod D]  para k ∈ (d − w, d]
+   
+   Se mantiene sumando cada salida y, al avanzar al día d, restando la
+   columna del día d − w que sale de la ventana.
+
+3. MÉTRICAS (ventana w, stock actual s)
+
+   Rotación anual     = (Vᵢ(w) · 365 / w) / sᵢ
+   Días de cobertura  = sᵢ / (Vᵢ(w) / w)
+   Sell-through (%)   = 100 · Vᵢ(w) / (Vᵢ(w) + sᵢ)
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence
+from models.inventario import Inventario
+from models.eventos import EventoInventario
+
+
+SEGUNDOS_DIA = 24 * 3600
+
+
+def _calcular_metricas(ventas: np.ndarray, stock: np.ndarray, ventana: int) -> Dict[str, np.ndarray]:
+    """Rotación, cobertura y sell-through a partir de ventas y stock (uso interno)."""
+    ventas = np.asarray(ventas, dtype=np.float64)
+    stock = np.asarray(stock, dtype=np.float64)
+    diario = ventas / ventana
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rotacion = np.where(stock > 0, diario * 365 / stock, np.where(ventas > 0, np.inf, 0.0))
+        cobertura = np.where(diario > 0, stock / diario, np.inf)
+        total = ventas + stock
+        sell_through = np.where(total > 0, 100 * ventas / total, 0.0)
+    
+    return {
+        'ventas': ventas,
+        'rotacion_anual': rotacion,
+        'dias_cobertura': cobertura,
+        'sell_through': sell_through
+    }
+
+
+class MetricasRotacion:
+    """
+    Métricas de rotación por producto y categoría en ventanas móviles.
+    
+    Se suscribe a los eventos del inventario y, tras cada cambio de stock,
+    incorpora las salidas nuevas del registro de movimientos. Si el
+    registro se trunca (por ejemplo, al revertir una transacción) las
+    sumas se reconstruyen desde el registro.
+    
+    Atributos:
+        inventario (Inventario): Inventario observado
+        ventanas (tuple): Longitudes de ventana en días, de menor a mayor
+        _buffer (np.ndarray): Salidas diarias por producto, forma (filas, D)
+        _sumas (np.ndarray): Salidas por producto en cada ventana, forma (filas, ventanas)
+        _filas (Dict[int, int]): Fila del búfer de cada producto
+        _dia (Optional[int]): Día (desde epoch) más reciente del búfer
+    
+    Ejemplo:
+        >>> rotacion = MetricasRotacion(inventario, ventanas=(7, 30))
+        >>> operaciones.registrar_salida(3, 10)
+        >>> rotacion.metricas_producto(3, ventana=7)['dias_cobertura']
+        >>> rotacion.metricas_por_categoria(30)
+    """
+    
+    VENTANAS = (7, 30, 90)
+    CAPACIDAD_INICIAL = 1024
+    
+    def __init__(self, inventario: Inventario, ventanas: Sequence[int] = None):
+        """
+        Crea las métricas e incorpora las salidas ya registradas.
+        
+        Args:
+            inventario: Inventario a observar
+            ventanas: Longitudes de ventana en días (por defecto, 7, 30 y 90)
+        
+        Raises:
+            ValueError: Si alguna ventana no es positiva
+        """
+        ventanas = tuple(sorted(set(int(v) for v in (ventanas or self.VENTANAS))))
+        if not ventanas or ventanas[0] <= 0:
+            raise ValueError("Las ventanas deben ser de al menos un día")
+        
+        self.inventario = inventario
+        self.ventanas = ventanas
+        self._indice_ventana = {v: j for j, v in enumerate(ventanas)}
+        self._filas: Dict[int, int] = {}
+        self._reconstruir()
+        inventario.eventos.suscribir(
+            self._al_cambiar_inventario,
+            tipos=[EventoInventario.STOCK, EventoInventario.TRANSACCION]
+        )
+    
+    # ==========================================
+    # MANTENIMIENTO INCREMENTAL
+    # ==========================================
+    
+    def _al_cambiar_inventario(self, evento: EventoInventario):
+        """Incorpora las salidas registradas desde la última lectura (uso interno)."""
+        self._sincronizar()
+    
+    def _reconstruir(self):
+        """Vacía el búfer y vuelve a acumular todo el registro de movimientos (uso interno)."""
+        capacidad = max(self.CAPACIDAD_INICIAL, len(self._filas))
+        self._buffer = np.zeros((capacidad, self.ventanas[-1]), dtype=np.int64, order='F')
+        self._sumas = np.zeros((capacidad, len(self.ventanas)), dtype=np.int64, order='F')
+        self._dia = None
+        
+        movimientos = self.inventario.movimientos
+        self._procesados = len(movimientos)
+        self._reinicios = movimientos.reinicios
+        self._acumular(*movimientos.obtener_arreglos())
+    
+    def _sincronizar(self):
+        """Lee del registro solo los movimientos nuevos (uso interno)."""
+        movimientos = self.inventario.movimientos
+        if movimientos.reinicios != self._reinicios or len(movimientos) < self._procesados:
+            self._reconstruir()
+            return
+        
+        if len(movimientos) == self._procesados:
+            return
+        
+        ids, cantidades, tiempos = movimientos.obtener_arreglos()
+        inicio, self._procesados = self._procesados, len(movimientos)
+        self._acumular(ids[inicio:], cantidades[inicio:], tiempos[inicio:])
+    
+    def _fila(self, producto_id: int) -> int:
+        """Fila del búfer de un producto, asignándola si es nuevo (uso interno)."""
+        fila = self._filas.get(producto_id)
+        if fila is None:
+            fila = len(self._filas)
+            self._filas[producto_id] = fila
+            if fila >= len(self._buffer):
+                self._buffer = self._crecer(self._buffer)
+                self._sumas = self._crecer(self._sumas)
+        return fila
+    
+    @staticmethod
+    def _crecer(arreglo: np.ndarray) -> np.ndarray:
+        """Duplica las filas de un arreglo conservando su contenido (uso interno)."""
+        nuevo = np.zeros((2 * len(arreglo), arreglo.shape[1]), dtype=arreglo.dtype, order='F')
+        nuevo[:len(arreglo)] = arreglo
+        return nuevo
+    
+    def _acumular(self, ids: np.ndarray, cantidades: np.ndarray, tiempos: np.ndarray):
+        """Suma salidas al búfer y a las ventanas que aún las contienen (uso interno)."""
+        salidas = cantidades < 0
+        if not salidas.any():
+            return
+        
+        unidades = -cantidades[salidas]
+        dias = (tiempos[salidas] // SEGUNDOS_DIA).astype(np.int64)
+        self._avanzar(int(dias.max()))
+        
+        edades = self._dia - dias
+        filas = np.fromiter(
+            (self._fila(i) for i in ids[salidas].tolist()), dtype=np.intp, count=unidades.size
+        )
+        
+        # Acumular con np.bincount sobre las filas tocadas: el búfer es de
+        # orden Fortran, así que la celda (fila, columna) es fila + columna·n
+        D = self.ventanas[-1]
+        n = int(filas.max()) + 1
+        vigentes = edades < D
+        celdas = filas[vigentes] + (dias[vigentes] % D) * n
+        self._buffer[:n] += np.bincount(
+            celdas, weights=unidades[vigentes], minlength=n * D
+        ).astype(np.int64).reshape((n, D), order='F')
+        for j, ventana in enumerate(self.ventanas):
+            dentro = edades < ventana
+            self._sumas[:n, j] += np.bincount(
+                filas[dentro], weights=unidades[dentro], minlength=n
+            ).astype(np.int64)
+    
+    def _avanzar(self, dia: int):
+        """Mueve el búfer hasta `dia`, descontando los días que salen de cada ventana (uso interno)."""
+        if self._dia is None:
+            self._dia = dia
+            return
+        if dia <= self._dia:
+            return
+        
+        D = self.ventanas[-1]
+        n = len(self._filas)
+        if dia - self._dia >= D:
+            self._buffer[:n] = 0
+            self._sumas[:n] = 0
+        else:
+            for nuevo in range(self._dia + 1, dia + 1):
+                for j, ventana in enumerate(self.ventanas):
+                    self._sumas[:n, j] -= self._buffer[:n, (nuevo - ventana) % D]
+                self._buffer[:n, nuevo % D] = 0
+        self._dia = dia
+    
+    def _actualizar(self):
+        """Incorpora salidas pendientes y avanza hasta el día actual (uso interno)."""
+        self._sincronizar()
+        self._avanzar(int(time.time() // SEGUNDOS_DIA))
+    
+    def _columna(self, ventana: int) -> int:
+        """Columna de `_sumas` de una ventana (uso interno)."""
+        if ventana not in self._indice_ventana:
+            raise ValueError(f"Ventana no mantenida: {ventana} días (disponibles: {self.ventanas})")
+        return self._indice_ventana[ventana]
+    
+    # ==========================================
+    # CONSULTAS
+    # ==========================================
+    
+    def ventas(self, producto_id: int, ventana: int = 30) -> int:
+        """
+        Obtiene las unidades salidas de un producto en una ventana.
+        
+        Args:
+            producto_id: ID del producto
+            ventana: Días de la ventana (una de `ventanas`)
+        
+        Returns:
+            int: Unidades salidas en los últimos `ventana` días
+        """
+        j = self._columna(ventana)
+        self._actualizar()
+        fila = self._filas.get(producto_id)
+        return 0 if fila is None else int(self._sumas[fila, j])
+    
+    def metricas_producto(self, producto_id: int, ventana: int = 30) -> Dict[str, float]:
+        """
+        Calcula las métricas de rotación de un producto.
+        
+        Args:
+            producto_id: ID del producto
+            ventana: Días de la ventana (una de `ventanas`)
+        
+        Returns:
+            Dict[str, float]: ventas, rotacion_anual, dias_cobertura y sell_through
+        
+        Raises:
+            KeyError: Si el producto no existe en el inventario
+        """
+        producto = self.inventario.productos[producto_id]
+        ventas = self.ventas(producto_id, ventana)
+        metricas = _calcular_metricas([ventas], [producto.stock_actual], ventana)
+        return {nombre: float(valor[0]) for nombre, valor in metricas.items()}
+    
+    def _ventas_por_fila_matriz(self, j: int) -> np.ndarray:
+        """Ventas de la ventana j alineadas con las filas de la matriz (uso interno)."""
+        ids = self.inventario.obtener_matriz_inventario()[:, 0].astype(np.int64)
+        filas = np.fromiter(
+            (self._filas.get(i, -1) for i in ids.tolist()), dtype=np.intp, count=ids.size
+        )
+        ventas = np.zeros(ids.size, dtype=np.int64)
+        conocidas = filas >= 0
+        ventas[conocidas] = self._sumas[filas[conocidas], j]
+        return ventas
+    
+    def metricas(self, ventana: int = 30) -> pd.DataFrame:
+        """
+        Calcula las métricas de rotación de todos los productos.
+        
+        Args:
+            ventana: Días de la ventana (una de `ventanas`)
+        
+        Returns:
+            pd.DataFrame: Índice id y columnas stock_actual, ventas,
+                rotacion_anual, dias_cobertura y sell_through
+        """
+        j = self._columna(ventana)
+        self._actualizar()
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return pd.DataFrame()
+        
+        stock = matriz[:, 2]
+        df = pd.DataFrame(
+            _calcular_metricas(self._ventas_por_fila_matriz(j), stock, ventana),
+            index=pd.Index(matriz[:, 0].astype(np.int64), name='id')
+        )
+        df.insert(0, 'stock_actual', stock.astype(np.int64))
+        df['ventas'] = df['ventas'].astype(np.int64)
+        return df.round(2)
+    
+    def metricas_por_categoria(self, ventana: int = 30) -> pd.DataFrame:
+        """
+        Calcula las métricas de rotación agregadas por categoría.
+        
+        Las ventas y el stock se suman por código de categoría con
+        np.bincount antes de aplicar las fórmulas.
+        
+        Args:
+            ventana: Días de la ventana (una de `ventanas`)
+        
+        Returns:
+            pd.DataFrame: Índice categoria y las mismas columnas que `metricas`
+        """
+        j = self._columna(ventana)
+        self._actualizar()
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return pd.DataFrame()
+        
+        codigos = self.inventario.obtener_codigos_categoria()
+        k = len(self.inventario.categorias)
+        ventas = np.bincount(codigos, weights=self._ventas_por_fila_matriz(j), minlength=k)
+        stock = np.bincount(codigos, weights=matriz[:, 2], minlength=k)
+        presentes = np.bincount(codigos, minlength=k) > 0
+        
+        df = pd.DataFrame(
+            _calcular_metricas(ventas[presentes], stock[presentes], ventana),
+            index=pd.Index(np.array(self.inventario.categorias, dtype=object)[presentes], name='categoria')
+        )
+        df.insert(0, 'stock_actual', stock[presentes].astype(np.int64))
+        df['ventas'] = df['ventas'].astype(np.int64)
+        return df.sort_index().round(2)
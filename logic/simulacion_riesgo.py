@@ -0,0 +1,215 @@
+"""
+Módulo de simulación Monte Carlo del riesgo de quiebre de stock.
+
+`calcular_alertas_stock_bajo` solo indica si hoy stock < mínimo. Para
+planificar se necesita la probabilidad de quedarse sin stock en un
+horizonte dado. Este módulo simula miles de trayectorias de demanda por
+producto y estima esa probabilidad y el faltante esperado.
+
+Modelo Matemático:
+==================
+
+1. TENSOR DE DEMANDA SIMULADA
+
+   Para un bloque de k productos se genera un arreglo de forma
+   (k × escenarios × días):
+   
+   Xᵢₑₜ = max(0, μᵢ + σᵢ·εᵢₑₜ),  ε ~ N(0, 1)     (o Poisson(μᵢ))
+
+2. DEMANDA ACUMULADA EN EL HORIZONTE
+
+   Tᵢₑ = Σₜ Xᵢₑₜ
+   
+   Como la demanda es no negativa, el stock se agota en algún día del
+   horizonte si y solo si Tᵢₑ > sᵢ.
+
+3. INDICADORES POR PRODUCTO
+
+   P(quiebre)ᵢ    = (1/E) · Σₑ [Tᵢₑ > sᵢ]
+   faltante_esperadoᵢ = (1/E) · Σₑ max(0, Tᵢₑ - sᵢ)
+
+Los productos se procesan por bloques para acotar la memoria y, de forma
+opcional, los bloques se reparten en un grupo de procesos.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+from models.inventario import Inventario
+from logic.pronostico_demanda import PronosticoDemanda
+
+
+def _simular_bloque(tarea: tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simula un bloque de productos (uso interno, ejecutable en otro proceso).
+    
+    Args:
+        tarea: (semilla, stock, media, desviacion, escenarios, dias, distribucion)
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (probabilidad de quiebre, faltante esperado)
+    """
+    semilla, stock, media, desviacion, escenarios, dias, distribucion = tarea
+    generador = np.random.default_rng(semilla)
+    forma = (stock.size, escenarios, dias)
+    
+    if distribucion == SimulacionRiesgo.DISTRIBUCION_POISSON:
+        # poisson solo entrega int64 (8 bytes por valor): se genera producto
+        # a producto sobre el bloque float32 para no duplicar su memoria.
+        # La secuencia aleatoria es la misma que con una sola llamada.
+        demanda = np.empty(forma, dtype=np.float32)
+        for i in range(stock.size):
+            demanda[i] = generador.poisson(media[i], size=forma[1:])
+    else:
+        demanda = generador.standard_normal(size=forma, dtype=np.float32)
+        demanda *= desviacion[:, None, None].astype(np.float32)
+        demanda += media[:, None, None].astype(np.float32)
+        np.maximum(demanda, 0, out=demanda)
+    
+    total = demanda.sum(axis=2, dtype=np.float64)
+    del demanda
+    
+    faltante = np.maximum(total - stock[:, None], 0)
+    return (faltante > 0).mean(axis=1), faltante.mean(axis=1)
+
+
+class SimulacionRiesgo:
+    """
+    Simulador Monte Carlo de quiebres de stock para todo el inventario.
+    
+    Atributos:
+        inventario (Inventario): Inventario a simular
+        escenarios (int): Trayectorias de demanda por producto
+        dias (int): Horizonte de simulación en días
+        memoria_maxima_mb (float): Memoria máxima por bloque de productos
+        semilla (Optional[int]): Semilla para resultados reproducibles
+    """
+    
+    DISTRIBUCION_NORMAL = "normal"
+    DISTRIBUCION_POISSON = "poisson"
+    
+    def __init__(
+        self,
+        inventario: Inventario,
+        escenarios: int = 1000,
+        dias: int = 30,
+        memoria_maxima_mb: float = 128.0,
+        semilla: Optional[int] = None
+    ):
+        """
+        Inicializa el simulador.
+        
+        Args:
+            inventario: Inventario a simular
+            escenarios: Cantidad de trayectorias por producto
+            dias: Horizonte de simulación en días
+            memoria_maxima_mb: Tamaño máximo del tensor de un bloque en MB
+            semilla: Semilla para resultados reproducibles
+        
+        Raises:
+            ValueError: Si los escenarios o los días no son positivos
+        """
+        if escenarios <= 0 or dias <= 0:
+            raise ValueError("Los escenarios y los días deben ser positivos")
+        
+        self.inventario = inventario
+        self.escenarios = escenarios
+        self.dias = dias
+        self.memoria_maxima_mb = memoria_maxima_mb
+        self.semilla = semilla
+    
+    def tamano_bloque(self) -> int:
+        """
+        Calcula cuántos productos caben en un bloque según la memoria máxima.
+        
+        Cada producto ocupa escenarios × días valores float32; la demanda
+        Poisson, que numpy genera en int64, se convierte de a un producto
+        y su temporal no depende del tamaño del bloque.
+        
+        Returns:
+            int: Productos por bloque
+        """
+        bytes_por_producto = self.escenarios * self.dias * 4
+        return max(1, int(self.memoria_maxima_mb * 1024 * 1024 // bytes_por_producto))
+    
+    def simular(
+        self,
+        demanda_media: Optional[np.ndarray] = None,
+        demanda_desviacion: Optional[np.ndarray] = None,
+        distribucion: str = DISTRIBUCION_NORMAL,
+        procesos: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Estima la probabilidad de quiebre y el faltante esperado por producto.
+        
+        Si no se indica la demanda, se pronostica a partir de las salidas
+        registradas con `PronosticoDemanda` (periodos de un día).
+        
+        Args:
+            demanda_media: Demanda diaria media de cada producto
+            demanda_desviacion: Desviación estándar diaria (solo distribución normal)
+            distribucion: 'normal' o 'poisson'
+            procesos: Procesos para repartir los bloques (None o 1 = sin grupo)
+        
+        Returns:
+            pd.DataFrame: Columnas id, stock_actual, probabilidad_quiebre
+                y faltante_esperado
+        
+        Raises:
+            ValueError: Si la distribución no es válida
+        """
+        if distribucion not in (self.DISTRIBUCION_NORMAL, self.DISTRIBUCION_POISSON):
+            raise ValueError(f"Distribución no válida: {distribucion}")
+        
+        matriz = self.inventario.obtener_matriz_inventario()
+        n = matriz.shape[0]
+        if n == 0:
+            return pd.DataFrame(columns=[
+                'id', 'stock_actual', 'probabilidad_quiebre', 'faltante_esperado'
+            ])
+        
+        if demanda_media is None:
+            pronostico = PronosticoDemanda(self.inventario)
+            demanda_media, desviacion_pronostico = pronostico.pronosticar(
+                pronostico.construir_matriz_demanda(90)
+            )
+            if demanda_desviacion is None:
+                demanda_desviacion = desviacion_pronostico
+        
+        stock = matriz[:, 2].astype(np.float64)
+        media = np.broadcast_to(np.asarray(demanda_media, dtype=np.float64), (n,))
+        desviacion = np.broadcast_to(
+            np.asarray(0.0 if demanda_desviacion is None else demanda_desviacion, dtype=np.float64),
+            (n,)
+        )
+        
+        # Semillas independientes por bloque: mismo resultado con o sin procesos
+        tamano = self.tamano_bloque()
+        inicios = range(0, n, tamano)
+        semillas = np.random.SeedSequence(self.semilla).spawn(len(inicios))
+        tareas = [
+            (
+                semilla,
+                stock[i:i + tamano],
+                media[i:i + tamano],
+                desviacion[i:i + tamano],
+                self.escenarios,
+                self.dias,
+                distribucion
+            )
+            for i, semilla in zip(inicios, semillas)
+        ]
+        
+        if procesos and procesos > 1 and len(tareas) > 1:
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                resultados = list(ejecutor.map(_simular_bloque, tareas))
+        else:
+            resultados = [_simular_bloque(tarea) for tarea in tareas]
+        
+        return pd.DataFrame({
+            'id': matriz[:, 0].astype(np.int64),
+            'stock_actual': stock.astype(np.int64),
+            'probabilidad_quiebre': np.concatenate([r[0] for r in resultados]),
+            'faltante_esperado': np.concatenate([r[1] for r in resultados]).round(2)
+        })
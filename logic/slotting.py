@@ -0,0 +1,300 @@
+"""
+Módulo de optimización de ubicaciones (slotting) en bodega.
+
+Propone reubicar los productos de mayor frecuencia de picking en los BIN
+más cercanos al área de despacho, usando los BIN ya guardados en
+`Producto.bin` y respetando la capacidad de cada ubicación.
+
+Modelo Matemático:
+==================
+
+1. DISTANCIA AL DESPACHO
+
+   Para un BIN (pasillo a, rack r, nivel n) y el origen (a₀, r₀, n₀):
+   
+   d = wₐ·|a − a₀| + wᵣ·|r − r₀| + wₙ·|n − n₀|
+   
+   calculada de una vez para todos los BIN sobre los códigos empaquetados.
+
+2. CAPACIDAD
+
+   Cada producto ubicado define una posición (slot) en su BIN cuya
+   capacidad es su stock_maximo. El producto p puede ocupar la posición j
+   solo si maxₚ ≤ capacidadⱼ; la asignación actual siempre es factible.
+
+3. COSTO Y ASIGNACIÓN VORAZ
+
+   costo(p, j) = fₚ · dⱼ        (fₚ = salidas registradas del producto)
+   
+   Se minimiza Σ fₚ · d_σ(p) recorriendo los productos de mayor a menor
+   frecuencia: cada uno toma la posición libre y con capacidad de menor
+   costo (una fila del costo evaluada como vector). Con capacidades
+   iguales el resultado es óptimo (desigualdad de reordenamiento).
+   
+   Si a un producto no le queda posición factible, recupera la suya y el
+   que la ocupaba vuelve a la propia, en cadena: la asignación final es
+   siempre una permutación factible.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+from models.inventario import Inventario
+from logic.indice_bins import BASE_COORDENADA, empaquetar, parsear_bin
+
+
+class OptimizadorSlotting:
+    """
+    Optimizador de ubicaciones por frecuencia de picking y distancia.
+    
+    Atributos:
+        inventario (Inventario): Inventario a reubicar
+        origen (Tuple[int, int, int]): Coordenadas del área de despacho
+        pesos (Tuple[float, float, float]): Costo por unidad de pasillo, rack y nivel
+    
+    Ejemplo:
+        >>> optimizador = OptimizadorSlotting(inventario, origen=(1, 1, 1))
+        >>> propuesta = optimizador.proponer()
+        >>> optimizador.aplicar_propuesta(propuesta.head(20))
+    """
+    
+    PESOS_DISTANCIA = (10.0, 1.0, 0.5)
+    
+    def __init__(
+        self,
+        inventario: Inventario,
+        origen: Tuple[int, int, int] = (0, 0, 0),
+        pesos: Optional[Tuple[float, float, float]] = None
+    ):
+        """
+        Inicializa el optimizador.
+        
+        Args:
+            inventario: Inventario cuyos productos se reubican
+            origen: (pasillo, rack, nivel) del área de despacho
+            pesos: Costo por unidad de distancia en pasillo, rack y nivel
+        """
+        self.inventario = inventario
+        self.origen = tuple(int(c) for c in origen)
+        self.pesos = tuple(float(w) for w in (pesos or self.PESOS_DISTANCIA))
+    
+    def distancias(self, codigos: np.ndarray) -> np.ndarray:
+        """
+        Calcula la distancia al despacho de BINs empaquetados.
+        
+        Args:
+            codigos: Códigos de `indice_bins.empaquetar`
+        
+        Returns:
+            np.ndarray: Distancia ponderada de cada BIN
+        """
+        codigos = np.asarray(codigos, dtype=np.int64)
+        pasillos = codigos // (BASE_COORDENADA * BASE_COORDENADA)
+        racks = (codigos // BASE_COORDENADA) % BASE_COORDENADA
+        niveles = codigos % BASE_COORDENADA
+        wa, wr, wn = self.pesos
+        a0, r0, n0 = self.origen
+        return wa * np.abs(pasillos - a0) + wr * np.abs(racks - r0) + wn * np.abs(niveles - n0)
+    
+    def frecuencias_picking(self, desde: Optional[float] = None) -> np.ndarray:
+        """
+        Cuenta las salidas registradas de cada producto.
+        
+        Args:
+            desde: Marca de tiempo mínima de las salidas (None = todas)
+        
+        Returns:
+            np.ndarray: Cantidad de salidas, alineada con las filas de la matriz
+        """
+        matriz = self.inventario.obtener_matriz_inventario()
+        if matriz.size == 0:
+            return np.array([])
+        
+        ids_salida, _, tiempos = self.inventario.movimientos.obtener_salidas()
+        if desde is not None:
+            ids_salida = ids_salida[tiempos >= desde]
+        
+        ids = matriz[:, 0].astype(np.int64)
+        orden = np.argsort(ids, kind='stable')
+        posiciones = np.minimum(np.searchsorted(ids, ids_salida, sorter=orden), len(ids) - 1)
+        filas = orden[posiciones]
+        return np.bincount(filas[ids[filas] == ids_salida], minlength=len(ids)).astype(np.float64)
+    
+    def _posiciones(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Productos con BIN válido como posiciones (uso interno).
+        
+        Returns:
+            Tuple: (filas de la matriz, código del BIN, capacidad) de cada posición
+        """
+        matriz = self.inventario.obtener_matriz_inventario()
+        cache: Dict[str, Optional[int]] = {}
+        filas, codigos = [], []
+        for fila, producto in enumerate(self.inventario.productos.values()):
+            bin_value = producto.bin
+            if bin_value not in cache:
+                coordenadas = parsear_bin(bin_value)
+                cache[bin_value] = None if coordenadas is None else empaquetar(*coordenadas)
+            if cache[bin_value] is not None:
+                filas.append(fila)
+                codigos.append(cache[bin_value])
+        
+        filas = np.array(filas, dtype=np.intp)
+        return filas, np.array(codigos, dtype=np.int64), matriz[filas, 4]
+    
+    def asignar(
+        self,
+        frecuencias: np.ndarray,
+        distancias: np.ndarray,
+        necesidades: np.ndarray,
+        capacidades: np.ndarray
+    ) -> np.ndarray:
+        """
+        Asigna cada producto a una posición minimizando Σ frecuencia · distancia.
+        
+        El producto i ocupa inicialmente la posición i. Los productos se
+        recorren de mayor a menor frecuencia y cada uno toma la posición
+        libre, con capacidad suficiente, de menor costo. Un producto que se
+        queda sin posición factible recupera la suya (siempre le cabe) y el
+        desplazado vuelve a la propia, en cadena hasta llegar a una libre.
+        
+        Args:
+            frecuencias: Frecuencia de picking de cada producto
+            distancias: Distancia de cada posición
+            necesidades: Capacidad que requiere cada producto (stock_maximo)
+            capacidades: Capacidad de cada posición
+        
+        Returns:
+            np.ndarray: Posición asignada a cada producto (una permutación)
+        """
+        n = len(frecuencias)
+        asignacion = np.arange(n)
+        ocupante = np.full(n, -1, dtype=np.intp)
+        libres = np.ones(n, dtype=bool)
+        sin_lugar = []
+        
+        # Posiciones de la más cercana a la más lejana
+        por_distancia = np.argsort(distancias, kind='stable')
+        distancias_ordenadas = distancias[por_distancia]
+        capacidades_ordenadas = capacidades[por_distancia]
+        libres_ordenadas = libres[por_distancia]
+        actual_ordenada = np.empty(n, dtype=np.intp)
+        actual_ordenada[por_distancia] = np.arange(n)
+        
+        orden = np.lexsort((distancias, -frecuencias))
+        for producto in orden:
+            costos = frecuencias[producto] * distancias_ordenadas
+            costos[~(libres_ordenadas & (capacidades_ordenadas >= necesidades[producto]))] = np.inf
+            elegida = int(np.argmin(costos))
+            if costos[elegida] == np.inf:
+                sin_lugar.append(producto)
+                continue
+            # A igual costo se conserva la ubicación actual
+            actual = actual_ordenada[producto]
+            if costos[actual] == costos[elegida]:
+                elegida = actual
+            libres_ordenadas[elegida] = False
+            asignacion[producto] = por_distancia[elegida]
+            ocupante[asignacion[producto]] = producto
+        
+        # Sin posición factible: el producto recupera su BIN y quien lo
+        # ocupaba vuelve al suyo, hasta llegar a una posición libre
+        for producto in sin_lugar:
+            while producto >= 0:
+                desplazado = ocupante[producto]
+                asignacion[producto] = producto
+                ocupante[producto] = producto
+                producto = desplazado
+        return asignacion
+    
+    def proponer(
+        self,
+        frecuencias: Optional[Dict[int, float]] = None,
+        desde: Optional[float] = None
+    ) -> pd.DataFrame:
+        """
+        Propone reubicaciones que reducen el recorrido de picking.
+        
+        Args:
+            frecuencias: Frecuencia por ID de producto (por defecto, las
+                salidas registradas)
+            desde: Marca de tiempo mínima de las salidas contadas
+        
+        Returns:
+            pd.DataFrame: Un producto por fila, solo los que cambian de BIN,
+                con columnas id, nombre, frecuencia, bin_actual, bin_propuesto,
+                distancia_actual, distancia_propuesta y ahorro, ordenado por
+                ahorro descendente
+        """
+        columnas = [
+            'id', 'nombre', 'frecuencia', 'bin_actual', 'bin_propuesto',
+            'distancia_actual', 'distancia_propuesta', 'ahorro'
+        ]
+        filas, codigos, capacidades = self._posiciones()
+        if filas.size == 0:
+            return pd.DataFrame(columns=columnas)
+        
+        productos = list(self.inventario.productos.values())
+        if frecuencias is None:
+            frecuencia = self.frecuencias_picking(desde)[filas]
+        else:
+            frecuencia = np.array(
+                [float(frecuencias.get(productos[f].id, 0.0)) for f in filas.tolist()]
+            )
+        
+        distancia = self.distancias(codigos)
+        asignacion = self.asignar(frecuencia, distancia, capacidades, capacidades)
+        cambia = codigos[asignacion] != codigos
+        
+        origen, destino = filas[cambia], asignacion[cambia]
+        df = pd.DataFrame({
+            'id': [productos[f].id for f in origen.tolist()],
+            'nombre': [productos[f].nombre for f in origen.tolist()],
+            'frecuencia': frecuencia[cambia],
+            'bin_actual': [productos[f].bin for f in origen.tolist()],
+            'bin_propuesto': [productos[filas[j]].bin for j in destino.tolist()],
+            'distancia_actual': distancia[cambia],
+            'distancia_propuesta': distancia[destino],
+        }, columns=columnas[:-1])
+        df['ahorro'] = df['frecuencia'] * (df['distancia_actual'] - df['distancia_propuesta'])
+        return df.sort_values('ahorro', ascending=False, kind='stable').reset_index(drop=True)
+    
+    def costo_recorrido(self, propuesta: Optional[pd.DataFrame] = None) -> float:
+        """
+        Calcula Σ frecuencia · distancia de la ubicación actual o propuesta.
+        
+        Args:
+            propuesta: DataFrame de `proponer` (None = ubicación actual)
+        
+        Returns:
+            float: Costo total de recorrido
+        """
+        filas, codigos, _ = self._posiciones()
+        if filas.size == 0:
+            return 0.0
+        
+        costo = float(np.dot(self.frecuencias_picking()[filas], self.distancias(codigos)))
+        if propuesta is not None and not propuesta.empty:
+            costo -= float(propuesta['ahorro'].sum())
+        return costo
+    
+    def aplicar_propuesta(self, propuesta: pd.DataFrame) -> int:
+        """
+        Aplica en bloque las reubicaciones propuestas.
+        
+        Args:
+            propuesta: DataFrame devuelto por `proponer` (o un subconjunto)
+        
+        Returns:
+            int: Cantidad de productos reubicados
+        """
+        reubicados = 0
+        with self.inventario.transaccion():
+            for producto_id, bin_propuesto in zip(propuesta['id'], propuesta['bin_propuesto']):
+                producto = self.inventario.obtener_producto(int(producto_id))
+                if producto is None:
+                    continue
+                producto.bin = bin_propuesto
+                reubicados += 1
+        
+        return reubicados
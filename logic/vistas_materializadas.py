@@ -0,0 +1,481 @@
+"""
+Módulo de vistas materializadas de agregados del inventario.
+
+Una vista agrupa los productos por una clave (categoría, item, pasillo,
+rack o BIN) y guarda sus medidas agregadas (suma, cantidad, mínimo,
+máximo, promedio). En vez de reagrupar todo el inventario en cada
+reporte, las vistas se mantienen con deltas a partir de los eventos del
+inventario, y consultarlas cuesta O(grupos).
+
+Modelo Matemático:
+==================
+
+1. VISTA
+
+   Para una clave k(p) y un vector de valores m(p) de cada producto p:
+   
+   V[g] = ⊕ { m(p) : k(p) = g }
+   
+   con ⊕ = suma componente a componente más la cantidad de productos.
+
+2. MANTENIMIENTO POR DELTAS
+
+   Cada producto recuerda su último aporte (g, m). Ante un evento sobre p:
+   
+   V[g_anterior] −= m_anterior
+   V[g_nuevo]    += m_nuevo
+   
+   La suma y la cantidad se retiran de forma exacta porque los valores
+   son enteros: el dinero se acumula en centavos (ver
+   `Inventario.a_centavos`).
+
+3. MÍNIMO Y MÁXIMO
+
+   No se pueden restar: cada grupo lleva un conteo de sus valores
+   distintos. Retirar un valor que no es el extremo es O(1); si se retira
+   el extremo, este se recalcula al consultar sobre los valores distintos
+   del grupo (no sobre los productos).
+"""
+
+from collections import Counter
+import pandas as pd
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from models.inventario import Inventario
+from models.producto import Producto
+from models.eventos import EventoInventario
+from logic.indice_bins import parsear_bin
+
+
+def _clave_pasillo(producto: Producto) -> Optional[int]:
+    """Pasillo del BIN, o None si el BIN no tiene formato XXX/XXX/XXX."""
+    coordenadas = parsear_bin(producto.bin)
+    return None if coordenadas is None else coordenadas[0]
+
+
+def _clave_rack(producto: Producto) -> Optional[str]:
+    """Pasillo y rack del BIN ('003/012'), o None si el BIN no tiene formato."""
+    coordenadas = parsear_bin(producto.bin)
+    return None if coordenadas is None else f"{coordenadas[0]:03d}/{coordenadas[1]:03d}"
+
+
+# Claves de agrupación predefinidas; los productos con clave None quedan fuera
+CLAVES = {
+    'categoria': lambda producto: producto.categoria,
+    'item': Inventario.clave_grupo,
+    'pasillo': _clave_pasillo,
+    'rack': _clave_rack,
+    'bin': lambda producto: producto.bin,
+}
+
+
+def _centavos(precio: float) -> int:
+    """Precio en centavos; round() redondea igual que `Inventario.a_centavos` (mitad a par)."""
+    return round(precio * 100)
+
+
+# Valor entero de cada campo medible (el dinero, en centavos)
+VALORES = {
+    'stock_actual': lambda producto: producto.stock_actual,
+    'stock_minimo': lambda producto: producto.stock_minimo,
+    'stock_maximo': lambda producto: producto.stock_maximo,
+    'precio': lambda producto: _centavos(producto.precio),
+    'valor': lambda producto: _centavos(producto.precio) * producto.stock_actual,
+}
+
+# Campos que se guardan en centavos y se devuelven en unidades monetarias
+CAMPOS_MONETARIOS = ('precio', 'valor')
+
+AGREGADOS = ('suma', 'cantidad', 'minimo', 'maximo', 'promedio')
+
+# Medida: nombre -> (campo, agregado); la cantidad no lleva campo
+Medidas = Dict[str, Tuple[Optional[str], str]]
+
+# Vista con las columnas de `OperacionesMatriciales.analisis_por_categoria`
+MEDIDAS_CATEGORIA: Medidas = {
+    'cantidad_productos': (None, 'cantidad'),
+    'total_unidades': ('stock_actual', 'suma'),
+    'valor_total': ('valor', 'suma'),
+    'precio_promedio': ('precio', 'promedio'),
+}
+
+
+class _Grupo:
+    """
+    Acumuladores de un grupo de una vista (uso interno).
+    
+    Atributos:
+        cantidad (int): Productos del grupo
+        sumas (List[int]): Suma de cada campo de la vista
+        valores (List[Optional[Counter]]): Conteo de valores de los campos
+            con mínimo o máximo (None en los demás)
+        minimos (List): Mínimo de cada campo (None = por recalcular)
+        maximos (List): Máximo de cada campo (None = por recalcular)
+    """
+    
+    __slots__ = ('cantidad', 'sumas', 'valores', 'minimos', 'maximos')
+    
+    def __init__(self, extremos: Tuple[bool, ...]):
+        """
+        Crea un grupo vacío.
+        
+        Args:
+            extremos: Para cada campo, si alguna medida pide su mínimo o máximo
+        """
+        self.cantidad = 0
+        self.sumas = [0] * len(extremos)
+        self.valores = [Counter() if extremo else None for extremo in extremos]
+        self.minimos = [None] * len(extremos)
+        self.maximos = [None] * len(extremos)
+    
+    def agregar(self, valores: Tuple[int, ...]):
+        """Suma el aporte de un producto."""
+        self.cantidad += 1
+        for i, valor in enumerate(valores):
+            self.sumas[i] += valor
+            conteo = self.valores[i]
+            if conteo is None:
+                continue
+            conteo[valor] += 1
+            if self.minimos[i] is not None and valor < self.minimos[i]:
+                self.minimos[i] = valor
+            if self.maximos[i] is not None and valor > self.maximos[i]:
+                self.maximos[i] = valor
+    
+    def retirar(self, valores: Tuple[int, ...]):
+        """Resta el aporte de un producto."""
+        self.cantidad -= 1
+        for i, valor in enumerate(valores):
+            self.sumas[i] -= valor
+            conteo = self.valores[i]
+            if conteo is None:
+                continue
+            conteo[valor] -= 1
+            if conteo[valor] == 0:
+                del conteo[valor]
+                # El extremo se fue: se recalcula al consultar
+                if valor == self.minimos[i]:
+                    self.minimos[i] = None
+                if valor == self.maximos[i]:
+                    self.maximos[i] = None
+    
+    def minimo(self, i: int) -> int:
+        """Mínimo del campo i, recalculado sobre los valores distintos si hace falta."""
+        if self.minimos[i] is None:
+            self.minimos[i] = min(self.valores[i])
+        return self.minimos[i]
+    
+    def maximo(self, i: int) -> int:
+        """Máximo del campo i, recalculado sobre los valores distintos si hace falta."""
+        if self.maximos[i] is None:
+            self.maximos[i] = max(self.valores[i])
+        return self.maximos[i]
+
+
+class VistaMaterializada:
+    """
+    Agregados de los productos por una clave, mantenidos por deltas.
+    
+    Atributos:
+        nombre (str): Nombre de la vista en el registro
+        agrupar_por (str): Nombre de la clave de agrupación
+        medidas (Medidas): Medidas por nombre: (campo, agregado)
+        _clave (Callable[[Producto], Any]): Función de agrupación
+        _campos (Tuple[str, ...]): Campos que acumula cada grupo
+        _grupos (Dict[Any, _Grupo]): Acumuladores por grupo
+        _aportes (Dict[int, Tuple[Any, Tuple[int, ...]]]): Último aporte
+            (grupo, valores) de cada producto
+    """
+    
+    def __init__(
+        self,
+        nombre: str,
+        agrupar_por: Union[str, Callable[[Producto], Any]],
+        medidas: Medidas
+    ):
+        """
+        Crea una vista vacía.
+        
+        Args:
+            nombre: Nombre de la vista
+            agrupar_por: Clave de CLAVES o función producto -> grupo (None = fuera)
+            medidas: Medidas por nombre: (campo de VALORES o None, agregado de AGREGADOS)
+        
+        Raises:
+            ValueError: Si la clave, un campo o un agregado no existen
+        """
+        if callable(agrupar_por):
+            self._clave = agrupar_por
+            self.agrupar_por = getattr(agrupar_por, '__name__', 'clave')
+        elif agrupar_por in CLAVES:
+            self._clave = CLAVES[agrupar_por]
+            self.agrupar_por = agrupar_por
+        else:
+            raise ValueError(f"Clave desconocida '{agrupar_por}'. Claves válidas: {', '.join(CLAVES)}")
+        
+        if not medidas:
+            raise ValueError("La vista necesita al menos una medida")
+        for medida, (campo, agregado) in medidas.items():
+            if agregado not in AGREGADOS:
+                raise ValueError(f"Agregado desconocido '{agregado}' en la medida '{medida}'")
+            if agregado != 'cantidad' and campo not in VALORES:
+                raise ValueError(f"Campo desconocido '{campo}' en la medida '{medida}'")
+        
+        self.nombre = nombre
+        self.medidas = dict(medidas)
+        self._campos = tuple(sorted({
+            campo for campo, agregado in self.medidas.values() if agregado != 'cantidad'
+        }))
+        self._extremos = tuple(
+            any(c == campo and agregado in ('minimo', 'maximo') for c, agregado in self.medidas.values())
+            for campo in self._campos
+        )
+        self._valores = tuple(VALORES[campo] for campo in self._campos)
+        self._grupos: Dict[Any, _Grupo] = {}
+        self._aportes: Dict[int, Tuple[Any, Tuple[int, ...]]] = {}
+    
+    def _aporte(self, producto: Producto) -> Tuple[Any, Tuple[int, ...]]:
+        """Grupo y valores de un producto (uso interno)."""
+        return self._clave(producto), tuple(valor(producto) for valor in self._valores)
+    
+    def aplicar(self, producto_id: int, producto: Optional[Producto]):
+        """
+        Actualiza la vista con el estado actual de un producto.
+        
+        Retira el aporte anterior del producto y suma el actual.
+        
+        Args:
+            producto_id: ID del producto
+            producto: Producto con ese ID en el inventario (None = ya no está)
+        """
+        anterior = self._aportes.get(producto_id)
+        actual = None if producto is None else self._aporte(producto)
+        if actual is not None and actual[0] is None:
+            actual = None
+        if actual == anterior:
+            return
+        
+        if anterior is not None:
+            grupo = self._grupos[anterior[0]]
+            grupo.retirar(anterior[1])
+            if grupo.cantidad == 0:
+                del self._grupos[anterior[0]]
+            del self._aportes[producto_id]
+        if actual is not None:
+            grupo = self._grupos.get(actual[0])
+            if grupo is None:
+                grupo = self._grupos[actual[0]] = _Grupo(self._extremos)
+            grupo.agregar(actual[1])
+            self._aportes[producto_id] = actual
+    
+    def mover_id(self, anterior: int, nuevo: int):
+        """
+        Traslada el aporte recordado de un producto que cambió de ID.
+        
+        Args:
+            anterior: ID previo
+            nuevo: ID actual
+        """
+        aporte = self._aportes.pop(anterior, None)
+        if aporte is not None:
+            self._aportes[nuevo] = aporte
+    
+    def reconstruir(self, productos):
+        """
+        Recalcula la vista desde cero.
+        
+        Args:
+            productos: Productos del inventario
+        """
+        self._grupos = {}
+        self._aportes = {}
+        for producto in productos:
+            self.aplicar(producto.id, producto)
+    
+    def _medida(self, grupo: _Grupo, campo: Optional[str], agregado: str):
+        """Valor de una medida de un grupo, en unidades de salida (uso interno)."""
+        if agregado == 'cantidad':
+            return grupo.cantidad
+        i = self._campos.index(campo)
+        if agregado == 'suma':
+            valor = grupo.sumas[i]
+        elif agregado == 'minimo':
+            valor = grupo.minimo(i)
+        elif agregado == 'maximo':
+            valor = grupo.maximo(i)
+        else:
+            valor = grupo.sumas[i] / grupo.cantidad
+        return valor / 100 if campo in CAMPOS_MONETARIOS else valor
+    
+    def obtener(self, clave) -> Optional[Dict[str, Any]]:
+        """
+        Medidas de un grupo.
+        
+        Args:
+            clave: Grupo buscado
+        
+        Returns:
+            Optional[Dict[str, Any]]: Medidas por nombre, o None si el grupo no existe
+        """
+        grupo = self._grupos.get(clave)
+        if grupo is None:
+            return None
+        return {
+            medida: self._medida(grupo, campo, agregado)
+            for medida, (campo, agregado) in self.medidas.items()
+        }
+    
+    def consultar(self) -> pd.DataFrame:
+        """
+        Obtiene la vista completa, un grupo por fila, en O(grupos).
+        
+        Returns:
+            pd.DataFrame: Índice con la clave (ordenado) y una columna por medida
+        """
+        claves = sorted(self._grupos, key=lambda clave: (str(type(clave)), clave))
+        datos = {
+            medida: [self._medida(self._grupos[clave], campo, agregado) for clave in claves]
+            for medida, (campo, agregado) in self.medidas.items()
+        }
+        return pd.DataFrame(datos, index=pd.Index(claves, name=self.agrupar_por), columns=list(self.medidas))
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de grupos."""
+        return len(self._grupos)
+    
+    def __repr__(self) -> str:
+        """Representación string de la vista."""
+        return f"VistaMaterializada({self.nombre!r}, por={self.agrupar_por!r}, grupos={len(self)})"
+
+
+class RegistroVistas:
+    """
+    Registro de vistas materializadas de un inventario.
+    
+    Se suscribe una sola vez al bus de eventos del inventario y reparte
+    cada cambio a todas las vistas registradas.
+    
+    Atributos:
+        inventario (Inventario): Inventario observado
+        vistas (Dict[str, VistaMaterializada]): Vistas por nombre
+    
+    Ejemplo:
+        >>> vistas = RegistroVistas(inventario)
+        >>> vistas.registrar('por_pasillo', 'pasillo', {
+        ...     'unidades': ('stock_actual', 'suma'),
+        ...     'productos': (None, 'cantidad'),
+        ...     'precio_max': ('precio', 'maximo'),
+        ... })
+        >>> vistas.consultar('por_pasillo')
+    """
+    
+    def __init__(self, inventario: Inventario):
+        """
+        Crea el registro y lo suscribe a los cambios del inventario.
+        
+        Args:
+            inventario: Inventario cuyas vistas se mantienen
+        """
+        self.inventario = inventario
+        self.vistas: Dict[str, VistaMaterializada] = {}
+        inventario.eventos.suscribir(self._al_cambiar_inventario)
+    
+    def registrar(
+        self,
+        nombre: str,
+        agrupar_por: Union[str, Callable[[Producto], Any]],
+        medidas: Medidas
+    ) -> VistaMaterializada:
+        """
+        Registra una vista y la calcula por única vez sobre el inventario actual.
+        
+        Args:
+            nombre: Nombre de la vista
+            agrupar_por: Clave de CLAVES o función producto -> grupo
+            medidas: Medidas por nombre: (campo, agregado)
+        
+        Returns:
+            VistaMaterializada: La vista registrada
+        
+        Raises:
+            ValueError: Si ya existe una vista con ese nombre o la definición no es válida
+        """
+        if nombre in self.vistas:
+            raise ValueError(f"Ya existe la vista '{nombre}'")
+        vista = VistaMaterializada(nombre, agrupar_por, medidas)
+        vista.reconstruir(self.inventario.productos.values())
+        self.vistas[nombre] = vista
+        return vista
+    
+    def eliminar(self, nombre: str) -> bool:
+        """
+        Elimina una vista del registro.
+        
+        Returns:
+            bool: True si existía
+        """
+        return self.vistas.pop(nombre, None) is not None
+    
+    def consultar(self, nombre: str) -> pd.DataFrame:
+        """
+        Obtiene una vista registrada.
+        
+        Args:
+            nombre: Nombre de la vista
+        
+        Returns:
+            pd.DataFrame: Ver `VistaMaterializada.consultar`
+        
+        Raises:
+            KeyError: Si la vista no existe
+        """
+        return self[nombre].consultar()
+    
+    def _aplicar(self, producto_ids):
+        """Lleva a las vistas el estado actual de algunos productos (uso interno)."""
+        productos = self.inventario.productos
+        for producto_id in producto_ids:
+            producto = productos.get(producto_id)
+            for vista in self.vistas.values():
+                vista.aplicar(producto_id, producto)
+    
+    def _reconstruir(self):
+        """Recalcula todas las vistas (cambios sin producto conocido) (uso interno)."""
+        for vista in self.vistas.values():
+            vista.reconstruir(self.inventario.productos.values())
+    
+    def _al_cambiar_inventario(self, evento: EventoInventario):
+        """Aplica a las vistas el delta de un evento del inventario (uso interno)."""
+        if not self.vistas:
+            return
+        
+        if evento.tipo == EventoInventario.TRANSACCION:
+            if evento.nuevo is None:
+                self._reconstruir()
+            else:
+                self._aplicar(evento.nuevo)
+        elif evento.producto_id is None:
+            self._reconstruir()
+        else:
+            if evento.tipo == EventoInventario.ATRIBUTOS and evento.campo == 'id':
+                for vista in self.vistas.values():
+                    vista.mover_id(evento.anterior, evento.producto_id)
+            self._aplicar((evento.producto_id,))
+    
+    def __getitem__(self, nombre: str) -> VistaMaterializada:
+        """Obtiene una vista por nombre."""
+        try:
+            return self.vistas[nombre]
+        except KeyError:
+            raise KeyError(f"No existe la vista '{nombre}'") from None
+    
+    def __contains__(self, nombre: str) -> bool:
+        """Verifica si una vista está registrada."""
+        return nombre in self.vistas
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de vistas."""
+        return len(self.vistas)
+    
+    def __repr__(self) -> str:
+        """Representación string del registro."""
+        return f"RegistroVistas(vistas={list(self.vistas)})"
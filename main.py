@@ -19,13 +19,20 @@ Autor: Sistema de Gestión de Inventario
 Versión: 1.0.0
 """
 
+import multiprocessing
+import os
 import sys
 import numpy as np
 import pandas as pd
 from typing import Optional
 
 from models import Producto, Inventario
-from logic import OperacionesMatriciales
+from logic import OperacionesMatriciales, IndiceBins, HistorialStock, MotorConsultas, RegistroVistas
+from logic.archivos import (
+    ATRIBUTOS_MAPEO, HOJA_ALERTAS, HOJA_CATEGORIAS, detectar_formato,
+    leer_columnas, leer_archivo, leer_metadatos, mapeo_automatico, exportar_inventario
+)
+from logic.importacion import ImportadorInventario
 
 
 class SistemaInventario:
@@ -36,10 +43,18 @@ class SistemaInventario:
     el inventario utilizando operaciones de álgebra lineal.
     """
     
+    # Filas que se imprimen como máximo en los listados de la consola
+    MAXIMO_FILAS_LISTADO = 20
+    
     def __init__(self):
         """Inicializa el sistema de inventario."""
         self.inventario = Inventario()
-        self.operaciones = OperacionesMatriciales(self.inventario)
+        self.vistas = RegistroVistas(self.inventario)
+        self.operaciones = OperacionesMatriciales(self.inventario, self.vistas)
+        self.importador = ImportadorInventario(self.inventario)
+        self.indice_bins = IndiceBins(self.inventario)
+        self.historial = HistorialStock(inventario=self.inventario)
+        self.consultas = MotorConsultas(self.inventario)
         self._cargar_datos_ejemplo()
     
     def _cargar_datos_ejemplo(self):
@@ -76,6 +91,13 @@ class SistemaInventario:
         print("  7. Ver reporte completo (DataFrame)")
         print("  8. Análisis por categoría")
         print("  9. Agregar nuevo producto")
+        print(" 10. Importar inventario (Excel/CSV/Parquet)")
+        print(" 11. Exportar inventario (Excel/CSV/Parquet)")
+        print(" 12. Importación masiva (varios archivos)")
+        print(" 13. Consultar zona de bodega (BIN)")
+        print(" 14. Historial de stock de un producto")
+        print(" 15. Clasificación ABC (Pareto)")
+        print(" 16. Consulta avanzada (filtros)")
         print("  0. Salir")
         print("  ─" * 30)
     
@@ -248,6 +270,39 @@ class SistemaInventario:
         print("\n")
         print(df.to_string())
     
+    def ver_clasificacion_abc(self):
+        """Muestra la clasificación ABC por valor de inventario o de consumo."""
+        print("\n" + "─" * 50)
+        print("   CLASIFICACIÓN ABC (PARETO)")
+        print("─" * 50)
+        
+        respuesta = input("\n¿Clasificar por consumo en vez de valor en stock? (s/N): ")
+        base = "consumo" if respuesta.strip().lower() == "s" else "valor"
+        
+        resumen = self.operaciones.resumen_abc(base)
+        if resumen.empty:
+            print("\nNo hay datos para mostrar.")
+            return
+        
+        print("\n")
+        print(resumen.to_string())
+        
+        # Solo los de mayor aporte: los textos se leen para las filas impresas
+        valores = (
+            self.operaciones.calcular_vector_valores() if base == "valor"
+            else self.operaciones.calcular_vector_consumo()
+        )
+        clase_a = np.flatnonzero(self.operaciones.clasificar_abc(base) == "A")
+        clase_a = clase_a[np.argsort(-valores[clase_a], kind='stable')]
+        productos = self.inventario.listar_productos()
+        
+        print(f"\n  Productos clase A ({clase_a.size}):")
+        for fila in clase_a[:self.MAXIMO_FILAS_LISTADO].tolist():
+            producto = productos[fila]
+            print(f"  {producto.id:>8}  {producto.nombre[:30]:<30}  {producto.categoria:<15}  {valores[fila]:>14,.2f}")
+        if clase_a.size > self.MAXIMO_FILAS_LISTADO:
+            print(f"  ... y {clase_a.size - self.MAXIMO_FILAS_LISTADO} más")
+    
     def agregar_producto(self):
         """Agrega un nuevo producto al inventario."""
         print("\n" + "─" * 50)
@@ -255,7 +310,8 @@ class SistemaInventario:
         print("─" * 50)
         
         try:
-            producto_id = int(input("\nIngrese el ID del producto: "))
+            texto_id = input("\nIngrese el ID del producto (vacío = automático): ").strip()
+            producto_id = int(texto_id) if texto_id else self.inventario.nuevo_id()
             nombre = input("Ingrese el nombre del producto: ")
             precio = float(input("Ingrese el precio: "))
             stock = int(input("Ingrese el stock inicial: "))
@@ -267,14 +323,207 @@ class SistemaInventario:
                 producto_id, nombre, precio, stock, minimo, maximo, categoria
             )
             
-            if self.inventario.agregar_producto(producto):
-                print(f"\n✓ Producto '{nombre}' agregado exitosamente.")
+            # Un BIN nuevo de un item existente comparte sus datos maestros
+            actualizar_item = False
+            conflictos = self.inventario.conflictos_ficha(producto)
+            if conflictos:
+                print(f"\n⚠ El item {self.inventario.clave_grupo(producto)} ya existe con otros datos:")
+                for campo, (actual, propio) in conflictos.items():
+                    print(f"  {campo}: '{actual}' (item) / '{propio}' (ingresado)")
+                respuesta = input("¿Actualizar el item en todos sus BINs? (s/N): ").strip().lower()
+                actualizar_item = respuesta == 's'
+            
+            if self.inventario.agregar_producto(producto, actualizar_item):
+                print(
+                    f"\n✓ Producto '{producto.nombre}' (precio ${producto.precio:.2f}, "
+                    f"categoría {producto.categoria}) agregado exitosamente."
+                )
             else:
                 print(f"\n✗ Error: Ya existe un producto con ID {producto_id}.")
                 
         except ValueError as e:
             print(f"\n✗ Error: {e}")
     
+    def importar_archivo(self):
+        """Importa productos desde un archivo Excel, CSV o Parquet."""
+        print("\n" + "─" * 50)
+        print("   IMPORTAR INVENTARIO")
+        print("─" * 50)
+        
+        ruta = input("\nRuta del archivo (.xlsx, .csv, .parquet): ").strip()
+        
+        try:
+            columnas = leer_columnas(ruta)
+            mapeo = mapeo_automatico(columnas)
+            
+            # Completar a mano los atributos que no se reconocieron
+            print(f"\nColumnas del archivo: {', '.join(map(str, columnas))}")
+            for etiqueta, atributo, _ in ATRIBUTOS_MAPEO:
+                if atributo in mapeo:
+                    print(f"  {etiqueta}: {mapeo[atributo]}")
+                    continue
+                columna = input(f"  {etiqueta} (Enter para omitir): ").strip()
+                if columna:
+                    if columna not in columnas:
+                        print(f"\n✗ Error: La columna '{columna}' no existe.")
+                        return
+                    mapeo[atributo] = columna
+            
+            if not any(clave in mapeo for clave in ('id', 'numero_item', 'codigo_upc')):
+                print("\n✗ Error: Debe mapear al menos un identificador (ID, Número Item o UPC).")
+                return
+            if 'bin' not in mapeo:
+                print("\n✗ Error: El atributo BIN (Ubicación Bodega) es requerido.")
+                return
+            
+            df = leer_archivo(ruta, mapeo)
+            # La marca de agua guardada evita reentregar IDs ya usados
+            self.inventario.ids.restaurar(leer_metadatos(ruta))
+            resumen = self.importador.importar_diferencial(df, mapeo)
+            print(f"\n{resumen['mensaje']}")
+            
+        except (OSError, ValueError, ImportError) as e:
+            print(f"\n✗ Error: {e}")
+    
+    def importar_masivo(self):
+        """Importa varios archivos a la vez, leyéndolos en paralelo."""
+        print("\n" + "─" * 50)
+        print("   IMPORTACIÓN MASIVA")
+        print("─" * 50)
+        
+        entrada = input("\nRutas de los archivos (separadas por ';'): ")
+        rutas = [ruta.strip() for ruta in entrada.split(";") if ruta.strip()]
+        if not rutas:
+            print("\n✗ Error: No se indicaron archivos.")
+            return
+        
+        resumen = self.importador.importar_archivos(
+            rutas, procesos=os.cpu_count()
+        )
+        print(f"\nFilas leídas: {resumen['filas']}")
+        print(resumen['mensaje'])
+    
+    def exportar_archivo(self):
+        """Exporta el inventario a un archivo Excel, CSV o Parquet."""
+        print("\n" + "─" * 50)
+        print("   EXPORTAR INVENTARIO")
+        print("─" * 50)
+        
+        ruta = input("\nRuta de destino (.xlsx, .csv, .parquet): ").strip()
+        
+        try:
+            hojas_extra = []
+            if detectar_formato(ruta) == "excel":
+                respuesta = input("¿Incluir hojas de alertas y categorías? (s/n): ").strip().lower()
+                if respuesta == "s":
+                    hojas_extra = [HOJA_ALERTAS, HOJA_CATEGORIAS]
+            
+            cantidad = exportar_inventario(self.inventario, ruta, hojas_extra)
+            print(f"\n✓ {cantidad} productos exportados a '{ruta}'.")
+        except (OSError, ValueError, ImportError) as e:
+            print(f"\n✗ Error: {e}")
+    
+    @staticmethod
+    def _leer_filtro(texto: str):
+        """Convierte '2' en 2 y '10-15' en (10, 15); vacío = sin filtro."""
+        texto = texto.strip()
+        if not texto:
+            return None
+        if '-' in texto:
+            desde, hasta = texto.split('-', 1)
+            return int(desde), int(hasta)
+        return int(texto)
+    
+    def consultar_zona(self):
+        """Muestra stock, valor y ocupación de una zona de la bodega."""
+        print("\n" + "─" * 50)
+        print("   CONSULTA POR ZONA DE BODEGA")
+        print("─" * 50)
+        print("\nIndique un número (2) o un rango (10-15); vacío = todos.")
+        
+        try:
+            pasillo = self._leer_filtro(input("Pasillo: "))
+            rack = self._leer_filtro(input("Rack: "))
+        except ValueError:
+            print("\n✗ Error: Ingrese números válidos.")
+            return
+        
+        agrupar = "rack" if pasillo is not None else "pasillo"
+        resumen = self.indice_bins.resumen_por_zona(agrupar, pasillo=pasillo, rack=rack)
+        
+        if resumen.empty:
+            print("\nNo hay productos en esa zona.")
+        else:
+            print("\n")
+            print(resumen.to_string())
+        
+        sin_ubicacion = self.indice_bins.sin_ubicacion()
+        if sin_ubicacion:
+            print(f"\n⚠️ {len(sin_ubicacion)} productos sin BIN con formato XXX/XXX/XXX")
+    
+    def ver_historial_stock(self):
+        """Muestra la evolución del stock de un producto."""
+        print("\n" + "─" * 50)
+        print("   HISTORIAL DE STOCK")
+        print("─" * 50)
+        
+        try:
+            producto_id = int(input("\nID del producto: "))
+        except ValueError:
+            print("\n✗ Error: Ingrese un ID válido.")
+            return
+        
+        desde = input("Desde (AAAA-MM-DD, vacío = inicio): ").strip() or None
+        hasta = input("Hasta (AAAA-MM-DD, vacío = hoy): ").strip() or None
+        if hasta is not None:
+            hasta = f"{hasta} 23:59:59"
+        
+        try:
+            serie = self.historial.serie(producto_id, desde, hasta)
+        except ValueError:
+            print("\n✗ Error: Fecha no válida.")
+            return
+        
+        if serie.empty:
+            print("\nNo hay movimientos registrados en ese rango.")
+        else:
+            print("\n")
+            print(serie.to_string())
+    
+    def consulta_avanzada(self):
+        """Filtra, ordena y limita el inventario con una condición escrita."""
+        print("\n" + "─" * 50)
+        print("   CONSULTA AVANZADA")
+        print("─" * 50)
+        print('\nEjemplo: categoria == "Electrónica" and precio > 100 and ocupacion < 20')
+        print("Campos: id, precio, stock, minimo, maximo, ocupacion, valor,")
+        print("        pasillo, rack, nivel, categoria, bin, item, upc, nombre")
+        
+        donde = input("\nCondición (vacío = todos): ").strip() or None
+        columnas = input("Columnas separadas por coma (vacío = habituales): ").strip()
+        ordenar_por = input("Ordenar por (vacío = sin orden): ").strip() or None
+        descendente = ordenar_por is not None and input("¿Descendente? (s/n): ").strip().lower() == "s"
+        limite = input("Límite de filas (vacío = todas): ").strip()
+        
+        try:
+            resultado = self.consultas.consultar(
+                donde,
+                columnas=[c.strip() for c in columnas.split(",") if c.strip()] or None,
+                ordenar_por=ordenar_por,
+                descendente=descendente,
+                limite=int(limite) if limite else None
+            )
+        except ValueError as e:
+            print(f"\n✗ Error: {e}")
+            return
+        
+        if resultado.empty:
+            print("\nNingún producto cumple la condición.")
+        else:
+            print("\n")
+            print(resultado.to_string(index=False))
+            print(f"\n{len(resultado)} productos.")
+    
     def ejecutar(self):
         """Ejecuta el bucle principal del sistema."""
         print("\n🚀 Iniciando Sistema de Gestión de Inventario...")
@@ -304,6 +553,20 @@ class SistemaInventario:
                     self.ver_analisis_categoria()
                 elif opcion == "9":
                     self.agregar_producto()
+                elif opcion == "10":
+                    self.importar_archivo()
+                elif opcion == "11":
+                    self.exportar_archivo()
+                elif opcion == "12":
+                    self.importar_masivo()
+                elif opcion == "13":
+                    self.consultar_zona()
+                elif opcion == "14":
+                    self.ver_historial_stock()
+                elif opcion == "15":
+                    self.ver_clasificacion_abc()
+                elif opcion == "16":
+                    self.consulta_avanzada()
                 elif opcion == "0":
                     print("\n¡Hasta luego! 👋")
                     break
@@ -322,4 +585,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # En el ejecutable congelado, los procesos de la carga masiva deben
+    # ejecutar su tarea y no volver a abrir la aplicación
+    multiprocessing.freeze_support()
     main()
@@ -5,7 +5,11 @@ Este módulo contiene las clases de modelo que representan las entidades
 principales del sistema de inventario utilizando programación orientada a objetos.
 """
 
-from models.producto import Producto
+from models.producto import Producto, FichaProducto
 from models.inventario import Inventario
+from models.movimientos import RegistroMovimientos
+from models.eventos import BusEventos, EventoInventario
+from models.asignador_ids import AsignadorIds
 
-__all__ = ['Producto', 'Inventario']
+__all__ = ['Producto', 'FichaProducto', 'Inventario', 'RegistroMovimientos', 'BusEventos', 'EventoInventario',
+           'AsignadorIds']
@@ -0,0 +1,116 @@
+"""
+Módulo que define el asignador de IDs de productos.
+
+Reemplaza el cálculo de `max(id) + 1` por producto nuevo (que vuelve
+cuadrática una carga masiva) por una marca de agua: el siguiente ID que
+nunca se entregó. Asignar, reservar un rango y observar un ID explícito
+cuestan O(1). Opcionalmente reutiliza los IDs liberados.
+"""
+
+import heapq
+from numbers import Integral
+from typing import Dict, List
+
+
+class AsignadorIds:
+    """
+    Asignador monótono de IDs con reserva de rangos.
+    
+    Atributos:
+        siguiente (int): Marca de agua; ningún ID ≥ siguiente fue entregado
+            ni observado
+        reutilizar (bool): Si es True, `asignar` entrega primero los IDs liberados
+        _libres (List[int]): Montículo de IDs liberados (solo si reutilizar)
+    """
+    
+    def __init__(self, siguiente: int = 1, reutilizar: bool = False):
+        """
+        Crea el asignador.
+        
+        Args:
+            siguiente: Primer ID a entregar
+            reutilizar: Reutilizar los IDs liberados
+        """
+        self.siguiente = int(siguiente)
+        self.reutilizar = reutilizar
+        self._libres: List[int] = []
+    
+    def asignar(self) -> int:
+        """
+        Entrega un ID nuevo.
+        
+        Returns:
+            int: El menor ID liberado (si se reutilizan) o la marca de agua
+        """
+        if self.reutilizar and self._libres:
+            return heapq.heappop(self._libres)
+        producto_id = self.siguiente
+        self.siguiente += 1
+        return producto_id
+    
+    def reservar(self, cantidad: int) -> range:
+        """
+        Reserva un rango contiguo de IDs en una sola operación.
+        
+        Args:
+            cantidad: IDs a reservar
+        
+        Returns:
+            range: IDs reservados
+        
+        Raises:
+            ValueError: Si la cantidad es negativa
+        """
+        if cantidad < 0:
+            raise ValueError("La cantidad a reservar no puede ser negativa")
+        inicio = self.siguiente
+        self.siguiente += cantidad
+        return range(inicio, self.siguiente)
+    
+    def observar(self, producto_id: int):
+        """
+        Registra un ID asignado por fuera (por ejemplo, leído de un archivo).
+        
+        Los IDs no enteros se ignoran: no compiten con los que se asignan.
+        
+        Args:
+            producto_id: ID en uso
+        """
+        if isinstance(producto_id, Integral) and producto_id >= self.siguiente:
+            self.siguiente = int(producto_id) + 1
+    
+    def liberar(self, producto_id: int):
+        """
+        Devuelve un ID que dejó de usarse.
+        
+        Solo tiene efecto si se reutilizan IDs; la marca de agua nunca baja.
+        
+        Args:
+            producto_id: ID liberado
+        """
+        if self.reutilizar and isinstance(producto_id, Integral) and producto_id < self.siguiente:
+            heapq.heappush(self._libres, int(producto_id))
+    
+    def a_dict(self) -> Dict[str, int]:
+        """
+        Estado persistible del asignador.
+        
+        Returns:
+            Dict[str, int]: {'siguiente_id': marca de agua}
+        """
+        return {'siguiente_id': self.siguiente}
+    
+    def restaurar(self, estado: Dict[str, int]):
+        """
+        Restaura la marca de agua guardada, sin bajarla nunca.
+        
+        Args:
+            estado: Diccionario de `a_dict`
+        """
+        siguiente = estado.get('siguiente_id')
+        if siguiente is not None:
+            self.observar(int(siguiente) - 1)
+    
+    def __repr__(self) -> str:
+        """Representación string del asignador."""
+        return f"AsignadorIds(siguiente={self.siguiente}, libres={len(self._libres)})"
@@ -0,0 +1,158 @@
+"""
+Módulo que define el bus de eventos de cambios del inventario.
+
+El inventario publica un evento por cada cambio (producto insertado,
+eliminado, cambio de stock o de atributos) y los interesados (interfaz
+gráfica, cachés, índices) se suscriben para actualizar solo lo afectado
+en lugar de reconstruir todo.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+class EventoInventario:
+    """
+    Cambio puntual en el inventario.
+    
+    Atributos:
+        tipo (str): 'insertado', 'eliminado', 'stock', 'atributos' o 'transaccion'
+        producto_id (Optional[int]): Producto afectado (None = no se sabe cuál)
+        campo (Optional[str]): Atributo modificado, si se conoce
+        anterior (Any): Valor anterior del campo
+        nuevo (Any): Valor nuevo del campo; en 'transaccion', el conjunto
+            de IDs afectados (None = no se sabe cuáles)
+    """
+    
+    INSERTADO = "insertado"
+    ELIMINADO = "eliminado"
+    STOCK = "stock"
+    ATRIBUTOS = "atributos"
+    TRANSACCION = "transaccion"
+    
+    __slots__ = ('tipo', 'producto_id', 'campo', 'anterior', 'nuevo')
+    
+    def __init__(
+        self,
+        tipo: str,
+        producto_id: Optional[int] = None,
+        campo: Optional[str] = None,
+        anterior: Any = None,
+        nuevo: Any = None
+    ):
+        """
+        Crea un evento.
+        
+        Args:
+            tipo: Tipo de cambio
+            producto_id: ID del producto afectado
+            campo: Atributo modificado
+            anterior: Valor anterior
+            nuevo: Valor nuevo
+        """
+        self.tipo = tipo
+        self.producto_id = producto_id
+        self.campo = campo
+        self.anterior = anterior
+        self.nuevo = nuevo
+    
+    def __repr__(self) -> str:
+        """Representación string del evento."""
+        detalle = f", campo={self.campo!r}" if self.campo else ""
+        return f"EventoInventario({self.tipo!r}, producto_id={self.producto_id!r}{detalle})"
+
+
+class BusEventos:
+    """
+    Bus de publicación y suscripción de eventos del inventario.
+    
+    Los eventos se entregan de forma sincrónica y en orden. Dentro de un
+    bloque `lote()` se acumulan y se entregan juntos al cerrar el bloque
+    más externo.
+    
+    Atributos:
+        _suscriptores (List): Pares (función, tipos aceptados o None)
+        _pendientes (List[EventoInventario]): Eventos acumulados en el lote
+        _nivel_lote (int): Profundidad de bloques `lote()` anidados
+    """
+    
+    def __init__(self):
+        """Inicializa un bus sin suscriptores."""
+        self._suscriptores: List[Tuple[Callable[[EventoInventario], None], Optional[frozenset]]] = []
+        self._pendientes: List[EventoInventario] = []
+        self._nivel_lote = 0
+    
+    def suscribir(
+        self,
+        funcion: Callable[[EventoInventario], None],
+        tipos: Optional[Iterable[str]] = None
+    ) -> Callable[[EventoInventario], None]:
+        """
+        Suscribe una función a los eventos.
+        
+        Args:
+            funcion: Función que recibe cada evento
+            tipos: Tipos de evento a recibir (None = todos)
+        
+        Returns:
+            Callable: La misma función, para usarla con `desuscribir`
+        """
+        self._suscriptores.append((funcion, frozenset(tipos) if tipos is not None else None))
+        return funcion
+    
+    def desuscribir(self, funcion: Callable[[EventoInventario], None]) -> bool:
+        """
+        Elimina una suscripción.
+        
+        Args:
+            funcion: Función suscrita
+        
+        Returns:
+            bool: True si estaba suscrita
+        """
+        for i, (suscrita, _) in enumerate(self._suscriptores):
+            if suscrita == funcion:
+                del self._suscriptores[i]
+                return True
+        return False
+    
+    def publicar(self, evento: EventoInventario):
+        """
+        Publica un evento (o lo acumula si hay un lote abierto).
+        
+        Args:
+            evento: Evento a publicar
+        """
+        if self._nivel_lote:
+            self._pendientes.append(evento)
+        else:
+            self._entregar([evento])
+    
+    @contextmanager
+    def lote(self):
+        """
+        Agrupa los eventos publicados dentro del bloque.
+        
+        Uso:
+            with inventario.eventos.lote():
+                ...  # los eventos se entregan al salir del bloque
+        """
+        self._nivel_lote += 1
+        try:
+            yield self
+        finally:
+            self._nivel_lote -= 1
+            if self._nivel_lote == 0 and self._pendientes:
+                eventos, self._pendientes = self._pendientes, []
+                self._entregar(eventos)
+    
+    def _entregar(self, eventos: List[EventoInventario]):
+        """Entrega los eventos a los suscriptores que los aceptan (uso interno)."""
+        for funcion, tipos in list(self._suscriptores):
+            for evento in eventos:
+                if tipos is None or evento.tipo in tipos:
+                    funcion(evento)
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de suscriptores."""
+        return len(self._suscriptores)
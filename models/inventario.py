@@ -7,12 +7,21 @@ El inventario se representa como una matriz donde:
 
 Esta representación matricial permite realizar operaciones de álgebra lineal
 para cálculos eficientes de stock, entradas, salidas y alertas.
+
+Los datos del inventario están normalizados en dos tablas: un catálogo de
+fichas (una por item, con identificadores, nombre, precio y categoría) y
+las filas BIN (stock por ubicación), unidas por referencia a la ficha.
+`Producto` sigue siendo la vista de una fila BIN con los datos de su item.
 """
 
+from contextlib import contextmanager
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
-from models.producto import Producto
+from typing import Any, Dict, List, Optional, Tuple
+from models.producto import FichaProducto, Producto
+from models.movimientos import RegistroMovimientos
+from models.asignador_ids import AsignadorIds
+from models.eventos import BusEventos, EventoInventario
 
 
 class Inventario:
@@ -26,36 +35,603 @@ class Inventario:
     
     Atributos:
         productos (Dict[int, Producto]): Diccionario de productos por ID
-        _matriz_cache (np.ndarray): Caché de la matriz de inventario
+        fichas (Dict[str, FichaProducto]): Catálogo de fichas de item por clave
+        movimientos (RegistroMovimientos): Historial de entradas y salidas
+        _columnas (Dict[str, np.ndarray]): Caché tipado por columnas (ver TIPOS_COLUMNAS)
+        _matriz_cache (Optional[np.ndarray]): Vista float64 de las columnas,
+            construida solo cuando se pide (None = sin construir)
         _cache_valido (bool): Indica si el caché está actualizado
+        _posiciones (Dict[int, int]): Fila de cada producto en el caché
+        _codigos_cache (np.ndarray): Código de categoría de cada fila del caché
+        categorias (List[str]): Diccionario compartido código -> categoría
+        _cache_entregado (bool): Indica si el caché se entregó a un llamador
+        version (int): Contador que aumenta con cada cambio notificado
+        eventos (BusEventos): Bus donde se publican los cambios
+        ids (AsignadorIds): Asignador de IDs para productos nuevos
+        _deshacer (Optional[List[tuple]]): Registro de deshacer de la
+            transacción abierta (None = sin transacción)
     """
     
+    # Columna de la matriz de inventario de cada atributo numérico
+    COLUMNAS_MATRIZ = {
+        'id': 0, 'precio': 1, 'stock_actual': 2, 'stock_minimo': 3, 'stock_maximo': 4
+    }
+    
+    # Tipo de cada columna del caché tipado; el precio se guarda en centavos
+    # para que la valorización sea un producto punto entero y exacto
+    TIPOS_COLUMNAS = {
+        'id': np.int64, 'precio_centavos': np.int64,
+        'stock_actual': np.int32, 'stock_minimo': np.int32, 'stock_maximo': np.int32
+    }
+    
+    # Acciones del registro de deshacer
+    _DESHACER_CAMPO = 0
+    _DESHACER_INSERTADO = 1
+    _DESHACER_ELIMINADO = 2
+    _DESHACER_FICHA = 3
+    
     def __init__(self):
         """Inicializa un inventario vacío."""
         self.productos: Dict[int, Producto] = {}
+        self.fichas: Dict[str, FichaProducto] = {}
+        self._columnas: Dict[str, np.ndarray] = {}
         self._matriz_cache: Optional[np.ndarray] = None
         self._cache_valido: bool = False
         self._nombres_cache: List[str] = []
+        self._posiciones: Dict[int, int] = {}
+        self._codigos_cache: np.ndarray = np.empty(0, dtype=np.intp)
+        self.categorias: List[str] = []
+        self._codigos_categoria: Dict[str, int] = {}
+        self._cache_entregado: bool = False
+        self.movimientos = RegistroMovimientos()
+        self.version: int = 0
+        self.eventos = BusEventos()
+        self.ids = AsignadorIds()
+        
+        # Estado de la transacción abierta
+        self._deshacer: Optional[List[tuple]] = None
+        self._ids_transaccion: set = set()
+        self._cambio_desconocido: bool = False
+        self._filas_pendientes: set = set()
+        self._orden_original: Optional[List[int]] = None
     
     def _invalidar_cache(self):
         """Invalida el caché de la matriz cuando hay cambios (uso interno)."""
         self._cache_valido = False
+        self.version += 1
     
-    def notificar_cambio_stock(self):
+    def notificar_cambio_stock(
+        self,
+        producto_id: Optional[int] = None,
+        anterior: Optional[int] = None,
+        nuevo: Optional[int] = None
+    ):
         """
         Notifica que hubo un cambio en el stock de productos.
         
         Debe llamarse después de modificar el stock de un producto
-        para mantener la coherencia del caché de la matriz.
+        para mantener la coherencia del caché de la matriz. Publica un
+        evento 'stock'; sin producto_id los suscriptores deben asumir que
+        pudo cambiar cualquier producto.
+        
+        Args:
+            producto_id: ID del producto modificado (None = varios o desconocido)
+            anterior: Stock anterior
+            nuevo: Stock nuevo
         """
         self._cache_valido = False
+        if self._registrar_en_transaccion(producto_id):
+            return
+        self.version += 1
+        self.eventos.publicar(EventoInventario(
+            EventoInventario.STOCK, producto_id, 'stock_actual', anterior, nuevo
+        ))
+    
+    def notificar_cambio_atributos(
+        self,
+        producto_id: Optional[int] = None,
+        campo: Optional[str] = None,
+        anterior=None,
+        nuevo=None
+    ):
+        """
+        Notifica que cambiaron atributos de un producto (nombre, BIN, precio...).
+        
+        Args:
+            producto_id: ID del producto modificado (None = varios o desconocido)
+            campo: Atributo modificado (None = varios)
+            anterior: Valor anterior
+            nuevo: Valor nuevo
+        """
+        self._cache_valido = False
+        if self._registrar_en_transaccion(producto_id):
+            return
+        self.version += 1
+        self.eventos.publicar(EventoInventario(
+            EventoInventario.ATRIBUTOS, producto_id, campo, anterior, nuevo
+        ))
+    
+    def _al_cambiar_campo(self, producto: Producto, campo: str, anterior, nuevo):
+        """
+        Recibe el cambio de un atributo de un producto propio (uso interno).
+        
+        Lo llama el descriptor de Producto. Actualiza en su lugar la fila
+        del caché de la matriz en vez de invalidarlo y publica el evento.
+        
+        Args:
+            producto: Producto modificado
+            campo: Atributo modificado
+            anterior: Valor anterior
+            nuevo: Valor nuevo
+        """
+        if self.productos.get(producto.id) is not producto:
+            return
+        
+        if self._deshacer is not None:
+            self._deshacer.append((self._DESHACER_CAMPO, producto, campo, anterior))
+            self._ids_transaccion.add(producto.id)
+            if campo == 'id':
+                self._ids_transaccion.add(anterior)
+                self._cache_valido = False
+            else:
+                self._filas_pendientes.add(producto.id)
+            return
+        
+        if self._cache_valido:
+            if campo == 'id':
+                self._cache_valido = False
+            elif campo in self.COLUMNAS_MATRIZ:
+                self._preparar_escritura_cache()
+                self._escribir_cache(self._posiciones[producto.id], campo, nuevo)
+            elif campo == 'nombre':
+                self._nombres_cache[self._posiciones[producto.id]] = nuevo
+            elif campo == 'categoria':
+                self._preparar_escritura_cache()
+                self._codigos_cache[self._posiciones[producto.id]] = self.codigo_categoria(nuevo)
+        self.version += 1
+        
+        tipo = EventoInventario.STOCK if campo == 'stock_actual' else EventoInventario.ATRIBUTOS
+        self.eventos.publicar(EventoInventario(tipo, producto.id, campo, anterior, nuevo))
+    
+    def _al_cambiar_ficha(self, ficha: FichaProducto, campo: str, anterior, nuevo):
+        """
+        Recibe el cambio de un dato maestro de un item (uso interno).
+        
+        Lo llama el descriptor de Producto. El valor se guardó una sola vez
+        en la ficha; aquí se propaga el cambio al caché y a los suscriptores
+        como un cambio de cada ubicación del item. Los cambios que alteran
+        la clave del item no llegan aquí: los resuelve `_cambiar_item`.
+        
+        Args:
+            ficha: Ficha modificada
+            campo: Atributo modificado
+            anterior: Valor anterior
+            nuevo: Valor nuevo
+        """
+        for producto in list(ficha.ubicaciones):
+            self._al_cambiar_campo(producto, campo, anterior, nuevo)
+    
+    def _vincular_ficha(self, producto: Producto, ficha: Optional[FichaProducto] = None):
+        """
+        Une un producto que entra al inventario con la ficha de su item (uso interno).
+        
+        Si el catálogo ya tiene una ficha con la misma clave, el producto
+        pasa a compartirla y sus datos maestros propios se descartan (ver
+        `conflictos_ficha`); si no, su ficha se registra en el catálogo.
+        
+        Args:
+            producto: Producto que entra al inventario
+            ficha: Ficha a la que se une (por defecto, la del catálogo)
+        """
+        ficha = ficha or producto._ficha
+        clave = ficha.clave()
+        if clave is not None:
+            registrada = self.fichas.setdefault(clave, ficha)
+            if registrada is ficha:
+                ficha._clave = clave
+            elif not ficha.ubicaciones:
+                ficha = registrada
+        producto._ficha = ficha
+        ficha.ubicaciones.append(producto)
+    
+    def _desvincular_ficha(self, producto: Producto) -> FichaProducto:
+        """
+        Separa un producto que sale del inventario de la ficha de su item (uso interno).
+        
+        El producto se queda con una copia independiente de los datos
+        maestros; la ficha sale del catálogo cuando se queda sin ubicaciones.
+        
+        Returns:
+            FichaProducto: Ficha de la que se separó
+        """
+        ficha = producto._ficha
+        ficha.ubicaciones.remove(producto)
+        if not ficha.ubicaciones and ficha._clave is not None:
+            del self.fichas[ficha._clave]
+            ficha._clave = None
+        producto._ficha = ficha.copia()
+        return ficha
+    
+    def _cambiar_item(self, producto: Producto, campo: str, valor) -> bool:
+        """
+        Cambia un identificador de una fila BIN moviéndola al item que le corresponde (uso interno).
+        
+        Lo llama el descriptor de Producto antes de escribir el valor. Si
+        la clave del item no cambia, no hace nada y el valor se escribe en
+        la ficha compartida como cualquier otro dato maestro. Si cambia,
+        solo esta fila deja su ficha (las demás ubicaciones conservan el
+        identificador) y se une a la ficha del catálogo con la nueva clave,
+        tomando sus datos maestros; si no hay ninguna, se registra una
+        copia de los datos con el identificador nuevo. Así el catálogo
+        tiene siempre una sola ficha por clave.
+        
+        Args:
+            producto: Fila BIN modificada
+            campo: 'numero_item' o 'codigo_upc'
+            valor: Valor nuevo
+        
+        Returns:
+            bool: True si la fila cambió de item (el valor ya quedó escrito)
+        """
+        anterior = producto._ficha
+        destino = anterior.copia()
+        setattr(destino, campo, valor)
+        if destino.clave() == anterior.clave():
+            return False
+        
+        self._desvincular_ficha(producto)
+        self._vincular_ficha(producto, destino)
+        if self._deshacer is not None:
+            self._deshacer.append((self._DESHACER_FICHA, producto, None, anterior))
+            self._ids_transaccion.add(producto.id)
+            self._filas_pendientes.add(producto.id)
+            return True
+        
+        for nombre in FichaProducto.CAMPOS:
+            antes, ahora = getattr(anterior, nombre), getattr(producto._ficha, nombre)
+            if antes != ahora:
+                self._al_cambiar_campo(producto, nombre, antes, ahora)
+        return True
+    
+    def _preparar_escritura_cache(self):
+        """
+        Prepara el caché para modificarlo en su lugar (uso interno).
+        
+        Si el caché ya se entregó a un llamador se copia antes, para que
+        las matrices obtenidas antes del cambio no se modifiquen.
+        """
+        if self._cache_entregado:
+            self._columnas = {nombre: columna.copy() for nombre, columna in self._columnas.items()}
+            if self._matriz_cache is not None:
+                self._matriz_cache = self._matriz_cache.copy(order='F')
+            self._codigos_cache = self._codigos_cache.copy()
+            self._cache_entregado = False
+    
+    def _escribir_cache(self, filas, campo: str, valores):
+        """
+        Escribe un atributo numérico en las columnas tipadas y en la vista float64 (uso interno).
+        
+        Args:
+            filas: Fila o filas del caché
+            campo: Atributo de COLUMNAS_MATRIZ
+            valores: Valor o valores nuevos
+        """
+        if campo == 'precio':
+            centavos = self.a_centavos(valores)
+            self._columnas['precio_centavos'][filas] = centavos
+            valores = centavos / 100
+        else:
+            self._columnas[campo][filas] = valores
+        if self._matriz_cache is not None:
+            self._matriz_cache[filas, self.COLUMNAS_MATRIZ[campo]] = valores
+    
+    @staticmethod
+    def a_centavos(precios):
+        """
+        Convierte precios a centavos enteros, redondeando al más cercano.
+        
+        Args:
+            precios: Precio o array de precios
+        
+        Returns:
+            np.int64 o np.ndarray: Centavos
+        """
+        return np.rint(np.asarray(precios, dtype=np.float64) * 100).astype(np.int64)
+    
+    def codigo_categoria(self, categoria: str) -> int:
+        """
+        Obtiene el código entero de una categoría, registrándola si es nueva.
+        
+        Args:
+            categoria: Nombre de la categoría
+        
+        Returns:
+            int: Posición de la categoría en `categorias`
+        """
+        codigo = self._codigos_categoria.get(categoria)
+        if codigo is None:
+            codigo = len(self.categorias)
+            self._codigos_categoria[categoria] = codigo
+            self.categorias.append(categoria)
+        return codigo
+    
+    def _reasignar_id(self, producto: Producto, anterior: int, nuevo: int):
+        """
+        Mueve un producto propio a su nuevo ID en el diccionario (uso interno).
+        
+        Raises:
+            ValueError: Si ya existe otro producto con el nuevo ID
+        """
+        if self.productos.get(anterior) is not producto:
+            return
+        if nuevo in self.productos:
+            raise ValueError(f"Ya existe un producto con ID {nuevo}")
+        
+        self._guardar_orden()
+        del self.productos[anterior]
+        self.productos[nuevo] = producto
+        self.ids.observar(nuevo)
+        self.ids.liberar(anterior)
+    
+    def nuevo_id(self) -> int:
+        """
+        Entrega un ID libre para un producto nuevo en O(1).
+        
+        Returns:
+            int: ID que ningún producto del inventario usa
+        """
+        producto_id = self.ids.asignar()
+        # Un ID liberado pudo volver a usarse (p. ej., al revertir una eliminación)
+        while producto_id in self.productos:
+            producto_id = self.ids.asignar()
+        return producto_id
+    
+    def reservar_ids(self, cantidad: int) -> range:
+        """
+        Reserva un rango contiguo de IDs nuevos para una inserción masiva.
+        
+        Args:
+            cantidad: IDs a reservar
+        
+        Returns:
+            range: IDs reservados, todos mayores que cualquier ID usado
+        """
+        return self.ids.reservar(cantidad)
+    
+    def cambiar_id(self, producto_id: int, nuevo_id: int) -> bool:
+        """
+        Cambia el ID de un producto manteniendo el inventario coherente.
+        
+        Args:
+            producto_id: ID actual del producto
+            nuevo_id: Nuevo ID
+        
+        Returns:
+            bool: True si se cambió, False si el producto no existe o el
+                nuevo ID ya está ocupado por otro producto
+        """
+        producto = self.productos.get(producto_id)
+        if producto is None:
+            return False
+        if nuevo_id == producto_id:
+            return True
+        if nuevo_id in self.productos:
+            return False
+        
+        producto.id = nuevo_id
+        return True
     
-    def agregar_producto(self, producto: Producto) -> bool:
+    # =========================================================================
+    # TRANSACCIONES
+    # =========================================================================
+    
+    @contextmanager
+    def transaccion(self):
+        """
+        Agrupa cambios en una transacción atómica.
+        
+        Cada cambio (atributo, alta, baja, movimiento) se anota en un
+        registro de deshacer con su valor anterior. Si el bloque lanza una
+        excepción se deshace todo en O(cambios); si termina bien se
+        actualiza el caché una sola vez y se publica un único evento
+        'transaccion' con los IDs afectados.
+        
+        Una transacción anidada funciona como punto de guardado: si falla
+        solo se deshacen sus propios cambios y la excepción sigue subiendo.
+        
+        Uso:
+            with inventario.transaccion():
+                ...  # cambios sobre los productos
+        """
+        if self._deshacer is not None:
+            punto = self.punto_guardado()
+            try:
+                yield self
+            except BaseException:
+                self.revertir_a(punto)
+                raise
+            return
+        
+        self._deshacer = []
+        inicio = self.punto_guardado()
+        try:
+            yield self
+        except BaseException:
+            self.revertir_a(inicio)
+            self._cerrar_transaccion()
+            self.version += 1
+            raise
+        
+        ids, desconocido = self._cerrar_transaccion()
+        if ids or desconocido:
+            self._refrescar_filas_cache()
+            self.version += 1
+            self.eventos.publicar(EventoInventario(
+                EventoInventario.TRANSACCION, nuevo=None if desconocido else frozenset(ids)
+            ))
+    
+    def punto_guardado(self) -> Tuple[int, int]:
+        """
+        Marca el estado actual de la transacción abierta.
+        
+        Returns:
+            Tuple[int, int]: Punto para `revertir_a` (entradas de deshacer, movimientos)
+        
+        Raises:
+            RuntimeError: Si no hay una transacción abierta
+        """
+        if self._deshacer is None:
+            raise RuntimeError("No hay una transacción abierta")
+        return len(self._deshacer), len(self.movimientos)
+    
+    def revertir_a(self, punto: Tuple[int, int]):
+        """
+        Deshace los cambios de la transacción posteriores a un punto de guardado.
+        
+        Args:
+            punto: Valor retornado por `punto_guardado`
+        
+        Raises:
+            RuntimeError: Si no hay una transacción abierta
+        """
+        if self._deshacer is None:
+            raise RuntimeError("No hay una transacción abierta")
+        
+        marca, movimientos = punto
+        estructura = False
+        while len(self._deshacer) > marca:
+            accion, producto, campo, anterior = self._deshacer.pop()
+            if accion == self._DESHACER_CAMPO:
+                if campo == 'id':
+                    del self.productos[producto.id]
+                    self.productos[anterior] = producto
+                    estructura = True
+                else:
+                    self._filas_pendientes.add(producto.id)
+                # Escritura directa: deshacer no genera nuevos cambios
+                producto._restaurar(campo, anterior)
+            elif accion == self._DESHACER_FICHA:
+                # La fila vuelve a la ficha del item que tenía
+                self._desvincular_ficha(producto)
+                self._vincular_ficha(producto, anterior)
+                self._filas_pendientes.add(producto.id)
+            elif accion == self._DESHACER_INSERTADO:
+                del self.productos[producto.id]
+                producto._inventario = None
+                self._desvincular_ficha(producto)
+                estructura = True
+            else:
+                self.productos[producto.id] = producto
+                producto._inventario = self
+                self._vincular_ficha(producto, anterior)
+                estructura = True
+        
+        if estructura:
+            self._cache_valido = False
+            self._restaurar_orden()
+        self.movimientos.truncar(movimientos)
+    
+    def _registrar_en_transaccion(self, producto_id: Optional[int]) -> bool:
+        """
+        Anota una notificación explícita si hay transacción abierta (uso interno).
+        
+        Returns:
+            bool: True si se anotó (y no debe publicarse todavía)
+        """
+        if self._deshacer is None:
+            return False
+        if producto_id is None:
+            self._cambio_desconocido = True
+        else:
+            self._ids_transaccion.add(producto_id)
+        return True
+    
+    def _guardar_orden(self):
+        """Guarda el orden de los productos antes del primer cambio estructural (uso interno)."""
+        if self._deshacer is not None and self._orden_original is None:
+            self._orden_original = list(self.productos)
+    
+    def _restaurar_orden(self):
+        """Devuelve los productos a su orden previo a la transacción (uso interno)."""
+        if self._orden_original is None:
+            return
+        actuales = dict(self.productos)
+        self.productos.clear()
+        for producto_id in self._orden_original:
+            if producto_id in actuales:
+                self.productos[producto_id] = actuales.pop(producto_id)
+        self.productos.update(actuales)
+    
+    def _cerrar_transaccion(self) -> Tuple[set, bool]:
+        """
+        Termina la transacción abierta (uso interno).
+        
+        Returns:
+            Tuple[set, bool]: (IDs afectados, hubo cambios sin ID conocido)
+        """
+        ids, desconocido = self._ids_transaccion, self._cambio_desconocido
+        self._deshacer = None
+        self._ids_transaccion = set()
+        self._cambio_desconocido = False
+        self._orden_original = None
+        return ids, desconocido
+    
+    def _refrescar_filas_cache(self):
+        """Copia al caché las filas de los productos modificados (uso interno)."""
+        ids, self._filas_pendientes = self._filas_pendientes, set()
+        if not self._cache_valido or not ids:
+            return
+        
+        productos = [self.productos[producto_id] for producto_id in ids]
+        filas = [self._posiciones[producto.id] for producto in productos]
+        self._preparar_escritura_cache()
+        for campo in self.COLUMNAS_MATRIZ:
+            self._escribir_cache(filas, campo, [getattr(producto, campo) for producto in productos])
+        for fila, producto in zip(filas, productos):
+            self._nombres_cache[fila] = producto.nombre
+            self._codigos_cache[fila] = self.codigo_categoria(producto.categoria)
+    
+    # =========================================================================
+    # PRODUCTOS
+    # =========================================================================
+    
+    def conflictos_ficha(self, producto: Producto) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Compara los datos maestros de un producto con los del item al que se uniría.
+        
+        Args:
+            producto: Producto que todavía no está en el inventario
+        
+        Returns:
+            Dict[str, Tuple[Any, Any]]: {atributo: (valor del item, valor del
+                producto)} de los datos que difieren; vacío si el item no
+                existe o coincide
+        """
+        clave = producto._ficha.clave()
+        registrada = self.fichas.get(clave) if clave is not None else None
+        if registrada is None or registrada is producto._ficha:
+            return {}
+        
+        conflictos = {}
+        for campo in FichaProducto.CAMPOS:
+            actual, propio = getattr(registrada, campo), getattr(producto._ficha, campo)
+            if actual != propio:
+                conflictos[campo] = (actual, propio)
+        return conflictos
+    
+    def agregar_producto(self, producto: Producto, actualizar_item: bool = False) -> bool:
         """
         Agrega un nuevo producto al inventario.
         
+        Si ya hay otra ubicación del mismo item (misma clave de grupo), el
+        producto se une a su ficha. Por defecto toma los datos maestros del
+        item (nombre, precio, categoría) y descarta los propios; con
+        `actualizar_item` los propios reemplazan los del item en todos sus
+        BINs. `conflictos_ficha` indica antes de agregar qué datos difieren.
+        
         Args:
             producto: Producto a agregar
+            actualizar_item: Si sus datos maestros reemplazan los del item existente
         
         Returns:
             bool: True si se agregó exitosamente, False si ya existe
@@ -63,8 +639,22 @@ class Inventario:
         if producto.id in self.productos:
             return False
         
+        conflictos = self.conflictos_ficha(producto) if actualizar_item else {}
         self.productos[producto.id] = producto
-        self._invalidar_cache()
+        producto._inventario = self
+        self._vincular_ficha(producto)
+        self.ids.observar(producto.id)
+        if self._deshacer is not None:
+            self._deshacer.append((self._DESHACER_INSERTADO, producto, None, None))
+            self._ids_transaccion.add(producto.id)
+            self._cache_valido = False
+        else:
+            self._invalidar_cache()
+            self.eventos.publicar(EventoInventario(EventoInventario.INSERTADO, producto.id))
+        
+        # Se asignan después de unirse para que lleguen a todos los BINs del item
+        for campo, (_, propio) in conflictos.items():
+            setattr(producto, campo, propio)
         return True
     
     def eliminar_producto(self, producto_id: int) -> bool:
@@ -80,10 +670,46 @@ class Inventario:
         if producto_id not in self.productos:
             return False
         
-        del self.productos[producto_id]
+        self._guardar_orden()
+        producto = self.productos.pop(producto_id)
+        producto._inventario = None
+        ficha = self._desvincular_ficha(producto)
+        self.ids.liberar(producto_id)
+        if self._deshacer is not None:
+            self._deshacer.append((self._DESHACER_ELIMINADO, producto, None, ficha))
+            self._ids_transaccion.add(producto_id)
+            self._cache_valido = False
+            return True
         self._invalidar_cache()
+        self.eventos.publicar(EventoInventario(EventoInventario.ELIMINADO, producto_id))
         return True
     
+    def vaciar(self) -> int:
+        """
+        Elimina todos los productos del inventario.
+        
+        Fuera de una transacción publica un único evento 'eliminado' sin
+        producto_id; dentro de una, elimina uno por uno para poder deshacerlo.
+        
+        Returns:
+            int: Cantidad de productos eliminados
+        """
+        cantidad = len(self.productos)
+        if self._deshacer is not None:
+            for producto_id in list(self.productos):
+                self.eliminar_producto(producto_id)
+            return cantidad
+        
+        for producto in self.productos.values():
+            producto._inventario = None
+            producto._ficha = producto._ficha.copia()
+            self.ids.liberar(producto.id)
+        self.productos.clear()
+        self.fichas.clear()
+        self._invalidar_cache()
+        self.eventos.publicar(EventoInventario(EventoInventario.ELIMINADO))
+        return cantidad
+    
     def obtener_producto(self, producto_id: int) -> Optional[Producto]:
         """
         Obtiene un producto por su ID.
@@ -226,12 +852,7 @@ class Inventario:
         """
         agrupados = {}
         for producto in self.productos.values():
-            # Usar numero_item como clave principal, o codigo_upc si no hay numero_item
-            clave = producto.numero_item if producto.numero_item != "N/D" else producto.codigo_upc
-            
-            if clave == "N/D":
-                # Si no tiene identificador válido, usar el ID
-                clave = f"ID_{producto.id}"
+            clave = self.clave_grupo(producto)
             
             if clave not in agrupados:
                 agrupados[clave] = []
@@ -239,6 +860,25 @@ class Inventario:
         
         return agrupados
     
+    @staticmethod
+    def clave_grupo(producto: Producto) -> str:
+        """
+        Calcula la clave de agrupación de un producto.
+        
+        Args:
+            producto: Producto a agrupar
+        
+        Returns:
+            str: numero_item, o codigo_upc si no hay numero_item, o "ID_<id>"
+        """
+        # Usar numero_item como clave principal, o codigo_upc si no hay numero_item
+        clave = producto.numero_item if producto.numero_item != "N/D" else producto.codigo_upc
+        
+        if clave == "N/D":
+            # Si no tiene identificador válido, usar el ID
+            clave = f"ID_{producto.id}"
+        return clave
+    
     def actualizar_o_agregar_producto(self, producto_nuevo: Producto) -> Tuple[bool, str, Optional[Producto]]:
         """
         Actualiza un producto existente o agrega uno nuevo basándose en numero_item/codigo_upc Y BIN.
@@ -275,6 +915,58 @@ class Inventario:
             else:
                 return (False, "Error al agregar producto", None)
     
+    def _actualizar_cache(self):
+        """
+        Deja el caché tipado al día (uso interno).
+        
+        Si es válido solo copia las filas pendientes; si no, reconstruye las
+        columnas tipadas desde los productos y descarta la vista float64.
+        """
+        if self._cache_valido:
+            if self._filas_pendientes:
+                self._refrescar_filas_cache()
+            return
+        
+        productos = self.productos.values()
+        n = len(productos)
+        
+        def columna(campo, tipo):
+            return np.fromiter((getattr(p, campo) for p in productos), dtype=tipo, count=n)
+        
+        self._columnas = {
+            'id': columna('id', np.int64),
+            'precio_centavos': self.a_centavos(columna('precio', np.float64)),
+            'stock_actual': columna('stock_actual', np.int32),
+            'stock_minimo': columna('stock_minimo', np.int32),
+            'stock_maximo': columna('stock_maximo', np.int32),
+        }
+        self._matriz_cache = None
+        self._nombres_cache = [p.nombre for p in productos]
+        self._codigos_cache = np.fromiter(
+            (self.codigo_categoria(p.categoria) for p in productos), dtype=np.intp, count=n
+        )
+        self._posiciones = {producto_id: i for i, producto_id in enumerate(self.productos)}
+        self._filas_pendientes = set()
+        self._cache_valido = True
+        self._cache_entregado = False
+    
+    def obtener_columnas(self) -> Dict[str, np.ndarray]:
+        """
+        Obtiene el inventario como columnas de tipo estrecho.
+        
+        Columnas (ver TIPOS_COLUMNAS): id (int64), precio_centavos (int64),
+        stock_actual, stock_minimo y stock_maximo (int32), alineadas con
+        las filas de `obtener_matriz_inventario`. No deben modificarse.
+        
+        Returns:
+            Dict[str, np.ndarray]: Columnas por nombre
+        """
+        if not self.productos:
+            return {nombre: np.empty(0, dtype=tipo) for nombre, tipo in self.TIPOS_COLUMNAS.items()}
+        self._actualizar_cache()
+        self._cache_entregado = True
+        return dict(self._columnas)
+    
     def obtener_matriz_inventario(self) -> np.ndarray:
         """
         Obtiene la representación matricial del inventario.
@@ -282,28 +974,54 @@ class Inventario:
         La matriz tiene la forma (n_productos, 5) donde cada fila es:
         [id, precio, stock_actual, stock_minimo, stock_maximo]
         
+        Es una vista float64 de las columnas tipadas (precio = centavos / 100)
+        que se construye la primera vez que se pide y luego se actualiza en
+        su lugar junto con ellas.
+        
         Returns:
             np.ndarray: Matriz de inventario
         """
-        if self._cache_valido and self._matriz_cache is not None:
-            return self._matriz_cache
-        
         if not self.productos:
             return np.array([]).reshape(0, 5)
         
-        # Construir matriz a partir de vectores de productos
-        vectores = [p.to_vector() for p in self.productos.values()]
-        self._matriz_cache = np.vstack(vectores)
-        self._nombres_cache = [p.nombre for p in self.productos.values()]
-        self._cache_valido = True
+        self._actualizar_cache()
+        if self._matriz_cache is None:
+            # Se guarda por columnas (orden Fortran): los cálculos toman columnas completas
+            columnas = self._columnas
+            matriz = np.empty((len(columnas['id']), 5), order='F')
+            matriz[:, 0] = columnas['id']
+            matriz[:, 1] = columnas['precio_centavos'] / 100
+            matriz[:, 2] = columnas['stock_actual']
+            matriz[:, 3] = columnas['stock_minimo']
+            matriz[:, 4] = columnas['stock_maximo']
+            self._matriz_cache = matriz
+        self._cache_entregado = True
         
         return self._matriz_cache
     
+    def obtener_codigos_categoria(self) -> np.ndarray:
+        """
+        Obtiene el código de categoría de cada producto.
+        
+        El vector está alineado con las filas de `obtener_matriz_inventario`
+        y sus valores son posiciones en `categorias`.
+        
+        Returns:
+            np.ndarray: Vector de códigos de categoría (np.intp, el tipo que
+                usa np.bincount sin conversión)
+        """
+        if not self.productos:
+            return np.empty(0, dtype=np.intp)
+        self._actualizar_cache()
+        self._cache_entregado = True
+        return self._codigos_cache
+    
     def obtener_dataframe(self) -> pd.DataFrame:
         """
         Obtiene el inventario como DataFrame de Pandas.
         
-        Útil para análisis y visualización de datos.
+        Útil para análisis y visualización de datos. La columna
+        `categoria` es un Categorical sobre el diccionario `categorias`.
         
         Returns:
             pd.DataFrame: Inventario en formato tabular
@@ -326,11 +1044,55 @@ class Inventario:
                 'stock_actual': producto.stock_actual,
                 'stock_minimo': producto.stock_minimo,
                 'stock_maximo': producto.stock_maximo,
-                'categoria': producto.categoria,
                 'valor_inventario': producto.valor_en_inventario()
             })
         
-        return pd.DataFrame(datos)
+        df = pd.DataFrame(datos)
+        df.insert(9, 'categoria', pd.Categorical.from_codes(
+            self.obtener_codigos_categoria(), categories=self.categorias
+        ))
+        return df
+    
+    def obtener_tablas_normalizadas(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Obtiene el inventario como tabla maestra de items y tabla de stock por BIN.
+        
+        La tabla de BINs referencia al maestro por posición (`item_ref`), de
+        modo que `maestro.loc[bins['item_ref']]` reconstruye los datos de
+        cada fila sin repetir los textos por ubicación.
+        
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: (maestro con numero_item,
+                codigo_upc, nombre, precio y categoria, una fila por item;
+                BINs con id, item_ref, bin, stock_actual, stock_minimo y
+                stock_maximo, alineada con las filas de la matriz)
+        """
+        referencias: Dict[int, int] = {}
+        fichas: List[FichaProducto] = []
+        item_ref = np.empty(len(self.productos), dtype=np.intp)
+        for fila, producto in enumerate(self.productos.values()):
+            ficha = producto._ficha
+            ref = referencias.setdefault(id(ficha), len(fichas))
+            if ref == len(fichas):
+                fichas.append(ficha)
+            item_ref[fila] = ref
+        
+        maestro = pd.DataFrame(
+            [[getattr(ficha, campo) for campo in FichaProducto.CAMPOS] for ficha in fichas],
+            columns=list(FichaProducto.CAMPOS)
+        )
+        maestro.index.name = 'item_ref'
+        
+        matriz = self.obtener_matriz_inventario()
+        bins = pd.DataFrame({
+            'id': [producto.id for producto in self.productos.values()],
+            'item_ref': item_ref,
+            'bin': [producto.bin for producto in self.productos.values()],
+            'stock_actual': matriz[:, 2].astype(np.int64),
+            'stock_minimo': matriz[:, 3].astype(np.int64),
+            'stock_maximo': matriz[:, 4].astype(np.int64),
+        })
+        return maestro, bins
     
     def cantidad_productos(self) -> int:
         """
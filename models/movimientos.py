@@ -0,0 +1,150 @@
+"""
+Módulo que define el registro de movimientos de inventario.
+
+Cada entrada o salida de stock se guarda como un vector:
+[producto_id, cantidad, marca_tiempo]
+
+donde la cantidad es positiva para entradas y negativa para salidas.
+Los movimientos se almacenan por columnas en arreglos de NumPy que crecen
+por duplicación, de modo que el historial completo se puede analizar con
+operaciones vectoriales sin recorrer objetos de Python.
+"""
+
+import time
+import numpy as np
+from typing import Optional, Tuple
+
+
+class RegistroMovimientos:
+    """
+    Registro columnar de los movimientos de stock de un inventario.
+    
+    Atributos:
+        _ids (np.ndarray): Columna de IDs de producto (int64)
+        _cantidades (np.ndarray): Columna de cantidades con signo (int64)
+        _tiempos (np.ndarray): Columna de marcas de tiempo en segundos (float64)
+        _n (int): Cantidad de movimientos registrados
+        reinicios (int): Veces que se descartaron movimientos (limpiar/truncar);
+            permite a quien lee el registro de forma incremental detectarlo
+    """
+    
+    CAPACIDAD_INICIAL = 1024
+    
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self._ids = np.empty(self.CAPACIDAD_INICIAL, dtype=np.int64)
+        self._cantidades = np.empty(self.CAPACIDAD_INICIAL, dtype=np.int64)
+        self._tiempos = np.empty(self.CAPACIDAD_INICIAL, dtype=np.float64)
+        self._n = 0
+        self.reinicios = 0
+    
+    def _asegurar_capacidad(self, adicionales: int):
+        """Duplica la capacidad de las columnas si es necesario (uso interno)."""
+        requerida = self._n + adicionales
+        capacidad = len(self._ids)
+        if requerida <= capacidad:
+            return
+        
+        while capacidad < requerida:
+            capacidad *= 2
+        
+        for nombre in ('_ids', '_cantidades', '_tiempos'):
+            anterior = getattr(self, nombre)
+            nueva = np.empty(capacidad, dtype=anterior.dtype)
+            nueva[:self._n] = anterior[:self._n]
+            setattr(self, nombre, nueva)
+    
+    def registrar(
+        self,
+        producto_id: int,
+        cantidad: int,
+        marca_tiempo: Optional[float] = None
+    ):
+        """
+        Registra un movimiento.
+        
+        Args:
+            producto_id: ID del producto
+            cantidad: Cantidad con signo (+ entrada, - salida)
+            marca_tiempo: Segundos desde epoch (por defecto, el instante actual)
+        """
+        self._asegurar_capacidad(1)
+        self._ids[self._n] = producto_id
+        self._cantidades[self._n] = cantidad
+        self._tiempos[self._n] = time.time() if marca_tiempo is None else marca_tiempo
+        self._n += 1
+    
+    def registrar_lote(
+        self,
+        producto_ids: np.ndarray,
+        cantidades: np.ndarray,
+        marcas_tiempo: Optional[np.ndarray] = None
+    ):
+        """
+        Registra múltiples movimientos en una sola operación vectorial.
+        
+        Args:
+            producto_ids: Vector de IDs de producto
+            cantidades: Vector de cantidades con signo
+            marcas_tiempo: Vector de marcas de tiempo (por defecto, el instante actual)
+        """
+        producto_ids = np.asarray(producto_ids, dtype=np.int64)
+        k = producto_ids.size
+        if k == 0:
+            return
+        
+        self._asegurar_capacidad(k)
+        self._ids[self._n:self._n + k] = producto_ids
+        self._cantidades[self._n:self._n + k] = cantidades
+        self._tiempos[self._n:self._n + k] = (
+            time.time() if marcas_tiempo is None else marcas_tiempo
+        )
+        self._n += k
+    
+    def obtener_arreglos(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Obtiene las columnas del registro.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (ids, cantidades, marcas_tiempo)
+        """
+        return (
+            self._ids[:self._n],
+            self._cantidades[:self._n],
+            self._tiempos[:self._n]
+        )
+    
+    def obtener_salidas(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Obtiene solo las salidas, con la cantidad expresada en positivo.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (ids, cantidades, marcas_tiempo)
+        """
+        ids, cantidades, tiempos = self.obtener_arreglos()
+        mascara = cantidades < 0
+        return ids[mascara], -cantidades[mascara], tiempos[mascara]
+    
+    def limpiar(self):
+        """Elimina todos los movimientos registrados."""
+        self._n = 0
+        self.reinicios += 1
+    
+    def truncar(self, cantidad: int):
+        """
+        Descarta los movimientos registrados después de los primeros `cantidad`.
+        
+        Args:
+            cantidad: Movimientos a conservar
+        """
+        if cantidad < self._n:
+            self._n = max(0, cantidad)
+            self.reinicios += 1
+    
+    def __len__(self) -> int:
+        """Retorna la cantidad de movimientos registrados."""
+        return self._n
+    
+    def __repr__(self) -> str:
+        """Representación string del registro."""
+        return f"RegistroMovimientos(movimientos={self._n})"
@@ -6,10 +6,198 @@ Un producto se representa matemáticamente como un vector de características:
 
 Este enfoque vectorial permite realizar operaciones matriciales eficientes
 para análisis y cálculos de inventario.
+
+Los datos maestros de un item (identificadores, nombre, precio y categoría)
+viven en una FichaProducto que comparten todas sus ubicaciones (BINs): un
+Producto es la vista de una fila BIN unida a la ficha de su item.
 """
 
 import numpy as np
-from typing import Optional
+from typing import Any, List, Optional
+
+
+_SIN_VALOR = object()
+
+# Rango de las columnas int32 de stock en el caché tipado del inventario
+STOCK_MINIMO_REPRESENTABLE = int(np.iinfo(np.int32).min)
+STOCK_MAXIMO_REPRESENTABLE = int(np.iinfo(np.int32).max)
+
+
+class CampoObservado:
+    """
+    Descriptor de un atributo de Producto que avisa sus cambios.
+    
+    El valor se guarda en el diccionario de la instancia con el mismo
+    nombre; como el descriptor no define __get__, la lectura es un acceso
+    normal al atributo y solo la escritura pasa por aquí. Si el producto
+    pertenece a un inventario, cada cambio real (valor distinto) se informa
+    al inventario con el valor anterior y el nuevo, para que actualice sus
+    cachés e índices sin invalidarlos por completo.
+    
+    Atributos:
+        nombre (str): Nombre del atributo en el producto
+    """
+    
+    def __set_name__(self, propietario: type, nombre: str):
+        """Registra el nombre del atributo."""
+        self.nombre = nombre
+    
+    def __set__(self, producto: 'Producto', valor: Any):
+        """Asigna el valor y avisa al inventario dueño si cambió."""
+        datos = producto.__dict__
+        inventario = datos.get('_inventario')
+        if inventario is None:
+            datos[self.nombre] = valor
+            return
+        
+        anterior = datos.get(self.nombre, _SIN_VALOR)
+        if anterior is _SIN_VALOR or anterior == valor:
+            datos[self.nombre] = valor
+            return
+        
+        if self.nombre == 'id':
+            # Reubica la clave en el inventario antes de aplicar el cambio
+            inventario._reasignar_id(producto, anterior, valor)
+        datos[self.nombre] = valor
+        inventario._al_cambiar_campo(producto, self.nombre, anterior, valor)
+
+
+class CampoStock(CampoObservado):
+    """
+    Descriptor de una cantidad de stock de Producto.
+    
+    El inventario guarda estas cantidades en columnas int32; un valor fuera
+    de ese rango se rechaza al asignarlo, antes de que llegue al caché.
+    """
+    
+    def __set__(self, producto: 'Producto', valor: Any):
+        """Valida el rango y asigna el valor."""
+        if not STOCK_MINIMO_REPRESENTABLE <= valor <= STOCK_MAXIMO_REPRESENTABLE:
+            raise ValueError(
+                f"{self.nombre} fuera de rango: {valor} "
+                f"(máximo {STOCK_MAXIMO_REPRESENTABLE})"
+            )
+        super().__set__(producto, valor)
+
+
+class CampoFicha(CampoObservado):
+    """
+    Descriptor de un atributo maestro de Producto, guardado en su ficha.
+    
+    La lectura y la escritura pasan a la FichaProducto del producto, que
+    comparten todas las ubicaciones del mismo item en un inventario: un
+    cambio hecho desde cualquiera de ellas se ve en todas y el inventario
+    se entera una sola vez por item. La excepción es un identificador que
+    cambia la clave del item: entonces solo esa fila pasa al otro item.
+    """
+    
+    def __get__(self, producto: Optional['Producto'], propietario: type = None) -> Any:
+        """Lee el valor desde la ficha del producto."""
+        if producto is None:
+            return self
+        return getattr(producto.__dict__['_ficha'], self.nombre)
+    
+    def __set__(self, producto: 'Producto', valor: Any):
+        """Asigna el valor en la ficha y avisa al inventario dueño si cambió."""
+        datos = producto.__dict__
+        ficha = datos['_ficha']
+        anterior = getattr(ficha, self.nombre)
+        inventario = datos.get('_inventario')
+        if (
+            inventario is not None and anterior != valor
+            and self.nombre in FichaProducto.CAMPOS_CLAVE
+            and inventario._cambiar_item(producto, self.nombre, valor)
+        ):
+            # Otro item: solo esta fila cambió de ficha
+            return
+        
+        setattr(ficha, self.nombre, valor)
+        if inventario is not None and anterior != valor:
+            inventario._al_cambiar_ficha(ficha, self.nombre, anterior, valor)
+
+
+class FichaProducto:
+    """
+    Datos maestros de un item, una sola vez para todas sus ubicaciones.
+    
+    Un inventario guarda una ficha por item (clave: numero_item, o
+    codigo_upc si no hay numero_item) y cada fila BIN la referencia. Los
+    atributos se modifican a través de cualquier Producto del item, que
+    avisa al inventario; escribirlos directamente en la ficha no se notifica.
+    
+    Atributos:
+        numero_item (str): Número de item
+        codigo_upc (str): Código UPC
+        nombre (str): Nombre descriptivo
+        precio (float): Precio unitario
+        categoria (str): Categoría
+        ubicaciones (List[Producto]): Filas BIN del item en el inventario
+        _clave (Optional[str]): Clave con la que está registrada en el
+            catálogo del inventario (la administra Inventario)
+    """
+    
+    __slots__ = ('numero_item', 'codigo_upc', 'nombre', 'precio', 'categoria', 'ubicaciones', '_clave')
+    
+    CAMPOS = ('numero_item', 'codigo_upc', 'nombre', 'precio', 'categoria')
+    
+    # Atributos que determinan la clave del item
+    CAMPOS_CLAVE = ('numero_item', 'codigo_upc')
+    
+    def __init__(
+        self,
+        numero_item: str = "N/D",
+        codigo_upc: str = "N/D",
+        nombre: str = "",
+        precio: float = 0.0,
+        categoria: str = "General"
+    ):
+        """
+        Crea una ficha sin ubicaciones.
+        
+        Args:
+            numero_item: Número de item
+            codigo_upc: Código UPC
+            nombre: Nombre descriptivo
+            precio: Precio unitario
+            categoria: Categoría
+        """
+        self.numero_item = numero_item
+        self.codigo_upc = codigo_upc
+        self.nombre = nombre
+        self.precio = precio
+        self.categoria = categoria
+        self.ubicaciones: List['Producto'] = []
+        self._clave: Optional[str] = None
+    
+    def clave(self) -> Optional[str]:
+        """
+        Calcula la clave del item.
+        
+        Returns:
+            Optional[str]: numero_item, o codigo_upc si no hay numero_item;
+                None si no tiene identificador (el item no se comparte)
+        """
+        if self.numero_item != "N/D":
+            return self.numero_item
+        if self.codigo_upc != "N/D":
+            return self.codigo_upc
+        return None
+    
+    def copia(self) -> 'FichaProducto':
+        """
+        Crea una ficha independiente con los mismos datos y sin ubicaciones.
+        
+        Returns:
+            FichaProducto: Copia de los datos maestros
+        """
+        return FichaProducto(*(getattr(self, campo) for campo in self.CAMPOS))
+    
+    def __repr__(self) -> str:
+        """Representación string de la ficha."""
+        return (
+            f"FichaProducto(clave={self.clave()!r}, nombre='{self.nombre}', "
+            f"precio={self.precio:.2f}, ubicaciones={len(self.ubicaciones)})"
+        )
 
 
 class Producto:
@@ -35,11 +223,34 @@ class Producto:
         stock_maximo (int): Capacidad máxima de almacenamiento
         categoria (str): Categoría del producto
     
+    Los atributos numero_item, codigo_upc, nombre, precio y categoria se
+    guardan en la FichaProducto del item (`ficha`); en un inventario, todas
+    las ubicaciones del mismo item comparten la ficha, así que cambiar el
+    precio desde una de ellas lo cambia para todas. Cambiar el numero_item
+    (o el codigo_upc que hace de clave) de una fila la mueve a la ficha del
+    otro item sin tocar a sus hermanas.
+    
     Representación Vectorial:
         El producto se puede representar como un vector numérico:
         v = [id, precio, stock_actual, stock_minimo, stock_maximo]
+    
+    Observación de cambios:
+        Los atributos son descriptores `CampoObservado`: al modificarlos en
+        un producto que pertenece a un Inventario, este se entera del valor
+        anterior y del nuevo sin que el llamador tenga que notificarlo.
     """
     
+    id = CampoObservado()
+    numero_item = CampoFicha()
+    codigo_upc = CampoFicha()
+    bin = CampoObservado()
+    nombre = CampoFicha()
+    precio = CampoFicha()
+    stock_actual = CampoStock()
+    stock_minimo = CampoStock()
+    stock_maximo = CampoStock()
+    categoria = CampoFicha()
+    
     def __init__(
         self,
         id: int,
@@ -79,17 +290,53 @@ class Producto:
             raise ValueError("El stock mínimo no puede ser negativo")
         if stock_maximo < stock_minimo:
             raise ValueError("El stock máximo debe ser mayor o igual al mínimo")
+        if max(stock_actual, stock_maximo) > STOCK_MAXIMO_REPRESENTABLE:
+            raise ValueError(f"El stock no puede superar {STOCK_MAXIMO_REPRESENTABLE}")
         
-        self.id = id
-        self.numero_item = numero_item
-        self.codigo_upc = codigo_upc
-        self.bin = bin
-        self.nombre = nombre
-        self.precio = precio
-        self.stock_actual = stock_actual
-        self.stock_minimo = stock_minimo
-        self.stock_maximo = stock_maximo
-        self.categoria = categoria
+        # Escritura directa: un producto nuevo todavía no tiene a quién avisar
+        self.__dict__.update(
+            id=id,
+            bin=bin,
+            stock_actual=stock_actual,
+            stock_minimo=stock_minimo,
+            stock_maximo=stock_maximo,
+            # Datos maestros propios hasta que un inventario la una a la de su item
+            _ficha=FichaProducto(numero_item, codigo_upc, nombre, precio, categoria),
+            # Inventario al que pertenece (lo asigna Inventario.agregar_producto)
+            _inventario=None
+        )
+    
+    @property
+    def ficha(self) -> FichaProducto:
+        """Ficha con los datos maestros del item (compartida entre sus BINs)."""
+        return self._ficha
+    
+    def __getstate__(self) -> dict:
+        """
+        Estado para pickle y copy: la fila sin su inventario.
+        
+        Sin esto, serializar un producto arrastraría el inventario dueño
+        completo (con sus suscriptores) y, por la ficha, todas las filas
+        hermanas del item. La copia lleva una ficha independiente.
+        
+        Returns:
+            dict: Atributos de la fila con `_inventario` en None y una copia de la ficha
+        """
+        estado = dict(self.__dict__)
+        estado['_inventario'] = None
+        estado['_ficha'] = self._ficha.copia()
+        return estado
+    
+    def __setstate__(self, estado: dict):
+        """Restaura el estado de `__getstate__` sin avisar a ningún inventario."""
+        self.__dict__.update(estado)
+    
+    def _restaurar(self, campo: str, valor: Any):
+        """Escribe un atributo sin avisar al inventario (uso interno, al deshacer)."""
+        if campo in FichaProducto.CAMPOS:
+            setattr(self._ficha, campo, valor)
+        else:
+            self.__dict__[campo] = valor
     
     def to_vector(self) -> np.ndarray:
         """
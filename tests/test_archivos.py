@@ -0,0 +1,201 @@
+"""
+Pruebas unitarias para la lectura y escritura de archivos de inventario.
+
+Verifica la detección de formato, el mapeo automático, la lectura de CSV
+por bloques con tipos explícitos y la exportación de ida y vuelta.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from models import Producto, Inventario
+from logic.archivos import (
+    detectar_formato, mapeo_automatico, leer_columnas, leer_csv, leer_archivo,
+    exportar_inventario, exportar_excel_streaming, exportar_csv_por_bloques,
+    inventario_a_dataframe, leer_metadatos, parquet_disponible, COLUMNAS_EXPORTACION
+)
+from logic import OperacionesMatriciales
+
+
+class TestArchivos:
+    """Pruebas para las funciones del módulo de archivos."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture que crea un inventario con productos de prueba."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(
+            1, "Producto A", 10.5, 20, 5, 50, "Cat1",
+            numero_item="000123", codigo_upc="012345678905", bin="A-01"
+        ))
+        inventario.agregar_producto(Producto(
+            2, "Producto B", 3.0, 7, 10, 30, "Cat2",
+            numero_item="000456", codigo_upc="098765432109", bin="B-02"
+        ))
+        return inventario
+    
+    def test_detectar_formato(self):
+        """Verifica la detección del formato por extensión."""
+        assert detectar_formato("inventario.XLSX") == "excel"
+        assert detectar_formato("inventario.csv") == "csv"
+        assert detectar_formato("inventario.parquet") == "parquet"
+        
+        with pytest.raises(ValueError):
+            detectar_formato("inventario.txt")
+    
+    def test_mapeo_automatico(self):
+        """Verifica que se reconocen encabezados de exportación y de atributo."""
+        mapeo = mapeo_automatico(['ID', 'BIN_Bodega', 'stock actual', 'Otra'])
+        
+        assert mapeo == {'id': 'ID', 'bin': 'BIN_Bodega', 'stock_actual': 'stock actual'}
+    
+    def test_exportar_csv_ida_y_vuelta(self, inventario, tmp_path):
+        """Verifica que un CSV exportado se vuelve a leer con sus tipos."""
+        ruta = str(tmp_path / "inventario.csv")
+        
+        assert exportar_inventario(inventario, ruta) == 2
+        
+        columnas = leer_columnas(ruta)
+        assert columnas == list(COLUMNAS_EXPORTACION.values())
+        
+        mapeo = mapeo_automatico(columnas)
+        df = leer_archivo(ruta, mapeo)
+        
+        # Los códigos conservan los ceros a la izquierda
+        assert df['Numero_Item'].tolist() == ["000123", "000456"]
+        assert df['Codigo_UPC'].tolist() == ["012345678905", "098765432109"]
+        assert df['Stock_Actual'].dtype == 'float64'
+    
+    def test_leer_csv_con_tipos(self, tmp_path):
+        """Verifica que la lectura con mapeo trae solo las columnas mapeadas y tipadas."""
+        ruta = tmp_path / "grande.csv"
+        pd.DataFrame({'ID': range(25), 'BIN': ['Z'] * 25, 'Otra': 1}).to_csv(ruta, index=False)
+        
+        df = leer_csv(str(ruta), {'id': 'ID', 'bin': 'BIN'})
+        
+        assert df.columns.tolist() == ['ID', 'BIN']
+        assert df['ID'].dtype == 'float64'
+        assert df['ID'].tolist() == list(range(25))
+    
+    def test_leer_csv_numero_invalido(self, tmp_path):
+        """Verifica que una columna numérica con texto se lee sin tipo."""
+        ruta = tmp_path / "sucio.csv"
+        pd.DataFrame({'ID': [1, 2], 'Stock': ['5', 'cinco']}).to_csv(ruta, index=False)
+        
+        df = leer_csv(str(ruta), {'id': 'ID', 'stock_actual': 'Stock'})
+        
+        assert df['Stock'].tolist() == ['5', 'cinco']
+    
+    def test_exportar_excel(self, inventario, tmp_path):
+        """Verifica la exportación a Excel con los mismos encabezados."""
+        ruta = str(tmp_path / "inventario.xlsx")
+        
+        exportar_inventario(inventario, ruta)
+        
+        df = leer_archivo(ruta)
+        assert df.columns.tolist() == inventario_a_dataframe(inventario).columns.tolist()
+        assert len(df) == 2
+    
+    def test_exportar_excel_metadatos(self, inventario, tmp_path):
+        """Verifica que la marca de agua de IDs se guarda solo en Excel."""
+        inventario.nuevo_id()
+        excel, csv = str(tmp_path / "inventario.xlsx"), str(tmp_path / "inventario.csv")
+        
+        exportar_inventario(inventario, excel)
+        exportar_inventario(inventario, csv)
+        
+        assert leer_metadatos(excel) == {'siguiente_id': 4}
+        assert leer_metadatos(csv) == {}
+    
+    def test_exportar_excel_streaming_progreso(self, inventario, tmp_path):
+        """Verifica que el progreso se reporta tras cada bloque escrito."""
+        for i in range(3, 8):
+            inventario.agregar_producto(Producto(i, f"Producto {i}", 1.0, 1, 0, 10))
+        llamadas = []
+        
+        cantidad = exportar_excel_streaming(
+            inventario, str(tmp_path / "inventario.xlsx"),
+            tamano_bloque=3, progreso=lambda hechos, total: llamadas.append((hechos, total))
+        )
+        
+        assert cantidad == 7
+        assert llamadas == [(3, 7), (6, 7), (7, 7)]
+    
+    def test_exportar_csv_por_bloques_progreso(self, inventario, tmp_path):
+        """Verifica que el CSV se escribe por bloques y reporta el progreso de cada uno."""
+        for i in range(3, 8):
+            inventario.agregar_producto(Producto(i, f"Producto {i}", 1.0, 1, 0, 10))
+        ruta = str(tmp_path / "inventario.csv")
+        llamadas = []
+        
+        cantidad = exportar_csv_por_bloques(
+            inventario, ruta,
+            tamano_bloque=3, progreso=lambda hechos, total: llamadas.append((hechos, total))
+        )
+        
+        assert cantidad == 7
+        assert llamadas == [(3, 7), (6, 7), (7, 7)]
+        df = leer_archivo(ruta)
+        assert df.columns.tolist() == list(COLUMNAS_EXPORTACION.values())
+        assert df['ID'].tolist() == [p.id for p in inventario.listar_productos()]
+    
+    def test_exportar_xls_no_permitido(self, inventario, tmp_path):
+        """Verifica que .xls se reconoce para leer pero no se usa para exportar."""
+        ruta = str(tmp_path / "inventario.xls")
+        
+        assert detectar_formato(ruta) == "excel"
+        with pytest.raises(ValueError):
+            exportar_inventario(inventario, ruta)
+        assert not (tmp_path / "inventario.xls").exists()
+    
+    def test_exportar_excel_cambios_durante_el_progreso(self, inventario, tmp_path):
+        """Verifica que modificar el inventario desde el progreso no interrumpe la exportación."""
+        for i in range(3, 8):
+            inventario.agregar_producto(Producto(i, f"Producto {i}", 1.0, 1, 0, 10))
+        
+        def progreso(hechos, total):
+            inventario.eliminar_producto(7)
+            inventario.agregar_producto(Producto(100 + hechos, "Nuevo", 1.0, 1, 0, 10))
+        
+        cantidad = exportar_excel_streaming(
+            inventario, str(tmp_path / "inventario.xlsx"), tamano_bloque=3, progreso=progreso
+        )
+        
+        assert cantidad == 7
+    
+    def test_exportar_excel_hojas_extra(self, inventario, tmp_path):
+        """Verifica las hojas de alertas y de análisis por categoría."""
+        ruta = str(tmp_path / "inventario.xlsx")
+        
+        exportar_inventario(inventario, ruta, ['alertas', 'categorias'])
+        
+        hojas = pd.read_excel(ruta, sheet_name=None)
+        assert list(hojas) == ['Inventario', 'Alertas', 'Categorias']
+        assert hojas['Alertas']['ID'].tolist() == [2]
+        assert hojas['Alertas']['Faltante'].tolist() == [3]
+        
+        # Mismos valores que el análisis con Pandas
+        esperado = OperacionesMatriciales(inventario).analisis_por_categoria()
+        categorias = hojas['Categorias'].set_index('Categoria')
+        np.testing.assert_allclose(categorias.values, esperado.values)
+    
+    def test_exportar_excel_hoja_invalida(self, inventario, tmp_path):
+        """Verifica que se rechaza una hoja adicional desconocida."""
+        with pytest.raises(ValueError):
+            exportar_excel_streaming(inventario, str(tmp_path / "x.xlsx"), ['otra'])
+    
+    @pytest.mark.skipif(not parquet_disponible(), reason="Requiere pyarrow o fastparquet")
+    def test_exportar_parquet_ida_y_vuelta(self, inventario, tmp_path):
+        """Verifica la exportación y lectura de Parquet."""
+        ruta = str(tmp_path / "inventario.parquet")
+        
+        exportar_inventario(inventario, ruta)
+        df = leer_archivo(ruta, mapeo_automatico(leer_columnas(ruta)))
+        
+        assert df['Numero_Item'].tolist() == ["000123", "000456"]
+    
+    @pytest.mark.skipif(parquet_disponible(), reason="Solo sin motor de Parquet")
+    def test_parquet_sin_motor(self, inventario, tmp_path):
+        """Verifica el error descriptivo cuando no hay motor de Parquet."""
+        with pytest.raises(ImportError):
+            exportar_inventario(inventario, str(tmp_path / "inventario.parquet"))
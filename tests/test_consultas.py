@@ -0,0 +1,141 @@
+"""
+Pruebas unitarias para el motor de consultas vectorizadas.
+
+Verifica el lenguaje de condiciones, la proyección, el orden, el límite,
+el caché de planes y que los textos se actualicen con el inventario.
+"""
+
+import numpy as np
+import pytest
+from models import Producto, Inventario
+from logic import MotorConsultas
+from logic.consultas import compilar
+
+
+@pytest.fixture
+def inventario():
+    """Inventario con categorías, BINs y ocupaciones variadas."""
+    inventario = Inventario()
+    inventario.agregar_producto(Producto(1, "Laptop", 900.0, 2, 5, 50, "Electrónica", "000001", bin="003/001/001"))
+    inventario.agregar_producto(Producto(2, "Monitor", 250.0, 20, 5, 30, "Electrónica", "000002", bin="003/002/001"))
+    inventario.agregar_producto(Producto(3, "Cable HDMI", 15.0, 3, 30, 200, "Accesorios", "000003", bin="001/001/001"))
+    inventario.agregar_producto(Producto(4, "Mouse", 30.0, 45, 20, 100, "Accesorios", "000004", bin="N/D"))
+    inventario.agregar_producto(Producto(5, "Audífonos", 60.0, 22, 15, 50, "Audio", "000005", bin="003/001/002"))
+    return inventario
+
+
+@pytest.fixture
+def motor(inventario):
+    """Motor de consultas sobre el inventario de prueba."""
+    return MotorConsultas(inventario)
+
+
+class TestMotorConsultas:
+    """Pruebas para la clase MotorConsultas."""
+    
+    def test_condicion_compuesta(self, motor):
+        """Verifica una condición sobre categoría, precio, ocupación y pasillo."""
+        ids = motor.ids('categoria == "Electrónica" and precio > 100 and ocupacion < 20 and pasillo == 3')
+        
+        assert ids.tolist() == [1]
+    
+    def test_comparacion_entre_campos_y_aritmetica(self, motor):
+        """Verifica comparaciones entre columnas y expresiones aritméticas."""
+        assert motor.ids("stock < minimo").tolist() == [1, 3]
+        assert motor.ids("stock * precio > 4000").tolist() == [2]
+        assert motor.ids("valor > 4000").tolist() == [2]
+    
+    def test_comparacion_encadenada_y_pertenencia(self, motor):
+        """Verifica 'a <= x < b', 'in' y 'not in'."""
+        assert motor.ids("20 <= stock < 45").tolist() == [2, 5]
+        assert motor.ids('categoria in ["Audio", "Accesorios"]').tolist() == [3, 4, 5]
+        assert motor.ids("id not in [1, 2, 3]").tolist() == [4, 5]
+    
+    def test_funciones_de_texto(self, motor):
+        """Verifica contiene, empieza y termina sobre campos de texto."""
+        assert motor.ids('contiene(nombre, "hdmi")').tolist() == [3]
+        assert motor.ids('empieza(bin, "003/001")').tolist() == [1, 5]
+        assert motor.ids('termina(item, "5") or not (rack >= 0)').tolist() == [4, 5]
+    
+    def test_categoria_inexistente(self, motor):
+        """Verifica que una categoría desconocida no coincida ni se registre."""
+        motor.contar('categoria == "Audio"')
+        categorias = list(motor.inventario.categorias)
+        
+        assert motor.contar('categoria == "Juguetes"') == 0
+        assert motor.contar('categoria != "Juguetes"') == 5
+        assert motor.inventario.categorias == categorias
+    
+    def test_proyeccion_orden_y_limite(self, motor):
+        """Verifica columnas pedidas, orden descendente estable y límite."""
+        resultado = motor.consultar(
+            "precio < 100", columnas=["id", "nombre", "stock_actual"],
+            ordenar_por="categoria", descendente=True, limite=2
+        )
+        
+        assert list(resultado.columns) == ["id", "nombre", "stock"]
+        assert resultado["id"].tolist() == [5, 3]
+    
+    def test_sin_condicion(self, motor):
+        """Verifica que sin condición se devuelvan todas las filas."""
+        resultado = motor.consultar()
+        
+        assert len(resultado) == 5
+        assert resultado["categoria"].tolist()[:3] == ["Electrónica", "Electrónica", "Accesorios"]
+    
+    def test_textos_se_actualizan(self, motor, inventario):
+        """Verifica que los textos armados se descarten al cambiar atributos o productos."""
+        assert motor.contar('contiene(nombre, "teclado")') == 0
+        
+        inventario.obtener_producto(4).nombre = "Teclado"
+        assert motor.ids('contiene(nombre, "teclado")').tolist() == [4]
+        
+        inventario.agregar_producto(Producto(6, "Teclado USB", 20.0, 1, 1, 10, "Accesorios", bin="002/001/001"))
+        assert motor.ids('contiene(nombre, "teclado") and pasillo == 2').tolist() == [6]
+    
+    def test_cambios_de_stock_no_invalidan_textos(self, motor, inventario):
+        """Verifica que un cambio de stock conserve los textos y actualice la máscara."""
+        motor.contar('empieza(bin, "003/")')
+        textos = motor.texto('bin')
+        
+        inventario.obtener_producto(2).stock_actual = 1
+        
+        assert motor.ids('stock < minimo and empieza(bin, "003/")').tolist() == [1, 2]
+        assert motor.texto('bin') is textos
+    
+    def test_errores(self, motor):
+        """Verifica los errores de sintaxis, campos y tipos."""
+        for expresion in [
+            'precio > "caro"', 'peso > 1', 'precio >', 'categoria < "A"',
+            '__import__("os")', 'precio', 'nombre.upper() == "X"', 'contiene(precio, "1")',
+        ]:
+            with pytest.raises(ValueError):
+                motor.filtrar(expresion)
+        with pytest.raises(ValueError):
+            motor.consultar(columnas=["peso"])
+        with pytest.raises(ValueError):
+            motor.consultar(limite=-1)
+    
+    def test_cache_de_planes(self, motor):
+        """Verifica que una consulta repetida reutilice el plan compilado."""
+        expresion = "precio > 12.5 and stock > 2"
+        plan = compilar(expresion)
+        
+        assert compilar(expresion) is plan
+        assert plan.campos == frozenset({"precio", "stock"})
+        assert motor.contar(expresion) == 4
+    
+    def test_inventario_vacio(self):
+        """Verifica consultas sobre un inventario sin productos."""
+        motor = MotorConsultas(Inventario())
+        
+        assert motor.contar('pasillo == 1 and contiene(nombre, "x")') == 0
+        assert motor.consultar("precio > 0").empty
+    
+    def test_coordenadas_bin(self, motor):
+        """Verifica pasillo, rack y nivel, con -1 para BIN sin formato."""
+        coordenadas = motor.coordenadas_bin()
+        
+        assert coordenadas['pasillo'].tolist() == [3, 3, 1, -1, 3]
+        assert coordenadas['rack'].tolist() == [1, 2, 1, -1, 1]
+        assert np.array_equal(coordenadas['nivel'], [1, 1, 1, -1, 2])
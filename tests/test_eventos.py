@@ -0,0 +1,125 @@
+"""
+Pruebas unitarias para el bus de eventos del inventario.
+
+Verifica la suscripción, el filtrado por tipo, la agrupación en lotes y
+que el inventario y sus operaciones publiquen los cambios esperados.
+"""
+
+import pytest
+import pandas as pd
+from models import Producto, Inventario, BusEventos, EventoInventario
+from logic import OperacionesMatriciales
+from logic.importacion import ImportadorInventario
+
+
+@pytest.fixture
+def inventario_con_eventos():
+    """Inventario con dos productos y la lista de eventos recibidos."""
+    inventario = Inventario()
+    inventario.agregar_producto(Producto(1, "P1", 10.0, 20, 5, 50, numero_item="A", bin="B1"))
+    inventario.agregar_producto(Producto(2, "P2", 20.0, 30, 5, 50, numero_item="B", bin="B1"))
+    
+    recibidos = []
+    inventario.eventos.suscribir(recibidos.append)
+    return inventario, recibidos
+
+
+class TestBusEventos:
+    """Pruebas para la clase BusEventos."""
+    
+    def test_suscribir_y_publicar(self):
+        """Verifica que los suscriptores reciben los eventos en orden."""
+        bus = BusEventos()
+        recibidos = []
+        bus.suscribir(recibidos.append)
+        
+        bus.publicar(EventoInventario(EventoInventario.INSERTADO, 1))
+        bus.publicar(EventoInventario(EventoInventario.ELIMINADO, 2))
+        
+        assert [(e.tipo, e.producto_id) for e in recibidos] == [
+            (EventoInventario.INSERTADO, 1),
+            (EventoInventario.ELIMINADO, 2)
+        ]
+    
+    def test_filtrar_por_tipo(self):
+        """Verifica que solo se entregan los tipos suscritos."""
+        bus = BusEventos()
+        recibidos = []
+        bus.suscribir(recibidos.append, tipos=[EventoInventario.STOCK])
+        
+        bus.publicar(EventoInventario(EventoInventario.INSERTADO, 1))
+        bus.publicar(EventoInventario(EventoInventario.STOCK, 1))
+        
+        assert [e.tipo for e in recibidos] == [EventoInventario.STOCK]
+    
+    def test_desuscribir(self):
+        """Verifica que una función desuscrita deja de recibir eventos."""
+        bus = BusEventos()
+        recibidos = []
+        funcion = bus.suscribir(recibidos.append)
+        
+        assert bus.desuscribir(funcion) is True
+        assert bus.desuscribir(funcion) is False
+        bus.publicar(EventoInventario(EventoInventario.STOCK, 1))
+        
+        assert recibidos == []
+        assert len(bus) == 0
+    
+    def test_lote_entrega_al_cerrar(self):
+        """Verifica que los eventos de un lote se entregan al cerrar el bloque externo."""
+        bus = BusEventos()
+        recibidos = []
+        bus.suscribir(recibidos.append)
+        
+        with bus.lote():
+            bus.publicar(EventoInventario(EventoInventario.STOCK, 1))
+            with bus.lote():
+                bus.publicar(EventoInventario(EventoInventario.STOCK, 2))
+            assert recibidos == []
+        
+        assert [e.producto_id for e in recibidos] == [1, 2]
+
+
+class TestEventosInventario:
+    """Pruebas de los eventos publicados por el inventario."""
+    
+    def test_agregar_y_eliminar(self, inventario_con_eventos):
+        """Verifica los eventos de inserción y eliminación."""
+        inventario, recibidos = inventario_con_eventos
+        
+        inventario.agregar_producto(Producto(3, "P3", 5.0))
+        inventario.eliminar_producto(1)
+        inventario.eliminar_producto(99)
+        
+        assert [(e.tipo, e.producto_id) for e in recibidos] == [
+            (EventoInventario.INSERTADO, 3),
+            (EventoInventario.ELIMINADO, 1)
+        ]
+    
+    def test_registrar_entrada_publica_stock(self, inventario_con_eventos):
+        """Verifica que una entrada publica el stock anterior y el nuevo."""
+        inventario, recibidos = inventario_con_eventos
+        
+        OperacionesMatriciales(inventario).registrar_entrada(1, 7)
+        
+        assert len(recibidos) == 1
+        evento = recibidos[0]
+        assert evento.tipo == EventoInventario.STOCK
+        assert (evento.producto_id, evento.anterior, evento.nuevo) == (1, 20, 27)
+    
+    def test_importacion_publica_por_producto(self, inventario_con_eventos):
+        """Verifica que la importación publica un único evento con los productos tocados."""
+        inventario, recibidos = inventario_con_eventos
+        df = pd.DataFrame({
+            'Item': ['A', 'C'],
+            'Bin': ['B1', 'B2'],
+            'Stock': [40, 5],
+            'Nombre': ['P1', 'P3']
+        })
+        mapeo = {'numero_item': 'Item', 'bin': 'Bin', 'stock_actual': 'Stock', 'nombre': 'Nombre'}
+        
+        ImportadorInventario(inventario).procesar_datos(df, mapeo)
+        
+        assert len(recibidos) == 1
+        assert recibidos[0].tipo == EventoInventario.TRANSACCION
+        assert recibidos[0].nuevo == {1, 3}
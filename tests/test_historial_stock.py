@@ -0,0 +1,156 @@
+"""
+Pruebas unitarias para el historial comprimido de stock.
+
+Verifica la codificación delta por bloques, las consultas por producto
+y por fecha, la persistencia mapeada en memoria y el registro automático
+a partir de los eventos del inventario.
+"""
+
+import numpy as np
+import pytest
+from models import Producto, Inventario
+from logic import HistorialStock, OperacionesMatriciales
+from logic.historial_stock import codificar_bloque, a_segundos
+
+
+DIA = 24 * 3600
+T0 = a_segundos("2024-01-01")
+
+
+@pytest.fixture
+def historial():
+    """Historial con bloques diarios y puntos de tres productos en tres días."""
+    historial = HistorialStock(duracion_bloque=DIA)
+    historial.registrar_lote([1, 2], [100, 50], T0)
+    historial.registrar(1, 90, T0 + 3600)
+    historial.registrar(2, 40, T0 + DIA + 60)
+    historial.registrar(3, 7, T0 + DIA + 120)
+    historial.registrar(1, 80, T0 + 2 * DIA)
+    return historial
+
+
+class TestHistorialStock:
+    """Pruebas para la clase HistorialStock."""
+    
+    def test_codificar_bloque_usa_tipos_minimos(self):
+        """Verifica que las columnas delta usan el entero más pequeño posible."""
+        bloque = codificar_bloque([2, 1, 2], [T0, T0 + 10, T0 + 20], [500, 3, 480])
+        
+        assert bloque['ids'].tolist() == [1, 2]
+        assert bloque['delta_tiempo'].dtype == np.uint8
+        assert bloque['delta_stock'].dtype == np.int8
+        assert bloque['delta_stock'].tolist() == [0, 0, -20]
+        assert bloque['base_stock'].tolist() == [3, 500]
+    
+    def test_bloques_por_ventana_de_tiempo(self, historial):
+        """Verifica que un punto de otra ventana cierra el bloque en curso."""
+        assert historial.bloques == 2
+        assert len(historial) == 6
+    
+    def test_serie_de_un_producto(self, historial):
+        """Verifica la evolución de un producto a través de varios bloques."""
+        serie = historial.serie(1)
+        
+        assert serie.tolist() == [100, 90, 80]
+        assert serie.index[1] == np.datetime64("2024-01-01T01:00:00")
+    
+    def test_serie_en_rango_incluye_stock_vigente(self, historial):
+        """Verifica que la serie parte con el stock vigente al inicio del rango."""
+        serie = historial.serie(1, desde=T0 + 7200, hasta=T0 + DIA + 7200)
+        
+        assert serie.tolist() == [90]
+        assert serie.index[0] == np.datetime64("2024-01-01T02:00:00")
+    
+    def test_stock_en_fecha(self, historial):
+        """Verifica el stock de todos los productos en distintas fechas."""
+        assert historial.stock_en(T0 + 1800).to_dict() == {1: 100, 2: 50}
+        assert historial.stock_en(T0 + DIA + 90).to_dict() == {1: 90, 2: 40}
+        assert historial.stock_en().to_dict() == {1: 80, 2: 40, 3: 7}
+        assert historial.stock_en(T0 - 1).empty
+    
+    def test_rechaza_tiempo_anterior(self, historial):
+        """Verifica que no se aceptan marcas de tiempo hacia atrás."""
+        with pytest.raises(ValueError):
+            historial.registrar(1, 5, T0)
+    
+    def test_persistencia_mapeada(self, historial, tmp_path):
+        """Verifica que los bloques guardados se reabren mapeados en memoria."""
+        persistente = HistorialStock(str(tmp_path), duracion_bloque=DIA)
+        persistente.registrar_lote([1, 2], [100, 50], T0)
+        persistente.registrar(1, 90, T0 + DIA)
+        persistente.sellar()
+        
+        reabierto = HistorialStock(str(tmp_path), duracion_bloque=DIA)
+        
+        assert reabierto.bloques == 2
+        assert isinstance(reabierto._bloques[0]['delta_stock'], np.memmap)
+        assert reabierto.serie(1).tolist() == [100, 90]
+        assert reabierto.stock_en().to_dict() == {1: 90, 2: 50}
+    
+    def test_bytes_por_movimiento(self):
+        """Verifica que cada movimiento ocupa pocos bytes."""
+        rng = np.random.default_rng(0)
+        historial = HistorialStock()
+        stock = np.full(1000, 500)
+        for paso in range(50):
+            ids = rng.choice(1000, size=200, replace=False)
+            stock[ids] -= rng.integers(1, 5, size=200)
+            historial.registrar_lote(ids, stock[ids], T0 + paso * 600)
+        historial.sellar()
+        
+        assert historial.nbytes / len(historial) < 8
+        assert historial.stock_en().to_dict() == {
+            i: int(s) for i, s in enumerate(stock) if s != 500
+        }
+
+
+class TestHistorialConInventario:
+    """Pruebas del registro automático desde los eventos del inventario."""
+    
+    def test_registra_movimientos(self):
+        """Verifica que entradas, salidas y transacciones quedan registradas."""
+        inventario = Inventario()
+        historial = HistorialStock(inventario=inventario)
+        inventario.agregar_producto(Producto(1, "P1", 1.0, 20, 0, 100))
+        inventario.agregar_producto(Producto(2, "P2", 1.0, 30, 0, 100))
+        operaciones = OperacionesMatriciales(inventario)
+        
+        operaciones.registrar_salida(1, 5)
+        operaciones.registrar_entradas_batch({1: 10, 2: 1})
+        
+        assert historial.serie(1).tolist() == [20, 15, 25]
+        assert historial.serie(2).tolist() == [30, 31]
+    
+    def test_transaccion_revertida_no_deja_rastro(self):
+        """Verifica que un cambio revertido no se registra."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 1.0, 20, 0, 100))
+        historial = HistorialStock(inventario=inventario)
+        historial.capturar()
+        
+        with pytest.raises(RuntimeError):
+            with inventario.transaccion():
+                inventario.obtener_producto(1).stock_actual = 3
+                raise RuntimeError("falla")
+        
+        assert historial.serie(1).tolist() == [20]
+    
+    def test_reabrir_no_duplica_stock_sin_cambios(self, tmp_path):
+        """Verifica que tras reabrir solo se capturan los productos que cambiaron."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 1.0, 20, 0, 100))
+        inventario.agregar_producto(Producto(2, "P2", 1.0, 30, 0, 100))
+        historial = HistorialStock(str(tmp_path), inventario=inventario)
+        historial.capturar(marca_tiempo=T0)
+        historial.sellar()
+        historial.registrar(2, 35, T0 + 60)
+        historial.sellar()
+        inventario.eventos.desuscribir(historial._al_cambiar_inventario)
+        inventario.obtener_producto(2).stock_actual = 35
+        
+        reabierto = HistorialStock(str(tmp_path), inventario=inventario)
+        
+        assert reabierto.capturar(marca_tiempo=T0 + 120) == 0
+        inventario.obtener_producto(1).stock_actual = 19
+        assert reabierto.serie(1).tolist() == [20, 19]
+        assert reabierto.serie(2).tolist() == [30, 35]
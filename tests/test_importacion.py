@@ -0,0 +1,329 @@
+"""
+Pruebas unitarias para la importación de datos tabulares al inventario.
+
+Verifica la identificación por (numero_item, BIN), (codigo_upc, BIN) e ID,
+la creación de productos nuevos y el reporte de errores por fila.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from models import Producto, Inventario
+from logic import ImportadorInventario
+from logic.archivos import exportar_inventario
+
+
+class TestImportadorInventario:
+    """Pruebas para la clase ImportadorInventario."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture que crea un inventario con productos de prueba."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(
+            1, "Producto A", 10.0, 20, 5, 50, "Cat1",
+            numero_item="100001", codigo_upc="111", bin="A-01"
+        ))
+        inventario.agregar_producto(Producto(
+            5, "Producto B", 3.0, 7, 10, 30, "Cat2",
+            numero_item="100002", codigo_upc="222", bin="B-02"
+        ))
+        return inventario
+    
+    @pytest.fixture
+    def mapeo(self):
+        """Fixture con el mapeo de columnas de prueba."""
+        return {
+            'numero_item': 'Item', 'codigo_upc': 'UPC', 'bin': 'BIN',
+            'stock_actual': 'Stock', 'nombre': 'Nombre'
+        }
+    
+    def test_fila_con_error_no_queda_a_medias(self, inventario):
+        """Verifica que una fila que falla a mitad de la actualización se deshace."""
+        class CategoriaInvalida:
+            def __str__(self):
+                raise ValueError("categoría ilegible")
+        
+        df = pd.DataFrame({
+            'Item': ["100001"], 'BIN': ["A-01"],
+            'Nombre': ["Nombre nuevo"], 'Stock': [99], 'Categoria': [CategoriaInvalida()]
+        })
+        mapeo = {
+            'numero_item': 'Item', 'bin': 'BIN', 'nombre': 'Nombre',
+            'stock_actual': 'Stock', 'categoria': 'Categoria'
+        }
+        
+        exito, mensaje = ImportadorInventario(inventario).procesar_datos(df, mapeo)
+        
+        assert exito is True
+        assert "Fila 2: categoría ilegible" in mensaje
+        assert inventario.obtener_producto(1).nombre == "Producto A"
+        assert inventario.obtener_producto(1).stock_actual == 20
+    
+    def test_actualiza_y_agrega(self, inventario, mapeo):
+        """Verifica que las filas existentes se actualizan y las nuevas se agregan."""
+        df = pd.DataFrame({
+            'Item': ["100001", "100001", np.nan],
+            'UPC': [np.nan, np.nan, "222"],
+            'BIN': ["A-01", "C-03", "B-02"],
+            'Stock': [99.0, 4.0, 1.0],
+            'Nombre': [np.nan, "Producto A", "Producto B2"],
+        })
+        
+        exito, mensaje = ImportadorInventario(inventario).procesar_datos(df, mapeo)
+        
+        assert exito
+        assert "Productos agregados: 1" in mensaje
+        assert "Productos actualizados: 2" in mensaje
+        assert inventario.obtener_producto(1).stock_actual == 99
+        assert inventario.obtener_producto(1).nombre == "Producto A"
+        assert inventario.obtener_producto(5).nombre == "Producto B2"
+        
+        # El nuevo producto recibe el siguiente ID libre
+        nuevo = inventario.obtener_producto(6)
+        assert (nuevo.numero_item, nuevo.bin, nuevo.stock_actual) == ("100001", "C-03", 4)
+    
+    def test_filas_repetidas_en_el_archivo(self, inventario, mapeo):
+        """Verifica que una fila repetida actualiza el producto creado antes."""
+        df = pd.DataFrame({
+            'Item': ["200000", "200000"],
+            'UPC': ["333", "333"],
+            'BIN': ["D-04", "D-04"],
+            'Stock': [1.0, 2.0],
+            'Nombre': ["Nuevo", "Nuevo"],
+        })
+        
+        ImportadorInventario(inventario).procesar_datos(df, mapeo)
+        
+        assert len(inventario) == 3
+        assert inventario.obtener_producto(6).stock_actual == 2
+    
+    def test_busqueda_tras_cambio_de_bin(self, inventario):
+        """Verifica que un cambio de BIN en la importación no deja búsquedas obsoletas."""
+        df = pd.DataFrame({
+            'ID': [1, 9],
+            'Item': ["100001", "100001"],
+            'BIN': ["Z-99", "A-01"],
+        })
+        
+        ImportadorInventario(inventario).procesar_datos(
+            df, {'id': 'ID', 'numero_item': 'Item', 'bin': 'BIN'}
+        )
+        
+        # La fila 2 ya no encuentra al producto 1 en A-01 y crea uno nuevo
+        assert inventario.obtener_producto(1).bin == "Z-99"
+        assert inventario.obtener_producto(9).bin == "A-01"
+    
+    def test_errores_por_fila(self, inventario, mapeo):
+        """Verifica que los errores se reportan con el número de fila."""
+        df = pd.DataFrame({
+            'Item': ["300000"],
+            'UPC': ["444"],
+            'BIN': ["E-05"],
+            'Stock': [-3.0],
+            'Nombre': ["Negativo"],
+        })
+        
+        _, mensaje = ImportadorInventario(inventario).procesar_datos(df, mapeo)
+        
+        assert "Errores encontrados: 1" in mensaje
+        assert "Fila 2" in mensaje
+
+
+class TestImportacionMasiva:
+    """Pruebas para la importación de varios archivos."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture que crea un inventario con un producto existente."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(
+            1, "Producto A", 10.0, 20, 5, 50, "Cat1",
+            numero_item="100001", codigo_upc="111", bin="A-01"
+        ))
+        return inventario
+    
+    @pytest.fixture
+    def archivos(self, tmp_path):
+        """Fixture que crea un CSV y un Excel con columnas distintas."""
+        csv = tmp_path / "sucursal_1.csv"
+        pd.DataFrame({
+            'Numero_Item': ["100001", "200000", "200000"],
+            'BIN_Bodega': ["A-01", "B-02", "B-02"],
+            'Stock_Actual': [5, 1, np.nan],
+            'Nombre': [np.nan, "Nuevo", "Nuevo v2"],
+        }).to_csv(csv, index=False)
+        
+        excel = tmp_path / "sucursal_2.xlsx"
+        pd.DataFrame({
+            'Codigo_UPC': ["111", "999"],
+            'BIN': ["A-01", "C-03"],
+            'Stock Actual': [7, 3],
+        }).to_excel(excel, index=False)
+        
+        return [str(csv), str(excel)]
+    
+    def test_ultimo_valor_no_vacio_gana(self, inventario, archivos):
+        """Verifica la resolución de conflictos en el orden de los archivos."""
+        resumen = ImportadorInventario(inventario).importar_archivos(archivos)
+        
+        assert resumen['filas'] == 5
+        assert (resumen['agregados'], resumen['actualizados']) == (2, 1)
+        assert resumen['errores'] == []
+        
+        # El producto 1 aparece en ambos archivos: gana el segundo
+        assert inventario.obtener_producto(1).stock_actual == 7
+        
+        # Filas repetidas: stock de la primera (la segunda está vacía), nombre de la segunda
+        nuevo = inventario.obtener_producto(2)
+        assert (nuevo.nombre, nuevo.stock_actual, nuevo.bin) == ("Nuevo v2", 1, "B-02")
+        assert inventario.obtener_producto(3).codigo_upc == "999"
+    
+    def test_mismo_resultado_con_procesos(self, archivos):
+        """Verifica que el grupo de procesos no altera el resultado."""
+        secuencial, paralelo = Inventario(), Inventario()
+        
+        ImportadorInventario(secuencial).importar_archivos(archivos)
+        ImportadorInventario(paralelo).importar_archivos(archivos, procesos=2)
+        
+        def contenido(inventario):
+            return [
+                (p.id, p.nombre, p.numero_item, p.codigo_upc, p.bin, p.stock_actual)
+                for p in inventario
+            ]
+        
+        assert contenido(paralelo) == contenido(secuencial)
+        assert len(paralelo) == 4
+    
+    def test_archivo_sin_columnas_reconocibles(self, inventario, tmp_path):
+        """Verifica que un archivo inválido se informa sin detener la carga."""
+        ruta = tmp_path / "otro.csv"
+        pd.DataFrame({'x': [1]}).to_csv(ruta, index=False)
+        
+        resumen = ImportadorInventario(inventario).importar_archivos([str(ruta)])
+        
+        assert resumen['filas'] == 0
+        assert len(resumen['errores']) == 1
+        assert "otro.csv" in resumen['errores'][0]
+    
+    def test_bin_nuevo_actualiza_ficha_del_item(self, inventario, tmp_path):
+        """Verifica que una fila nueva de un item existente actualiza sus datos maestros."""
+        ruta = tmp_path / "bin_nuevo.csv"
+        pd.DataFrame({
+            'Numero_Item': ["100001"],
+            'BIN': ["Z-09"],
+            'Precio': [12.0],
+        }).to_csv(ruta, index=False)
+        
+        ImportadorInventario(inventario).importar_archivos([str(ruta)])
+        
+        nuevo = inventario.obtener_producto(2)
+        assert nuevo.ficha is inventario.obtener_producto(1).ficha
+        assert (nuevo.nombre, nuevo.precio) == ("Producto A", 12.0)
+        assert inventario.obtener_producto(1).precio == 12.0
+    
+    def test_ids_nuevos_consecutivos(self, inventario, tmp_path):
+        """Verifica que las filas nuevas sin ID reciben IDs consecutivos tras el mayor."""
+        ruta = tmp_path / "nuevos.csv"
+        pd.DataFrame({
+            'ID': [40, np.nan, np.nan, np.nan],
+            'Numero_Item': ["300001", "300002", "300003", "300004"],
+            'BIN': ["A-01"] * 4,
+        }).to_csv(ruta, index=False)
+        
+        ImportadorInventario(inventario).importar_archivos([str(ruta)])
+        
+        assert sorted(p.id for p in inventario) == [1, 40, 41, 42, 43]
+        assert inventario.nuevo_id() == 44
+    
+    def test_marca_de_agua_desde_excel(self, tmp_path):
+        """Verifica que la marca de agua guardada en Excel se respeta al cargar."""
+        origen = Inventario()
+        origen.agregar_producto(Producto(1, "P1", 1.0))
+        origen.agregar_producto(Producto(9, "P9", 1.0))
+        origen.eliminar_producto(9)
+        ruta = str(tmp_path / "inventario.xlsx")
+        exportar_inventario(origen, ruta)
+        
+        destino = Inventario()
+        ImportadorInventario(destino).importar_archivos([ruta])
+        
+        assert [p.id for p in destino] == [1]
+        assert destino.nuevo_id() == 10
+
+
+class TestImportacionDiferencial:
+    """Pruebas para la importación diferencial."""
+    
+    @pytest.fixture
+    def mapeo(self):
+        """Fixture con el mapeo de columnas de prueba."""
+        return {'numero_item': 'Item', 'bin': 'BIN', 'stock_actual': 'Stock', 'nombre': 'Nombre'}
+    
+    @pytest.fixture
+    def hoja(self):
+        """Fixture con la hoja de stock del día."""
+        return pd.DataFrame({
+            'Item': ["100001", "100002", "100003"],
+            'BIN': ["A-01", "A-01", "B-02"],
+            'Stock': [10.0, 20.0, 30.0],
+            'Nombre': ["Uno", "Dos", "Tres"],
+        })
+    
+    def test_primera_importacion_aplica_todo(self, hoja, mapeo):
+        """Verifica que sin importación previa todas las filas son nuevas."""
+        inventario = Inventario()
+        
+        resumen = ImportadorInventario(inventario).importar_diferencial(hoja, mapeo)
+        
+        assert resumen['insertados'] == 3
+        assert resumen['agregados'] == 3
+        assert len(inventario) == 3
+    
+    def test_solo_aplica_cambios(self, hoja, mapeo):
+        """Verifica que las filas iguales se omiten y se informa el delta."""
+        inventario = Inventario()
+        importador = ImportadorInventario(inventario)
+        importador.importar_diferencial(hoja, mapeo)
+        
+        siguiente = pd.concat([
+            hoja.iloc[[0, 2]].assign(Stock=[10.0, 35.0]),
+            pd.DataFrame({'Item': ["100004"], 'BIN': ["C-03"], 'Stock': [1.0], 'Nombre': ["Cuatro"]}),
+        ], ignore_index=True)
+        
+        resumen = importador.importar_diferencial(siguiente, mapeo)
+        
+        assert (resumen['insertados'], resumen['modificados'], resumen['sin_cambios']) == (1, 1, 1)
+        assert resumen['desaparecidos'] == 1
+        assert (resumen['agregados'], resumen['actualizados']) == (1, 1)
+        
+        # La fila desaparecida no se elimina por defecto
+        assert len(inventario) == 4
+        stocks = {p.numero_item: p.stock_actual for p in inventario}
+        assert stocks == {"100001": 10, "100002": 20, "100003": 35, "100004": 1}
+    
+    def test_eliminar_ausentes(self, hoja, mapeo):
+        """Verifica la eliminación opcional de las filas desaparecidas."""
+        inventario = Inventario()
+        importador = ImportadorInventario(inventario)
+        importador.importar_diferencial(hoja, mapeo)
+        
+        resumen = importador.importar_diferencial(hoja.iloc[:2], mapeo, eliminar_ausentes=True)
+        
+        assert resumen['eliminados'] == 1
+        assert sorted(p.numero_item for p in inventario) == ["100001", "100002"]
+    
+    def test_cambio_externo_no_se_omite(self, hoja, mapeo):
+        """Verifica que un cambio manual entre importaciones se vuelve a sobrescribir."""
+        inventario = Inventario()
+        importador = ImportadorInventario(inventario)
+        importador.importar_diferencial(hoja, mapeo)
+        
+        producto = inventario.obtener_producto_por_numero_item_y_bin("100002", "A-01")
+        producto.stock_actual = 99
+        inventario.notificar_cambio_stock()
+        
+        resumen = importador.importar_diferencial(hoja, mapeo)
+        
+        assert resumen['modificados'] == 1
+        assert producto.stock_actual == 20
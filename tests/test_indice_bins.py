@@ -0,0 +1,101 @@
+"""
+Pruebas unitarias para el índice estructurado de BINs.
+
+Verifica el empaquetado de coordenadas, las consultas por prefijo y
+rango, los agregados por zona y la invalidación por eventos.
+"""
+
+import pytest
+from models import Producto, Inventario
+from logic import IndiceBins, OperacionesMatriciales
+from logic.indice_bins import parsear_bin, empaquetar
+
+
+@pytest.fixture
+def inventario():
+    """Inventario con productos repartidos en varios pasillos y racks."""
+    inventario = Inventario()
+    ubicaciones = [
+        "001/010/001", "001/012/003", "002/010/001", "002/011/002",
+        "002/015/001", "002/016/004", "003/010/001", "N/D"
+    ]
+    for i, bin_value in enumerate(ubicaciones, start=1):
+        inventario.agregar_producto(Producto(i, f"P{i}", 2.0, 10 * i, 0, 100, bin=bin_value))
+    return inventario
+
+
+class TestIndiceBins:
+    """Pruebas para la clase IndiceBins."""
+    
+    def test_parsear_y_empaquetar(self):
+        """Verifica la interpretación del formato XXX/XXX/XXX."""
+        assert parsear_bin("002/015/003") == (2, 15, 3)
+        assert parsear_bin("N/D") is None
+        assert parsear_bin("1/2") is None
+        assert empaquetar(2, 15, 3) == 2_015_003
+    
+    def test_buscar_por_pasillo(self, inventario):
+        """Verifica la consulta por prefijo de pasillo."""
+        indice = IndiceBins(inventario)
+        
+        assert indice.buscar(pasillo=2).tolist() == [3, 4, 5, 6]
+        assert indice.sin_ubicacion() == [8]
+        assert len(indice) == 7
+    
+    def test_buscar_rango_de_racks(self, inventario):
+        """Verifica la consulta por rango de racks dentro de un pasillo."""
+        indice = IndiceBins(inventario)
+        
+        assert indice.buscar(pasillo=2, rack=(10, 15)).tolist() == [3, 4, 5]
+    
+    def test_buscar_rack_en_todos_los_pasillos(self, inventario):
+        """Verifica filtros que no forman un prefijo contiguo."""
+        indice = IndiceBins(inventario)
+        
+        assert indice.buscar(rack=10, nivel=1).tolist() == [1, 3, 7]
+        assert indice.buscar(pasillo=(1, 2), rack=(11, 12)).tolist() == [2, 4]
+    
+    def test_resumen_por_pasillo(self, inventario):
+        """Verifica stock, valor y ocupación por pasillo."""
+        indice = IndiceBins(inventario)
+        
+        resumen = indice.resumen_por_zona()
+        
+        assert resumen.index.tolist() == ["001", "002", "003"]
+        assert resumen.loc["002", 'productos'] == 4
+        assert resumen.loc["002", 'stock_total'] == 30 + 40 + 50 + 60
+        assert resumen.loc["002", 'valor_total'] == 2.0 * 180
+        assert resumen.loc["002", 'porcentaje_ocupacion'] == 45.0
+    
+    def test_resumen_por_rack(self, inventario):
+        """Verifica la agrupación por pasillo y rack con filtro."""
+        indice = IndiceBins(inventario)
+        
+        resumen = indice.resumen_por_zona('rack', pasillo=2)
+        
+        assert resumen.index.tolist() == ["002/010", "002/011", "002/015", "002/016"]
+    
+    def test_agrupacion_invalida(self, inventario):
+        """Verifica que se rechaza un nivel de agrupación desconocido."""
+        with pytest.raises(ValueError):
+            IndiceBins(inventario).resumen_por_zona('bodega')
+    
+    def test_cambio_de_stock_no_reconstruye(self, inventario):
+        """Verifica que el índice sigue vigente tras un cambio de stock."""
+        indice = IndiceBins(inventario)
+        indice.buscar(pasillo=1)
+        
+        OperacionesMatriciales(inventario).registrar_salida(1, 5)
+        
+        assert indice._vigente is True
+        assert indice.resumen_por_zona(pasillo=1).loc["001", 'stock_total'] == 5 + 20
+    
+    def test_cambio_de_bin_reindexa(self, inventario):
+        """Verifica que mover un producto de BIN actualiza las consultas."""
+        indice = IndiceBins(inventario)
+        indice.buscar(pasillo=1)
+        
+        inventario.obtener_producto(1).bin = "003/020/001"
+        
+        assert indice.buscar(pasillo=1).tolist() == [2]
+        assert indice.buscar(pasillo=3).tolist() == [7, 1]
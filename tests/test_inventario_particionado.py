@@ -0,0 +1,132 @@
+"""
+Pruebas unitarias para el inventario particionado en múltiples procesos.
+
+Verifica que el enrutamiento de movimientos y la combinación de
+resultados parciales (scatter-gather) coincidan con el inventario
+de un solo proceso.
+"""
+
+import pytest
+import pandas as pd
+from models import Producto, Inventario
+from logic import OperacionesMatriciales, InventarioParticionado
+
+
+def crear_productos():
+    """Crea productos de prueba repartidos en varios items y BINs."""
+    return [
+        Producto(1, "Router", 89.99, 15, 10, 40, "Redes", "100012", "012345678912", "002/015/008"),
+        Producto(2, "Router", 89.99, 5, 10, 40, "Redes", "100012", "012345678912", "003/010/004"),
+        Producto(3, "Laptop", 899.99, 20, 5, 50, "Electrónica", "100001", "012345678901", "001/020/006"),
+        Producto(4, "Mouse", 29.99, 3, 20, 100, "Accesorios", "100002", "012345678902", "001/020/007"),
+        Producto(5, "Teclado", 79.99, 8, 10, 40, "Accesorios", "100003", "012345678903", "002/001/001"),
+        Producto(6, "Cable", 14.99, 60, 30, 200, "Accesorios", "100004", "012345678904", "003/010/001"),
+    ]
+
+
+class TestInventarioParticionado:
+    """Pruebas para la clase InventarioParticionado."""
+    
+    @pytest.fixture
+    def particionado(self):
+        """Fixture que crea un inventario particionado con productos de prueba."""
+        inventario = InventarioParticionado(num_particiones=3)
+        inventario.agregar_productos(crear_productos())
+        yield inventario
+        inventario.cerrar()
+    
+    @pytest.fixture
+    def operaciones(self):
+        """Fixture con el inventario equivalente de un solo proceso."""
+        inventario = Inventario()
+        for producto in crear_productos():
+            inventario.agregar_producto(producto)
+        return OperacionesMatriciales(inventario)
+    
+    def test_agregar_productos(self, particionado):
+        """Verifica que todos los productos quedan repartidos en las particiones."""
+        assert len(particionado) == 6
+        assert sum(particionado.tamanos_particiones()) == 6
+        assert particionado.agregar_producto(Producto(1, "Duplicado", 1.0)) is False
+    
+    def test_mismo_item_misma_particion(self, particionado):
+        """Verifica que los BINs de un mismo item quedan en la misma partición."""
+        p1, p2 = crear_productos()[:2]
+        
+        assert particionado.particion_de(p1) == particionado.particion_de(p2)
+    
+    def test_error_en_una_particion_no_desincroniza(self, particionado):
+        """Verifica que tras el error de una partición las demás conexiones quedan limpias."""
+        with pytest.raises(RuntimeError, match="Error en partición"):
+            particionado._dispersar('eliminar', {0: (), 1: (999,), 2: (999,)})
+        
+        assert sum(particionado.tamanos_particiones()) == 6
+        assert particionado.obtener_producto(3).nombre == "Laptop"
+    
+    def test_particion_por_zona(self):
+        """Verifica el particionado por pasillo del BIN."""
+        with InventarioParticionado(num_particiones=2, criterio="zona") as inventario:
+            p3, p4 = crear_productos()[2:4]
+            
+            assert inventario.particion_de(p3) == inventario.particion_de(p4)
+    
+    def test_criterio_invalido(self):
+        """Verifica que un criterio desconocido lance ValueError."""
+        with pytest.raises(ValueError, match="Criterio"):
+            InventarioParticionado(num_particiones=1, criterio="color")
+    
+    def test_registrar_entrada_y_salida(self, particionado):
+        """Verifica que los movimientos se aplican en la partición dueña."""
+        exito, _ = particionado.registrar_entrada(3, 10)
+        assert exito is True
+        
+        exito, mensaje = particionado.registrar_salida(4, 10)
+        assert exito is False
+        assert "insuficiente" in mensaje.lower()
+        
+        assert particionado.obtener_producto(3).stock_actual == 30
+    
+    def test_movimiento_producto_inexistente(self, particionado):
+        """Verifica el rechazo de productos que no están en ninguna partición."""
+        exito, mensaje = particionado.registrar_entrada(999, 1)
+        
+        assert exito is False
+        assert "no encontrado" in mensaje.lower()
+    
+    def test_registrar_salidas_batch(self, particionado):
+        """Verifica el registro de salidas repartidas entre particiones."""
+        exitosas, mensajes = particionado.registrar_salidas_batch({1: 5, 3: 5, 6: 10, 999: 1})
+        
+        assert exitosas == 3
+        assert len(mensajes) == 4
+    
+    def test_estadisticas_coinciden(self, particionado, operaciones):
+        """Verifica que las estadísticas combinadas coinciden con un solo proceso."""
+        esperado = operaciones.calcular_estadisticas()
+        obtenido = particionado.calcular_estadisticas()
+        
+        assert obtenido.keys() == esperado.keys()
+        for clave in esperado:
+            assert obtenido[clave] == pytest.approx(esperado[clave])
+    
+    def test_analisis_por_categoria_coincide(self, particionado, operaciones):
+        """Verifica que el análisis por categoría combinado coincide."""
+        esperado = operaciones.analisis_por_categoria()
+        obtenido = particionado.analisis_por_categoria()
+        
+        pd.testing.assert_frame_equal(obtenido, esperado, check_dtype=False)
+    
+    def test_alertas_coinciden(self, particionado, operaciones):
+        """Verifica que las alertas reunidas coinciden con un solo proceso."""
+        esperado = sorted(p.id for p in operaciones.obtener_productos_alerta())
+        obtenido = sorted(p.id for p in particionado.obtener_productos_alerta())
+        
+        assert obtenido == esperado
+        assert particionado.contar_alertas() == len(esperado)
+    
+    def test_inventario_vacio(self):
+        """Verifica las consultas globales sin productos."""
+        with InventarioParticionado(num_particiones=2) as inventario:
+            assert inventario.calcular_estadisticas()['total_productos'] == 0
+            assert inventario.analisis_por_categoria().empty
+            assert inventario.obtener_dataframe().empty
@@ -0,0 +1,126 @@
+"""
+Pruebas unitarias para la matriz de inventario en memoria compartida.
+
+Verifica la publicación por el proceso escritor, la lectura de copia
+cero por procesos lectores y la consistencia del protocolo seqlock.
+"""
+
+import multiprocessing as mp
+import pytest
+import numpy as np
+from models import Producto, Inventario
+from logic import MatrizCompartida
+
+
+def _lector_verifica_consistencia(nombre, lecturas, cola):
+    """Proceso lector: comprueba que cada instantánea sea uniforme."""
+    lector = MatrizCompartida.conectar(nombre)
+    inconsistentes = 0
+    for _ in range(lecturas):
+        valores = lector.con_instantanea(lambda m: (m.min(), m.max()) if m.size else (0, 0))
+        if valores[0] != valores[1]:
+            inconsistentes += 1
+    lector.cerrar()
+    cola.put(inconsistentes)
+
+
+def _lector_suma_stock(nombre, cola):
+    """Proceso lector: suma la columna de stock."""
+    lector = MatrizCompartida.conectar(nombre)
+    cola.put(lector.con_instantanea(lambda m: float(m[:, 2].sum())))
+    lector.cerrar()
+
+
+class TestMatrizCompartida:
+    """Pruebas para la clase MatrizCompartida."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture que crea un inventario con productos de prueba."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "Producto A", 100.0, 20, 10, 50))
+        inventario.agregar_producto(Producto(2, "Producto B", 50.0, 5, 10, 30))
+        inventario.agregar_producto(Producto(3, "Producto C", 75.0, 25, 15, 40))
+        return inventario
+    
+    @pytest.fixture
+    def escritor(self):
+        """Fixture que crea el bloque compartido como escritor."""
+        matriz = MatrizCompartida.crear(capacidad=100)
+        yield matriz
+        matriz.cerrar()
+    
+    def test_publicar_y_leer(self, escritor, inventario):
+        """Verifica que un lector obtiene la matriz publicada."""
+        secuencia = escritor.publicar_inventario(inventario)
+        
+        lector = MatrizCompartida.conectar(escritor.nombre)
+        matriz = lector.leer()
+        lector.cerrar()
+        
+        assert secuencia == 2
+        np.testing.assert_array_equal(matriz, inventario.obtener_matriz_inventario())
+    
+    def test_vista_copia_cero_solo_lectura(self, escritor, inventario):
+        """Verifica que la vista entregada a los lectores no es modificable."""
+        escritor.publicar_inventario(inventario)
+        
+        def modificar(vista):
+            vista[0, 0] = 99
+        
+        with pytest.raises(ValueError):
+            escritor.con_instantanea(modificar)
+    
+    def test_lector_no_puede_publicar(self, escritor):
+        """Verifica que solo el escritor puede publicar."""
+        lector = MatrizCompartida.conectar(escritor.nombre)
+        
+        with pytest.raises(PermissionError):
+            lector.publicar(np.zeros((1, 5)))
+        
+        lector.cerrar()
+    
+    def test_cerrar_dos_veces(self):
+        """Verifica que cerrar dentro de un bloque with no falla al salir."""
+        with MatrizCompartida.crear(capacidad=10) as matriz:
+            matriz.cerrar()
+        
+        assert matriz.cerrada
+        matriz.cerrar()
+        assert "cerrada" in repr(matriz)
+    
+    def test_capacidad_insuficiente(self, escritor):
+        """Verifica el rechazo de matrices más grandes que el bloque."""
+        with pytest.raises(ValueError, match="capacidad"):
+            escritor.publicar(np.zeros((101, 5)))
+    
+    def test_lector_en_otro_proceso(self, escritor, inventario):
+        """Verifica la lectura desde un proceso distinto."""
+        escritor.publicar_inventario(inventario)
+        cola = mp.Queue()
+        
+        proceso = mp.Process(target=_lector_suma_stock, args=(escritor.nombre, cola))
+        proceso.start()
+        resultado = cola.get(timeout=10)
+        proceso.join()
+        
+        assert resultado == 50.0
+    
+    def test_instantaneas_consistentes_con_escrituras_concurrentes(self, escritor):
+        """Verifica que un lector nunca ve una versión a medio escribir."""
+        cola = mp.Queue()
+        proceso = mp.Process(
+            target=_lector_verifica_consistencia,
+            args=(escritor.nombre, 2000, cola)
+        )
+        proceso.start()
+        
+        version = 0
+        while proceso.is_alive() and cola.empty():
+            version += 1
+            escritor.publicar(np.full((100, 5), version, dtype=np.float64))
+        
+        inconsistentes = cola.get(timeout=30)
+        proceso.join()
+        
+        assert inconsistentes == 0
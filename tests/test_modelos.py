@@ -5,10 +5,12 @@ Este módulo contiene tests para las clases Producto e Inventario,
 verificando la correcta representación vectorial y matricial.
 """
 
+import pickle
+import threading
 import pytest
 import numpy as np
 import pandas as pd
-from models import Producto, Inventario
+from models import Producto, Inventario, RegistroMovimientos, AsignadorIds, FichaProducto
 
 
 class TestProducto:
@@ -61,6 +63,15 @@ class TestProducto:
                 stock_minimo=50, stock_maximo=10
             )
     
+    def test_stock_fuera_de_int32_lanza_error(self):
+        """Verifica el límite de las columnas int32 de stock."""
+        limite = 2**31 - 1
+        producto = Producto(1, "Test", 10.0, limite, 0, limite)
+        assert producto.stock_maximo == limite
+        
+        with pytest.raises(ValueError, match="no puede superar"):
+            Producto(1, "Test", 10.0, 0, 0, limite + 1)
+    
     def test_to_vector(self):
         """Verifica la conversión a representación vectorial."""
         producto = Producto(
@@ -234,6 +245,27 @@ class TestInventario:
         
         assert matriz.shape == (0, 5)
     
+    def test_columnas_tipadas(self):
+        """Verifica los tipos estrechos y la vista float64 construida a pedido."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 10.555, 20, 5, 50))
+        inventario.agregar_producto(Producto(2, "P2", 0.1, 7, 0, 30))
+        
+        columnas = inventario.obtener_columnas()
+        assert {nombre: c.dtype for nombre, c in columnas.items()} == inventario.TIPOS_COLUMNAS
+        assert columnas['precio_centavos'].tolist() == [1056, 10]
+        assert inventario._matriz_cache is None
+        
+        matriz = inventario.obtener_matriz_inventario()
+        assert matriz.dtype == np.float64
+        assert matriz[:, 1].tolist() == [10.56, 0.1]
+        
+        # Un cambio actualiza en su lugar las columnas y la vista
+        inventario.obtener_producto(2).stock_actual = 9
+        assert inventario.obtener_columnas()['stock_actual'].tolist() == [20, 9]
+        assert inventario.obtener_matriz_inventario()[1, 2] == 9
+        assert columnas['stock_actual'].tolist() == [20, 7]
+    
     def test_obtener_dataframe(self):
         """Verifica obtener inventario como DataFrame."""
         inventario = Inventario()
@@ -259,3 +291,370 @@ class TestInventario:
         productos = list(inventario)
         
         assert len(productos) == 2
+    
+    def test_categorias_codificadas(self):
+        """Verifica el diccionario de categorías y su Categorical en el DataFrame."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 10.0, categoria="B"))
+        inventario.agregar_producto(Producto(2, "P2", 20.0, categoria="A"))
+        inventario.agregar_producto(Producto(3, "P3", 30.0, categoria="B"))
+        
+        codigos = inventario.obtener_codigos_categoria()
+        df = inventario.obtener_dataframe()
+        
+        assert [inventario.categorias[c] for c in codigos] == ["B", "A", "B"]
+        assert isinstance(df['categoria'].dtype, pd.CategoricalDtype)
+        assert df['categoria'].tolist() == ["B", "A", "B"]
+    
+    def test_cambio_de_categoria_actualiza_codigos(self):
+        """Verifica que cambiar la categoría actualiza su código sin reconstruir."""
+        inventario = Inventario()
+        producto = Producto(1, "P1", 10.0, categoria="A")
+        inventario.agregar_producto(producto)
+        anteriores = inventario.obtener_codigos_categoria()
+        
+        producto.categoria = "Z"
+        
+        assert inventario._cache_valido is True
+        assert inventario.categorias[inventario.obtener_codigos_categoria()[0]] == "Z"
+        assert inventario.categorias[anteriores[0]] == "A"
+    
+    def test_version_aumenta_con_cambios(self):
+        """Verifica que la versión aumenta con cada cambio notificado."""
+        inventario = Inventario()
+        version_inicial = inventario.version
+        
+        inventario.agregar_producto(Producto(1, "P1", 10.0))
+        inventario.notificar_cambio_stock()
+        inventario.eliminar_producto(1)
+        
+        assert inventario.version == version_inicial + 3
+    
+    def test_nuevo_id_sigue_al_mayor_usado(self):
+        """Verifica que los IDs nuevos superan a los agregados y no se repiten."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(7, "P7", 1.0))
+        inventario.agregar_producto(Producto(3, "P3", 1.0))
+        
+        assert inventario.nuevo_id() == 8
+        assert inventario.nuevo_id() == 9
+        
+        # Eliminar el mayor no hace retroceder la numeración
+        inventario.eliminar_producto(7)
+        assert inventario.nuevo_id() == 10
+        assert list(inventario.reservar_ids(3)) == [11, 12, 13]
+    
+    def test_cambiar_id_actualiza_marca_de_agua(self):
+        """Verifica que un ID asignado por cambio de ID no se vuelve a entregar."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 1.0))
+        inventario.cambiar_id(1, 50)
+        
+        assert inventario.nuevo_id() == 51
+
+
+class TestAsignadorIds:
+    """Pruebas para la clase AsignadorIds."""
+    
+    def test_asignar_y_reservar(self):
+        """Verifica la entrega secuencial y la reserva de rangos."""
+        asignador = AsignadorIds()
+        
+        assert asignador.asignar() == 1
+        assert asignador.reservar(3) == range(2, 5)
+        assert asignador.asignar() == 5
+        
+        with pytest.raises(ValueError):
+            asignador.reservar(-1)
+    
+    def test_observar_solo_sube(self):
+        """Verifica que observar IDs menores o no enteros no cambia la marca."""
+        asignador = AsignadorIds()
+        asignador.observar(10)
+        asignador.observar(4)
+        asignador.observar("A-10")
+        
+        assert asignador.siguiente == 11
+    
+    def test_reutilizar_liberados(self):
+        """Verifica que con reutilización se entrega primero el menor liberado."""
+        asignador = AsignadorIds(siguiente=10, reutilizar=True)
+        asignador.liberar(7)
+        asignador.liberar(3)
+        asignador.liberar(20)
+        
+        assert [asignador.asignar() for _ in range(3)] == [3, 7, 10]
+    
+    def test_restaurar_no_baja_la_marca(self):
+        """Verifica la restauración del estado guardado."""
+        asignador = AsignadorIds()
+        asignador.restaurar({'siguiente_id': 100})
+        assert asignador.a_dict() == {'siguiente_id': 100}
+        
+        asignador.restaurar({'siguiente_id': 5})
+        asignador.restaurar({})
+        assert asignador.siguiente == 100
+
+
+class TestFichaProducto:
+    """Pruebas para la ficha maestra compartida entre BINs."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture con un item en dos BINs y otro item en uno."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "Tornillo", 1.0, 10, 0, 50, "Ferretería", numero_item="T", bin="A-01"))
+        inventario.agregar_producto(Producto(2, "Tornillo", 1.0, 20, 0, 50, "Ferretería", numero_item="T", bin="B-02"))
+        inventario.agregar_producto(Producto(3, "Tuerca", 0.5, 30, 0, 50, "Ferretería", numero_item="U", bin="A-01"))
+        return inventario
+    
+    def test_ubicaciones_comparten_ficha(self, inventario):
+        """Verifica que las ubicaciones de un item comparten una sola ficha."""
+        primero, segundo = inventario.obtener_producto(1), inventario.obtener_producto(2)
+        
+        assert primero.ficha is segundo.ficha
+        assert isinstance(primero.ficha, FichaProducto)
+        assert set(inventario.fichas) == {"T", "U"}
+        assert inventario.fichas["T"].ubicaciones == [primero, segundo]
+    
+    def test_cambio_de_precio_en_todas_las_ubicaciones(self, inventario):
+        """Verifica que el precio se escribe una vez y se ve en cada BIN."""
+        inventario.obtener_matriz_inventario()
+        recibidos = []
+        inventario.eventos.suscribir(recibidos.append)
+        
+        inventario.obtener_producto(1).precio = 2.5
+        
+        assert inventario.obtener_producto(2).precio == 2.5
+        assert inventario.obtener_matriz_inventario()[:, 1].tolist() == [2.5, 2.5, 0.5]
+        assert [evento.producto_id for evento in recibidos] == [1, 2]
+    
+    def test_nueva_ubicacion_toma_datos_del_item(self, inventario):
+        """Verifica que un BIN nuevo de un item existente usa su ficha."""
+        nuevo = Producto(4, "Otro nombre", 9.0, 5, numero_item="T", bin="C-03")
+        inventario.agregar_producto(nuevo)
+        
+        assert (nuevo.nombre, nuevo.precio) == ("Tornillo", 1.0)
+        assert len(inventario.fichas["T"].ubicaciones) == 3
+    
+    def test_eliminar_ubicacion_separa_la_ficha(self, inventario):
+        """Verifica que un producto eliminado ya no modifica el item."""
+        eliminado = inventario.obtener_producto(1)
+        inventario.eliminar_producto(1)
+        eliminado.precio = 7.0
+        
+        assert inventario.obtener_producto(2).precio == 1.0
+        
+        inventario.eliminar_producto(3)
+        assert set(inventario.fichas) == {"T"}
+    
+    def test_cambio_de_identificador_reubica_la_ficha(self, inventario):
+        """Verifica que cambiar el item de un BIN mueve solo esa fila a una ficha nueva."""
+        inventario.obtener_producto(2).numero_item = "T2"
+        
+        assert set(inventario.fichas) == {"T", "T2", "U"}
+        assert inventario.obtener_producto(1).numero_item == "T"
+        assert inventario.fichas["T"].ubicaciones == [inventario.obtener_producto(1)]
+        assert inventario.fichas["T2"].ubicaciones == [inventario.obtener_producto(2)]
+        assert inventario.obtener_producto(2).nombre == "Tornillo"
+    
+    def test_cambio_a_item_existente_usa_su_ficha(self, inventario):
+        """Verifica que un BIN que pasa a otro item toma su ficha y sus datos."""
+        inventario.obtener_matriz_inventario()
+        recibidos = []
+        inventario.eventos.suscribir(recibidos.append)
+        
+        inventario.obtener_producto(2).numero_item = "U"
+        inventario.obtener_producto(1).numero_item = "U"
+        
+        assert set(inventario.fichas) == {"U"}
+        ficha = inventario.fichas["U"]
+        assert [producto.id for producto in ficha.ubicaciones] == [3, 2, 1]
+        assert all(producto.ficha is ficha for producto in inventario.productos.values())
+        assert set(inventario.fichas) == set(inventario.obtener_productos_agrupados())
+        assert inventario.obtener_producto(2).precio == 0.5
+        assert inventario.obtener_matriz_inventario()[:, 1].tolist() == [0.5, 0.5, 0.5]
+        assert {(evento.producto_id, evento.campo) for evento in recibidos} >= {(2, 'numero_item'), (2, 'precio')}
+    
+    def test_deshacer_cambio_de_item(self, inventario):
+        """Verifica que al deshacer un cambio de item la fila vuelve a su ficha."""
+        ficha = inventario.obtener_producto(2).ficha
+        
+        with pytest.raises(RuntimeError):
+            with inventario.transaccion():
+                inventario.obtener_producto(2).numero_item = "U"
+                raise RuntimeError("falla")
+        
+        assert inventario.obtener_producto(2).ficha is ficha
+        assert ficha.ubicaciones == [inventario.obtener_producto(1), inventario.obtener_producto(2)]
+        assert inventario.fichas["U"].ubicaciones == [inventario.obtener_producto(3)]
+        assert inventario.obtener_matriz_inventario()[:, 1].tolist() == [1.0, 1.0, 0.5]
+    
+    def test_conflictos_al_agregar(self, inventario):
+        """Verifica que se informan y, si se pide, se aplican los datos maestros distintos."""
+        nuevo = Producto(4, "Tornillo largo", 2.0, 5, 0, 50, "Ferretería", numero_item="T", bin="C-03")
+        
+        assert inventario.conflictos_ficha(nuevo) == {
+            'nombre': ("Tornillo", "Tornillo largo"), 'precio': (1.0, 2.0)
+        }
+        assert inventario.conflictos_ficha(Producto(5, "Otro", 1.0, numero_item="Z")) == {}
+        
+        inventario.agregar_producto(nuevo, actualizar_item=True)
+        
+        assert inventario.obtener_producto(1).nombre == "Tornillo largo"
+        assert inventario.obtener_matriz_inventario()[:, 1].tolist() == [2.0, 2.0, 0.5, 2.0]
+    
+    def test_pickle_no_arrastra_el_inventario(self, inventario):
+        """Verifica que serializar una fila no incluya su inventario ni sus filas hermanas."""
+        cerrojo = threading.Lock()
+        inventario.eventos.suscribir(lambda evento, cerrojo=cerrojo: None)
+        producto = inventario.obtener_producto(1)
+        
+        copia = pickle.loads(pickle.dumps(producto))
+        
+        assert copia._inventario is None
+        assert copia.ficha is not producto.ficha
+        assert copia.ficha.ubicaciones == []
+        assert (copia.id, copia.nombre, copia.bin, copia.stock_actual) == (1, "Tornillo", "A-01", 10)
+        assert len(pickle.dumps(producto)) < 1000
+        
+        copia.precio = 9.0
+        assert producto.precio == 1.0
+        assert producto._inventario is inventario
+    
+    def test_tablas_normalizadas(self, inventario):
+        """Verifica el maestro de items y la tabla de stock por BIN."""
+        maestro, bins = inventario.obtener_tablas_normalizadas()
+        
+        assert maestro['numero_item'].tolist() == ["T", "U"]
+        assert bins['item_ref'].tolist() == [0, 0, 1]
+        assert bins['stock_actual'].tolist() == [10, 20, 30]
+        
+        unidas = maestro.loc[bins['item_ref']].reset_index(drop=True)
+        pd.testing.assert_series_equal(
+            unidas['nombre'], inventario.obtener_dataframe()['nombre'], check_names=False
+        )
+
+
+class TestRegistroMovimientos:
+    """Pruebas para la clase RegistroMovimientos."""
+    
+    def test_registrar_movimientos(self):
+        """Verifica el registro columnar de entradas y salidas."""
+        registro = RegistroMovimientos()
+        registro.registrar(1, 10, marca_tiempo=100.0)
+        registro.registrar(2, -3, marca_tiempo=200.0)
+        
+        ids, cantidades, tiempos = registro.obtener_arreglos()
+        
+        assert len(registro) == 2
+        np.testing.assert_array_equal(ids, [1, 2])
+        np.testing.assert_array_equal(cantidades, [10, -3])
+        np.testing.assert_array_equal(tiempos, [100.0, 200.0])
+    
+    def test_obtener_salidas(self):
+        """Verifica que las salidas se devuelven con cantidad positiva."""
+        registro = RegistroMovimientos()
+        registro.registrar_lote([1, 2, 3], [5, -4, -1], [1.0, 2.0, 3.0])
+        
+        ids, cantidades, _ = registro.obtener_salidas()
+        
+        np.testing.assert_array_equal(ids, [2, 3])
+        np.testing.assert_array_equal(cantidades, [4, 1])
+    
+    def test_crecimiento_capacidad(self):
+        """Verifica que el registro crece más allá de la capacidad inicial."""
+        registro = RegistroMovimientos()
+        n = RegistroMovimientos.CAPACIDAD_INICIAL * 3
+        registro.registrar_lote(np.arange(n), np.ones(n, dtype=np.int64))
+        registro.registrar(n, 1)
+        
+        ids, _, _ = registro.obtener_arreglos()
+        
+        assert len(registro) == n + 1
+        np.testing.assert_array_equal(ids, np.arange(n + 1))
+
+
+class TestObservacionCampos:
+    """Pruebas de los atributos observados de Producto."""
+    
+    def test_cambio_de_stock_actualiza_cache_en_su_lugar(self):
+        """Verifica que la matriz refleja el cambio sin reconstruirse."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 10.0, 20, 5, 50))
+        inventario.agregar_producto(Producto(2, "P2", 25.0, 30, 10, 100))
+        anterior = inventario.obtener_matriz_inventario()
+        
+        inventario.obtener_producto(2).stock_actual = 7
+        matriz = inventario.obtener_matriz_inventario()
+        
+        assert inventario._cache_valido is True
+        assert matriz[1, 2] == 7
+        assert anterior[1, 2] == 30  # la matriz entregada antes no cambia
+    
+    def test_stock_fuera_de_rango_no_rompe_el_cache(self):
+        """Verifica que un stock que no cabe en int32 se rechaza y el caché sigue válido."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 10.0, 20, 5, 50))
+        producto = inventario.obtener_producto(1)
+        
+        with pytest.raises(ValueError, match="fuera de rango"):
+            producto.stock_maximo = 4_000_000_000
+        with pytest.raises(ValueError, match="fuera de rango"):
+            producto.stock_actual = -2**31 - 1
+        producto.stock_maximo = 2**31 - 1
+        
+        assert producto.stock_actual == 20
+        assert inventario.obtener_columnas()['stock_maximo'][0] == 2**31 - 1
+        assert inventario.obtener_matriz_inventario()[0, 4] == 2**31 - 1
+    
+    def test_cambio_publica_evento_con_valores(self):
+        """Verifica que el setter publica el valor anterior y el nuevo."""
+        inventario = Inventario()
+        producto = Producto(1, "P1", 10.0, 20, 5, 50)
+        inventario.agregar_producto(producto)
+        recibidos = []
+        inventario.eventos.suscribir(recibidos.append)
+        
+        producto.precio = 12.5
+        producto.precio = 12.5
+        
+        assert len(recibidos) == 1
+        assert (recibidos[0].campo, recibidos[0].anterior, recibidos[0].nuevo) == ('precio', 10.0, 12.5)
+    
+    def test_producto_eliminado_no_notifica(self):
+        """Verifica que un producto fuera del inventario ya no lo afecta."""
+        inventario = Inventario()
+        producto = Producto(1, "P1", 10.0, 20, 5, 50)
+        inventario.agregar_producto(producto)
+        inventario.eliminar_producto(1)
+        version = inventario.version
+        
+        producto.stock_actual = 3
+        
+        assert inventario.version == version
+    
+    def test_cambiar_id(self):
+        """Verifica el cambio de ID y el rechazo de IDs ocupados."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "P1", 10.0))
+        inventario.agregar_producto(Producto(2, "P2", 20.0))
+        
+        assert inventario.cambiar_id(1, 2) is False
+        assert inventario.cambiar_id(1, 5) is True
+        assert inventario.obtener_producto(1) is None
+        assert inventario.obtener_producto(5).nombre == "P1"
+        assert sorted(inventario.obtener_matriz_inventario()[:, 0]) == [2, 5]
+    
+    def test_asignar_id_ocupado_lanza_error(self):
+        """Verifica que asignar directamente un ID ocupado falla sin cambios."""
+        inventario = Inventario()
+        producto = Producto(1, "P1", 10.0)
+        inventario.agregar_producto(producto)
+        inventario.agregar_producto(Producto(2, "P2", 20.0))
+        
+        with pytest.raises(ValueError, match="Ya existe un producto con ID 2"):
+            producto.id = 2
+        
+        assert producto.id == 1
+        assert inventario.obtener_producto(1) is producto
@@ -104,6 +104,16 @@ class TestOperacionesMatriciales:
         
         assert ops.calcular_valor_total_inventario() == 0.0
     
+    def test_valor_total_exacto_en_centavos(self):
+        """Verifica que la valorización no acumula errores de redondeo."""
+        inventario = Inventario()
+        for i in range(1, 11):
+            inventario.agregar_producto(Producto(i, f"P{i}", 0.1, 3, 0, 10))
+        ops = OperacionesMatriciales(inventario)
+        
+        assert ops.calcular_valor_total_centavos() == 300
+        assert ops.calcular_valor_total_inventario() == 3.0
+    
     # =========================================================================
     # Tests de alertas
     # =========================================================================
@@ -149,6 +159,25 @@ class TestOperacionesMatriciales:
         assert sugerencia[1] == 15  # Producto B necesita 15
         assert sugerencia[2] == 0   # Producto C no necesita
     
+    def test_calcular_reabastecimiento_optimo(self, operaciones):
+        """
+        Verifica el reabastecimiento con punto de reorden y EOQ.
+        
+        d = 2, σ² = 0, L = 5 → ROP = 10; Q* = √(2·2·50/1) ≈ 14.14
+        Solo Producto B (stock 5 ≤ 10) recibe sugerencia: ⌈14.14⌉ = 15,
+        limitada al espacio disponible (30 - 5 = 25).
+        """
+        df = operaciones.calcular_reabastecimiento_optimo(
+            tasa_demanda=np.array([2.0, 2.0, 2.0]),
+            varianza_demanda=0.0,
+            tiempo_reposicion=5,
+            costo_pedido=50.0,
+            costo_mantener=1.0
+        )
+        
+        np.testing.assert_array_equal(df['punto_reorden'], [10.0, 10.0, 10.0])
+        np.testing.assert_array_equal(df['cantidad_sugerida'], [0, 15, 0])
+    
     # =========================================================================
     # Tests de entradas
     # =========================================================================
@@ -279,6 +308,146 @@ class TestOperacionesMatriciales:
         assert 'total_unidades' in df.columns
         assert 'valor_total' in df.columns
     
+    def test_analisis_por_categoria_coincide_con_groupby(self, operaciones, inventario_con_productos):
+        """Verifica que np.bincount da lo mismo que agrupar con Pandas."""
+        df = inventario_con_productos.obtener_dataframe()
+        esperado = df.groupby('categoria', observed=True).agg(
+            cantidad_productos=('id', 'count'),
+            total_unidades=('stock_actual', 'sum'),
+            valor_total=('valor_inventario', 'sum'),
+            precio_promedio=('precio', 'mean')
+        ).round(2)
+        
+        obtenido = operaciones.analisis_por_categoria()
+        
+        assert obtenido.index.tolist() == esperado.index.tolist()
+        assert obtenido.columns.tolist() == esperado.columns.tolist()
+        np.testing.assert_allclose(obtenido.to_numpy(dtype=float), esperado.to_numpy(dtype=float))
+    
+    def test_analisis_por_categoria_tras_cambio(self, operaciones, inventario_con_productos):
+        """Verifica que el análisis refleja un cambio de categoría."""
+        operaciones.analisis_por_categoria()
+        producto = next(iter(inventario_con_productos))
+        
+        producto.categoria = "Nueva"
+        df = operaciones.analisis_por_categoria()
+        
+        assert df.loc["Nueva", 'cantidad_productos'] == 1
+        assert df['cantidad_productos'].sum() == len(inventario_con_productos)
+    
+    # =========================================================================
+    # Tests de clasificación ABC
+    # =========================================================================
+    
+    def test_clasificar_abc_por_valor(self, operaciones):
+        """Verifica la clasificación de Pareto sobre precio × stock."""
+        # Valores 2000, 250 y 1875: A acumula hasta el 80 % del total
+        assert operaciones.clasificar_abc().tolist() == ['A', 'B', 'A']
+        assert operaciones.generar_reporte_dataframe()['clase_abc'].tolist() == ['A', 'B', 'A']
+    
+    def test_clasificar_abc_por_consumo(self, operaciones):
+        """Verifica la clasificación sobre el valor de las salidas registradas."""
+        operaciones.registrar_salida(2, 5)
+        operaciones.registrar_salida(1, 1)
+        
+        assert operaciones.clasificar_abc('consumo').tolist() == ['A', 'A', 'C']
+        with pytest.raises(ValueError):
+            operaciones.clasificar_abc('margen')
+    
+    def test_clasificar_abc_respeta_tolerancia(self, operaciones, inventario_con_productos, monkeypatch):
+        """Verifica que un cambio menor que la tolerancia no reordena."""
+        llamadas = []
+        original = OperacionesMatriciales._codigos_abc
+        monkeypatch.setattr(
+            OperacionesMatriciales, '_codigos_abc',
+            classmethod(lambda cls, *args: llamadas.append(1) or original(*args))
+        )
+        operaciones.clasificar_abc(tolerancia=0.05)
+        
+        operaciones.registrar_salida(3, 1)
+        operaciones.clasificar_abc(tolerancia=0.05)
+        assert len(llamadas) == 1
+        
+        inventario_con_productos.obtener_producto(2).stock_actual = 30
+        assert operaciones.clasificar_abc(tolerancia=0.05).tolist() == ['A', 'A', 'A']
+        assert len(llamadas) == 2
+    
+    def test_resumen_abc(self, operaciones):
+        """Verifica cantidades y participación del valor por clase."""
+        resumen = operaciones.resumen_abc()
+        
+        assert resumen['cantidad_productos'].tolist() == [2, 1, 0]
+        assert resumen.loc['A', 'valor_total'] == 3875.0
+        assert resumen['porcentaje_valor'].sum() == pytest.approx(100.0)
+    
+    # =========================================================================
+    # Tests de transferencias entre BINs
+    # =========================================================================
+    
+    @pytest.fixture
+    def inventario_multibin(self):
+        """Fixture con un ítem repartido en tres BINs y otro en uno."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "Tornillo", 1.0, 90, 0, 100, numero_item="T", bin="001/001/001"))
+        inventario.agregar_producto(Producto(2, "Tornillo", 1.0, 0, 0, 50, numero_item="T", bin="001/002/001"))
+        inventario.agregar_producto(Producto(3, "Tornillo", 1.0, 10, 0, 50, numero_item="T", bin="002/001/001"))
+        inventario.agregar_producto(Producto(4, "Tuerca", 1.0, 40, 0, 50, numero_item="U", bin="001/001/001"))
+        return inventario
+    
+    def test_transferir_lote(self, inventario_multibin):
+        """Verifica que las transferencias mueven stock sin registrar movimientos."""
+        ops = OperacionesMatriciales(inventario_multibin)
+        
+        exito, _ = ops.transferir_lote([0, 0], [1, 2], [30, 20])
+        
+        assert exito is True
+        assert [p.stock_actual for p in inventario_multibin] == [40, 30, 30, 40]
+        assert len(inventario_multibin.movimientos) == 0
+    
+    def test_transferir_lote_es_atomico(self, inventario_multibin):
+        """Verifica que una transferencia inválida cancela todo el lote."""
+        ops = OperacionesMatriciales(inventario_multibin)
+        
+        exito, mensajes = ops.transferir_lote([0, 2], [1, 1], [30, 11])
+        
+        assert exito is False
+        assert any("Stock insuficiente" in m for m in mensajes)
+        assert [p.stock_actual for p in inventario_multibin] == [90, 0, 10, 40]
+    
+    def test_transferir_lote_valida_capacidad_e_item(self, inventario_multibin):
+        """Verifica el rechazo por capacidad del destino y por ítem distinto."""
+        ops = OperacionesMatriciales(inventario_multibin)
+        
+        exito, mensajes = ops.transferir_lote([0, 0], [1, 3], [60, 5])
+        
+        assert exito is False
+        assert any("Capacidad excedida" in m for m in mensajes)
+        assert any("no son el mismo ítem" in m for m in mensajes)
+    
+    def test_rebalancear_bins(self, inventario_multibin):
+        """Verifica que el rebalanceo iguala la ocupación de cada ítem."""
+        ops = OperacionesMatriciales(inventario_multibin)
+        
+        propuesta = ops.proponer_rebalanceo()
+        exito, _ = ops.rebalancear_bins()
+        
+        # 100 unidades en 200 de capacidad: 50 % en cada BIN
+        assert exito is True
+        assert propuesta['cantidad'].sum() == 40
+        assert [p.stock_actual for p in inventario_multibin] == [50, 25, 25, 40]
+        assert ops.proponer_rebalanceo().empty
+    
+    def test_rebalanceo_conserva_el_total(self):
+        """Verifica que el redondeo no crea ni pierde unidades."""
+        inventario = Inventario()
+        for i, (stock, maximo) in enumerate([(7, 10), (0, 10), (0, 10)], start=1):
+            inventario.agregar_producto(Producto(i, "X", 1.0, stock, 0, maximo, numero_item="X", bin=f"00{i}/001/001"))
+        ops = OperacionesMatriciales(inventario)
+        
+        ops.rebalancear_bins()
+        
+        assert sorted(p.stock_actual for p in inventario) == [2, 2, 3]
+    
     def test_estadisticas_inventario_vacio(self):
         """Verifica estadísticas con inventario vacío."""
         inventario = Inventario()
@@ -0,0 +1,132 @@
+"""
+Pruebas unitarias para las vistas paginadas.
+
+Verifica la navegación entre páginas, la búsqueda, el orden estable y que
+solo se formatee la página visible.
+"""
+
+import time
+import numpy as np
+import pytest
+from logic import PaginadorTabla
+
+
+@pytest.fixture
+def paginador():
+    """Tabla de 25 filas con stock repetido, en páginas de 10."""
+    ids = np.arange(1, 26, dtype=np.float64)
+    stock = np.array([i % 3 for i in range(25)], dtype=np.float64)
+    return PaginadorTabla(
+        [("ID", ids, ">.0f"), ("Stock", stock, ">.0f")],
+        filas_por_pagina=10
+    )
+
+
+class TestPaginadorTabla:
+    """Pruebas para la clase PaginadorTabla."""
+    
+    def test_paginas_y_limites(self, paginador):
+        """Verifica la cantidad de páginas y que la navegación quede acotada."""
+        assert paginador.total_filas == 25
+        assert paginador.total_paginas == 3
+        
+        assert paginador.anterior() == 0
+        assert paginador.ir_a_pagina(99) == 2
+        assert paginador.siguiente() == 2
+        assert paginador.filas_pagina().tolist() == list(range(20, 25))
+    
+    def test_ir_a_fila(self, paginador):
+        """Verifica que saltar a una fila muestre la página que la contiene."""
+        assert paginador.ir_a_fila(14) == 1
+        assert paginador.describir_posicion() == "Página 2 de 3 (filas 10-19 de 25)"
+    
+    def test_buscar(self, paginador):
+        """Verifica la búsqueda de un valor y el caso sin coincidencias."""
+        assert paginador.buscar("ID", 23) == 22
+        assert paginador.pagina == 2
+        assert paginador.buscar("ID", 99) is None
+    
+    def test_ordenar_estable(self, paginador):
+        """Verifica el orden estable ascendente, descendente y el original."""
+        paginador.ordenar("Stock")
+        assert paginador.filas_pagina().tolist() == [0, 3, 6, 9, 12, 15, 18, 21, 24, 1]
+        
+        paginador.ordenar("Stock", descendente=True)
+        assert paginador.filas_pagina()[:4].tolist() == [2, 5, 8, 11]
+        assert paginador.describir_posicion().endswith("orden: Stock ↓")
+        
+        paginador.ordenar(None)
+        assert paginador.filas_pagina().tolist() == list(range(10))
+    
+    def test_columna_perezosa(self):
+        """Verifica que las columnas calculadas reciban solo las filas visibles."""
+        llamadas = []
+        
+        def nombres(filas):
+            llamadas.append(filas.tolist())
+            return [f"P{f}" for f in filas]
+        
+        paginador = PaginadorTabla(
+            [("ID", np.arange(1000), "d"), ("Nombre", nombres, "<")],
+            filas_por_pagina=5
+        )
+        paginador.ir_a_pagina(3)
+        texto = paginador.formatear_pagina()
+        
+        assert llamadas == [[15, 16, 17, 18, 19]]
+        assert "P17" in texto
+        with pytest.raises(ValueError):
+            paginador.ordenar("Nombre")
+    
+    def test_subconjunto_de_filas(self):
+        """Verifica una vista restringida a algunas filas (por ejemplo, alertas)."""
+        alerta = np.array([0, 1, 0, 1, 1], dtype=bool)
+        paginador = PaginadorTabla(
+            [("Nombre", lambda filas: [f"P{f}" for f in filas], "<")],
+            filas=np.flatnonzero(alerta)
+        )
+        
+        assert paginador.total_filas == 3
+        assert paginador.filas_pagina().tolist() == [1, 3, 4]
+    
+    def test_formatear_pagina(self, paginador):
+        """Verifica encabezado, separador y una línea por fila visible."""
+        lineas = paginador.formatear_pagina().splitlines()
+        
+        assert len(lineas) == 12
+        assert "ID" in lineas[0] and "Stock" in lineas[0]
+        assert lineas[2].split("|")[1].strip() == "1"
+    
+    def test_vista_vacia(self):
+        """Verifica que una vista sin filas tenga una página y se describa."""
+        paginador = PaginadorTabla([("ID", np.array([]), ">.0f")])
+        
+        assert paginador.total_paginas == 1
+        assert paginador.describir_posicion() == "Sin filas"
+        assert len(paginador.formatear_pagina().splitlines()) == 2
+    
+    def test_errores(self):
+        """Verifica los argumentos inválidos."""
+        with pytest.raises(ValueError):
+            PaginadorTabla([])
+        with pytest.raises(ValueError):
+            PaginadorTabla([("ID", np.arange(3), "d")], filas_por_pagina=-1)
+        with pytest.raises(ValueError):
+            PaginadorTabla([("Nombre", lambda filas: [], "<")])
+    
+    def test_pagina_rapida_con_muchas_filas(self):
+        """Verifica que ordenar y formatear no dependan de mostrar toda la tabla."""
+        n = 500_000
+        valores = np.random.default_rng(0).random(n)
+        paginador = PaginadorTabla([
+            ("ID", np.arange(n, dtype=np.float64), ">.0f"),
+            ("Valor", valores, ">.2f"),
+        ])
+        
+        inicio = time.perf_counter()
+        paginador.ordenar("Valor", descendente=True)
+        paginador.ir_a_pagina(paginador.total_paginas - 1)
+        texto = paginador.formatear_pagina()
+        
+        assert len(texto.splitlines()) == 102
+        assert time.perf_counter() - inicio < 2.0
@@ -0,0 +1,148 @@
+"""
+Pruebas unitarias para el motor de pronóstico de demanda.
+
+Verifica la construcción de la matriz de demanda a partir de las salidas
+registradas, los métodos SES y Croston y la propuesta de mínimos y máximos.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from models import Producto, Inventario
+from logic import OperacionesMatriciales, PronosticoDemanda
+
+
+DIA = 86400.0
+FIN = 100 * DIA
+
+
+class TestPronosticoDemanda:
+    """Pruebas para la clase PronosticoDemanda."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture con productos y salidas registradas en 10 días."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "Rápido", 10.0, 20, 5, 200))
+        inventario.agregar_producto(Producto(2, "Intermitente", 10.0, 100, 5, 200))
+        inventario.agregar_producto(Producto(3, "Sin ventas", 10.0, 100, 5, 200))
+        
+        for dia in range(10):
+            inventario.movimientos.registrar(1, -4, FIN - (10 - dia) * DIA + 1)
+        for dia in (1, 5, 9):
+            inventario.movimientos.registrar(2, -6, FIN - (10 - dia) * DIA + 1)
+        # Las entradas no cuentan como demanda
+        inventario.movimientos.registrar(3, 50, FIN - DIA)
+        return inventario
+    
+    @pytest.fixture
+    def pronostico(self, inventario):
+        """Fixture que crea el motor de pronóstico."""
+        return PronosticoDemanda(inventario, alfa=0.5)
+    
+    def test_construir_matriz_demanda(self, pronostico):
+        """Verifica la matriz (productos × periodos) de salidas."""
+        matriz = pronostico.construir_matriz_demanda(10, fin=FIN)
+        
+        assert matriz.shape == (3, 10)
+        np.testing.assert_array_equal(matriz[0], np.full(10, 4.0))
+        np.testing.assert_array_equal(np.nonzero(matriz[1])[0], [1, 5, 9])
+        assert matriz[2].sum() == 0
+    
+    def test_salidas_registradas_por_operaciones(self, inventario):
+        """Verifica que registrar_salida alimenta el historial de demanda."""
+        ops = OperacionesMatriciales(inventario)
+        ops.registrar_salida(3, 7)
+        
+        matriz = PronosticoDemanda(inventario).construir_matriz_demanda(1)
+        
+        assert matriz[2, 0] == 7
+    
+    def test_suavizado_exponencial(self, pronostico):
+        """Verifica SES sobre una serie conocida."""
+        demanda = np.array([[2.0, 4.0, 4.0], [5.0, 5.0, 5.0]])
+        
+        nivel, desviacion = pronostico.suavizado_exponencial(demanda)
+        
+        # l₁ = 2 + 0.5·(4 - 2) = 3; l₂ = 3 + 0.5·(4 - 3) = 3.5
+        np.testing.assert_allclose(nivel, [3.5, 5.0])
+        assert desviacion[1] == 0.0
+    
+    def test_metodo_croston(self, pronostico):
+        """Verifica Croston: demanda de 6 cada 4 periodos ≈ 1.5 por periodo."""
+        demanda = np.zeros((1, 12))
+        demanda[0, [3, 7, 11]] = 6.0
+        
+        media, _ = pronostico.metodo_croston(demanda)
+        
+        np.testing.assert_allclose(media, [1.5])
+    
+    def test_metodo_auto_usa_croston_en_intermitentes(self, pronostico):
+        """Verifica que el método automático distingue productos intermitentes."""
+        matriz = pronostico.construir_matriz_demanda(10, fin=FIN)
+        
+        media_auto, _ = pronostico.pronosticar(matriz)
+        media_cro, _ = pronostico.metodo_croston(matriz)
+        media_ses, _ = pronostico.suavizado_exponencial(matriz)
+        
+        assert media_auto[0] == pytest.approx(media_ses[0])
+        assert media_auto[1] == pytest.approx(media_cro[1])
+    
+    def test_metodo_invalido(self, pronostico):
+        """Verifica el rechazo de un método desconocido."""
+        with pytest.raises(ValueError, match="Método"):
+            pronostico.pronosticar(np.zeros((1, 3)), metodo="arima")
+    
+    def test_proponer_minimos_maximos(self, pronostico):
+        """Verifica la propuesta en bloque de mínimos y máximos."""
+        propuesta = pronostico.proponer_minimos_maximos(
+            n_periodos=10, periodos_reposicion=2, periodos_cobertura=5, fin=FIN
+        )
+        
+        assert isinstance(propuesta, pd.DataFrame)
+        # El producto sin ventas no tiene historia suficiente: no recibe propuesta
+        assert propuesta['id'].tolist() == [1, 2]
+        # Demanda constante de 4/día: min = 4·2 = 8, max = 8 + 4·5 = 28
+        fila = propuesta.iloc[0]
+        assert fila['stock_minimo_propuesto'] == 8
+        assert fila['stock_maximo_propuesto'] == 28
+        # El intermitente tiene 100 unidades: el máximo no baja de ahí
+        assert propuesta.iloc[1]['stock_maximo_propuesto'] == 100
+        assert (propuesta['stock_maximo_propuesto'] >= propuesta['stock_minimo_propuesto']).all()
+    
+    def test_aplicar_propuesta(self, pronostico, inventario):
+        """Verifica que la propuesta actualiza los productos y la matriz."""
+        propuesta = pronostico.proponer_minimos_maximos(
+            n_periodos=10, periodos_reposicion=2, periodos_cobertura=5, fin=FIN
+        )
+        
+        actualizados = pronostico.aplicar_propuesta(propuesta)
+        
+        assert actualizados == 2
+        assert inventario.obtener_producto(1).stock_minimo == 8
+        assert inventario.obtener_matriz_inventario()[0, 3] == 8
+        # Sin historia se conservan los valores cargados a mano
+        assert (inventario.obtener_producto(3).stock_minimo, inventario.obtener_producto(3).stock_maximo) == (5, 200)
+    
+    def test_propuesta_no_deja_stock_fuera_de_rango(self, pronostico, inventario):
+        """Verifica que el máximo propuesto cubra el stock actual y que se rechacen filas inválidas."""
+        inventario.obtener_producto(1).stock_actual = 35
+        propuesta = pronostico.proponer_minimos_maximos(
+            n_periodos=10, periodos_reposicion=1, periodos_cobertura=1, fin=FIN
+        )
+        
+        assert propuesta.iloc[0]['stock_maximo_propuesto'] == 35
+        
+        invalida = pd.DataFrame({
+            'id': [1, 2], 'stock_minimo_propuesto': [1, 9], 'stock_maximo_propuesto': [5, 4]
+        })
+        assert pronostico.aplicar_propuesta(invalida) == 0
+        assert inventario.obtener_producto(1).stock_maximo == 200
+        
+        assert pronostico.aplicar_propuesta(propuesta) == 2
+        assert inventario.obtener_producto(1).stock_maximo == 35
+    
+    def test_alfa_invalido(self, inventario):
+        """Verifica el rechazo de una constante de suavizado fuera de rango."""
+        with pytest.raises(ValueError):
+            PronosticoDemanda(inventario, alfa=0)
@@ -0,0 +1,82 @@
+"""
+Pruebas unitarias para el motor de reabastecimiento (punto de reorden y EOQ).
+
+Verifica las fórmulas del modelo (s, Q) y que cada llamada entregue
+vectores independientes.
+"""
+
+import pytest
+import numpy as np
+from logic import MotorReabastecimiento
+
+
+class TestMotorReabastecimiento:
+    """Pruebas para la clase MotorReabastecimiento."""
+    
+    @pytest.fixture
+    def motor(self):
+        """Fixture que crea un motor de reabastecimiento."""
+        return MotorReabastecimiento()
+    
+    @pytest.fixture
+    def entradas(self):
+        """Fixture con las entradas de tres productos."""
+        return {
+            'tasa_demanda': np.array([10.0, 4.0, 0.0]),
+            'varianza_demanda': np.array([4.0, 1.0, 0.0]),
+            'tiempo_reposicion': np.array([4.0, 9.0, 2.0]),
+            'costo_pedido': 50.0,
+            'costo_mantener': np.array([1.0, 4.0, 1.0]),
+            'factor_servicio': 2.0,
+        }
+    
+    def test_formulas(self, motor, entradas):
+        """
+        Verifica SS, ROP y EOQ.
+        
+        Producto 1: SS = 2·√(4·4) = 8; ROP = 10·4 + 8 = 48; Q* = √(2·10·50/1) = √1000
+        Producto 2: SS = 2·√(9·1) = 6; ROP = 4·9 + 6 = 42; Q* = √(2·4·50/4) = 10
+        """
+        resultado = motor.calcular(**entradas)
+        
+        np.testing.assert_allclose(resultado['stock_seguridad'], [8.0, 6.0, 0.0])
+        np.testing.assert_allclose(resultado['punto_reorden'], [48.0, 42.0, 0.0])
+        np.testing.assert_allclose(resultado['cantidad_economica'], [np.sqrt(1000), 10.0, 0.0])
+    
+    def test_costo_mantener_cero(self, motor, entradas):
+        """Verifica que un costo de mantener nulo no produce infinitos."""
+        entradas['costo_mantener'] = 0.0
+        
+        resultado = motor.calcular(**entradas)
+        
+        assert np.all(np.isfinite(resultado['cantidad_economica']))
+    
+    def test_entradas_negativas(self, motor, entradas):
+        """Verifica el rechazo de entradas negativas."""
+        entradas['tasa_demanda'] = np.array([-1.0, 4.0, 0.0])
+        
+        with pytest.raises(ValueError, match="negativas"):
+            motor.calcular(**entradas)
+    
+    def test_resultados_independientes(self, motor, entradas):
+        """Verifica que modificar un resultado no altera las llamadas siguientes."""
+        primero = motor.calcular(**entradas)
+        primero['punto_reorden'][:] = -1
+        
+        segundo = motor.calcular(**entradas)
+        
+        np.testing.assert_allclose(segundo['punto_reorden'], [48.0, 42.0, 0.0])
+        assert not np.shares_memory(segundo['punto_reorden'], segundo['stock_seguridad'])
+    
+    def test_entradas_escalares(self, motor):
+        """Verifica que con entradas escalares la cantidad sale de n_productos."""
+        resultado = motor.calcular(10.0, 4.0, 4.0, 50.0, 1.0, 2.0, n_productos=3)
+        
+        np.testing.assert_allclose(resultado['punto_reorden'], [48.0] * 3)
+    
+    def test_longitudes_incompatibles(self, motor, entradas):
+        """Verifica el rechazo de vectores con longitudes distintas."""
+        entradas['varianza_demanda'] = np.array([4.0, 1.0])
+        
+        with pytest.raises(ValueError):
+            motor.calcular(**entradas)
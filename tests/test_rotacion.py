@@ -0,0 +1,114 @@
+"""
+Pruebas unitarias para las métricas de rotación en ventanas móviles.
+
+Verifica las sumas por ventana del búfer circular, su actualización con
+cada salida, la salida de días antiguos de la ventana y las métricas
+por producto y por categoría.
+"""
+
+import time
+import numpy as np
+import pytest
+from models import Producto, Inventario
+from logic import MetricasRotacion, OperacionesMatriciales
+from logic.rotacion import SEGUNDOS_DIA
+
+
+@pytest.fixture
+def inventario():
+    """Inventario con tres productos en dos categorías."""
+    inventario = Inventario()
+    inventario.agregar_producto(Producto(1, "P1", 10.0, 100, 0, 500, "Cat1"))
+    inventario.agregar_producto(Producto(2, "P2", 10.0, 50, 0, 500, "Cat1"))
+    inventario.agregar_producto(Producto(3, "P3", 10.0, 80, 0, 500, "Cat2"))
+    return inventario
+
+
+def hace_dias(dias: float) -> float:
+    """Marca de tiempo de hace `dias` días."""
+    return time.time() - dias * SEGUNDOS_DIA
+
+
+class TestMetricasRotacion:
+    """Pruebas para la clase MetricasRotacion."""
+    
+    def test_salida_actualiza_ventanas(self, inventario):
+        """Verifica que cada salida suma en todas las ventanas."""
+        rotacion = MetricasRotacion(inventario, ventanas=(7, 30))
+        operaciones = OperacionesMatriciales(inventario)
+        
+        operaciones.registrar_salida(1, 10)
+        operaciones.registrar_salida(1, 5)
+        
+        assert rotacion.ventas(1, 7) == 15
+        assert rotacion.ventas(1, 30) == 15
+        assert rotacion.ventas(2, 7) == 0
+    
+    def test_entradas_no_cuentan(self, inventario):
+        """Verifica que solo las salidas forman parte de las ventas."""
+        rotacion = MetricasRotacion(inventario, ventanas=(7,))
+        
+        OperacionesMatriciales(inventario).registrar_entrada(1, 20)
+        
+        assert rotacion.ventas(1, 7) == 0
+    
+    def test_salidas_antiguas_salen_de_la_ventana(self, inventario):
+        """Verifica que una salida de hace 10 días cuenta en 30 pero no en 7."""
+        movimientos = inventario.movimientos
+        movimientos.registrar(1, -40, hace_dias(10))
+        movimientos.registrar(1, -3, hace_dias(1))
+        movimientos.registrar(2, -9, hace_dias(40))
+        
+        rotacion = MetricasRotacion(inventario, ventanas=(7, 30))
+        
+        assert rotacion.ventas(1, 7) == 3
+        assert rotacion.ventas(1, 30) == 43
+        assert rotacion.ventas(2, 30) == 0
+    
+    def test_metricas_producto(self, inventario):
+        """Verifica rotación, cobertura y sell-through de un producto."""
+        rotacion = MetricasRotacion(inventario, ventanas=(30,))
+        OperacionesMatriciales(inventario).registrar_salida(1, 60)
+        
+        metricas = rotacion.metricas_producto(1, 30)
+        
+        # Stock 40 y 2 unidades diarias
+        assert metricas['ventas'] == 60
+        assert metricas['dias_cobertura'] == pytest.approx(20.0)
+        assert metricas['rotacion_anual'] == pytest.approx(2 * 365 / 40)
+        assert metricas['sell_through'] == pytest.approx(60.0)
+        assert rotacion.metricas_producto(2, 30)['dias_cobertura'] == np.inf
+    
+    def test_metricas_por_categoria(self, inventario):
+        """Verifica la agregación de ventas y stock por categoría."""
+        rotacion = MetricasRotacion(inventario, ventanas=(30,))
+        OperacionesMatriciales(inventario).registrar_salidas_batch({1: 30, 2: 20, 3: 8})
+        
+        df = rotacion.metricas_por_categoria(30)
+        
+        assert df.loc['Cat1', 'ventas'] == 50
+        assert df.loc['Cat1', 'stock_actual'] == 100
+        assert df.loc['Cat2', 'sell_through'] == 10.0
+        assert rotacion.metricas(30).loc[2, 'ventas'] == 20
+    
+    def test_transaccion_revertida_reconstruye(self, inventario):
+        """Verifica que las salidas deshechas dejan de contar."""
+        rotacion = MetricasRotacion(inventario, ventanas=(7,))
+        operaciones = OperacionesMatriciales(inventario)
+        operaciones.registrar_salida(1, 10)
+        
+        exitosas, _ = operaciones.registrar_salidas_batch({1: 5, 2: 999}, atomico=True)
+        operaciones.registrar_salida(3, 1)
+        
+        assert exitosas == 0
+        assert rotacion.ventas(1, 7) == 10
+        assert rotacion.ventas(3, 7) == 1
+    
+    def test_ventana_no_mantenida(self, inventario):
+        """Verifica que se rechaza una ventana que no tiene búfer."""
+        rotacion = MetricasRotacion(inventario, ventanas=(7,))
+        
+        with pytest.raises(ValueError):
+            rotacion.ventas(1, 30)
+        with pytest.raises(ValueError):
+            MetricasRotacion(inventario, ventanas=(0,))
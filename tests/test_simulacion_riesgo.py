@@ -0,0 +1,117 @@
+"""
+Pruebas unitarias para la simulación Monte Carlo de quiebres de stock.
+
+Verifica los indicadores en casos deterministas, la reproducibilidad
+con semilla y la equivalencia entre el cálculo por bloques y con procesos.
+"""
+
+import tracemalloc
+import pytest
+import numpy as np
+import pandas as pd
+from models import Producto, Inventario
+from logic import SimulacionRiesgo
+from logic.simulacion_riesgo import _simular_bloque
+
+
+class TestSimulacionRiesgo:
+    """Pruebas para la clase SimulacionRiesgo."""
+    
+    @pytest.fixture
+    def inventario(self):
+        """Fixture que crea un inventario con productos de prueba."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "Sin demanda", 10.0, 5, 0, 50))
+        inventario.agregar_producto(Producto(2, "Agotado", 10.0, 0, 0, 50))
+        inventario.agregar_producto(Producto(3, "Constante", 10.0, 15, 0, 50))
+        inventario.agregar_producto(Producto(4, "Holgado", 10.0, 50, 0, 50))
+        return inventario
+    
+    def test_casos_deterministas(self, inventario):
+        """
+        Verifica los indicadores con desviación nula.
+        
+        Producto 3: demanda 2/día × 10 días = 20 > 15 → P = 1, faltante = 5
+        """
+        simulacion = SimulacionRiesgo(inventario, escenarios=50, dias=10, semilla=7)
+        
+        df = simulacion.simular(np.array([0.0, 1.0, 2.0, 2.0]), 0.0)
+        
+        assert isinstance(df, pd.DataFrame)
+        np.testing.assert_array_equal(df['probabilidad_quiebre'], [0.0, 1.0, 1.0, 0.0])
+        np.testing.assert_allclose(df['faltante_esperado'], [0.0, 10.0, 5.0, 0.0])
+    
+    def test_probabilidad_en_rango(self, inventario):
+        """Verifica que las probabilidades estén entre 0 y 1 con demanda aleatoria."""
+        simulacion = SimulacionRiesgo(inventario, escenarios=200, dias=10, semilla=1)
+        
+        df = simulacion.simular(np.full(4, 1.5), np.full(4, 1.0))
+        
+        assert df['probabilidad_quiebre'].between(0, 1).all()
+        assert (df['faltante_esperado'] >= 0).all()
+        assert 0 < df['probabilidad_quiebre'].iloc[2] < 1
+    
+    def test_distribucion_poisson(self, inventario):
+        """Verifica la simulación con demanda Poisson."""
+        simulacion = SimulacionRiesgo(inventario, escenarios=100, dias=5, semilla=3)
+        
+        df = simulacion.simular(np.full(4, 1.0), distribucion="poisson")
+        
+        assert df['probabilidad_quiebre'].iloc[0] > 0
+        assert df['probabilidad_quiebre'].iloc[3] == 0
+    
+    def test_poisson_respeta_memoria_del_bloque(self, inventario):
+        """Verifica que la demanda Poisson no supera la memoria presupuestada por bloque."""
+        simulacion = SimulacionRiesgo(inventario, escenarios=500, dias=20, memoria_maxima_mb=1.0)
+        k = simulacion.tamano_bloque()
+        tarea = (
+            0, np.full(k, 10.0), np.full(k, 2.0), np.zeros(k),
+            simulacion.escenarios, simulacion.dias, SimulacionRiesgo.DISTRIBUCION_POISSON
+        )
+        
+        tracemalloc.start()
+        try:
+            _simular_bloque(tarea)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        assert pico < 1.5 * 1024 * 1024
+    
+    def test_reproducible_por_bloques_y_procesos(self, inventario):
+        """Verifica que bloques pequeños y procesos dan el mismo resultado."""
+        media, desviacion = np.full(4, 1.5), np.full(4, 1.0)
+        
+        completo = SimulacionRiesgo(inventario, escenarios=100, dias=10, semilla=5)
+        por_bloques = SimulacionRiesgo(
+            inventario, escenarios=100, dias=10, semilla=5, memoria_maxima_mb=0.004
+        )
+        
+        assert por_bloques.tamano_bloque() == 1
+        df_serie = por_bloques.simular(media, desviacion)
+        df_procesos = por_bloques.simular(media, desviacion, procesos=2)
+        
+        pd.testing.assert_frame_equal(df_serie, df_procesos)
+        assert completo.simular(media, desviacion).shape == df_serie.shape
+    
+    def test_demanda_desde_historial(self, inventario):
+        """Verifica que sin demanda explícita se usa el pronóstico de salidas."""
+        simulacion = SimulacionRiesgo(inventario, escenarios=20, dias=5, semilla=2)
+        
+        df = simulacion.simular()
+        
+        # Sin salidas registradas la demanda pronosticada es nula
+        np.testing.assert_array_equal(df['probabilidad_quiebre'], [0.0, 0.0, 0.0, 0.0])
+    
+    def test_parametros_invalidos(self, inventario):
+        """Verifica el rechazo de parámetros inválidos."""
+        with pytest.raises(ValueError):
+            SimulacionRiesgo(inventario, escenarios=0)
+        with pytest.raises(ValueError, match="Distribución"):
+            SimulacionRiesgo(inventario).simular(np.ones(4), distribucion="gamma")
+    
+    def test_inventario_vacio(self):
+        """Verifica la simulación sin productos."""
+        df = SimulacionRiesgo(Inventario()).simular()
+        
+        assert df.empty
@@ -0,0 +1,107 @@
+"""
+Pruebas unitarias para el optimizador de ubicaciones (slotting).
+
+Verifica el cálculo de distancias, el conteo de picking, que la
+asignación respete capacidades y que la propuesta reduzca el recorrido.
+"""
+
+import numpy as np
+import pytest
+from models import Producto, Inventario
+from logic import OptimizadorSlotting, OperacionesMatriciales
+
+
+@pytest.fixture
+def inventario():
+    """Inventario donde el producto más vendido está en el BIN más lejano."""
+    inventario = Inventario()
+    inventario.agregar_producto(Producto(1, "Cercano", 1.0, 50, 0, 100, bin="001/001/001"))
+    inventario.agregar_producto(Producto(2, "Medio", 1.0, 50, 0, 100, bin="002/001/001"))
+    inventario.agregar_producto(Producto(3, "Lejano", 1.0, 50, 0, 100, bin="005/001/001"))
+    inventario.agregar_producto(Producto(4, "Sin BIN", 1.0, 50, 0, 100, bin="N/D"))
+    operaciones = OperacionesMatriciales(inventario)
+    for _ in range(5):
+        operaciones.registrar_salida(3, 1)
+    operaciones.registrar_salida(2, 1)
+    return inventario
+
+
+class TestOptimizadorSlotting:
+    """Pruebas para la clase OptimizadorSlotting."""
+    
+    def test_distancias(self, inventario):
+        """Verifica la distancia ponderada al área de despacho."""
+        optimizador = OptimizadorSlotting(inventario, origen=(1, 1, 1), pesos=(10, 1, 0.5))
+        
+        distancias = optimizador.distancias(np.array([1_001_001, 3_004_003]))
+        
+        assert distancias.tolist() == [0.0, 20 + 3 + 1.0]
+    
+    def test_frecuencias_picking(self, inventario):
+        """Verifica el conteo de salidas alineado con la matriz."""
+        optimizador = OptimizadorSlotting(inventario)
+        
+        assert optimizador.frecuencias_picking().tolist() == [0, 1, 5, 0]
+    
+    def test_propuesta_acerca_los_mas_vendidos(self, inventario):
+        """Verifica que el producto más vendido pasa al BIN más cercano."""
+        optimizador = OptimizadorSlotting(inventario)
+        
+        propuesta = optimizador.proponer()
+        
+        destino = dict(zip(propuesta['id'], propuesta['bin_propuesto']))
+        assert destino == {3: "001/001/001", 1: "005/001/001"}
+        assert propuesta['id'].tolist() == [3, 1]
+        assert optimizador.costo_recorrido(propuesta) < optimizador.costo_recorrido()
+    
+    def test_respeta_capacidad(self, inventario):
+        """Verifica que un producto no se ubica donde no cabe su stock máximo."""
+        inventario.obtener_producto(3).stock_maximo = 500
+        optimizador = OptimizadorSlotting(inventario)
+        
+        propuesta = optimizador.proponer()
+        
+        assert 3 not in propuesta['id'].tolist()
+    
+    def test_asignacion_optima_sin_restricciones(self):
+        """Verifica que con capacidades iguales se ordena por frecuencia."""
+        optimizador = OptimizadorSlotting(Inventario())
+        frecuencias = np.array([1.0, 9.0, 4.0])
+        distancias = np.array([1.0, 3.0, 2.0])
+        capacidades = np.full(3, 10.0)
+        
+        asignacion = optimizador.asignar(frecuencias, distancias, capacidades, capacidades)
+        
+        assert asignacion.tolist() == [1, 0, 2]
+    
+    def test_asignacion_es_permutacion(self):
+        """Verifica que un producto sin lugar factible no comparte su BIN con otro."""
+        optimizador = OptimizadorSlotting(Inventario())
+        capacidades = np.array([100.0, 10.0])
+        
+        asignacion = optimizador.asignar(np.array([0.0, 5.0]), np.array([1.0, 9.0]), capacidades, capacidades)
+        
+        assert asignacion.tolist() == [0, 1]
+        
+        generador = np.random.default_rng(7)
+        for _ in range(20):
+            capacidades = generador.integers(1, 50, size=30).astype(float)
+            asignacion = optimizador.asignar(
+                generador.poisson(3.0, size=30).astype(float), generador.random(30),
+                capacidades, capacidades
+            )
+            assert sorted(asignacion.tolist()) == list(range(30))
+            assert (capacidades[asignacion] >= capacidades).all()
+    
+    def test_aplicar_propuesta(self, inventario):
+        """Verifica que aplicar la propuesta cambia los BIN en una transacción."""
+        optimizador = OptimizadorSlotting(inventario)
+        recibidos = []
+        inventario.eventos.suscribir(recibidos.append)
+        
+        reubicados = optimizador.aplicar_propuesta(optimizador.proponer())
+        
+        assert reubicados >= 2
+        assert inventario.obtener_producto(3).bin == "001/001/001"
+        assert len(recibidos) == 1
+        assert optimizador.proponer().empty
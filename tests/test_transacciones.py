@@ -0,0 +1,118 @@
+"""
+Pruebas unitarias para las transacciones del inventario.
+
+Verifica que los cambios se deshacen al fallar, que los puntos de
+guardado revierten solo su parte y que al confirmar se publica un único
+evento.
+"""
+
+import pytest
+from models import Producto, Inventario, EventoInventario
+from logic import OperacionesMatriciales
+
+
+@pytest.fixture
+def inventario():
+    """Inventario con tres productos."""
+    inventario = Inventario()
+    inventario.agregar_producto(Producto(1, "P1", 10.0, 20, 5, 50))
+    inventario.agregar_producto(Producto(2, "P2", 20.0, 30, 5, 50))
+    inventario.agregar_producto(Producto(3, "P3", 30.0, 40, 5, 50))
+    return inventario
+
+
+class TestTransacciones:
+    """Pruebas para Inventario.transaccion."""
+    
+    def test_excepcion_deshace_todo(self, inventario):
+        """Verifica que una excepción deja el inventario como estaba."""
+        matriz_antes = inventario.obtener_matriz_inventario().copy()
+        
+        with pytest.raises(RuntimeError):
+            with inventario.transaccion():
+                inventario.obtener_producto(1).stock_actual = 0
+                inventario.obtener_producto(2).nombre = "Otro"
+                inventario.eliminar_producto(2)
+                inventario.agregar_producto(Producto(4, "P4", 5.0))
+                inventario.cambiar_id(3, 30)
+                raise RuntimeError("falla")
+        
+        assert list(inventario.productos) == [1, 2, 3]
+        assert inventario.obtener_producto(2).nombre == "P2"
+        assert inventario.obtener_producto(3).id == 3
+        assert (inventario.obtener_matriz_inventario() == matriz_antes).all()
+    
+    def test_confirmar_publica_un_evento(self, inventario):
+        """Verifica que al confirmar se publica un solo evento con los IDs."""
+        recibidos = []
+        inventario.eventos.suscribir(recibidos.append)
+        inventario.obtener_matriz_inventario()
+        
+        with inventario.transaccion():
+            inventario.obtener_producto(1).stock_actual = 7
+            inventario.obtener_producto(3).precio = 99.0
+            assert recibidos == []
+        
+        assert len(recibidos) == 1
+        assert recibidos[0].tipo == EventoInventario.TRANSACCION
+        assert recibidos[0].nuevo == {1, 3}
+        matriz = inventario.obtener_matriz_inventario()
+        assert matriz[0, 2] == 7
+        assert matriz[2, 1] == 99.0
+    
+    def test_punto_guardado(self, inventario):
+        """Verifica que una transacción anidada deshace solo sus cambios."""
+        with inventario.transaccion():
+            inventario.obtener_producto(1).stock_actual = 1
+            with pytest.raises(ValueError):
+                with inventario.transaccion():
+                    inventario.obtener_producto(2).stock_actual = 2
+                    raise ValueError("falla interna")
+        
+        assert inventario.obtener_producto(1).stock_actual == 1
+        assert inventario.obtener_producto(2).stock_actual == 30
+    
+    def test_deshacer_respeta_fichas_compartidas(self):
+        """Verifica que al deshacer bajas y altas cada BIN vuelve a su ficha."""
+        inventario = Inventario()
+        inventario.agregar_producto(Producto(1, "Tornillo", 1.0, numero_item="T", bin="A"))
+        inventario.agregar_producto(Producto(2, "Tornillo", 1.0, numero_item="T", bin="B"))
+        ficha = inventario.obtener_producto(1).ficha
+        
+        with pytest.raises(RuntimeError):
+            with inventario.transaccion():
+                inventario.obtener_producto(1).precio = 3.0
+                inventario.eliminar_producto(2)
+                inventario.agregar_producto(Producto(3, "Tornillo", 1.0, numero_item="T", bin="C"))
+                inventario.obtener_producto(3).numero_item = "X"
+                raise RuntimeError("falla")
+        
+        assert inventario.obtener_producto(2).ficha is ficha
+        assert ficha.ubicaciones == [inventario.obtener_producto(1), inventario.obtener_producto(2)]
+        assert ficha.precio == 1.0 and ficha.numero_item == "T"
+        assert set(inventario.fichas) == {"T"}
+    
+    def test_punto_guardado_sin_transaccion(self, inventario):
+        """Verifica que pedir un punto de guardado sin transacción falla."""
+        with pytest.raises(RuntimeError, match="No hay una transacción abierta"):
+            inventario.punto_guardado()
+    
+    def test_salidas_atomicas(self, inventario):
+        """Verifica que una salida rechazada cancela todo el lote atómico."""
+        operaciones = OperacionesMatriciales(inventario)
+        
+        exitosas, mensajes = operaciones.registrar_salidas_batch({1: 5, 2: 500}, atomico=True)
+        
+        assert exitosas == 0
+        assert "Lote cancelado" in mensajes[-1]
+        assert inventario.obtener_producto(1).stock_actual == 20
+        assert len(inventario.movimientos) == 0
+    
+    def test_salidas_no_atomicas(self, inventario):
+        """Verifica que sin atomicidad se aplican las salidas válidas."""
+        operaciones = OperacionesMatriciales(inventario)
+        
+        exitosas, _ = operaciones.registrar_salidas_batch({1: 5, 2: 500})
+        
+        assert exitosas == 1
+        assert inventario.obtener_producto(1).stock_actual == 15
@@ -0,0 +1,205 @@
+"""
+Pruebas unitarias para las vistas materializadas.
+
+Verifica las medidas de cada vista, su mantenimiento por deltas ante
+altas, bajas, cambios de stock, atributos, IDs y transacciones, y que
+coincidan siempre con recalcularlas desde cero.
+"""
+
+import random
+import numpy as np
+import pytest
+from models import Producto, Inventario
+from logic import OperacionesMatriciales, RegistroVistas, VistaMaterializada
+
+
+MEDIDAS = {
+    'productos': (None, 'cantidad'),
+    'unidades': ('stock_actual', 'suma'),
+    'valor': ('valor', 'suma'),
+    'precio_min': ('precio', 'minimo'),
+    'precio_max': ('precio', 'maximo'),
+    'stock_promedio': ('stock_actual', 'promedio'),
+}
+
+
+@pytest.fixture
+def inventario():
+    """Inventario con dos categorías, un item en dos BIN y un BIN sin formato."""
+    inventario = Inventario()
+    inventario.agregar_producto(Producto(1, "Laptop", 900.10, 2, 5, 50, "Electrónica", "000001", bin="003/001/001"))
+    inventario.agregar_producto(Producto(2, "Laptop", 900.10, 8, 5, 50, "Electrónica", "000001", bin="001/002/001"))
+    inventario.agregar_producto(Producto(3, "Cable", 15.0, 3, 30, 200, "Accesorios", "000003", bin="001/001/001"))
+    inventario.agregar_producto(Producto(4, "Mouse", 30.0, 45, 20, 100, "Accesorios", "000004", bin="N/D"))
+    return inventario
+
+
+@pytest.fixture
+def vistas(inventario):
+    """Registro con vistas por categoría, item y pasillo."""
+    vistas = RegistroVistas(inventario)
+    vistas.registrar('categoria', 'categoria', MEDIDAS)
+    vistas.registrar('item', 'item', MEDIDAS)
+    vistas.registrar('pasillo', 'pasillo', MEDIDAS)
+    return vistas
+
+
+def _desde_cero(vistas):
+    """Recalcula cada vista registrada desde cero."""
+    resultado = {}
+    for nombre, vista in vistas.vistas.items():
+        nueva = VistaMaterializada(nombre, vista._clave, vista.medidas)
+        nueva.reconstruir(vistas.inventario.productos.values())
+        resultado[nombre] = nueva.consultar()
+    return resultado
+
+
+def _coinciden(vistas):
+    """Compara las vistas mantenidas por deltas con las recalculadas."""
+    for nombre, esperado in _desde_cero(vistas).items():
+        obtenido = vistas.consultar(nombre)
+        assert obtenido.index.tolist() == esperado.index.tolist(), nombre
+        assert obtenido.to_dict() == esperado.to_dict(), nombre
+
+
+class TestVistaMaterializada:
+    """Pruebas para las clases VistaMaterializada y RegistroVistas."""
+    
+    def test_medidas_por_categoria(self, vistas):
+        """Verifica suma, cantidad, mínimo, máximo y promedio por categoría."""
+        df = vistas.consultar('categoria')
+        
+        assert df.index.tolist() == ["Accesorios", "Electrónica"]
+        assert df.loc["Electrónica"].to_dict() == {
+            'productos': 2, 'unidades': 10, 'valor': 9001.0,
+            'precio_min': 900.10, 'precio_max': 900.10, 'stock_promedio': 5.0,
+        }
+        assert df.loc["Accesorios", 'precio_min'] == 15.0
+        assert df.loc["Accesorios", 'precio_max'] == 30.0
+    
+    def test_claves_item_y_pasillo(self, vistas):
+        """Verifica la agrupación por item y por pasillo (sin BIN válido, fuera)."""
+        assert vistas['item'].obtener("000001")['unidades'] == 10
+        assert vistas.consultar('pasillo').index.tolist() == [1, 3]
+        assert vistas['pasillo'].obtener(1)['productos'] == 2
+    
+    def test_deltas_de_stock_y_atributos(self, vistas, inventario):
+        """Verifica que los cambios se apliquen como deltas a los grupos afectados."""
+        inventario.obtener_producto(3).stock_actual = 13
+        inventario.obtener_producto(4).categoria = "Electrónica"
+        inventario.obtener_producto(4).bin = "003/004/001"
+        
+        categoria = vistas['categoria']
+        assert categoria.obtener("Accesorios")['unidades'] == 13
+        assert categoria.obtener("Electrónica")['productos'] == 3
+        assert categoria.obtener("Electrónica")['precio_min'] == 30.0
+        assert vistas['pasillo'].obtener(3)['unidades'] == 47
+        _coinciden(vistas)
+    
+    def test_extremo_retirado_se_recalcula(self, vistas, inventario):
+        """Verifica que retirar el mínimo o el máximo de un grupo lo recalcule."""
+        inventario.eliminar_producto(4)
+        assert vistas['categoria'].obtener("Accesorios")['precio_max'] == 15.0
+        
+        inventario.eliminar_producto(3)
+        assert vistas['categoria'].obtener("Accesorios") is None
+        assert len(vistas['categoria']) == 1
+    
+    def test_cambio_de_id_y_transaccion(self, vistas, inventario):
+        """Verifica cambios de ID, transacciones confirmadas y revertidas."""
+        inventario.cambiar_id(3, 30)
+        inventario.obtener_producto(30).stock_actual = 1
+        
+        with inventario.transaccion():
+            inventario.obtener_producto(1).stock_actual = 20
+            inventario.agregar_producto(Producto(5, "Audífonos", 60.0, 22, 15, 50, "Audio", bin="002/001/001"))
+        
+        with pytest.raises(RuntimeError):
+            with inventario.transaccion():
+                inventario.eliminar_producto(2)
+                raise RuntimeError("fallo")
+        
+        assert vistas['categoria'].obtener("Electrónica")['unidades'] == 28
+        assert vistas['categoria'].obtener("Audio")['productos'] == 1
+        _coinciden(vistas)
+    
+    def test_vaciar(self, vistas, inventario):
+        """Verifica que vaciar el inventario deje las vistas sin grupos."""
+        inventario.vaciar()
+        
+        assert vistas.consultar('categoria').empty
+        inventario.agregar_producto(Producto(9, "Nuevo", 1.0, 1, 0, 5, "Otra"))
+        assert vistas.consultar('categoria').index.tolist() == ["Otra"]
+    
+    def test_coincide_con_recalcular_tras_cambios_aleatorios(self, vistas, inventario):
+        """Verifica, tras muchos cambios aleatorios, que los deltas den lo mismo que recalcular."""
+        aleatorio = random.Random(7)
+        categorias = ["A", "B", "C"]
+        siguiente_id = 100
+        
+        for paso in range(400):
+            ids = list(inventario.productos)
+            accion = aleatorio.random()
+            if accion < 0.2 or not ids:
+                siguiente_id += 1
+                inventario.agregar_producto(Producto(
+                    siguiente_id, f"P{siguiente_id}", aleatorio.choice([1.05, 2.5, 9.99]),
+                    aleatorio.randint(0, 50), 5, 60, aleatorio.choice(categorias),
+                    numero_item=f"{aleatorio.randint(1, 8):06d}",
+                    bin=f"{aleatorio.randint(1, 4):03d}/001/001"
+                ))
+            elif accion < 0.3:
+                inventario.eliminar_producto(aleatorio.choice(ids))
+            elif accion < 0.6:
+                inventario.obtener_producto(aleatorio.choice(ids)).stock_actual = aleatorio.randint(0, 50)
+            elif accion < 0.7:
+                inventario.obtener_producto(aleatorio.choice(ids)).categoria = aleatorio.choice(categorias)
+            elif accion < 0.8:
+                inventario.obtener_producto(aleatorio.choice(ids)).precio = aleatorio.choice([1.05, 3.0, 7.77])
+            elif accion < 0.85:
+                siguiente_id += 1
+                inventario.cambiar_id(aleatorio.choice(ids), siguiente_id)
+            else:
+                try:
+                    with inventario.transaccion():
+                        for producto_id in aleatorio.sample(ids, min(3, len(ids))):
+                            inventario.obtener_producto(producto_id).stock_actual += 1
+                            inventario.obtener_producto(producto_id).bin = "004/002/001"
+                        if aleatorio.random() < 0.5:
+                            raise ValueError("revertir")
+                except ValueError:
+                    pass
+            if paso % 50 == 0:
+                _coinciden(vistas)
+        
+        _coinciden(vistas)
+    
+    def test_errores(self, vistas):
+        """Verifica las definiciones no válidas y las vistas inexistentes."""
+        with pytest.raises(ValueError):
+            vistas.registrar('categoria', 'categoria', MEDIDAS)
+        with pytest.raises(ValueError):
+            vistas.registrar('x', 'color', MEDIDAS)
+        with pytest.raises(ValueError):
+            vistas.registrar('x', 'categoria', {'m': ('peso', 'suma')})
+        with pytest.raises(ValueError):
+            vistas.registrar('x', 'categoria', {'m': ('precio', 'mediana')})
+        with pytest.raises(KeyError):
+            vistas.consultar('no_existe')
+        
+        assert vistas.eliminar('item')
+        assert 'item' not in vistas
+    
+    def test_analisis_por_categoria_desde_vista(self, inventario):
+        """Verifica que el análisis leído de la vista coincida con el calculado."""
+        esperado = OperacionesMatriciales(inventario).analisis_por_categoria()
+        operaciones = OperacionesMatriciales(inventario, RegistroVistas(inventario))
+        
+        obtenido = operaciones.analisis_por_categoria()
+        
+        assert obtenido.index.tolist() == esperado.index.tolist()
+        assert obtenido.columns.tolist() == esperado.columns.tolist()
+        np.testing.assert_allclose(obtenido.to_numpy(dtype=float), esperado.to_numpy(dtype=float))
+        
+        inventario.obtener_producto(3).stock_actual = 100
+        assert operaciones.analisis_por_categoria().loc["Accesorios", 'total_unidades'] == 145